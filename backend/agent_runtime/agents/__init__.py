@@ -2,68 +2,65 @@
 HR DSS - Agent Runtime Package
 
 의사결정 지원을 위한 AI Agent 모듈
+(하위 모듈은 처음 사용할 때 로드하여 API 기동 시간을 줄임)
 """
 
-from backend.agent_runtime.agents.impact_simulator import (
-    ImpactAnalysis,
-    ImpactSimulatorAgent,
-    ScenarioComparison,
-)
-from backend.agent_runtime.agents.option_generator import (
-    DecisionOption,
-    OptionGeneratorAgent,
-    OptionSet,
-)
-from backend.agent_runtime.agents.query_decomposition import (
-    DecomposedQuery,
-    QueryDecompositionAgent,
-    SubQuery,
-)
-from backend.agent_runtime.agents.success_probability import (
-    ProbabilityResult,
-    RiskFactor,
-    SuccessProbabilityAgent,
-)
-from backend.agent_runtime.agents.validator import (
-    EvidenceLink,
-    ValidationResult,
-    ValidatorAgent,
-)
-from backend.agent_runtime.agents.workflow_builder import (
-    StepType,
-    WorkflowBuilderAgent,
-    WorkflowContext,
-    WorkflowDefinition,
-    WorkflowExecution,
-    WorkflowStatus,
-)
+import importlib
+from typing import Any
 
-__all__ = [
+_EXPORTS = {
     # Query Decomposition
-    "QueryDecompositionAgent",
-    "DecomposedQuery",
-    "SubQuery",
+    "QueryDecompositionAgent": "query_decomposition",
+    "DecomposedQuery": "query_decomposition",
+    "SubQuery": "query_decomposition",
     # Option Generator
-    "OptionGeneratorAgent",
-    "DecisionOption",
-    "OptionSet",
+    "OptionGeneratorAgent": "option_generator",
+    "DecisionOption": "option_generator",
+    "OptionSet": "option_generator",
+    "ReallocationOptimizer": "reallocation",
+    "ReallocationPlan": "reallocation",
+    "HeadcountPlanner": "headcount_planner",
+    "HeadcountPlan": "headcount_planner",
+    "OptionRanker": "option_ranking",
+    "OptionRanking": "option_ranking",
     # Impact Simulator
-    "ImpactSimulatorAgent",
-    "ImpactAnalysis",
-    "ScenarioComparison",
+    "ImpactSimulatorAgent": "impact_simulator",
+    "ImpactAnalysis": "impact_simulator",
+    "ScenarioComparison": "impact_simulator",
+    "Distribution": "monte_carlo",
+    "MonteCarloSummary": "monte_carlo",
+    "SweepResult": "sensitivity",
+    "SimulationCache": "simulation_cache",
     # Success Probability
-    "SuccessProbabilityAgent",
-    "ProbabilityResult",
-    "RiskFactor",
+    "SuccessProbabilityAgent": "success_probability",
+    "ProbabilityResult": "success_probability",
+    "RiskFactor": "success_probability",
+    "BatchScores": "success_probability",
+    "SuccessModel": "success_model",
+    "SuccessPredictor": "success_model",
+    "PortfolioOptimizer": "portfolio",
+    "PortfolioResult": "portfolio",
     # Validator
-    "ValidatorAgent",
-    "ValidationResult",
-    "EvidenceLink",
+    "ValidatorAgent": "validator",
+    "ValidationResult": "validator",
+    "EvidenceLink": "validator",
     # Workflow Builder
-    "WorkflowBuilderAgent",
-    "WorkflowDefinition",
-    "WorkflowExecution",
-    "WorkflowContext",
-    "WorkflowStatus",
-    "StepType",
-]
+    "WorkflowBuilderAgent": "workflow_builder",
+    "WorkflowDefinition": "workflow_builder",
+    "WorkflowExecution": "workflow_builder",
+    "WorkflowContext": "workflow_builder",
+    "WorkflowStatus": "workflow_builder",
+    "StepType": "workflow_builder",
+    "KGLookupCache": "workflow_builder",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
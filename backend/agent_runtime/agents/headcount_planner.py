@@ -0,0 +1,311 @@
+"""
+HR DSS - 다기간 증원 계획 (동적 계획법)
+
+조직의 주차별 Capacity 부족분(FTE)을 채용 / 외주 / 내부 재배치로 메우는 비용 최소 일정 수립
+- 채용: 착수 후 리드타임이 지나 합류, 온보딩 기간 동안 생산성이 선형으로 증가.
+  채용 수수료 + 합류 후 주급 (계획 기간 내)
+- 외주: 계약 리드타임 이후 주 단위로 FTE 조정. 신규 투입 FTE마다 온보딩 비용 (전환 비용)
+- 재배치: 주차별 가용 한도 안에서 주급 기회비용으로 충당
+- 그래도 남는 부족분은 주당 미충족 비용으로 계산
+
+채용 코호트(착수 주차 × 인원) 후보마다 외주 인원을 상태로 하는 역방향 DP를 풀며,
+모든 후보를 NumPy 배열로 한 번에 계산
+"""
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# 계획 기간 (주)
+MIN_HORIZON_WEEKS = 12
+MAX_HORIZON_WEEKS = 52
+
+
+@dataclass(frozen=True)
+class PlanningCosts:
+    """계획 비용/제약 파라미터 (금액: 원)"""
+
+    hire_fee: float = 10_000_000  # 채용 1명당 수수료
+    hire_weekly: float = 1_600_000  # 정규직 주급 (합류 후)
+    hire_lead_weeks: int = 8  # 착수 → 합류
+    ramp_weeks: int = 8  # 합류 → 생산성 100%
+    max_hires: int | None = None  # 미지정 시 최대 부족분 기준
+    contractor_weekly: float = 3_000_000  # 외주 1 FTE 주간 비용
+    contractor_onboarding: float = 2_000_000  # 외주 1 FTE 신규 투입 비용
+    contractor_lead_weeks: int = 2
+    max_contractors: int = 10
+    reassign_weekly: float = 800_000  # 재배치 1 FTE 주간 기회비용
+    shortfall_weekly: float = 5_000_000  # 미충족 1 FTE 주간 손실
+
+
+@dataclass
+class HeadcountPlan:
+    """주차별 증원 일정"""
+
+    option_type: str
+    name: str
+    weeks: list[str]
+    gap_fte: np.ndarray
+    hires: int
+    hire_start: int | None  # 채용 착수 주차 인덱스
+    hire_lead_weeks: int
+    hire_fte: np.ndarray  # 채용 인력 실효 FTE (온보딩 반영)
+    contractor_fte: np.ndarray
+    reassign_fte: np.ndarray
+    unmet_fte: np.ndarray
+    costs: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_cost(self) -> float:
+        return sum(self.costs.values())
+
+    @property
+    def added_fte(self) -> np.ndarray:
+        """주차별 추가 투입 FTE (채용 + 외주 + 재배치)"""
+        return self.hire_fte + self.contractor_fte + self.reassign_fte
+
+    @property
+    def coverage_ratio(self) -> float:
+        shortage = np.clip(self.gap_fte, 0.0, None).sum()
+        return float(1 - self.unmet_fte.sum() / shortage) if shortage > 0 else 1.0
+
+    @property
+    def arrival(self) -> int | None:
+        return None if self.hire_start is None else self.hire_start + self.hire_lead_weeks
+
+    def actions(self) -> list[str]:
+        """일정 요약 액션"""
+        actions = []
+        if self.hires:
+            start, arrival = self.weeks[self.hire_start], self.weeks[self.arrival]
+            actions.append(f"{start} 정규직 {self.hires}명 채용 착수 → {arrival} 합류 후 온보딩")
+        used = np.nonzero(self.contractor_fte > 0)[0]
+        if len(used):
+            actions.append(
+                f"{self.weeks[used[0]]}~{self.weeks[used[-1]]} 외주 최대 "
+                f"{int(self.contractor_fte.max())} FTE 투입"
+            )
+        used = np.nonzero(self.reassign_fte > 1e-9)[0]
+        if len(used):
+            actions.append(
+                f"{self.weeks[used[0]]}~{self.weeks[used[-1]]} 내부 재배치 최대 "
+                f"{self.reassign_fte.max():.1f} FTE"
+            )
+        unmet = self.unmet_fte.sum()
+        if unmet > 1e-9:
+            actions.append(f"미충족 {unmet:.1f} FTE-주는 일정 조정/우선순위 재검토")
+        return actions
+
+    def to_schedule(self) -> dict[str, Any]:
+        """ImpactSimulatorAgent 대안 입력용 (JSON 호환)"""
+        return {
+            "weeks": self.weeks,
+            "gap_fte": self.gap_fte.round(3).tolist(),
+            "hires": self.hires,
+            "hire_start_week": None if self.hire_start is None else self.weeks[self.hire_start],
+            "hire_arrival_week": None if self.arrival is None else self.weeks[self.arrival],
+            "hire_fte": self.hire_fte.round(3).tolist(),
+            "contractor_fte": self.contractor_fte.round(3).tolist(),
+            "reassign_fte": self.reassign_fte.round(3).tolist(),
+            "unmet_fte": self.unmet_fte.round(3).tolist(),
+            "added_fte": self.added_fte.round(3).tolist(),
+            "costs": {key: round(value) for key, value in self.costs.items()},
+            "total_cost": round(self.total_cost),
+            "coverage_ratio": round(self.coverage_ratio, 4),
+        }
+
+
+class HeadcountPlanner:
+    """다기간 증원 계획 DP"""
+
+    def __init__(self, costs: PlanningCosts | None = None):
+        self.costs = costs or PlanningCosts()
+
+    def plan(
+        self,
+        gap_fte: Sequence[float],
+        weeks: Sequence[str] | None = None,
+        reassign_fte: float | Sequence[float] = 0.0,
+    ) -> list[HeadcountPlan]:
+        """
+        증원 일정 수립
+
+        Args:
+            gap_fte: 주차별 부족 FTE (수요 - 공급, 음수는 여유)
+            weeks: 주차 라벨 (미지정 시 W01부터)
+            reassign_fte: 주차별 재배치 가능 FTE 한도
+
+        Returns:
+            list[HeadcountPlan]: [채용 없음(CONSERVATIVE), 비용 최소(BALANCED),
+                채용 중심(AGGRESSIVE, 외주 없음)]
+        """
+        gap = np.asarray(gap_fte, dtype=float)
+        horizon = len(gap)
+        if not MIN_HORIZON_WEEKS <= horizon <= MAX_HORIZON_WEEKS:
+            raise ValueError(
+                f"계획 기간은 {MIN_HORIZON_WEEKS}~{MAX_HORIZON_WEEKS}주여야 합니다: {horizon}"
+            )
+        weeks = list(weeks) if weeks is not None else [f"W{i:02d}" for i in range(1, horizon + 1)]
+        if len(weeks) != horizon:
+            raise ValueError("weeks 길이가 gap_fte와 다릅니다")
+        reassign_cap = np.broadcast_to(np.asarray(reassign_fte, dtype=float), (horizon,))
+
+        starts, sizes, hire_fte = self._hire_cohorts(gap)
+        hire_cost = self._hire_costs(starts, sizes, horizon)
+        week_cost = self._week_costs(gap[None, :] - hire_fte, reassign_cap)
+        value, policy = self._contract_dp(week_cost)
+        total = hire_cost + value
+
+        # 외주 없이 채용 + 재배치만 하는 경우 (상태 0 고정)
+        no_contract = hire_cost + week_cost[:, :, 0].sum(axis=1)
+        hiring = np.nonzero(sizes > 0)[0]
+
+        choices = [
+            ("CONSERVATIVE", "증원 없이 외주·재배치 대응", 0, True),
+            ("BALANCED", "비용 최소 혼합 계획", int(np.argmin(total)), True),
+        ]
+        if len(hiring):
+            choices.append(
+                (
+                    "AGGRESSIVE",
+                    "정규직 채용 중심",
+                    int(hiring[np.argmin(no_contract[hiring])]),
+                    False,
+                )
+            )
+
+        plans = []
+        for option_type, name, p, contractors in choices:
+            contractor = self._trace(policy, p) if contractors else np.zeros(horizon)
+            plans.append(
+                self._build_plan(
+                    option_type,
+                    name,
+                    weeks,
+                    gap,
+                    reassign_cap,
+                    int(sizes[p]),
+                    int(starts[p]) if sizes[p] else None,
+                    hire_fte[p],
+                    contractor,
+                )
+            )
+        return plans
+
+    def _hire_cohorts(self, gap: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """채용 코호트 후보 (착수 주차, 인원, 주차별 실효 FTE). 0번은 채용 없음"""
+        c = self.costs
+        horizon = len(gap)
+        max_hires = c.max_hires
+        if max_hires is None:
+            max_hires = max(0, math.ceil(gap.max(initial=0.0)))
+        last_start = horizon - c.hire_lead_weeks  # 이후 착수는 기간 내 합류 불가
+        start_grid, size_grid = np.meshgrid(
+            np.arange(max(last_start, 0)), np.arange(1, max_hires + 1), indexing="ij"
+        )
+        starts = np.concatenate([[0], start_grid.ravel()])
+        sizes = np.concatenate([[0], size_grid.ravel()])
+
+        # 합류 후 경과 주차 a에서 생산성 min(1, (a + 1) / ramp)
+        age = np.arange(horizon)[None, :] - (starts[:, None] + c.hire_lead_weeks)
+        ramp = np.clip((age + 1) / max(c.ramp_weeks, 1), 0.0, 1.0)
+        return starts, sizes, sizes[:, None] * np.where(age >= 0, ramp, 0.0)
+
+    def _hire_costs(self, starts: np.ndarray, sizes: np.ndarray, horizon: int) -> np.ndarray:
+        c = self.costs
+        paid_weeks = np.clip(horizon - (starts + c.hire_lead_weeks), 0, None)
+        return sizes * (c.hire_fee + c.hire_weekly * paid_weeks)
+
+    def _week_costs(self, residual: np.ndarray, reassign_cap: np.ndarray) -> np.ndarray:
+        """(코호트, 주차, 외주 FTE)별 주간 비용: 외주 + 재배치 + 미충족"""
+        c = self.costs
+        contractors = np.arange(c.max_contractors + 1)
+        remaining = np.clip(residual[:, :, None] - contractors, 0.0, None)
+        reassigned = np.minimum(remaining, reassign_cap[None, :, None])
+        cost = (
+            c.contractor_weekly * contractors
+            + c.reassign_weekly * reassigned
+            + c.shortfall_weekly * (remaining - reassigned)
+        )
+        # 계약 리드타임 전에는 외주 투입 불가
+        cost[:, : c.contractor_lead_weeks, 1:] = np.inf
+        return cost
+
+    def _contract_dp(self, week_cost: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        외주 인원 상태 역방향 DP
+
+        V[t, c] = min_c' (온보딩 × max(c' - c, 0) + 주간 비용[t, c'] + V[t+1, c'])
+
+        Returns:
+            tuple: (코호트별 최소 비용 (시작 외주 0명), 정책 [주차, 코호트, 이전 외주] → 외주)
+        """
+        n_plans, horizon, n_states = week_cost.shape
+        levels = np.arange(n_states)
+        switch = self.costs.contractor_onboarding * np.clip(
+            levels[None, :] - levels[:, None], 0, None
+        )
+
+        value = np.zeros((n_plans, n_states))
+        policy = np.zeros((horizon, n_plans, n_states), dtype=np.int16)
+        for t in range(horizon - 1, -1, -1):
+            total = switch[None, :, :] + (week_cost[:, t, :] + value)[:, None, :]
+            policy[t] = total.argmin(axis=2)
+            value = np.take_along_axis(total, policy[t][:, :, None].astype(np.intp), axis=2)[
+                :, :, 0
+            ]
+        return value[:, 0], policy
+
+    @staticmethod
+    def _trace(policy: np.ndarray, plan_index: int) -> np.ndarray:
+        """정책을 따라 주차별 외주 인원 복원"""
+        contractors = np.zeros(policy.shape[0])
+        state = 0
+        for t in range(policy.shape[0]):
+            state = int(policy[t, plan_index, state])
+            contractors[t] = state
+        return contractors
+
+    def _build_plan(
+        self,
+        option_type: str,
+        name: str,
+        weeks: list[str],
+        gap: np.ndarray,
+        reassign_cap: np.ndarray,
+        hires: int,
+        hire_start: int | None,
+        hire_fte: np.ndarray,
+        contractor: np.ndarray,
+    ) -> HeadcountPlan:
+        c = self.costs
+        remaining = np.clip(gap - hire_fte - contractor, 0.0, None)
+        reassign = np.minimum(remaining, reassign_cap)
+        unmet = remaining - reassign
+        onboarded = np.clip(np.diff(contractor, prepend=0.0), 0, None).sum()
+        salary = hires * c.hire_weekly * (len(gap) - hire_start - c.hire_lead_weeks) if hires else 0
+        return HeadcountPlan(
+            option_type=option_type,
+            name=name,
+            weeks=weeks,
+            gap_fte=gap,
+            hires=hires,
+            hire_start=hire_start,
+            hire_lead_weeks=c.hire_lead_weeks,
+            hire_fte=hire_fte,
+            contractor_fte=contractor,
+            reassign_fte=reassign,
+            unmet_fte=unmet,
+            costs={
+                "hiring": float(hires * c.hire_fee),
+                "salary": float(salary),
+                "contractor": float(
+                    c.contractor_weekly * contractor.sum() + c.contractor_onboarding * onboarded
+                ),
+                "reassign": float(c.reassign_weekly * reassign.sum()),
+                "shortfall": float(c.shortfall_weekly * unmet.sum()),
+            },
+        )
@@ -3,14 +3,29 @@ HR DSS - Impact Simulator Agent
 
 대안별 영향도를 시뮬레이션하는 에이전트
 As-Is vs To-Be 비교 분석
+(samples > 0이면 baseline 불확실성을 Monte Carlo로 반영해 신뢰구간 산출)
 """
 
 import logging
-from dataclasses import dataclass, field
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+
+from backend.agent_runtime.agents.monte_carlo import (
+    Distribution,
+    MonteCarloSummary,
+    percentiles,
+    sample_inputs,
+)
+from backend.agent_runtime.agents.sensitivity import SweepPlan, SweepResult
+from backend.agent_runtime.agents.simulation_cache import SimulationCache, fingerprint
+from backend.agent_runtime.state import from_jsonable, to_jsonable
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +42,11 @@ class MetricType(Enum):
     QUALITY = "QUALITY"
 
 
+# 증가가 개선인 지표 / 감소가 개선인 지표 (나머지는 방향 중립)
+POSITIVE_METRICS = {MetricType.REVENUE, MetricType.MARGIN, MetricType.QUALITY}
+NEGATIVE_METRICS = {MetricType.COST, MetricType.RISK, MetricType.TIME}
+
+
 @dataclass
 class MetricValue:
     """지표 값"""
@@ -46,28 +66,101 @@ class MetricValue:
             self.change_percent = 100 if self.to_be_value > 0 else 0
 
         # 지표별 방향 결정
-        positive_metrics = {MetricType.REVENUE, MetricType.MARGIN, MetricType.QUALITY}
-        negative_metrics = {MetricType.COST, MetricType.RISK, MetricType.TIME}
-
         if self.change_percent > 0:
-            if self.metric_type in positive_metrics:
+            if self.metric_type in POSITIVE_METRICS:
                 self.change_direction = "POSITIVE"
-            elif self.metric_type in negative_metrics:
+            elif self.metric_type in NEGATIVE_METRICS:
                 self.change_direction = "NEGATIVE"
         elif self.change_percent < 0:
-            if self.metric_type in positive_metrics:
+            if self.metric_type in POSITIVE_METRICS:
                 self.change_direction = "NEGATIVE"
-            elif self.metric_type in negative_metrics:
+            elif self.metric_type in NEGATIVE_METRICS:
                 self.change_direction = "POSITIVE"
 
 
 @dataclass
-class TimeSeriesPoint:
-    """시계열 데이터 포인트"""
+class MetricEstimate:
+    """지표 모델 출력 (as_is/to_be는 스칼라 또는 샘플별 NumPy 배열)"""
 
-    period: str
-    as_is_value: float
-    to_be_value: float
+    metric_type: MetricType
+    name: str
+    unit: str
+    as_is: Any
+    to_be: Any
+
+    def to_metric(self) -> MetricValue:
+        return MetricValue(
+            metric_type=self.metric_type,
+            name=self.name,
+            as_is_value=_scalar(self.as_is),
+            to_be_value=_scalar(self.to_be),
+            unit=self.unit,
+        )
+
+
+def _scalar(value: Any) -> Any:
+    """NumPy 스칼라 → Python 스칼라 (직렬화용)"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _change_percent(as_is: Any, to_be: Any) -> np.ndarray:
+    """MetricValue.change_percent의 배열 버전"""
+    as_is = np.asarray(as_is, dtype=float)
+    to_be = np.asarray(to_be, dtype=float)
+    nonzero = as_is != 0
+    change = (to_be - as_is) / np.where(nonzero, as_is, 1.0) * 100
+    return np.where(nonzero, change, np.where(to_be > 0, 100.0, 0.0))
+
+
+@lru_cache(maxsize=64)
+def _progress_curve(option_type: str, weeks: int) -> np.ndarray:
+    """옵션 유형별 주차별 진행률 (0-1, 읽기 전용 배열을 대안 간 공유)"""
+    week = np.arange(1, weeks + 1, dtype=float)
+    if option_type == "CONSERVATIVE":
+        # 느린 변화
+        progress = (week / weeks) ** 0.5
+    elif option_type == "AGGRESSIVE":
+        # 늦게 시작해서 급격히 변화
+        progress = np.maximum(0, (week - weeks * 0.5) / (weeks * 0.5)) ** 2
+    else:
+        # 선형 변화
+        progress = week / weeks
+    progress.flags.writeable = False
+    return progress
+
+
+@lru_cache(maxsize=64)
+def _period_labels(weeks: int) -> tuple[str, ...]:
+    return tuple(f"W{week:02d}" for week in range(1, weeks + 1))
+
+
+@dataclass
+class TimeSeries:
+    """주간 시계열 (W01부터의 주차 인덱스 + As-Is/To-Be 배열)"""
+
+    as_is: np.ndarray
+    to_be: np.ndarray
+
+    def __post_init__(self):
+        # 저장소에서 복원한 리스트 → 배열
+        self.as_is = np.asarray(self.as_is, dtype=float)
+        self.to_be = np.asarray(self.to_be, dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.to_be)
+
+    @property
+    def periods(self) -> tuple[str, ...]:
+        return _period_labels(len(self))
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """API 응답 형식 [{"period", "as_is", "to_be"}, ...]으로 변환"""
+        return [
+            {"period": period, "as_is": as_is, "to_be": to_be}
+            for period, as_is, to_be in zip(
+                self.periods, self.as_is.tolist(), self.to_be.tolist(), strict=True
+            )
+        ]
 
 
 @dataclass
@@ -77,11 +170,12 @@ class ImpactAnalysis:
     option_id: str
     option_name: str
     metrics: list[MetricValue]
-    time_series: dict[str, list[TimeSeriesPoint]] = field(default_factory=dict)
+    time_series: dict[str, TimeSeries] = field(default_factory=dict)
     overall_impact_score: float = 0.0
     confidence_interval: tuple[float, float] = (0.0, 0.0)
     assumptions: list[str] = field(default_factory=list)
     risks: list[str] = field(default_factory=list)
+    monte_carlo: MonteCarloSummary | None = None
 
 
 @dataclass
@@ -94,6 +188,7 @@ class ScenarioComparison:
     comparison_summary: dict[str, Any]
     best_option_id: str
     best_option_reason: str
+    # 계산 시각 (캐시에서 반환한 결과도 처음 계산한 시각 유지)
     simulated_at: datetime = field(default_factory=datetime.now)
 
 
@@ -111,12 +206,43 @@ class ImpactSimulatorAgent:
         MetricType.QUALITY: 0.05,
     }
 
-    def __init__(self, kg_client: Any = None):
+    # 질문 유형별 지표 모델 입력과 기본값 (스윕 가능한 파라미터)
+    BASELINE_DEFAULTS: dict[str, dict[str, float]] = {
+        "CAPACITY": {"utilization": 0.85, "cost": 100000000, "risk": 0.3},
+        "GO_NOGO": {"deal_value": 500000000, "utilization": 0.8, "margin": 0.15, "risk": 0.2},
+        "HEADCOUNT": {
+            "headcount": 10,
+            "requested_headcount": 2,
+            "utilization": 0.9,
+            "cost": 500000000,
+        },
+        "COMPETENCY_GAP": {"coverage": 0.6},
+        "GENERIC": {"quality": 70},
+    }
+
+    # 지표 모델이 읽는 대안 필드 (캐시 키에 포함)
+    OPTION_FIELDS = ("option_id", "name", "option_type", "prerequisites", "trade_offs", "schedule")
+    # 지표 모델/점수 계산 변경 시 올려서 공유 캐시를 무효화
+    MODEL_VERSION = 2
+
+    def __init__(
+        self,
+        kg_client: Any = None,
+        mc_samples: int = 0,
+        mc_seed: int | None = None,
+        cache: SimulationCache | None = None,
+    ):
         """
         Args:
             kg_client: Knowledge Graph 클라이언트
+            mc_samples: 기본 Monte Carlo 샘플 수 (0이면 고정 불확실성 계수 사용)
+            mc_seed: Monte Carlo 난수 시드 (None이면 매번 다른 결과)
+            cache: 시뮬레이션 결과 캐시 (미지정 시 매번 계산)
         """
         self.kg_client = kg_client
+        self.mc_samples = mc_samples
+        self.mc_seed = mc_seed
+        self.cache = cache
 
     def simulate(
         self,
@@ -124,6 +250,9 @@ class ImpactSimulatorAgent:
         options: list[dict],
         baseline: dict[str, Any],
         horizon_weeks: int = 12,
+        samples: int | None = None,
+        distributions: Mapping[str, Distribution | Mapping[str, Any]] | None = None,
+        seed: int | None = None,
     ) -> ScenarioComparison:
         """
         대안별 영향도 시뮬레이션
@@ -133,16 +262,93 @@ class ImpactSimulatorAgent:
             options: 대안 목록
             baseline: 현재 상태 (As-Is)
             horizon_weeks: 시뮬레이션 기간 (주)
+            samples: Monte Carlo 샘플 수 (None이면 mc_samples, 0이면 점추정만)
+            distributions: baseline 입력값별 분포 (기본 불확실성을 덮어씀)
+            seed: 난수 시드 (None이면 mc_seed)
 
         Returns:
-            ScenarioComparison: 비교 분석 결과
+            ScenarioComparison: 비교 분석 결과 (캐시 적중 시 simulated_at은 원래 계산 시각)
+        """
+        samples = self.mc_samples if samples is None else samples
+        seed = self.mc_seed if seed is None else seed
+        # 시드 없는 Monte Carlo는 결정적이지 않으므로 캐시하지 않음
+        if self.cache is None or (samples > 0 and seed is None):
+            return self._simulate(
+                query_type, options, baseline, horizon_weeks, samples, distributions, seed
+            )
+
+        key = self._cache_key(
+            query_type, options, baseline, horizon_weeks, samples, distributions, seed
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            comparison = from_jsonable(ScenarioComparison, cached)
+            comparison.baseline = baseline
+            return comparison
+
+        comparison = self._simulate(
+            query_type, options, baseline, horizon_weeks, samples, distributions, seed
+        )
+        # baseline 원본(KG 조회 결과 등)은 키에 쓰인 값만 의미가 있으므로 저장하지 않음
+        self.cache.put(key, to_jsonable(replace(comparison, baseline={})))
+        return comparison
+
+    def _cache_key(
+        self,
+        query_type: str,
+        options: list[dict],
+        baseline: dict[str, Any],
+        horizon_weeks: int,
+        samples: int,
+        distributions: Mapping[str, Distribution | Mapping[str, Any]] | None,
+        seed: int | None,
+    ) -> str:
+        """
+        정규화된 입력의 지문
+
+        결과에 영향을 주는 값만 사용: 대안의 OPTION_FIELDS, 기본값을 반영한 숫자 입력값,
+        Monte Carlo 설정 (samples > 0일 때만)
         """
+        inputs = {
+            key: float(value)
+            for key, value in self._resolve_inputs(query_type, baseline).items()
+            if isinstance(value, int | float) and not isinstance(value, bool)
+        }
+        return fingerprint(
+            self.MODEL_VERSION,
+            query_type,
+            [{key: option.get(key) for key in self.OPTION_FIELDS} for option in options],
+            inputs,
+            horizon_weeks,
+            [samples, distributions, seed] if samples > 0 else None,
+        )
+
+    def _simulate(
+        self,
+        query_type: str,
+        options: list[dict],
+        baseline: dict[str, Any],
+        horizon_weeks: int,
+        samples: int,
+        distributions: Mapping[str, Distribution | Mapping[str, Any]] | None,
+        seed: int | None,
+    ) -> ScenarioComparison:
+        """시뮬레이션 실행 (캐시 미사용)"""
         analyses = []
 
         for option in options:
             analysis = self._simulate_option(query_type, option, baseline, horizon_weeks)
             analyses.append(analysis)
 
+        # 불확실성 반영: 실제 샘플 백분위로 신뢰구간 교체
+        if samples > 0 and analyses:
+            summaries = self._run_monte_carlo(
+                query_type, options, baseline, horizon_weeks, samples, distributions, seed
+            )
+            for analysis, summary in zip(analyses, summaries, strict=True):
+                analysis.monte_carlo = summary
+                analysis.confidence_interval = summary.interval
+
         # 최적 옵션 결정
         best_option_id, best_reason = self._determine_best_option(analyses)
 
@@ -158,6 +364,56 @@ class ImpactSimulatorAgent:
             best_option_reason=best_reason,
         )
 
+    def sweep(
+        self,
+        query_type: str,
+        options: list[dict],
+        baseline: dict[str, Any],
+        ranges: Mapping[str, Sequence[float] | Mapping[str, Any]],
+        horizon_weeks: int = 12,
+        max_points: int = 100_000,
+    ) -> SweepResult:
+        """
+        baseline 파라미터 범위 스윕 (민감도 분석)
+
+        그리드 전체, 토네이도, 손익분기점 지점을 하나의 입력 배열로 묶어
+        대안별로 지표 모델을 한 번씩만 평가
+
+        Args:
+            query_type: 질문 유형
+            options: 대안 목록
+            baseline: 현재 상태 (As-Is)
+            ranges: 파라미터별 값 목록 또는 {"low", "high", "steps"}
+            horizon_weeks: 시뮬레이션 기간 (주)
+            max_points: 최대 그리드 지점 수 (초과 시 ValueError)
+
+        Returns:
+            SweepResult: 그리드 점수, 토네이도, 손익분기점
+
+        Raises:
+            ValueError: 질문 유형의 지표 모델이 읽지 않는 파라미터 (변화폭이 항상 0이 됨)
+        """
+        supported = self.BASELINE_DEFAULTS.get(query_type, self.BASELINE_DEFAULTS["GENERIC"])
+        unsupported = sorted(set(ranges) - set(supported))
+        if unsupported:
+            raise ValueError(
+                f"{query_type} 지표 모델이 사용하지 않는 파라미터: {unsupported} "
+                f"(스윕 가능: {list(supported)})"
+            )
+        inputs = self._resolve_inputs(query_type, baseline)
+        plan = SweepPlan.build(inputs, ranges, max_points)
+
+        scores = np.empty((len(options), plan.size))
+        for i, option in enumerate(options):
+            option_type = option.get("option_type", "BALANCED")
+            estimates, _ = self._metric_model(
+                query_type, option_type, plan.inputs, horizon_weeks, option.get("schedule")
+            )
+            scores[i] = self._score_samples(estimates, plan.size)
+
+        option_ids = [option.get("option_id", "UNKNOWN") for option in options]
+        return plan.result(query_type, option_ids, scores)
+
     def _simulate_option(
         self, query_type: str, option: dict, baseline: dict[str, Any], horizon_weeks: int
     ) -> ImpactAnalysis:
@@ -168,19 +424,21 @@ class ImpactSimulatorAgent:
         option_type = option.get("option_type", "BALANCED")
 
         # 기본 지표 계산
-        metrics = []
-        time_series = {}
+        inputs = self._resolve_inputs(query_type, baseline)
+        schedule = option.get("schedule")
+        estimates, series = self._metric_model(
+            query_type, option_type, inputs, horizon_weeks, schedule
+        )
+        metrics = [estimate.to_metric() for estimate in estimates]
 
-        if query_type == "CAPACITY":
-            metrics, time_series = self._simulate_capacity_impact(option, baseline, horizon_weeks)
-        elif query_type == "GO_NOGO":
-            metrics, time_series = self._simulate_gonogo_impact(option, baseline, horizon_weeks)
-        elif query_type == "HEADCOUNT":
-            metrics, time_series = self._simulate_headcount_impact(option, baseline, horizon_weeks)
-        elif query_type == "COMPETENCY_GAP":
-            metrics, time_series = self._simulate_competency_impact(option, baseline, horizon_weeks)
-        else:
-            metrics = self._simulate_generic_impact(option, baseline)
+        time_series = {}
+        if query_type == "HEADCOUNT" and schedule:
+            time_series = self._schedule_time_series(inputs, schedule)
+        elif series is not None:
+            key, start, end = series
+            time_series[key] = self._generate_time_series(
+                _scalar(start), _scalar(end), horizon_weeks, option_type
+            )
 
         # 종합 점수 계산
         overall_score = self._calculate_overall_score(metrics)
@@ -203,16 +461,46 @@ class ImpactSimulatorAgent:
             risks=risks,
         )
 
-    def _simulate_capacity_impact(
-        self, option: dict, baseline: dict[str, Any], horizon_weeks: int
-    ) -> tuple[list[MetricValue], dict]:
-        """Capacity 영향도 시뮬레이션"""
+    def _resolve_inputs(self, query_type: str, baseline: dict[str, Any]) -> dict[str, Any]:
+        """baseline에 질문 유형별 기본값 반영"""
+        defaults = self.BASELINE_DEFAULTS.get(query_type, self.BASELINE_DEFAULTS["GENERIC"])
+        return {**defaults, **baseline}
 
-        as_is_util = baseline.get("utilization", 0.85)
-        _as_is_headcount = baseline.get("headcount", 10)  # 향후 확장용
-        _gap_fte = baseline.get("gap_fte", 2)  # 향후 확장용
+    def _metric_model(
+        self,
+        query_type: str,
+        option_type: str,
+        inputs: Mapping[str, Any],
+        horizon_weeks: int,
+        schedule: Mapping[str, Any] | None = None,
+    ) -> tuple[list[MetricEstimate], tuple[str, Any, Any] | None]:
+        """
+        질문 유형별 지표 모델
 
-        option_type = option.get("option_type", "BALANCED")
+        inputs 값이 스칼라면 점추정, NumPy 배열이면 샘플별 값을 한 번에 계산
+        schedule이 있는 증원 대안은 유형별 계수 대신 주차별 일정(HeadcountPlanner)으로 계산
+
+        Returns:
+            tuple: (지표 추정 목록, 시계열 (키, 시작값, 종료값) 또는 None)
+        """
+        if query_type == "CAPACITY":
+            return self._capacity_model(option_type, inputs)
+        if query_type == "GO_NOGO":
+            return self._gonogo_model(option_type, inputs, horizon_weeks)
+        if query_type == "HEADCOUNT":
+            if schedule:
+                return self._headcount_schedule_model(inputs, schedule)
+            return self._headcount_model(option_type, inputs)
+        if query_type == "COMPETENCY_GAP":
+            return self._competency_model(option_type, inputs)
+        return self._generic_model(inputs), None
+
+    def _capacity_model(
+        self, option_type: str, inputs: Mapping[str, Any]
+    ) -> tuple[list[MetricEstimate], tuple[str, Any, Any]]:
+        """Capacity 영향도 모델"""
+
+        as_is_util = inputs["utilization"]
 
         # 옵션별 To-Be 계산
         if option_type == "CONSERVATIVE":
@@ -232,48 +520,29 @@ class ImpactSimulatorAgent:
             to_be_risk = 0.35
 
         metrics = [
-            MetricValue(
-                metric_type=MetricType.UTILIZATION,
-                name="가동률",
-                as_is_value=as_is_util * 100,
-                to_be_value=to_be_util * 100,
-                unit="%",
-            ),
-            MetricValue(
-                metric_type=MetricType.COST,
-                name="비용",
-                as_is_value=baseline.get("cost", 100000000),
-                to_be_value=baseline.get("cost", 100000000) * to_be_cost_factor,
-                unit="원",
+            MetricEstimate(
+                MetricType.UTILIZATION, "가동률", "%", as_is_util * 100, to_be_util * 100
             ),
-            MetricValue(
-                metric_type=MetricType.RISK,
-                name="리스크",
-                as_is_value=baseline.get("risk", 0.3) * 100,
-                to_be_value=to_be_risk * 100,
-                unit="%",
+            MetricEstimate(
+                MetricType.COST,
+                "비용",
+                "원",
+                inputs["cost"],
+                inputs["cost"] * to_be_cost_factor,
             ),
+            MetricEstimate(MetricType.RISK, "리스크", "%", inputs["risk"] * 100, to_be_risk * 100),
         ]
 
-        # 시계열 데이터 생성
-        time_series = {
-            "utilization": self._generate_time_series(
-                as_is_util * 100, to_be_util * 100, horizon_weeks, option_type
-            )
-        }
-
-        return metrics, time_series
+        return metrics, ("utilization", as_is_util * 100, to_be_util * 100)
 
-    def _simulate_gonogo_impact(
-        self, option: dict, baseline: dict[str, Any], horizon_weeks: int
-    ) -> tuple[list[MetricValue], dict]:
-        """Go/No-go 영향도 시뮬레이션"""
+    def _gonogo_model(
+        self, option_type: str, inputs: Mapping[str, Any], horizon_weeks: int
+    ) -> tuple[list[MetricEstimate], tuple[str, Any, Any]]:
+        """Go/No-go 영향도 모델"""
 
-        deal_value = baseline.get("deal_value", 500000000)
-        current_util = baseline.get("utilization", 0.8)
-        current_margin = baseline.get("margin", 0.15)
-
-        option_type = option.get("option_type", "BALANCED")
+        deal_value = inputs["deal_value"]
+        current_util = inputs["utilization"]
+        current_margin = inputs["margin"]
 
         if option_type == "CONSERVATIVE":  # No-Go
             to_be_revenue = 0
@@ -283,64 +552,36 @@ class ImpactSimulatorAgent:
         elif option_type == "AGGRESSIVE":  # Full Go
             to_be_revenue = deal_value
             to_be_margin = current_margin * 0.9  # 마진 약간 감소
-            to_be_util = min(current_util + 0.15, 1.0)
+            to_be_util = np.minimum(current_util + 0.15, 1.0)
             to_be_risk = 0.6
         else:  # Conditional Go
             to_be_revenue = deal_value * 0.8
             to_be_margin = current_margin * 0.95
-            to_be_util = min(current_util + 0.10, 0.95)
+            to_be_util = np.minimum(current_util + 0.10, 0.95)
             to_be_risk = 0.35
 
         metrics = [
-            MetricValue(
-                metric_type=MetricType.REVENUE,
-                name="매출",
-                as_is_value=0,
-                to_be_value=to_be_revenue,
-                unit="원",
+            MetricEstimate(MetricType.REVENUE, "매출", "원", 0, to_be_revenue),
+            MetricEstimate(
+                MetricType.MARGIN, "마진율", "%", current_margin * 100, to_be_margin * 100
             ),
-            MetricValue(
-                metric_type=MetricType.MARGIN,
-                name="마진율",
-                as_is_value=current_margin * 100,
-                to_be_value=to_be_margin * 100,
-                unit="%",
-            ),
-            MetricValue(
-                metric_type=MetricType.UTILIZATION,
-                name="가동률",
-                as_is_value=current_util * 100,
-                to_be_value=to_be_util * 100,
-                unit="%",
-            ),
-            MetricValue(
-                metric_type=MetricType.RISK,
-                name="리스크",
-                as_is_value=baseline.get("risk", 0.2) * 100,
-                to_be_value=to_be_risk * 100,
-                unit="%",
+            MetricEstimate(
+                MetricType.UTILIZATION, "가동률", "%", current_util * 100, to_be_util * 100
             ),
+            MetricEstimate(MetricType.RISK, "리스크", "%", inputs["risk"] * 100, to_be_risk * 100),
         ]
 
-        time_series = {
-            "revenue": self._generate_time_series(
-                0, to_be_revenue / horizon_weeks, horizon_weeks, option_type
-            )
-        }
-
-        return metrics, time_series
-
-    def _simulate_headcount_impact(
-        self, option: dict, baseline: dict[str, Any], horizon_weeks: int
-    ) -> tuple[list[MetricValue], dict]:
-        """증원 영향도 시뮬레이션"""
+        return metrics, ("revenue", 0, to_be_revenue / horizon_weeks)
 
-        current_hc = baseline.get("headcount", 10)
-        requested_hc = baseline.get("requested_headcount", 2)
-        current_util = baseline.get("utilization", 0.9)
-        current_cost = baseline.get("cost", 500000000)
+    def _headcount_model(
+        self, option_type: str, inputs: Mapping[str, Any]
+    ) -> tuple[list[MetricEstimate], tuple[str, Any, Any]]:
+        """증원 영향도 모델"""
 
-        option_type = option.get("option_type", "BALANCED")
+        current_hc = inputs["headcount"]
+        requested_hc = inputs["requested_headcount"]
+        current_util = inputs["utilization"]
+        current_cost = inputs["cost"]
 
         if option_type == "CONSERVATIVE":  # 불승인
             to_be_hc = current_hc
@@ -356,136 +597,191 @@ class ImpactSimulatorAgent:
             to_be_cost = current_cost * 1.2
 
         metrics = [
-            MetricValue(
-                metric_type=MetricType.HEADCOUNT,
-                name="인원",
-                as_is_value=current_hc,
-                to_be_value=to_be_hc,
-                unit="명",
+            MetricEstimate(MetricType.HEADCOUNT, "인원", "명", current_hc, to_be_hc),
+            MetricEstimate(
+                MetricType.UTILIZATION, "가동률", "%", current_util * 100, to_be_util * 100
             ),
-            MetricValue(
-                metric_type=MetricType.UTILIZATION,
-                name="가동률",
-                as_is_value=current_util * 100,
-                to_be_value=to_be_util * 100,
-                unit="%",
-            ),
-            MetricValue(
-                metric_type=MetricType.COST,
-                name="인건비",
-                as_is_value=current_cost,
-                to_be_value=to_be_cost,
-                unit="원",
+            MetricEstimate(MetricType.COST, "인건비", "원", current_cost, to_be_cost),
+        ]
+
+        return metrics, ("headcount", current_hc, to_be_hc)
+
+    def _headcount_schedule_model(
+        self, inputs: Mapping[str, Any], schedule: Mapping[str, Any]
+    ) -> tuple[list[MetricEstimate], tuple[str, Any, Any]]:
+        """
+        주차별 증원 일정 영향도 모델
+
+        가동률: 현재 부하를 (현재 인원 + 기간 평균 추가 투입 FTE)로 나눔
+        인건비: 현재 인건비 + 일정 총비용 (채용/외주/재배치/미충족)
+        """
+        current_hc = inputs["headcount"]
+        current_util = inputs["utilization"]
+        current_cost = inputs["cost"]
+
+        to_be_hc = current_hc + schedule["hires"]
+        added = float(np.mean(schedule["added_fte"]))
+        to_be_util = current_util * current_hc / (current_hc + added)
+        to_be_cost = current_cost + schedule["total_cost"]
+
+        metrics = [
+            MetricEstimate(MetricType.HEADCOUNT, "인원", "명", current_hc, to_be_hc),
+            MetricEstimate(
+                MetricType.UTILIZATION, "가동률", "%", current_util * 100, to_be_util * 100
             ),
+            MetricEstimate(MetricType.COST, "인건비", "원", current_cost, to_be_cost),
         ]
 
-        time_series = {
-            "headcount": self._generate_time_series(
-                current_hc, to_be_hc, horizon_weeks, option_type
+        return metrics, ("headcount", current_hc, to_be_hc)
+
+    def _schedule_time_series(
+        self, inputs: Mapping[str, Any], schedule: Mapping[str, Any]
+    ) -> dict[str, TimeSeries]:
+        """일정의 주차별 투입 FTE로 가동률 시계열 계산 (진행 곡선 대신 실제 일정)"""
+        current_hc = _scalar(inputs["headcount"])
+        current_util = _scalar(inputs["utilization"])
+        added = np.asarray(schedule["added_fte"], dtype=float)
+        return {
+            "utilization": TimeSeries(
+                as_is=np.full(len(added), current_util * 100),
+                to_be=current_util * current_hc / (current_hc + added) * 100,
             )
         }
 
-        return metrics, time_series
-
-    def _simulate_competency_impact(
-        self, option: dict, baseline: dict[str, Any], horizon_weeks: int
-    ) -> tuple[list[MetricValue], dict]:
-        """역량 갭 영향도 시뮬레이션"""
+    def _competency_model(
+        self, option_type: str, inputs: Mapping[str, Any]
+    ) -> tuple[list[MetricEstimate], tuple[str, Any, Any]]:
+        """역량 갭 영향도 모델"""
 
-        current_gap = baseline.get("gap_count", 5)
-        current_coverage = baseline.get("coverage", 0.6)
-
-        option_type = option.get("option_type", "BALANCED")
+        current_coverage = inputs["coverage"]
 
         if option_type == "CONSERVATIVE":  # 내부 육성
-            _to_be_gap = current_gap * 0.7  # 향후 확장용
             to_be_coverage = current_coverage * 1.2
             to_be_cost = 20000000
             to_be_time = 52  # 주
         elif option_type == "AGGRESSIVE":  # 팀 빌딩
-            _to_be_gap = current_gap * 0.2  # 향후 확장용
             to_be_coverage = current_coverage * 1.8
             to_be_cost = 200000000
             to_be_time = 26
         else:  # 혼합
-            _to_be_gap = current_gap * 0.5  # 향후 확장용
             to_be_coverage = current_coverage * 1.4
             to_be_cost = 80000000
             to_be_time = 20
 
         metrics = [
-            MetricValue(
-                metric_type=MetricType.QUALITY,
-                name="역량 커버리지",
-                as_is_value=current_coverage * 100,
-                to_be_value=min(to_be_coverage * 100, 100),
-                unit="%",
-            ),
-            MetricValue(
-                metric_type=MetricType.COST,
-                name="투자 비용",
-                as_is_value=0,
-                to_be_value=to_be_cost,
-                unit="원",
-            ),
-            MetricValue(
-                metric_type=MetricType.TIME,
-                name="소요 기간",
-                as_is_value=0,
-                to_be_value=to_be_time,
-                unit="주",
+            MetricEstimate(
+                MetricType.QUALITY,
+                "역량 커버리지",
+                "%",
+                current_coverage * 100,
+                np.minimum(to_be_coverage * 100, 100),
             ),
+            MetricEstimate(MetricType.COST, "투자 비용", "원", 0, to_be_cost),
+            MetricEstimate(MetricType.TIME, "소요 기간", "주", 0, to_be_time),
         ]
 
-        time_series = {
-            "coverage": self._generate_time_series(
-                current_coverage * 100, to_be_coverage * 100, horizon_weeks, option_type
+        return metrics, ("coverage", current_coverage * 100, to_be_coverage * 100)
+
+    def _generic_model(self, inputs: Mapping[str, Any]) -> list[MetricEstimate]:
+        """일반 영향도 모델"""
+        quality = inputs["quality"]
+        return [MetricEstimate(MetricType.QUALITY, "품질", "점", quality, quality * 1.1)]
+
+    def _run_monte_carlo(
+        self,
+        query_type: str,
+        options: list[dict],
+        baseline: dict[str, Any],
+        horizon_weeks: int,
+        samples: int,
+        distributions: Mapping[str, Distribution | Mapping[str, Any]] | None,
+        seed: int | None,
+    ) -> list[MonteCarloSummary]:
+        """
+        Monte Carlo 시뮬레이션
+
+        모든 대안이 같은 입력 샘플을 공유하므로 대안 간 비교(prob_best)가 가능
+        """
+        inputs = self._resolve_inputs(query_type, baseline)
+        sampled = sample_inputs(inputs, samples, distributions, seed)
+
+        option_estimates = []
+        scores = np.empty((len(options), samples))
+        for i, option in enumerate(options):
+            option_type = option.get("option_type", "BALANCED")
+            estimates, _ = self._metric_model(
+                query_type, option_type, sampled, horizon_weeks, option.get("schedule")
             )
-        }
+            option_estimates.append(estimates)
+            scores[i] = self._score_samples(estimates, samples)
 
-        return metrics, time_series
+        best_share = np.bincount(scores.argmax(axis=0), minlength=len(options)) / samples
+        score_percentiles = percentiles(scores, axis=1)
 
-    def _simulate_generic_impact(self, option: dict, baseline: dict[str, Any]) -> list[MetricValue]:
-        """일반 영향도 시뮬레이션"""
         return [
-            MetricValue(
-                metric_type=MetricType.QUALITY,
-                name="품질",
-                as_is_value=baseline.get("quality", 70),
-                to_be_value=baseline.get("quality", 70) * 1.1,
-                unit="점",
-            ),
+            MonteCarloSummary(
+                samples=samples,
+                mean=float(scores[i].mean()),
+                std=float(scores[i].std()),
+                percentiles={key: float(values[i]) for key, values in score_percentiles.items()},
+                prob_improvement=float((scores[i] > 50).mean()),
+                prob_best=float(best_share[i]),
+                metrics={
+                    estimate.name: self._metric_sample_stats(estimate, samples)
+                    for estimate in estimates
+                },
+            )
+            for i, estimates in enumerate(option_estimates)
         ]
 
-    def _generate_time_series(
-        self, start_value: float, end_value: float, weeks: int, option_type: str
-    ) -> list[TimeSeriesPoint]:
-        """시계열 데이터 생성"""
-        points = []
-
-        for week in range(1, weeks + 1):
-            # 옵션 유형별 변화 패턴
-            if option_type == "CONSERVATIVE":
-                # 느린 변화
-                progress = (week / weeks) ** 0.5
-            elif option_type == "AGGRESSIVE":
-                # 늦게 시작해서 급격히 변화
-                progress = max(0, (week - weeks * 0.5) / (weeks * 0.5)) ** 2
-            else:
-                # 선형 변화
-                progress = week / weeks
+    def _score_samples(self, estimates: list[MetricEstimate], samples: int) -> np.ndarray:
+        """샘플별 종합 점수 (_calculate_overall_score의 배열 버전)"""
+        weighted = np.zeros(samples)
+        total_weight = 0.0
+
+        for estimate in estimates:
+            weight = self.METRIC_WEIGHTS.get(estimate.metric_type, 0.1)
+            total_weight += weight
+            weighted += self._metric_scores(estimate) * weight
 
-            to_be = start_value + (end_value - start_value) * progress
+        return weighted / total_weight if total_weight > 0 else np.full(samples, 50.0)
 
-            points.append(
-                TimeSeriesPoint(
-                    period=f"W{week:02d}",
-                    as_is_value=start_value,
-                    to_be_value=to_be,
-                )
-            )
+    @staticmethod
+    def _metric_scores(estimate: MetricEstimate) -> np.ndarray | float:
+        """지표 점수: 개선 방향이면 50 + |변화율|, 악화 방향이면 50 - |변화율| (0-100)"""
+        if estimate.metric_type in POSITIVE_METRICS:
+            polarity = 1.0
+        elif estimate.metric_type in NEGATIVE_METRICS:
+            polarity = -1.0
+        else:
+            return 50.0
+        return np.clip(50 + polarity * _change_percent(estimate.as_is, estimate.to_be), 0, 100)
+
+    @staticmethod
+    def _metric_sample_stats(estimate: MetricEstimate, samples: int) -> dict[str, float | None]:
+        """지표별 To-Be 백분위와 개선 확률 (방향 중립 지표는 None)"""
+        to_be = np.broadcast_to(np.asarray(estimate.to_be, dtype=float), (samples,))
+        stats: dict[str, float | None] = {
+            key: round(float(value), 4) for key, value in percentiles(to_be).items()
+        }
+        change = _change_percent(estimate.as_is, estimate.to_be)
+        if estimate.metric_type in POSITIVE_METRICS:
+            stats["prob_improvement"] = round(float(np.mean(change > 0)), 4)
+        elif estimate.metric_type in NEGATIVE_METRICS:
+            stats["prob_improvement"] = round(float(np.mean(change < 0)), 4)
+        else:
+            stats["prob_improvement"] = None
+        return stats
 
-        return points
+    def _generate_time_series(
+        self, start_value: float, end_value: float, weeks: int, option_type: str
+    ) -> TimeSeries:
+        """시계열 데이터 생성 (옵션 유형별 변화 패턴)"""
+        progress = _progress_curve(option_type, weeks)
+        return TimeSeries(
+            as_is=np.full(weeks, start_value, dtype=float),
+            to_be=start_value + (end_value - start_value) * progress,
+        )
 
     def _calculate_overall_score(self, metrics: list[MetricValue]) -> float:
         """종합 영향도 점수 계산 (0-100)"""
@@ -607,15 +903,10 @@ class ImpactSimulatorAgent:
                         }
                         for m in a.metrics
                     ],
-                    "time_series": {
-                        key: [
-                            {"period": p.period, "as_is": p.as_is_value, "to_be": p.to_be_value}
-                            for p in points
-                        ]
-                        for key, points in a.time_series.items()
-                    },
+                    "time_series": {key: series.to_list() for key, series in a.time_series.items()},
                     "overall_impact_score": round(a.overall_impact_score, 2),
                     "confidence_interval": a.confidence_interval,
+                    "monte_carlo": a.monte_carlo.to_dict() if a.monte_carlo else None,
                     "assumptions": a.assumptions,
                     "risks": a.risks,
                 }
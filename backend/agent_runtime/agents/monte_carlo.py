@@ -0,0 +1,188 @@
+"""
+HR DSS - Monte Carlo 샘플링
+
+baseline 입력값(가동률, 비용, 딜 금액, 마진, 리스크)의 불확실성을 분포로 표현하고
+N개 샘플을 NumPy 배열로 생성. 지표 계산은 ImpactSimulatorAgent의 지표 모델이
+스칼라 대신 배열을 받아 모든 샘플을 한 번에 평가
+"""
+
+import math
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# 요약 백분위 (하한, 중앙값, 상한 → 90% 구간)
+INTERVAL_PERCENTILES = (5.0, 50.0, 95.0)
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """입력값 분포 (kind별 params는 생성 classmethod 참고)"""
+
+    kind: str
+    params: tuple[float, ...]
+    low: float | None = None
+    high: float | None = None
+
+    @classmethod
+    def normal(
+        cls, mean: float, std: float, low: float | None = None, high: float | None = None
+    ) -> "Distribution":
+        return cls("normal", (mean, std), low, high)
+
+    @classmethod
+    def lognormal(
+        cls, median: float, sigma: float, low: float | None = None, high: float | None = None
+    ) -> "Distribution":
+        if median <= 0:
+            raise ValueError(f"lognormal median은 양수여야 합니다: {median}")
+        return cls("lognormal", (math.log(median), sigma), low, high)
+
+    @classmethod
+    def triangular(cls, left: float, mode: float, right: float) -> "Distribution":
+        if not left <= mode <= right:
+            raise ValueError(
+                f"triangular는 left <= mode <= right 이어야 합니다: {left, mode, right}"
+            )
+        if left == right:
+            return cls.fixed(mode)
+        return cls("triangular", (left, mode, right))
+
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "Distribution":
+        return cls("uniform", (low, high))
+
+    @classmethod
+    def fixed(cls, value: float) -> "Distribution":
+        return cls("fixed", (value,))
+
+    @classmethod
+    def from_dict(cls, spec: Mapping[str, Any]) -> "Distribution":
+        """
+        딕셔너리 명세에서 생성
+
+        예: {"kind": "normal", "mean": 0.85, "std": 0.05, "high": 1.0}
+        """
+        params = dict(spec)
+        kind = params.pop("kind", None)
+        if kind not in _KINDS:
+            raise ValueError(f"지원하지 않는 분포입니다: {kind} (지원: {', '.join(_KINDS)})")
+        try:
+            return getattr(cls, kind)(**params)
+        except TypeError as e:
+            raise ValueError(f"{kind} 분포 파라미터가 올바르지 않습니다: {e}") from e
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """size개 샘플 (low/high가 있으면 잘라냄)"""
+        if self.kind == "normal":
+            values = rng.normal(self.params[0], self.params[1], size)
+        elif self.kind == "lognormal":
+            values = rng.lognormal(self.params[0], self.params[1], size)
+        elif self.kind == "triangular":
+            values = rng.triangular(*self.params, size)
+        elif self.kind == "uniform":
+            values = rng.uniform(self.params[0], self.params[1], size)
+        else:
+            values = np.full(size, float(self.params[0]))
+        if self.low is not None or self.high is not None:
+            np.clip(values, self.low, self.high, out=values)
+        return values
+
+
+_KINDS = ("normal", "lognormal", "triangular", "uniform", "fixed")
+
+
+def _default_deal_value(value: float) -> Distribution:
+    if value <= 0:
+        return Distribution.fixed(value)
+    # 수주 금액은 하향 조정되는 경우가 많음
+    return Distribution.triangular(value * 0.6, value, value * 1.1)
+
+
+# 입력값별 기본 불확실성 (점추정값 → 분포)
+DEFAULT_UNCERTAINTY: dict[str, Callable[[float], Distribution]] = {
+    "utilization": lambda v: Distribution.normal(v, 0.05, low=0.0, high=1.5),
+    "cost": lambda v: Distribution.lognormal(v, 0.10) if v > 0 else Distribution.fixed(v),
+    "deal_value": _default_deal_value,
+    "margin": lambda v: Distribution.normal(v, abs(v) * 0.2, low=-1.0, high=1.0),
+    "risk": lambda v: Distribution.triangular(
+        min(v, max(0.0, v - 0.1)), v, max(v, min(1.0, v + 0.15))
+    ),
+}
+
+
+def default_distributions(inputs: Mapping[str, Any]) -> dict[str, Distribution]:
+    """입력값 중 숫자인 항목에 기본 불확실성 분포 적용"""
+    return {
+        key: build(float(inputs[key]))
+        for key, build in DEFAULT_UNCERTAINTY.items()
+        if isinstance(inputs.get(key), int | float) and not isinstance(inputs[key], bool)
+    }
+
+
+def sample_inputs(
+    inputs: Mapping[str, Any],
+    samples: int,
+    distributions: Mapping[str, Distribution | Mapping[str, Any]] | None = None,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """
+    입력값 샘플링
+
+    Args:
+        inputs: baseline 점추정값 (기본값 반영 완료)
+        samples: 샘플 수
+        distributions: 입력값별 분포 (기본 분포를 덮어씀, dict 명세 허용)
+        seed: 난수 시드 (같은 시드 → 같은 결과)
+
+    Returns:
+        dict[str, Any]: 분포가 있는 항목은 (samples,) 배열, 나머지는 원래 값
+    """
+    specs: dict[str, Distribution] = default_distributions(inputs)
+    for key, spec in (distributions or {}).items():
+        specs[key] = spec if isinstance(spec, Distribution) else Distribution.from_dict(spec)
+
+    rng = np.random.default_rng(seed)
+    sampled = dict(inputs)
+    for key in sorted(specs):
+        sampled[key] = specs[key].sample(rng, samples)
+    return sampled
+
+
+@dataclass
+class MonteCarloSummary:
+    """대안별 Monte Carlo 요약"""
+
+    samples: int
+    mean: float
+    std: float
+    percentiles: dict[str, float]
+    prob_improvement: float  # 종합 점수 > 50 (현상 유지보다 개선) 확률
+    prob_best: float  # 같은 샘플에서 대안 중 최고 점수일 확률 (동점이면 앞선 대안)
+    metrics: dict[str, dict[str, float | None]] = field(default_factory=dict)
+
+    @property
+    def interval(self) -> tuple[float, float]:
+        """INTERVAL_PERCENTILES 양 끝 백분위 구간 (딕셔너리 순서와 무관하게 키로 조회)"""
+        low = self.percentiles[f"p{INTERVAL_PERCENTILES[0]:g}"]
+        high = self.percentiles[f"p{INTERVAL_PERCENTILES[-1]:g}"]
+        return (round(low, 1), round(high, 1))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "mean": round(self.mean, 2),
+            "std": round(self.std, 2),
+            "percentiles": {key: round(value, 2) for key, value in self.percentiles.items()},
+            "prob_improvement": round(self.prob_improvement, 4),
+            "prob_best": round(self.prob_best, 4),
+            "metrics": self.metrics,
+        }
+
+
+def percentiles(values: np.ndarray, axis: int | None = None) -> dict[str, Any]:
+    """INTERVAL_PERCENTILES 백분위 (p5/p50/p95)"""
+    result = np.percentile(values, INTERVAL_PERCENTILES, axis=axis)
+    return {f"p{p:g}": value for p, value in zip(INTERVAL_PERCENTILES, result, strict=True)}
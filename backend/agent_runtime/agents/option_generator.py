@@ -6,13 +6,29 @@ HR DSS - Option Generator Agent
 """
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from backend.agent_runtime.agents.headcount_planner import HeadcountPlan, HeadcountPlanner
+from backend.agent_runtime.agents.option_ranking import (
+    OptionRanker,
+    OptionRanking,
+    WeightProfile,
+    resolve_profile,
+)
+from backend.agent_runtime.agents.reallocation import (
+    ReallocationOptimizer,
+    ReallocationPlan,
+    problem_from_context,
+)
+
 logger = logging.getLogger(__name__)
 
+# 보수적 대안에 개별 액션으로 나열할 재배치 건수 (나머지는 요약)
+MAX_REALLOCATION_ACTIONS = 10
+
 
 class OptionType(Enum):
     """대안 유형"""
@@ -51,6 +67,7 @@ class DecisionOption:
     prerequisites: list[str] = field(default_factory=list)
     trade_offs: list[str] = field(default_factory=list)
     scores: dict[str, float] = field(default_factory=dict)
+    schedule: dict[str, Any] | None = None  # 주차별 일정 (ImpactSimulatorAgent 입력)
 
 
 @dataclass
@@ -63,19 +80,30 @@ class OptionSet:
     recommendation: str
     recommendation_reason: str
     generated_at: datetime = field(default_factory=datetime.now)
+    ranking: dict[str, Any] | None = None  # 파레토 최적 여부/종합 점수 순위
 
 
 class OptionGeneratorAgent:
     """대안 생성 에이전트"""
 
-    def __init__(self, llm_client: Any = None, kg_client: Any = None):
+    def __init__(
+        self,
+        llm_client: Any = None,
+        kg_client: Any = None,
+        headcount_planner: HeadcountPlanner | None = None,
+        ranker: OptionRanker | None = None,
+    ):
         """
         Args:
             llm_client: LLM 클라이언트
             kg_client: Knowledge Graph 클라이언트
+            headcount_planner: 다기간 증원 계획기 (미지정 시 기본 비용 파라미터)
+            ranker: 대안 순위화 (미지정 시 balanced 가중치 프로필)
         """
         self.llm_client = llm_client
         self.kg_client = kg_client
+        self.headcount_planner = headcount_planner or HeadcountPlanner()
+        self.ranker = ranker or OptionRanker()
 
     def generate_options(
         self, query_type: str, context: dict[str, Any], constraints: dict[str, Any] | None = None
@@ -86,7 +114,7 @@ class OptionGeneratorAgent:
         Args:
             query_type: 질문 유형 (CAPACITY, GO_NOGO, HEADCOUNT, COMPETENCY_GAP)
             context: 분석 컨텍스트 (KG 쿼리 결과 등)
-            constraints: 제약조건
+            constraints: 제약조건 (weight_profile: 추천에 쓸 가중치 프로필 이름 또는 가중치)
 
         Returns:
             OptionSet: 3가지 대안 세트
@@ -109,9 +137,9 @@ class OptionGeneratorAgent:
     ) -> OptionSet:
         """Capacity 병목 해결 대안 생성"""
 
-        _bottleneck_weeks = context.get("bottleneck_weeks", [])  # 향후 확장용
         gap_fte = context.get("gap_fte", 0)
         _org_unit = context.get("org_unit", "대상 조직")  # 향후 확장용
+        reallocation = self._plan_reallocation(context)
 
         options = [
             DecisionOption(
@@ -198,9 +226,13 @@ class OptionGeneratorAgent:
                 },
             ),
         ]
+        if reallocation is not None:
+            self._apply_reallocation(options[0], reallocation)
 
         # 추천 결정
-        recommendation, reason = self._determine_recommendation(options, "CAPACITY")
+        recommendation, reason, ranking = self._determine_recommendation(
+            options, "CAPACITY", profile=self._weight_profile(constraints)
+        )
 
         return OptionSet(
             query_type="CAPACITY",
@@ -208,7 +240,50 @@ class OptionGeneratorAgent:
             options=options,
             recommendation=recommendation,
             recommendation_reason=reason,
+            ranking=ranking.to_dict(),
+        )
+
+    def _plan_reallocation(self, context: dict[str, Any]) -> ReallocationPlan | None:
+        """KG 조회 결과의 직원별 가용 FTE/역량과 주차별 부족분으로 재배치 계획 수립"""
+        staff, demand = problem_from_context(context)
+        if not staff or not demand:
+            return None
+        return ReallocationOptimizer().solve(staff, demand, context.get("org_unit_id"))
+
+    @staticmethod
+    def _apply_reallocation(option: DecisionOption, plan: ReallocationPlan) -> None:
+        """재배치 계획을 보수적 대안의 구체적 액션/리소스 배분으로 반영"""
+        shown = plan.reassignments[:MAX_REALLOCATION_ACTIONS]
+        actions = []
+        for r in shown:
+            period = r.weeks[0] if len(r.weeks) == 1 else f"{r.weeks[0]}~{r.weeks[-1]}"
+            target = f"{r.competency_id} 수요" if r.competency_id else "병목 조직"
+            actions.append(
+                f"{r.name or r.employee_id}({r.employee_id}) {period} "
+                f"평균 {r.average_fte:.1f} FTE → {target} 지원"
+            )
+        if len(plan.reassignments) > len(shown):
+            actions.append(f"외 {len(plan.reassignments) - len(shown)}건 재배치")
+        uncovered = sum(plan.uncovered_by_week.values())
+        if uncovered > 0:
+            actions.append(f"미충족 {uncovered:.1f} FTE-주는 외부 인력/일정 조정으로 보완")
+        option.actions = actions + option.actions[1:]
+        option.description = (
+            f"유휴 인력 {plan.employees_moved}명을 병목 주차에 재배치하여 "
+            f"부족분의 {plan.coverage_ratio:.0%} 해소"
         )
+        option.resource_allocations = [
+            ResourceAllocation(
+                employee_id=r.employee_id,
+                allocation_fte=round(r.average_fte, 2),
+                role=r.competency_id or "",
+                start_date=r.weeks[0],
+                end_date=r.weeks[-1],
+            )
+            for r in plan.reassignments
+        ]
+        if uncovered > 0:
+            option.trade_offs.append(f"재배치만으로 {uncovered:.1f} FTE-주 미충족")
 
     def _generate_gonogo_options(
         self, context: dict[str, Any], constraints: dict[str, Any]
@@ -308,8 +383,11 @@ class OptionGeneratorAgent:
             ),
         ]
 
-        recommendation, reason = self._determine_recommendation(
-            options, "GO_NOGO", {"success_probability": success_prob, "resource_fit": resource_fit}
+        recommendation, reason, ranking = self._determine_recommendation(
+            options,
+            "GO_NOGO",
+            {"success_probability": success_prob, "resource_fit": resource_fit},
+            profile=self._weight_profile(constraints),
         )
 
         return OptionSet(
@@ -318,6 +396,7 @@ class OptionGeneratorAgent:
             options=options,
             recommendation=recommendation,
             recommendation_reason=reason,
+            ranking=ranking.to_dict(),
         )
 
     def _generate_headcount_options(
@@ -415,9 +494,19 @@ class OptionGeneratorAgent:
                 },
             ),
         ]
-
-        recommendation, reason = self._determine_recommendation(
-            options, "HEADCOUNT", {"utilization": current_utilization}
+        plans = self._plan_headcount(context)
+        if plans is not None:
+            by_type = {plan.option_type: plan for plan in plans}
+            for option in options:
+                plan = by_type.get(option.option_type.value)
+                if plan is not None:
+                    self._apply_headcount_plan(option, plan)
+
+        recommendation, reason, ranking = self._determine_recommendation(
+            options,
+            "HEADCOUNT",
+            {"utilization": current_utilization},
+            profile=self._weight_profile(constraints),
         )
 
         return OptionSet(
@@ -426,8 +515,49 @@ class OptionGeneratorAgent:
             options=options,
             recommendation=recommendation,
             recommendation_reason=reason,
+            ranking=ranking.to_dict(),
         )
 
+    def _plan_headcount(self, context: dict[str, Any]) -> list[HeadcountPlan] | None:
+        """
+        주차별 부족 FTE(gap_series)가 있으면 채용/외주/재배치 일정 수립
+
+        재배치 한도: reassign_fte, 없으면 available_resources의 가용 FTE 합계
+        """
+        gap_series = context.get("gap_series")
+        if not gap_series:
+            return None
+        reassign_fte = context.get("reassign_fte")
+        if reassign_fte is None:
+            reassign_fte = sum(
+                float(r.get("available_fte", 0) or 0)
+                for r in context.get("available_resources") or []
+            )
+        try:
+            return self.headcount_planner.plan(
+                gap_series, context.get("gap_weeks"), reassign_fte=reassign_fte
+            )
+        except ValueError as e:
+            logger.warning("증원 일정 수립 불가, 기본 대안 사용: %s", e)
+            return None
+
+    def _apply_headcount_plan(self, option: DecisionOption, plan: HeadcountPlan) -> None:
+        """증원 일정을 대안의 액션/비용/일정으로 반영"""
+        costs = self.headcount_planner.costs
+        shortage = float(sum(max(gap, 0.0) for gap in plan.gap_fte))
+        option.name = plan.name
+        option.description = (
+            f"{len(plan.weeks)}주 부족분의 {plan.coverage_ratio:.0%}를 "
+            f"채용 {plan.hires}명/외주/재배치로 충당"
+        )
+        option.actions = plan.actions()
+        option.estimated_cost = round(plan.total_cost)
+        option.estimated_benefit = round(
+            (shortage - float(plan.unmet_fte.sum())) * costs.shortfall_weekly
+        )
+        option.implementation_time = f"{len(plan.weeks)}주 일정"
+        option.schedule = plan.to_schedule()
+
     def _generate_competency_options(
         self, context: dict[str, Any], constraints: dict[str, Any]
     ) -> OptionSet:
@@ -524,7 +654,9 @@ class OptionGeneratorAgent:
             ),
         ]
 
-        recommendation, reason = self._determine_recommendation(options, "COMPETENCY_GAP")
+        recommendation, reason, ranking = self._determine_recommendation(
+            options, "COMPETENCY_GAP", profile=self._weight_profile(constraints)
+        )
 
         return OptionSet(
             query_type="COMPETENCY_GAP",
@@ -532,6 +664,7 @@ class OptionGeneratorAgent:
             options=options,
             recommendation=recommendation,
             recommendation_reason=reason,
+            ranking=ranking.to_dict(),
         )
 
     def _generate_generic_options(
@@ -576,58 +709,56 @@ class OptionGeneratorAgent:
             recommendation_reason="불확실한 상황에서는 점진적 접근이 안전함",
         )
 
+    def _weight_profile(self, constraints: dict[str, Any]) -> WeightProfile | None:
+        """제약조건의 가중치 프로필 (잘못된 값이면 기본 프로필)"""
+        value = constraints.get("weight_profile")
+        if value is None:
+            return None
+        try:
+            return resolve_profile(value)
+        except ValueError as e:
+            logger.warning("가중치 프로필 무시, 기본 프로필 사용: %s", e)
+            return None
+
     def _determine_recommendation(
         self,
         options: list[DecisionOption],
         query_type: str,
         metrics: dict[str, float] | None = None,
-    ) -> tuple[str, str]:
-        """추천 대안 결정"""
+        profile: WeightProfile | None = None,
+    ) -> tuple[str, str, OptionRanking]:
+        """추천 대안 결정 (가중치 프로필 종합 점수 + 파레토 최적 여부)"""
         metrics = metrics or {}
 
-        # 가중치 기반 종합 점수 계산
-        weights = {
-            "impact": 0.35,
-            "feasibility": 0.25,
-            "risk": -0.20,  # 리스크는 낮을수록 좋음
-            "cost": -0.10,  # 비용도 낮을수록 좋음
-            "time": -0.10,  # 시간도 적을수록 좋음
-        }
-
-        best_option = None
-        best_score = float("-inf")
-        reason_parts = []
-
+        # 컨텍스트 기반 조정
+        adjustments = []
         for opt in options:
-            score = sum(opt.scores.get(metric, 50) * weight for metric, weight in weights.items())
-
-            # 컨텍스트 기반 조정
+            adjustment = 0.0
             if query_type == "GO_NOGO":
                 success_prob = metrics.get("success_probability", 0.5)
                 _resource_fit = metrics.get("resource_fit", 0.5)  # 향후 확장용
 
                 if opt.option_type == OptionType.AGGRESSIVE and success_prob < 0.5:
-                    score -= 20
+                    adjustment -= 20
                 elif opt.option_type == OptionType.CONSERVATIVE and success_prob > 0.7:
-                    score -= 10
+                    adjustment -= 10
 
             elif query_type == "HEADCOUNT":
                 utilization = metrics.get("utilization", 0.8)
                 if utilization > 0.9 and opt.option_type == OptionType.CONSERVATIVE:
-                    score -= 15
-
-            if score > best_score:
-                best_score = score
-                best_option = opt
-                reason_parts = [
-                    f"영향도({opt.scores.get('impact', 0)}점)",
-                    f"실현가능성({opt.scores.get('feasibility', 0)}점)",
-                    f"리스크({opt.scores.get('risk', 0)}점)",
-                ]
-
+                    adjustment -= 15
+            adjustments.append(adjustment)
+
+        ranking = self.ranker.rank(options, profile=profile, adjustments=adjustments)
+        best_option = options[ranking.recommended_index]
+        reason_parts = [
+            f"영향도({best_option.scores.get('impact', 0)}점)",
+            f"실현가능성({best_option.scores.get('feasibility', 0)}점)",
+            f"리스크({best_option.scores.get('risk', 0)}점)",
+        ]
         reason = f"{best_option.name}이(가) 종합 점수가 가장 높음: {', '.join(reason_parts)}"
 
-        return best_option.option_id, reason
+        return best_option.option_id, reason, ranking
 
     def to_dict(self, option_set: OptionSet) -> dict:
         """결과를 딕셔너리로 변환"""
@@ -648,11 +779,14 @@ class OptionGeneratorAgent:
                     "prerequisites": opt.prerequisites,
                     "trade_offs": opt.trade_offs,
                     "scores": opt.scores,
+                    "resource_allocations": [asdict(ra) for ra in opt.resource_allocations],
+                    "schedule": opt.schedule,
                 }
                 for opt in option_set.options
             ],
             "recommendation": option_set.recommendation,
             "recommendation_reason": option_set.recommendation_reason,
+            "ranking": option_set.ranking,
             "generated_at": option_set.generated_at.isoformat(),
         }
 
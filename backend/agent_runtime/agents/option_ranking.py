@@ -0,0 +1,247 @@
+"""
+HR DSS - 대안 순위화 (파레토 프런티어)
+
+대안 개수 제한 없이 영향도/실현가능성/리스크/비용/기간 5개 기준으로 순위를 매김
+- 파레토 최적(비지배): 모든 기준에서 같거나 낫고 하나 이상에서 더 나은 대안이 없는 대안
+- 지배 판정은 기준별 블록 비교를 NumPy로 누적 (메모리 상한 내에서 수천 개 대안 처리)
+- 종합 점수는 가중치 프로필(기본 제공 또는 사용자 지정) 기준, 컨텍스트 조정 점수를 더할 수 있음
+- 순위: 종합 점수 → 지배당하는 수 → 입력 순서 (양의 가중치면 1위는 항상 파레토 최적)
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+CRITERIA = ("impact", "feasibility", "risk", "cost", "time")
+# +1: 높을수록 좋음, -1: 낮을수록 좋음
+DIRECTIONS = np.array([1.0, 1.0, -1.0, -1.0, -1.0])
+DEFAULT_SCORE = 50.0  # 점수가 없는 기준
+
+# 지배 판정 블록당 비교 원소 수 (블록 × 대안 수)
+_BLOCK_ELEMENTS = 4_000_000
+
+
+@dataclass(frozen=True)
+class WeightProfile:
+    """기준별 가중치 (0 이상, 방향은 DIRECTIONS로 적용)"""
+
+    name: str
+    weights: Mapping[str, float]
+
+    def vector(self) -> np.ndarray:
+        """합이 1인 방향 포함 가중치 벡터 (컨텍스트 조정 점수와 척도를 맞춤)"""
+        unknown = set(self.weights) - set(CRITERIA)
+        if unknown:
+            raise ValueError(f"알 수 없는 평가 기준: {sorted(unknown)}")
+        raw = np.array([float(self.weights.get(c, 0.0)) for c in CRITERIA])
+        if (raw < 0).any() or not np.isfinite(raw).all():
+            raise ValueError("가중치는 0 이상의 유한한 값이어야 합니다")
+        total = raw.sum()
+        if total <= 0:
+            raise ValueError("가중치 합이 0보다 커야 합니다")
+        return raw / total * DIRECTIONS
+
+
+WEIGHT_PROFILES = {
+    "balanced": WeightProfile(
+        "balanced", {"impact": 0.35, "feasibility": 0.25, "risk": 0.20, "cost": 0.10, "time": 0.10}
+    ),
+    "growth": WeightProfile(
+        "growth", {"impact": 0.50, "feasibility": 0.20, "risk": 0.10, "cost": 0.10, "time": 0.10}
+    ),
+    "risk_averse": WeightProfile(
+        "risk_averse",
+        {"impact": 0.25, "feasibility": 0.25, "risk": 0.35, "cost": 0.10, "time": 0.05},
+    ),
+    "cost_saving": WeightProfile(
+        "cost_saving",
+        {"impact": 0.25, "feasibility": 0.20, "risk": 0.15, "cost": 0.30, "time": 0.10},
+    ),
+    "speed": WeightProfile(
+        "speed", {"impact": 0.25, "feasibility": 0.25, "risk": 0.15, "cost": 0.05, "time": 0.30}
+    ),
+}
+DEFAULT_PROFILE = "balanced"
+
+
+def resolve_profile(value: str | Mapping[str, Any] | WeightProfile | None) -> WeightProfile:
+    """
+    가중치 프로필 해석
+
+    - None: 기본(balanced)
+    - 문자열: WEIGHT_PROFILES 이름
+    - {"name"?, "weights": {기준: 가중치}} 또는 {기준: 가중치} (빠진 기준은 0)
+    """
+    if value is None:
+        return WEIGHT_PROFILES[DEFAULT_PROFILE]
+    if isinstance(value, WeightProfile):
+        profile = value
+    elif isinstance(value, str):
+        if value not in WEIGHT_PROFILES:
+            raise ValueError(f"알 수 없는 가중치 프로필: {value} (지원: {list(WEIGHT_PROFILES)})")
+        return WEIGHT_PROFILES[value]
+    elif isinstance(value, Mapping):
+        if "weights" in value:
+            profile = WeightProfile(str(value.get("name", "custom")), dict(value["weights"]))
+        else:
+            profile = WeightProfile("custom", dict(value))
+    else:
+        raise ValueError(f"가중치 프로필 형식 오류: {type(value).__name__}")
+    profile.vector()  # 검증
+    return profile
+
+
+def dominance_counts(matrix: np.ndarray, directions: np.ndarray = DIRECTIONS) -> np.ndarray:
+    """
+    대안별로 자신을 지배하는 대안 수 (0이면 파레토 최적)
+
+    j가 i를 지배하면 (방향 보정) 점수 합도 j가 크거나 같으므로, 합 내림차순으로 정렬한 뒤
+    각 블록은 합이 블록 최솟값 이상인 앞쪽 대안과만 비교 (비교 횟수 약 절반)
+
+    Args:
+        matrix: 대안 × 기준 점수
+        directions: 기준별 방향 (+1 높을수록 좋음, -1 낮을수록 좋음)
+    """
+    values = np.asarray(matrix, dtype=float) * directions
+    n, k = values.shape
+    totals = values.sum(axis=1)
+    order = np.argsort(-totals, kind="stable")
+    columns = [np.ascontiguousarray(values[order, c]) for c in range(k)]
+    descending = -totals[order]
+
+    # 같거나 나은 대안 수에서 자기 자신과 점수가 같은 대안(중복)을 빼면 지배 수
+    _, inverse, duplicates = np.unique(
+        values[order], axis=0, return_inverse=True, return_counts=True
+    )
+    counts = -duplicates[inverse.ravel()]
+    block = max(1, _BLOCK_ELEMENTS // max(n, 1))
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        limit = int(np.searchsorted(descending, descending[stop - 1], side="right"))
+        no_worse = columns[0][None, :limit] >= columns[0][start:stop, None]
+        for column in columns[1:]:
+            no_worse &= column[None, :limit] >= column[start:stop, None]
+        counts[start:stop] += no_worse.sum(axis=1)
+
+    result = np.empty(n, dtype=np.int64)
+    result[order] = counts
+    return result
+
+
+def pareto_front(matrix: np.ndarray, directions: np.ndarray = DIRECTIONS) -> np.ndarray:
+    """파레토 최적 여부 마스크"""
+    return dominance_counts(matrix, directions) == 0
+
+
+@dataclass
+class OptionRanking:
+    """대안 순위 결과"""
+
+    option_ids: list[str]
+    profile: WeightProfile
+    utilities: np.ndarray  # 종합 점수 (컨텍스트 조정 포함)
+    dominated_by: np.ndarray  # 지배하는 대안 수
+    order: np.ndarray  # 순위별 대안 인덱스
+
+    @property
+    def recommended_index(self) -> int:
+        return int(self.order[0])
+
+    @property
+    def recommended(self) -> str:
+        return self.option_ids[self.recommended_index]
+
+    @property
+    def pareto_mask(self) -> np.ndarray:
+        return self.dominated_by == 0
+
+    @property
+    def pareto_ids(self) -> list[str]:
+        """파레토 최적 대안 (순위순)"""
+        return [self.option_ids[i] for i in self.order if self.dominated_by[i] == 0]
+
+    def to_dict(self, top_k: int | None = None) -> dict[str, Any]:
+        order = self.order if top_k is None else self.order[:top_k]
+        return {
+            "profile": self.profile.name,
+            "weights": {c: float(self.profile.weights.get(c, 0.0)) for c in CRITERIA},
+            "option_count": len(self.option_ids),
+            "pareto_count": int(self.pareto_mask.sum()),
+            "pareto_option_ids": self.pareto_ids,
+            "ranked": [
+                {
+                    "rank": rank,
+                    "option_id": self.option_ids[i],
+                    "utility": round(float(self.utilities[i]), 2),
+                    "pareto_optimal": bool(self.dominated_by[i] == 0),
+                    "dominated_by": int(self.dominated_by[i]),
+                }
+                for rank, i in enumerate(order.tolist(), start=1)
+            ],
+        }
+
+
+def _option_fields(option: Any) -> tuple[str, Mapping[str, Any]]:
+    """DecisionOption 또는 {"option_id", "scores"} / {"option_id", 기준: 점수}"""
+    if isinstance(option, Mapping):
+        scores = option.get("scores")
+        return str(option.get("option_id", "")), scores if scores is not None else option
+    return option.option_id, option.scores
+
+
+class OptionRanker:
+    """파레토 프런티어 + 가중치 프로필 기반 대안 순위화"""
+
+    def __init__(self, profile: str | Mapping[str, Any] | WeightProfile | None = None):
+        """
+        Args:
+            profile: 기본 가중치 프로필 (rank 호출 시 덮어쓸 수 있음)
+        """
+        self.profile = resolve_profile(profile)
+
+    def rank(
+        self,
+        options: Sequence[Any],
+        profile: str | Mapping[str, Any] | WeightProfile | None = None,
+        adjustments: Sequence[float] | None = None,
+    ) -> OptionRanking:
+        """
+        대안 순위화
+
+        Args:
+            options: DecisionOption 또는 점수 딕셔너리 목록
+            profile: 가중치 프로필 (미지정 시 기본 프로필)
+            adjustments: 대안별 종합 점수 조정값 (컨텍스트 기반 가감점)
+
+        Returns:
+            OptionRanking: 종합 점수, 지배 수, 순위
+        """
+        if not options:
+            raise ValueError("순위화할 대안이 없습니다")
+        profile = self.profile if profile is None else resolve_profile(profile)
+
+        option_ids = []
+        matrix = np.full((len(options), len(CRITERIA)), DEFAULT_SCORE)
+        for i, option in enumerate(options):
+            option_id, scores = _option_fields(option)
+            option_ids.append(option_id or f"OPT-{i + 1}")
+            for j, criterion in enumerate(CRITERIA):
+                if scores.get(criterion) is not None:
+                    matrix[i, j] = float(scores[criterion])
+        if not np.isfinite(matrix).all():
+            raise ValueError("대안 점수는 유한한 숫자여야 합니다")
+
+        utilities = matrix @ profile.vector()
+        if adjustments is not None:
+            utilities = utilities + np.asarray(adjustments, dtype=float)
+        dominated_by = dominance_counts(matrix)
+        order = np.lexsort((np.arange(len(options)), dominated_by, -utilities))
+        return OptionRanking(
+            option_ids=option_ids,
+            profile=profile,
+            utilities=utilities,
+            dominated_by=dominated_by,
+            order=order,
+        )
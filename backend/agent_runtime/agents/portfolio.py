@@ -0,0 +1,377 @@
+"""
+HR DSS - 포트폴리오 Go/No-go 최적화
+
+파이프라인의 여러 기회를 한 번에 평가하여 공유 Capacity 안에서 수주할 조합을 선택
+- 점수: 기회별 성공 확률(SuccessProbabilityAgent) × 계약 금액 = 기대 매출
+- 선택: 주차별 가용 FTE를 제약으로 하는 다차원 배낭 문제
+  (유효 기울기 greedy + 1:1 교체 개선, 기회 × 주차 행렬을 NumPy로 계산)
+- 효율적 경계: 가동률 상한을 바꿔가며(ε-제약) 푼 결과 중
+  "기대 매출은 더 높고 최대 가동률은 더 낮은" 조합이 없는 점만 남김
+"""
+
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from backend.agent_runtime.agents.success_probability import SuccessProbabilityAgent
+
+# 기본 가동률 상한 (ε-제약 스윕)
+DEFAULT_UTILIZATION_CAPS = tuple(round(0.6 + 0.05 * i, 2) for i in range(13))  # 0.60 ~ 1.20
+# 추천 조합의 최대 가동률 (KG 병목 기준과 동일)
+TARGET_UTILIZATION = 0.9
+# 교체 개선 최대 반복
+MAX_SWAP_PASSES = 50
+
+_EPS = 1e-9
+
+
+@dataclass
+class ScoredOpportunity:
+    """평가된 기회"""
+
+    opportunity_id: str
+    name: str
+    deal_value: float
+    success_probability: float
+    demand: np.ndarray  # 주차별 필요 FTE
+
+    @property
+    def expected_value(self) -> float:
+        return self.deal_value * self.success_probability
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "opportunity_id": self.opportunity_id,
+            "name": self.name,
+            "deal_value": self.deal_value,
+            "success_probability": self.success_probability,
+            "expected_value": round(self.expected_value, 2),
+            "peak_fte": round(float(self.demand.max(initial=0.0)), 3),
+            "fte_weeks": round(float(self.demand.sum()), 3),
+        }
+
+
+@dataclass
+class FrontierPoint:
+    """효율적 경계의 한 점 (선택 조합)"""
+
+    utilization_cap: float
+    selected: list[str]
+    expected_revenue: float
+    total_deal_value: float
+    peak_utilization: float  # 선택 기회를 모두 수주했을 때
+    mean_utilization: float
+    expected_peak_utilization: float  # 성공 확률 가중 부하 기준
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "utilization_cap": self.utilization_cap,
+            "selected": self.selected,
+            "expected_revenue": round(self.expected_revenue, 2),
+            "total_deal_value": round(self.total_deal_value, 2),
+            "peak_utilization": round(self.peak_utilization, 4),
+            "mean_utilization": round(self.mean_utilization, 4),
+            "expected_peak_utilization": round(self.expected_peak_utilization, 4),
+        }
+
+
+@dataclass
+class PortfolioResult:
+    """포트폴리오 최적화 결과"""
+
+    weeks: list[str]
+    opportunities: list[ScoredOpportunity]
+    frontier: list[FrontierPoint]
+    recommended: FrontierPoint | None
+    capacity_fte: np.ndarray
+    committed_fte: np.ndarray
+    solve_ms: float = 0.0
+    rejected: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "weeks": self.weeks,
+            "capacity_fte": self.capacity_fte.round(3).tolist(),
+            "committed_fte": self.committed_fte.round(3).tolist(),
+            "opportunities": [opp.to_dict() for opp in self.opportunities],
+            "frontier": [point.to_dict() for point in self.frontier],
+            "recommended": self.recommended.to_dict() if self.recommended else None,
+            "rejected": self.rejected,
+            "solve_ms": round(self.solve_ms, 2),
+        }
+
+
+def _weekly(value: Any, weeks: list[str], name: str) -> np.ndarray:
+    """스칼라 / 주차 순서 목록(배열) / {주차: 값} → 주차별 배열 (null은 0)"""
+    if isinstance(value, Mapping):
+        return np.array([float(value.get(week) or 0.0) for week in weeks])
+    if isinstance(value, Sequence | np.ndarray) and not isinstance(value, str):
+        if len(value) != len(weeks):
+            raise ValueError(f"{name} 길이 {len(value)}가 계획 주차 수 {len(weeks)}와 다릅니다")
+        return np.array([float(v or 0.0) for v in value])
+    return np.full(len(weeks), float(value or 0.0))
+
+
+def _opportunity_demand(item: Mapping[str, Any], weeks: list[str]) -> np.ndarray:
+    """
+    기회의 주차별 필요 FTE
+
+    - weekly_fte: 주차 순서 목록 또는 {주차: FTE}
+    - 또는 required_fte + start_week(주차 라벨 또는 0부터의 인덱스) + duration_weeks
+    """
+    if item.get("weekly_fte") is not None:
+        return _weekly(item["weekly_fte"], weeks, "weekly_fte")
+    demand = np.zeros(len(weeks))
+    start = item.get("start_week") or 0
+    start = weeks.index(start) if isinstance(start, str) else int(start)
+    duration = item.get("duration_weeks")
+    duration = len(weeks) - start if duration is None else int(duration)
+    demand[max(start, 0) : max(start + duration, 0)] = float(item.get("required_fte") or 0.0)
+    return demand
+
+
+_FILL_RULES = ("gradient", "value", "density")
+
+
+def _fill(
+    values: np.ndarray,
+    demand: np.ndarray,
+    selected: np.ndarray,
+    remaining: np.ndarray,
+    rule: str = "gradient",
+    rows: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    여유 FTE 안에 들어가는 기회를 기준 순으로 추가 (selected 갱신, 남은 여유 반환)
+
+    - gradient: 남은 여유 대비 경쟁이 심한 주차의 FTE를 비싸게 본 "기대 매출 / 가중 FTE"
+    - value: 기대 매출
+    - density: 기대 매출 / 전체 FTE-주
+    - rows: 후보 인덱스 (미지정 시 미선택 전체). 여유는 줄기만 하므로 후보도 줄여 나감
+    """
+    if rows is None:
+        rows = np.nonzero((values > 0) & ~selected)[0]
+    while True:
+        rows = rows[np.all(demand[rows] <= remaining + _EPS, axis=1)]
+        if not len(rows):
+            return remaining
+        if rule == "value":
+            priority = values[rows]
+        elif rule == "density":
+            priority = values[rows] / (demand[rows].sum(axis=1) + _EPS)
+        else:
+            weights = demand[rows].sum(axis=0) / np.maximum(remaining, _EPS)
+            priority = values[rows] / (demand[rows] @ weights + _EPS)
+        best = int(np.argmax(priority))
+        selected[rows[best]] = True
+        remaining = remaining - demand[rows[best]]
+        rows = np.delete(rows, best)
+
+
+def _improve(
+    values: np.ndarray, demand: np.ndarray, selected: np.ndarray, remaining: np.ndarray
+) -> None:
+    """1:1 교체와 제외 후 재채우기로 개선이 없을 때까지 반복 (selected 갱신)"""
+    for _ in range(MAX_SWAP_PASSES):
+        inside = np.nonzero(selected)[0]
+        outside = np.nonzero((values > 0) & ~selected)[0]
+        if not len(inside) or not len(outside):
+            return
+
+        # (선택, 미선택): i를 빼면 j가 들어가는지 (j가 지금 넘치는 양을 i가 덮는지)
+        # 어떤 선택을 빼도 들어갈 수 없는 j는 먼저 제외
+        overflow = np.maximum(demand[outside] - remaining, 0.0)
+        possible = np.all(overflow <= demand[inside].max(axis=0) + _EPS, axis=1)
+        outside, overflow = outside[possible], overflow[possible]
+        if not len(outside):
+            return
+        fits = np.all(overflow[None, :, :] <= demand[inside][:, None, :] + _EPS, axis=2)
+        gain = np.where(fits, values[outside][None, :] - values[inside][:, None], 0.0)
+        best = np.unravel_index(int(np.argmax(gain)), gain.shape)
+        if gain[best] > _EPS:
+            out_row, in_row = inside[best[0]], outside[best[1]]
+            selected[out_row], selected[in_row] = False, True
+            remaining = remaining + demand[out_row] - demand[in_row]
+            remaining = _fill(values, demand, selected, remaining)
+            continue
+
+        # 선택 1건을 빼고 다시 채움 (들어갈 수 있는 기회 합계가 뺀 것보다 클 때만 시도)
+        bound = np.where(fits, values[outside][None, :], 0.0).sum(axis=1)
+        density = values[inside] / (demand[inside].sum(axis=1) + _EPS)
+        for k in np.argsort(density):
+            if bound[k] <= values[inside[k]] + _EPS:
+                continue
+            trial = selected.copy()
+            trial[inside[k]] = False
+            trial_remaining = _fill(
+                values, demand, trial, remaining + demand[inside[k]], rows=outside[fits[k]]
+            )
+            if values[trial].sum() > values[selected].sum() + _EPS:
+                selected[:] = trial
+                remaining = _fill(values, demand, selected, trial_remaining)
+                break
+        else:
+            return
+
+
+class PortfolioOptimizer:
+    """파이프라인 포트폴리오 Go/No-go 최적화"""
+
+    def __init__(self, probability_agent: SuccessProbabilityAgent | None = None):
+        """
+        Args:
+            probability_agent: 성공 확률 에이전트 (미지정 시 기본 휴리스틱)
+        """
+        self.probability_agent = probability_agent or SuccessProbabilityAgent()
+
+    def evaluate(
+        self,
+        opportunities: list[dict[str, Any]],
+        capacity_fte: Any,
+        committed_fte: Any = 0.0,
+        weeks: list[str] | int = 12,
+        utilization_caps: Sequence[float] = DEFAULT_UTILIZATION_CAPS,
+        target_utilization: float = TARGET_UTILIZATION,
+    ) -> PortfolioResult:
+        """
+        기회 일괄 평가 및 수주 조합 최적화
+
+        Args:
+            opportunities: 기회 목록 (opportunity_id, name, deal_value, 주차별 필요 FTE,
+                성공 확률 컨텍스트 또는 success_probability)
+            capacity_fte: 주차별 가용 FTE (스칼라/목록/{주차: FTE})
+            committed_fte: 주차별 기존 투입 FTE
+            weeks: 계획 주차 라벨 또는 주차 수
+            utilization_caps: 효율적 경계를 그릴 가동률 상한 목록
+            target_utilization: 추천 조합의 최대 가동률
+
+        Returns:
+            PortfolioResult: 기회별 점수, 효율적 경계, 추천 조합
+        """
+        started = time.perf_counter()
+        if isinstance(weeks, int):
+            weeks = [f"W{i:02d}" for i in range(1, weeks + 1)]
+        capacity = _weekly(capacity_fte, weeks, "capacity_fte")
+        committed = _weekly(committed_fte, weeks, "committed_fte")
+        if np.any(capacity <= 0):
+            raise ValueError("capacity_fte는 모든 주차에서 0보다 커야 합니다")
+
+        scored = self.score(opportunities, weeks)
+        values = np.array([opp.expected_value for opp in scored])
+        probabilities = np.array([opp.success_probability for opp in scored])
+        demand = np.array([opp.demand for opp in scored]).reshape(len(scored), len(weeks))
+        ids = np.array([opp.opportunity_id for opp in scored], dtype=object)
+
+        points: dict[tuple[str, ...], FrontierPoint] = {}
+        selected = None
+        for cap in sorted(utilization_caps):
+            headroom = np.clip(cap * capacity - committed, 0.0, None)
+            # 상한이 커지면 이전 해도 여전히 들어가므로 이어서 개선
+            selected = self.select(values, demand, headroom, start=selected)
+            key = tuple(ids[selected])
+            if key in points:
+                continue
+            load = committed + demand[selected].sum(axis=0)
+            expected_load = committed + (probabilities[selected, None] * demand[selected]).sum(
+                axis=0
+            )
+            points[key] = FrontierPoint(
+                utilization_cap=float(cap),
+                selected=list(key),
+                expected_revenue=float(values[selected].sum()),
+                total_deal_value=float(sum(scored[i].deal_value for i in np.nonzero(selected)[0])),
+                peak_utilization=float((load / capacity).max(initial=0.0)),
+                mean_utilization=float((load / capacity).mean()) if len(weeks) else 0.0,
+                expected_peak_utilization=float((expected_load / capacity).max(initial=0.0)),
+            )
+
+        frontier = self._efficient(list(points.values()))
+        within = [p for p in frontier if p.peak_utilization <= target_utilization + _EPS]
+        recommended = max(within, key=lambda p: p.expected_revenue) if within else None
+        chosen = set().union(*(p.selected for p in frontier)) if frontier else set()
+
+        return PortfolioResult(
+            weeks=weeks,
+            opportunities=scored,
+            frontier=frontier,
+            recommended=recommended,
+            capacity_fte=capacity,
+            committed_fte=committed,
+            solve_ms=(time.perf_counter() - started) * 1000,
+            rejected=[opp.opportunity_id for opp in scored if opp.opportunity_id not in chosen],
+        )
+
+    def score(
+        self, opportunities: list[dict[str, Any]], weeks: list[str]
+    ) -> list[ScoredOpportunity]:
+        """기회별 성공 확률(확률이 없는 기회는 일괄 계산)과 주차별 필요 FTE"""
+        # null 값은 빠진 값으로 보고 에이전트 기본값 적용
+        missing = [
+            {key: value for key, value in item.items() if value is not None}
+            for item in opportunities
+            if item.get("success_probability") is None
+        ]
+        estimated = iter(self.probability_agent.score_batch(missing).probabilities())
+
+        scored = []
+        for i, item in enumerate(opportunities):
+            opportunity_id = str(item.get("opportunity_id") or f"OPP-{i + 1:03d}")
+            name = item.get("name", opportunity_id)
+            probability = item.get("success_probability")
+            if probability is None:
+                probability = next(estimated)
+            scored.append(
+                ScoredOpportunity(
+                    opportunity_id=opportunity_id,
+                    name=name,
+                    deal_value=float(item.get("deal_value") or 0.0),
+                    success_probability=float(probability),
+                    demand=_opportunity_demand(item, weeks),
+                )
+            )
+        return scored
+
+    @staticmethod
+    def select(
+        values: np.ndarray,
+        demand: np.ndarray,
+        headroom: np.ndarray,
+        start: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        다차원 배낭: 주차별 여유 FTE 안에서 기대 매출 합계 최대화
+
+        1) greedy 채우기를 세 가지 기준(유효 기울기 / 기대 매출 / 매출 밀도)으로 시작
+        2) 1:1 교체: 선택 1건을 빼고 더 가치 있는 미선택 1건을 넣을 수 있으면 교체
+        3) 제외 후 재채우기: 선택 1건을 빼고 다시 채워 합계가 늘면 채택 (1:N 교체)
+        세 시작점 중 합계가 가장 큰 조합을 반환
+
+        Args:
+            start: 여유 안에 들어가는 초기 선택 (더 낮은 가동률 상한의 해를 이어서 개선)
+
+        Returns:
+            선택 여부 (bool 배열)
+        """
+        best = np.zeros(len(values), dtype=bool)
+        for rule in _FILL_RULES:
+            selected = np.zeros(len(values), dtype=bool)
+            if start is not None:
+                selected[:] = start
+            remaining = headroom.astype(float) - demand[selected].sum(axis=0)
+            remaining = _fill(values, demand, selected, remaining, rule)
+            _improve(values, demand, selected, remaining)
+            if values[selected].sum() > values[best].sum() + _EPS:
+                best = selected
+        return best
+
+    @staticmethod
+    def _efficient(points: list[FrontierPoint]) -> list[FrontierPoint]:
+        """최대 가동률 오름차순으로 기대 매출이 늘어나는 점만 유지"""
+        frontier: list[FrontierPoint] = []
+        for point in sorted(points, key=lambda p: (p.peak_utilization, -p.expected_revenue)):
+            if not frontier or point.expected_revenue > frontier[-1].expected_revenue + _EPS:
+                frontier.append(point)
+        return frontier
@@ -0,0 +1,328 @@
+"""
+HR DSS - Capacity 재배치 최적화
+
+병목 주차의 부족 FTE를 유휴 인력 재배치로 메우는 배정 엔진
+- 입력: 직원별 주차별 가용 FTE, 보유 역량(레벨), 주차별(역량별) 부족 FTE
+- 방식: 가중 집합 피복(greedy weighted set cover). 매 단계 "메울 수 있는 FTE / 교란 비용"이
+  가장 큰 직원을 골라 가능한 모든 병목 주차에 한 번에 배정 → 이동 인원 최소화
+- 교란 비용: 이동 1명 + 요구 레벨 초과분(상위 전문가 보호) + 타 조직 이동
+  (이미 다른 역량 수요로 이동한 직원은 이동 비용 절반)
+- 공급이 부족한 역량 수요부터 배정하여 범용 수요가 희소 인력을 먼저 쓰지 않도록 함
+- 직원 × 주차 행렬을 NumPy로 계산하므로 수천 명 규모도 요청 시간 내 처리
+"""
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+_EPS = 1e-9
+
+
+@dataclass
+class StaffMember:
+    """재배치 후보 직원"""
+
+    employee_id: str
+    name: str = ""
+    org_unit_id: str | None = None
+    available_fte: float | dict[str, float] = 0.0  # 전 주차 동일 또는 주차별
+    competencies: dict[str, int] = field(default_factory=dict)  # 역량 ID → 레벨
+
+
+@dataclass
+class DemandGap:
+    """주차별 부족 FTE (competency_id가 없으면 역량 무관)"""
+
+    week: str
+    gap_fte: float
+    competency_id: str | None = None
+    min_level: int = 3
+
+
+@dataclass
+class Reassignment:
+    """재배치 1건"""
+
+    employee_id: str
+    name: str
+    competency_id: str | None
+    weeks: list[str]
+    fte: list[float]
+
+    @property
+    def total_fte(self) -> float:
+        """배정된 FTE-주 합계"""
+        return sum(self.fte)
+
+    @property
+    def average_fte(self) -> float:
+        return self.total_fte / len(self.fte) if self.fte else 0.0
+
+
+@dataclass
+class ReallocationPlan:
+    """재배치 계획"""
+
+    reassignments: list[Reassignment]
+    demand_fte: float  # 부족 FTE-주 합계
+    covered_fte: float
+    uncovered_by_week: dict[str, float]
+    employees_considered: int
+    solve_ms: float
+
+    @property
+    def coverage_ratio(self) -> float:
+        return self.covered_fte / self.demand_fte if self.demand_fte > 0 else 1.0
+
+    @property
+    def employees_moved(self) -> int:
+        return len({r.employee_id for r in self.reassignments})
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "reassignments": [
+                {
+                    "employee_id": r.employee_id,
+                    "name": r.name,
+                    "competency_id": r.competency_id,
+                    "weeks": r.weeks,
+                    "fte": [round(value, 3) for value in r.fte],
+                }
+                for r in self.reassignments
+            ],
+            "demand_fte": round(self.demand_fte, 3),
+            "covered_fte": round(self.covered_fte, 3),
+            "coverage_ratio": round(self.coverage_ratio, 4),
+            "uncovered_by_week": {
+                week: round(value, 3) for week, value in self.uncovered_by_week.items()
+            },
+            "employees_considered": self.employees_considered,
+            "employees_moved": self.employees_moved,
+            "solve_ms": round(self.solve_ms, 2),
+        }
+
+
+class ReallocationOptimizer:
+    """병목 주차 재배치 최적화"""
+
+    def __init__(
+        self,
+        move_cost: float = 1.0,
+        level_excess_cost: float = 0.25,
+        cross_org_cost: float = 0.5,
+        min_allocation_fte: float = 0.1,
+    ):
+        """
+        Args:
+            move_cost: 직원 1명을 이동시키는 비용
+            level_excess_cost: 요구 레벨 초과 1단계당 비용 (상위 전문가 보호)
+            cross_org_cost: 대상 조직이 아닌 직원 이동 비용
+            min_allocation_fte: 이보다 작은 가용 FTE는 배정하지 않음 (쪼개기 방지)
+        """
+        self.move_cost = move_cost
+        self.level_excess_cost = level_excess_cost
+        self.cross_org_cost = cross_org_cost
+        self.min_allocation_fte = min_allocation_fte
+
+    def solve(
+        self,
+        staff: list[StaffMember],
+        demand: list[DemandGap],
+        target_org_unit_id: str | None = None,
+    ) -> ReallocationPlan:
+        """
+        재배치 계획 수립
+
+        Args:
+            staff: 재배치 후보 직원
+            demand: 주차별(역량별) 부족 FTE
+            target_org_unit_id: 병목 조직 (같은 조직 직원은 조직 이동 비용 없음)
+
+        Returns:
+            ReallocationPlan: 재배치 목록과 충족/미충족 FTE
+        """
+        started = time.perf_counter()
+        weeks = list(dict.fromkeys(gap.week for gap in demand))
+        week_index = {week: i for i, week in enumerate(weeks)}
+
+        available = self._availability_matrix(staff, weeks)
+        available[available < self.min_allocation_fte] = 0.0
+
+        # (역량, 최소 레벨)별 주차 부족분
+        groups: dict[tuple[str | None, int], np.ndarray] = {}
+        for gap in demand:
+            key = (gap.competency_id, gap.min_level if gap.competency_id else 0)
+            groups.setdefault(key, np.zeros(len(weeks)))[week_index[gap.week]] += max(
+                gap.gap_fte, 0.0
+            )
+        demand_fte = float(sum(need.sum() for need in groups.values()))
+
+        cross_org = np.array(
+            [target_org_unit_id is not None and s.org_unit_id != target_org_unit_id for s in staff]
+        )
+        moved = np.zeros(len(staff), dtype=bool)
+        reassignments: list[Reassignment] = []
+        remaining: dict[tuple[str | None, int], np.ndarray] = {}
+
+        levels = {
+            key: np.fromiter((s.competencies.get(key[0], 0) for s in staff), float, len(staff))
+            for key in groups
+            if key[0] is not None
+        }
+        for key in self._by_scarcity(groups, levels, available):
+            competency_id, min_level = key
+            need = groups[key].copy()
+            if competency_id is None:
+                excess = np.zeros(len(staff))
+            else:
+                excess = np.where(levels[key] >= min_level, levels[key] - min_level, -1.0)
+            rows = np.nonzero((excess >= 0) & (available.sum(axis=1) > 0))[0]
+            # 이동 비용은 반복마다 moved 상태에 따라 더함
+            base_cost = (
+                self.level_excess_cost * excess[rows] + self.cross_org_cost * cross_org[rows]
+            )
+
+            while len(rows) and need.sum() > _EPS:
+                take = np.minimum(available[rows], need)
+                coverage = take.sum(axis=1)
+                cost = base_cost + self.move_cost * np.where(moved[rows], 0.5, 1.0)
+                best = int(np.argmax(coverage / cost))
+                if coverage[best] <= _EPS:
+                    break
+
+                row = rows[best]
+                assigned = take[best]
+                available[row] -= assigned
+                need -= assigned
+                moved[row] = True
+                used = np.nonzero(assigned > _EPS)[0]
+                reassignments.append(
+                    Reassignment(
+                        employee_id=staff[row].employee_id,
+                        name=staff[row].name,
+                        competency_id=competency_id,
+                        weeks=[weeks[i] for i in used],
+                        fte=assigned[used].tolist(),
+                    )
+                )
+                # 이번 역량 수요에 더 줄 수 있는 주차가 없으면 후보에서 제외
+                keep = (np.minimum(available[rows], need) > _EPS).any(axis=1)
+                rows, base_cost = rows[keep], base_cost[keep]
+            remaining[key] = need
+
+        uncovered = np.zeros(len(weeks))
+        for need in remaining.values():
+            uncovered += need
+        return ReallocationPlan(
+            reassignments=reassignments,
+            demand_fte=demand_fte,
+            covered_fte=demand_fte - float(uncovered.sum()),
+            uncovered_by_week={
+                week: float(value)
+                for week, value in zip(weeks, uncovered, strict=True)
+                if value > _EPS
+            },
+            employees_considered=len(staff),
+            solve_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    @staticmethod
+    def _availability_matrix(staff: list[StaffMember], weeks: list[str]) -> np.ndarray:
+        """직원 × 주차 가용 FTE"""
+        matrix = np.zeros((len(staff), len(weeks)))
+        for i, member in enumerate(staff):
+            if isinstance(member.available_fte, Mapping):
+                matrix[i] = [member.available_fte.get(week, 0.0) for week in weeks]
+            else:
+                matrix[i] = member.available_fte
+        return matrix
+
+    @staticmethod
+    def _by_scarcity(
+        groups: dict[tuple[str | None, int], np.ndarray],
+        levels: dict[tuple[str | None, int], np.ndarray],
+        available: np.ndarray,
+    ) -> list[tuple[str | None, int]]:
+        """공급 대비 수요가 큰 역량부터 (역량 무관 수요는 마지막)"""
+
+        def pressure(key: tuple[str | None, int]) -> float:
+            if key[0] is None:
+                return -1.0
+            supply = available[levels[key] >= key[1]].sum()
+            return float(groups[key].sum() / supply) if supply > 0 else float("inf")
+
+        return sorted(groups, key=pressure, reverse=True)
+
+
+def _parse_competencies(value: Any) -> dict[str, int]:
+    """{역량: 레벨} 또는 [{"competency_id", "level"}] → {역량: 레벨}"""
+    if isinstance(value, Mapping):
+        return {str(k): int(v) for k, v in value.items()}
+    result = {}
+    for item in value or []:
+        competency_id = item.get("competency_id") or item.get("competencyId")
+        if competency_id:
+            result[competency_id] = int(item.get("level") or 0)
+    return result
+
+
+def _parse_weekly(value: Any) -> dict[str, float]:
+    """{주차: FTE} 또는 [{"week", "available_fte"|"availableFTE"}] → {주차: FTE}"""
+    if isinstance(value, Mapping):
+        return {str(k): float(v) for k, v in value.items()}
+    return {
+        str(item["week"]): float(item.get("available_fte", item.get("availableFTE", 0.0)) or 0.0)
+        for item in value
+    }
+
+
+def problem_from_context(
+    context: Mapping[str, Any],
+) -> tuple[list[StaffMember], list[DemandGap]]:
+    """
+    KG 조회 결과(컨텍스트)에서 재배치 입력 구성
+
+    - available_resources: [{employee_id, name, org_unit_id, available_fte | available_fte_by_week,
+      competencies}] (KnowledgeGraphQuery.get_reallocation_candidates의 camelCase 행도 허용)
+    - weekly_demand: [{week, gap_fte, competency_id?, min_level?}]
+      (없으면 bottleneck_weeks마다 gap_fte만큼 역량 무관 수요로 간주)
+    """
+    staff = []
+    for item in context.get("available_resources") or []:
+        employee_id = item.get("employee_id") or item.get("employeeId")
+        if not employee_id:
+            continue
+        weekly = item.get("available_fte_by_week") or item.get("availableFTEByWeek")
+        if weekly:
+            available_fte: float | dict[str, float] = _parse_weekly(weekly)
+        else:
+            available_fte = float(item.get("available_fte", item.get("availableFTE", 0.0)) or 0.0)
+        staff.append(
+            StaffMember(
+                employee_id=employee_id,
+                name=item.get("name", ""),
+                org_unit_id=item.get("org_unit_id") or item.get("orgUnitId"),
+                available_fte=available_fte,
+                competencies=_parse_competencies(item.get("competencies")),
+            )
+        )
+
+    demand = [
+        DemandGap(
+            week=str(item["week"]),
+            gap_fte=float(item.get("gap_fte", 0.0)),
+            competency_id=item.get("competency_id"),
+            min_level=int(item.get("min_level", 3)),
+        )
+        for item in context.get("weekly_demand") or []
+    ]
+    if not demand:
+        gap_fte = float(context.get("gap_fte", 0) or 0)
+        demand = [
+            DemandGap(week=str(week), gap_fte=gap_fte)
+            for week in context.get("bottleneck_weeks") or []
+        ]
+    return staff, demand
@@ -0,0 +1,219 @@
+"""
+HR DSS - 민감도 분석 (파라미터 스윕)
+
+baseline 파라미터 범위를 받아 평가할 입력 배열을 한 번에 구성하고,
+대안별 점수 행렬을 그리드 / 토네이도 / 손익분기점 데이터로 해석
+- 그리드: 모든 파라미터 값의 조합
+- 토네이도: 한 번에 한 파라미터만 low/high로 바꿨을 때의 점수 변화폭
+- 손익분기점: 한 파라미터를 촘촘히 바꿨을 때 최적 대안이 바뀌는 값,
+  대안 점수가 현상 유지(50점)를 넘나드는 값
+"""
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# 손익분기점 탐색용 1차원 라인 해상도
+LINE_POINTS = 101
+# 현상 유지 점수 (종합 점수 50 = 변화 없음)
+NEUTRAL_SCORE = 50.0
+
+
+def parameter_values(spec: Sequence[float] | Mapping[str, Any]) -> np.ndarray:
+    """
+    파라미터 범위 명세 → 정렬된 값 배열
+
+    Args:
+        spec: 값 목록 또는 {"low", "high", "steps"(기본 11)}
+    """
+    if isinstance(spec, Mapping):
+        steps = int(spec.get("steps", 11))
+        if steps < 2:
+            raise ValueError(f"steps는 2 이상이어야 합니다: {steps}")
+        values = np.linspace(float(spec["low"]), float(spec["high"]), steps)
+    else:
+        values = np.asarray(spec, dtype=float)
+    values = np.unique(values)
+    if values.size == 0 or not np.all(np.isfinite(values)):
+        raise ValueError("파라미터 범위는 비어 있지 않은 유한한 값이어야 합니다")
+    return values
+
+
+def _crossings(x: np.ndarray, diff: np.ndarray) -> list[tuple[int, float]]:
+    """diff의 부호가 바뀌는 구간과 선형 보간한 x 값"""
+    positive = diff > 0
+    result = []
+    for i in np.nonzero(positive[:-1] != positive[1:])[0]:
+        d0, d1 = diff[i], diff[i + 1]
+        ratio = d0 / (d0 - d1) if d0 != d1 else 0.0
+        result.append((int(i), float(x[i] + (x[i + 1] - x[i]) * ratio)))
+    return result
+
+
+@dataclass
+class SweepResult:
+    """스윕 결과"""
+
+    query_type: str
+    option_ids: list[str]
+    values: dict[str, np.ndarray]
+    base_inputs: dict[str, float]
+    base_scores: np.ndarray  # (대안,)
+    grid_scores: np.ndarray  # (대안, 파라미터1 값, 파라미터2 값, ...)
+    tornado: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    break_even: dict[str, dict[str, list[dict[str, Any]]]] = field(default_factory=dict)
+
+    @property
+    def best_option_grid(self) -> np.ndarray:
+        """그리드 지점별 최적 대안 (option_id)"""
+        return np.asarray(self.option_ids, dtype=object)[self.grid_scores.argmax(axis=0)]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "query_type": self.query_type,
+            "parameters": list(self.values),
+            "values": {key: values.round(6).tolist() for key, values in self.values.items()},
+            "base_inputs": self.base_inputs,
+            "base_scores": dict(
+                zip(self.option_ids, self.base_scores.round(2).tolist(), strict=True)
+            ),
+            "grid": {
+                "scores": dict(
+                    zip(self.option_ids, self.grid_scores.round(2).tolist(), strict=True)
+                ),
+                "best_option": self.best_option_grid.tolist(),
+            },
+            "tornado": self.tornado,
+            "break_even": self.break_even,
+        }
+
+
+@dataclass
+class SweepPlan:
+    """
+    스윕 평가 계획
+
+    그리드 / 기준점 / 토네이도 / 1차원 라인 지점을 하나의 입력 배열로 이어 붙여
+    지표 모델을 대안별로 한 번만 호출하게 함
+    """
+
+    values: dict[str, np.ndarray]
+    base: dict[str, float]
+    inputs: dict[str, Any]
+    size: int
+    lines: dict[str, np.ndarray]
+
+    @classmethod
+    def build(
+        cls,
+        inputs: Mapping[str, Any],
+        ranges: Mapping[str, Sequence[float] | Mapping[str, Any]],
+        max_points: int,
+    ) -> "SweepPlan":
+        if not ranges:
+            raise ValueError("스윕할 파라미터가 없습니다")
+        values = {key: parameter_values(spec) for key, spec in ranges.items()}
+        grid_size = math.prod(v.size for v in values.values())
+        if grid_size > max_points:
+            raise ValueError(f"그리드 지점 수 {grid_size}가 최대 {max_points}를 초과합니다")
+
+        # 스윕하지 않는 축의 기준값: baseline 값 (숫자가 아니면 범위 중앙값)
+        base = {}
+        for key, v in values.items():
+            current = inputs.get(key)
+            numeric = isinstance(current, int | float) and not isinstance(current, bool)
+            base[key] = float(current) if numeric else float(np.median(v))
+        lines = {key: np.linspace(v[0], v[-1], LINE_POINTS) for key, v in values.items()}
+
+        mesh = np.meshgrid(*values.values(), indexing="ij")
+        columns = {}
+        for j, key in enumerate(values):
+            parts = [mesh[j].ravel(), [base[key]]]
+            # 토네이도: 해당 파라미터만 low/high로, 나머지는 기준값
+            for other, v in values.items():
+                parts.append([v[0], v[-1]] if other == key else [base[key]] * 2)
+            # 1차원 라인: 해당 파라미터만 촘촘히, 나머지는 기준값
+            for other, line in lines.items():
+                parts.append(line if other == key else np.full(LINE_POINTS, base[key]))
+            columns[key] = np.concatenate(parts)
+
+        size = grid_size + 1 + 2 * len(values) + LINE_POINTS * len(values)
+        return cls(values, base, {**inputs, **columns}, size, lines)
+
+    def result(self, query_type: str, option_ids: list[str], scores: np.ndarray) -> SweepResult:
+        """대안별 점수 행렬 (대안, size) 해석"""
+        shape = tuple(v.size for v in self.values.values())
+        grid_size = math.prod(shape)
+        offset = grid_size
+        base_scores = scores[:, offset]
+        offset += 1
+        tornado_scores = scores[:, offset : offset + 2 * len(self.values)]
+        offset += 2 * len(self.values)
+
+        tornado: dict[str, list[dict[str, Any]]] = {}
+        for i, option_id in enumerate(option_ids):
+            bars = []
+            for j, (key, v) in enumerate(self.values.items()):
+                low_score, high_score = tornado_scores[i, 2 * j], tornado_scores[i, 2 * j + 1]
+                bars.append(
+                    {
+                        "parameter": key,
+                        "low": float(v[0]),
+                        "high": float(v[-1]),
+                        "score_low": round(float(low_score), 2),
+                        "score_high": round(float(high_score), 2),
+                        "swing": round(abs(float(high_score - low_score)), 2),
+                    }
+                )
+            tornado[option_id] = sorted(bars, key=lambda bar: bar["swing"], reverse=True)
+
+        break_even = {}
+        for key, line in self.lines.items():
+            line_scores = scores[:, offset : offset + LINE_POINTS]
+            offset += LINE_POINTS
+            break_even[key] = self._break_even(line, line_scores, option_ids)
+
+        return SweepResult(
+            query_type=query_type,
+            option_ids=option_ids,
+            values=self.values,
+            base_inputs=self.base,
+            base_scores=base_scores,
+            grid_scores=scores[:, :grid_size].reshape(len(option_ids), *shape),
+            tornado=tornado,
+            break_even=break_even,
+        )
+
+    @staticmethod
+    def _break_even(
+        line: np.ndarray, scores: np.ndarray, option_ids: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """최적 대안 전환점과 대안별 현상 유지(50점) 교차점"""
+        best = scores.argmax(axis=0)
+        best_changes = []
+        for i in np.nonzero(best[:-1] != best[1:])[0]:
+            a, b = best[i], best[i + 1]
+            # i에서 a가 b 이상, i+1에서 b가 a 이상 → 두 점수가 같아지는 지점 보간
+            d0 = scores[a, i] - scores[b, i]
+            d1 = scores[a, i + 1] - scores[b, i + 1]
+            ratio = d0 / (d0 - d1) if d0 != d1 else 0.0
+            value = float(line[i] + (line[i + 1] - line[i]) * ratio)
+            best_changes.append(
+                {"value": round(value, 6), "from_option": option_ids[a], "to_option": option_ids[b]}
+            )
+
+        thresholds = []
+        for i, option_id in enumerate(option_ids):
+            diff = scores[i] - NEUTRAL_SCORE
+            for index, value in _crossings(line, diff):
+                thresholds.append(
+                    {
+                        "option_id": option_id,
+                        "value": round(value, 6),
+                        "improves_above": bool(diff[index + 1] > 0),
+                    }
+                )
+        return {"best_option_changes": best_changes, "improvement_thresholds": thresholds}
@@ -0,0 +1,100 @@
+"""
+HR DSS - 영향도 시뮬레이션 결과 캐시
+
+ImpactSimulatorAgent.simulate 결과를 정규화된 입력의 지문(fingerprint)으로 저장
+- StateStore에 보관하므로 같은 저장소를 쓰는 워커끼리 공유
+- 최대 항목 수를 넘으면 오래 저장된 항목부터 저장소에서 일괄 삭제 (FIFO, 조회 시 쓰기 없음)
+  크기는 여유분(max_size의 10%)만큼 저장할 때마다 한 번 확인
+- hits/misses/evictions는 프로세스별 카운터
+"""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Any
+
+from backend.agent_runtime.state import InMemoryStateStore, StateStore, to_jsonable
+
+# 초과 시 max_size의 이 비율까지 줄여 삭제 스캔 빈도를 낮춤
+_LOW_WATER_RATIO = 0.9
+
+
+def fingerprint(*parts: Any) -> str:
+    """입력값의 안정적인 해시 (키 순서/데이터클래스 표현과 무관)"""
+    payload = json.dumps(
+        to_jsonable(parts),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SimulationCache:
+    """시뮬레이션 결과 캐시 (StateStore 공유, 크기 제한)"""
+
+    def __init__(
+        self,
+        store: StateStore | None = None,
+        max_size: int = 512,
+        namespace: str = "impact_simulations",
+    ):
+        """
+        Args:
+            store: 저장소 (미지정 시 프로세스 메모리)
+            max_size: 최대 항목 수
+            namespace: 저장소 네임스페이스
+        """
+        self.store = store or InMemoryStateStore()
+        self.max_size = max_size
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        # 크기 확인 주기 (낮은 수위까지 줄인 뒤 다시 넘칠 수 있는 최소 저장 횟수)
+        self._check_every = max(1, max_size - int(max_size * _LOW_WATER_RATIO))
+        self._puts = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """저장된 값 (없으면 None)"""
+        entry = self.store.get(self.namespace, key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry["value"]
+
+    def put(self, key: str, value: Any) -> None:
+        """저장 (JSON 호환 값) 후 크기 초과분 삭제"""
+        self.store.put(self.namespace, key, {"stored_at": time.time(), "value": value})
+        with self._lock:
+            self._puts += 1
+            check = self._puts % self._check_every == 0
+        if check and self.store.count(self.namespace) > self.max_size:
+            self._evict()
+
+    def _evict(self) -> None:
+        evicted = self.store.prune(self.namespace, int(self.max_size * _LOW_WATER_RATIO))
+        with self._lock:
+            self.evictions += evicted
+
+    def clear(self) -> None:
+        self.store.clear(self.namespace)
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계 (size는 저장소 전체 기준)"""
+        with self._lock:
+            hits, misses, evictions = self.hits, self.misses, self.evictions
+        total = hits + misses
+        return {
+            "size": self.store.count(self.namespace),
+            "max_size": self.max_size,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,544 @@
+"""
+HR DSS - 성공 확률 학습 모델
+
+라벨링된 결과(data/labeled)로 학습하는 경량 로지스틱 회귀 (NumPy 구현)
+- 특성: SuccessProbabilityAgent와 같은 컨텍스트 키를 열 단위로 변환, 값이 없으면 NaN
+  (학습 평균으로 대체). 기회(OPPORTUNITY)는 KG 평가 결과로 빠진 FTE 값을 보충
+- 학습 예제: project_outcomes의 SUCCESS 1 / PARTIAL 0.5 / FAILURE 0 (연성 라벨)
+  - 특성은 라벨의 context, KG의 착수 시점 컨텍스트, 대상 ID별로 넘긴 컨텍스트 순으로 병합.
+    라벨 자체에는 사후 지표만 있으므로 컨텍스트가 없는 라벨은 제외
+    (전부 평균 대체된 행은 아무것도 학습하지 않음)
+  - capacity_outcomes(병목 발생 여부)는 프로젝트 성공과 다른 목표라 쓰지 않음
+- 학습: 표준화 + L2 정규화 Newton(IRLS). 소표본이므로 leave-one-out 예측으로 보정 지표 산출
+  - 학습셋에서 값이 전혀 없거나 일정한 특성은 학습되지 않음 → 경고 후 지표에 기록,
+    학습되는 특성이 하나도 없으면 실패 (휴리스틱 유지)
+- 직렬화: JSON (특성/표준화 값/계수/지표). 추론은 SuccessPredictor가 특성 행을 캐시하며 일괄 처리
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from backend.agent_runtime.agents.success_probability import SuccessProbabilityAgent
+
+logger = logging.getLogger(__name__)
+
+MODEL_VERSION = 2  # 1: CAPACITY 라벨 혼합 학습 (폐기)
+DEFAULT_LABELED_DIR = Path(__file__).resolve().parents[3] / "data" / "labeled"
+DEFAULT_MODEL_PATH = Path(__file__).resolve().parents[3] / "data" / "models" / "success_model.json"
+
+FEATURES = (
+    "base_rate",  # 프로젝트 유형별 기본 성공률
+    "resource_ratio",  # 가용 / 필요 FTE (0-2)
+    "competency_match",
+    "historical_success_rate",
+    "customer_relationship",
+    "existing_customer",
+    "buffer_ratio",  # 버퍼 / 계획 기간 (0-0.5)
+    "team_experience_years",  # 0-15
+    "similar_project_count",  # 0-10
+    "tech_complexity_high",
+    "current_utilization",
+)
+# 특성 계산에 쓰는 컨텍스트 키 (캐시 키 구성)
+CONTEXT_KEYS = (
+    "project_type",
+    "available_fte",
+    "required_fte",
+    "competency_match_score",
+    "historical_success_rate",
+    "customer_relationship",
+    "is_existing_customer",
+    "buffer_weeks",
+    "planned_duration_weeks",
+    "team_avg_experience_years",
+    "similar_project_count",
+    "tech_complexity",
+    "current_utilization",
+)
+PROJECT_TARGETS = {"SUCCESS": 1.0, "PARTIAL": 0.5, "FAILURE": 0.0}
+# KnowledgeGraphQuery.get_project_start_contexts 열 → 컨텍스트 키
+KG_START_CONTEXT_KEYS = {
+    "requiredFTE": "required_fte",
+    "availableFTE": "available_fte",
+    "plannedDurationWeeks": "planned_duration_weeks",
+    "teamAvgExperienceYears": "team_avg_experience_years",
+    "similarProjectCount": "similar_project_count",
+}
+MIN_TRAINING_EXAMPLES = 10
+
+
+def feature_matrix(contexts: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    """컨텍스트 → 대상 × FEATURES 행렬 (없는 값은 NaN)"""
+    n = len(contexts)
+
+    def column(key: str) -> np.ndarray:
+        return np.fromiter(
+            (math.nan if context.get(key) is None else float(context[key]) for context in contexts),
+            float,
+            n,
+        )
+
+    def flag(key: str, test: Any) -> np.ndarray:
+        return np.fromiter(
+            (
+                math.nan if context.get(key) is None else float(test(context[key]))
+                for context in contexts
+            ),
+            float,
+            n,
+        )
+
+    base_probs = SuccessProbabilityAgent.PROJECT_TYPE_BASE_PROB
+    base_rate = np.fromiter(
+        (
+            base_probs.get(context.get("project_type", "DEFAULT"), base_probs["DEFAULT"])
+            for context in contexts
+        ),
+        float,
+        n,
+    )
+    available, required = column("available_fte"), column("required_fte")
+    buffer_weeks = column("buffer_weeks")
+    planned = np.fromiter(
+        (
+            12.0
+            if context.get("planned_duration_weeks") is None
+            else float(context["planned_duration_weeks"])
+            for context in contexts
+        ),
+        float,
+        n,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        resource_ratio = np.where(required > 0, available / required, 2.0)
+        buffer_ratio = np.where(planned > 0, buffer_weeks / planned, 0.0)
+    resource_ratio[np.isnan(available) | np.isnan(required)] = np.nan
+    buffer_ratio[np.isnan(buffer_weeks)] = np.nan
+
+    return np.column_stack(
+        [
+            base_rate,
+            np.clip(resource_ratio, 0, 2),
+            column("competency_match_score"),
+            column("historical_success_rate"),
+            column("customer_relationship"),
+            flag("is_existing_customer", bool),
+            np.clip(buffer_ratio, 0, 0.5),
+            np.clip(column("team_avg_experience_years"), 0, 15),
+            np.clip(column("similar_project_count"), 0, 10),
+            flag("tech_complexity", lambda value: value == "HIGH"),
+            column("current_utilization"),
+        ]
+    )
+
+
+@dataclass
+class SuccessModel:
+    """표준화 + 로지스틱 회귀 계수"""
+
+    features: list[str]
+    mean: np.ndarray
+    scale: np.ndarray
+    coef: np.ndarray
+    intercept: float
+    metrics: dict[str, Any] = field(default_factory=dict)
+    trained_at: str = ""
+    version: int = MODEL_VERSION
+
+    def predict_proba(self, matrix: np.ndarray) -> np.ndarray:
+        """특성 행렬 → 성공 확률 (행별 독립 계산이라 일괄/단건 결과가 같음)"""
+        standardized = np.nan_to_num((matrix - self.mean) / self.scale, nan=0.0)
+        logits = (standardized * self.coef).sum(axis=1) + self.intercept
+        return 1.0 / (1.0 + np.exp(-logits))
+
+    def predict(self, contexts: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        return self.predict_proba(feature_matrix(contexts))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "trained_at": self.trained_at,
+            "features": self.features,
+            "mean": self.mean.tolist(),
+            "scale": self.scale.tolist(),
+            "coef": self.coef.tolist(),
+            "intercept": self.intercept,
+            "metrics": self.metrics,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "SuccessModel":
+        if data.get("version") != MODEL_VERSION:
+            raise ValueError(f"지원하지 않는 모델 버전: {data.get('version')}")
+        if list(data["features"]) != list(FEATURES):
+            raise ValueError("모델 특성이 현재 특성 정의와 다릅니다 (재학습 필요)")
+        return cls(
+            features=list(data["features"]),
+            mean=np.asarray(data["mean"], dtype=float),
+            scale=np.asarray(data["scale"], dtype=float),
+            coef=np.asarray(data["coef"], dtype=float),
+            intercept=float(data["intercept"]),
+            metrics=dict(data.get("metrics") or {}),
+            trained_at=data.get("trained_at", ""),
+        )
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SuccessModel":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class FeatureCache:
+    """대상별 특성 행 캐시 (LRU, KG 보충 결과 포함)"""
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._rows: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(
+        subject_type: str | None, subject_id: str, context: Mapping[str, Any]
+    ) -> Hashable | None:
+        """(대상, 특성에 쓰는 컨텍스트 값) 키 (해시할 수 없는 값이 있으면 None)"""
+        key = (subject_type, subject_id, *(context.get(name) for name in CONTEXT_KEYS))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                self.misses += 1
+                return None
+            self._rows.move_to_end(key)
+            self.hits += 1
+            return row
+
+    def put(self, key: Hashable, row: np.ndarray) -> None:
+        with self._lock:
+            self._rows[key] = row
+            self._rows.move_to_end(key)
+            while len(self._rows) > self.max_size:
+                self._rows.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._rows),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+class SuccessPredictor:
+    """
+    학습 모델 추론기 (SuccessProbabilityAgent의 ml_model)
+
+    대상 ID가 주어지면 특성 행을 캐시(단건 호출, KG 보충 시)하고,
+    기회는 KG 평가 결과로 빠진 FTE 값을 보충
+    """
+
+    def __init__(
+        self, model: SuccessModel, kg_client: Any = None, cache: FeatureCache | None = None
+    ):
+        self.model = model
+        self.kg_client = kg_client
+        self.cache = cache if cache is not None else FeatureCache()
+
+    @classmethod
+    def load(
+        cls, path: str | Path = DEFAULT_MODEL_PATH, kg_client: Any = None
+    ) -> "SuccessPredictor":
+        return cls(SuccessModel.load(path), kg_client=kg_client)
+
+    def predict(
+        self,
+        contexts: Sequence[Mapping[str, Any]],
+        subject_type: str | None = None,
+        subject_ids: Sequence[str] | None = None,
+    ) -> np.ndarray:
+        """대상별 성공 확률"""
+        return self.model.predict_proba(self.features(contexts, subject_type, subject_ids))
+
+    def features(
+        self,
+        contexts: Sequence[Mapping[str, Any]],
+        subject_type: str | None = None,
+        subject_ids: Sequence[str] | None = None,
+    ) -> np.ndarray:
+        """
+        특성 행렬 (캐시에 없는 행만 계산)
+
+        KG 보충이 없는 일괄 계산은 열 단위 계산이 행별 캐시 조회보다 빠르므로 캐시를 쓰지 않음
+        """
+        if subject_ids is None or (self.kg_client is None and len(contexts) > 1):
+            return feature_matrix(contexts)
+
+        keys = [
+            FeatureCache.key(subject_type, subject_id, context)
+            for subject_id, context in zip(subject_ids, contexts, strict=True)
+        ]
+        rows: list[np.ndarray | None] = [
+            None if key is None else self.cache.get(key) for key in keys
+        ]
+        missing = [i for i, row in enumerate(rows) if row is None]
+        if missing:
+            built = feature_matrix(
+                [self._enrich(subject_type, subject_ids[i], contexts[i]) for i in missing]
+            )
+            for i, row in zip(missing, built, strict=True):
+                rows[i] = row
+                if keys[i] is not None:
+                    self.cache.put(keys[i], row)
+        if not rows:
+            return np.empty((0, len(FEATURES)))
+        return np.vstack(rows)
+
+    def _enrich(
+        self, subject_type: str | None, subject_id: str, context: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """기회의 빠진 가용/필요 FTE를 KG 평가 결과로 보충 (컨텍스트 값 우선)"""
+        if self.kg_client is None or subject_type != "OPPORTUNITY" or not subject_id:
+            return context
+        if context.get("available_fte") is not None and context.get("required_fte") is not None:
+            return context
+        try:
+            data = self.kg_client.evaluate_opportunity(subject_id).data
+        except Exception as e:
+            logger.warning("KG 기회 평가 실패 (%s): %s", subject_id, e)
+            return context
+        row = data[0] if data else {}
+        kg_values = {
+            "available_fte": row.get("availableStaff"),
+            "required_fte": row.get("requiredFTE"),
+        }
+        return {**{k: v for k, v in kg_values.items() if v is not None}, **context}
+
+
+# =========================================================
+# 학습
+# =========================================================
+
+
+@dataclass
+class TrainingSet:
+    """학습 예제 (착수 시점 컨텍스트가 있는 프로젝트 라벨)"""
+
+    subject_ids: list[str]
+    contexts: list[dict[str, Any]]
+    targets: np.ndarray
+    skipped: list[str] = field(default_factory=list)  # 컨텍스트가 없어 제외한 라벨
+
+
+def kg_start_contexts(kg_client: Any, project_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+    """KG에서 프로젝트별 착수 시점 컨텍스트 조회 (값이 없는 열은 제외)"""
+    if not project_ids:
+        return {}
+    data = kg_client.get_project_start_contexts(list(project_ids)).data
+    return {
+        row["projectId"]: {
+            key: row[column]
+            for column, key in KG_START_CONTEXT_KEYS.items()
+            if row.get(column) is not None
+        }
+        for row in data
+    }
+
+
+def load_training_set(
+    labeled_dir: str | Path = DEFAULT_LABELED_DIR,
+    contexts: Mapping[str, Mapping[str, Any]] | None = None,
+    kg_client: Any = None,
+) -> TrainingSet:
+    """
+    라벨 파일 → 학습 예제
+
+    Args:
+        labeled_dir: project_outcomes.json 위치
+        contexts: 대상 ID → 사전(착수 시점) 컨텍스트 (가장 우선)
+        kg_client: KnowledgeGraphQuery (지정 시 contexts에 없는 프로젝트의 착수 시점 컨텍스트 조회)
+    """
+    contexts = contexts or {}
+    subject_ids, rows, targets, skipped = [], [], [], []
+
+    path = Path(labeled_dir) / "project_outcomes.json"
+    labels = [
+        label
+        for label in json.loads(path.read_text(encoding="utf-8")).get("labels", [])
+        if label.get("label") in PROJECT_TARGETS
+    ]
+    kg_contexts = {}
+    if kg_client is not None:
+        missing = [label["subjectId"] for label in labels if label["subjectId"] not in contexts]
+        kg_contexts = kg_start_contexts(kg_client, missing)
+
+    for label in labels:
+        subject_id = label["subjectId"]
+        context = {
+            **(label.get("context") or {}),
+            **kg_contexts.get(subject_id, {}),
+            **contexts.get(subject_id, {}),
+        }
+        if not any(context.get(key) is not None for key in CONTEXT_KEYS):
+            skipped.append(subject_id)
+            continue
+        subject_ids.append(subject_id)
+        rows.append(context)
+        targets.append(PROJECT_TARGETS[label["label"]])
+
+    return TrainingSet(subject_ids, rows, np.asarray(targets, dtype=float), skipped)
+
+
+def unlearned_features(matrix: np.ndarray) -> list[str]:
+    """학습셋에서 값이 없거나 일정해 계수를 학습할 수 없는 특성"""
+    observed = ~np.isnan(matrix)
+    high = np.where(observed, matrix, -np.inf).max(axis=0)
+    low = np.where(observed, matrix, np.inf).min(axis=0)
+    return [name for name, h, lo in zip(FEATURES, high, low, strict=True) if not h > lo]
+
+
+def fit_logistic(
+    matrix: np.ndarray, targets: np.ndarray, l2: float = 0.3, max_iter: int = 100
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    L2 정규화 로지스틱 회귀 (Newton / IRLS, 연성 라벨 허용)
+
+    Returns:
+        (mean, scale, coef, intercept) - 표준화 후 계수
+    """
+    observed = ~np.isnan(matrix)
+    counts = observed.sum(axis=0)
+    mean = np.where(counts > 0, np.nansum(matrix, axis=0) / np.maximum(counts, 1), 0.0)
+    centered = np.where(observed, matrix - mean, 0.0)
+    std = np.sqrt((centered**2).sum(axis=0) / np.maximum(counts, 1))
+    scale = np.where(std > 1e-9, std, 1.0)
+    centered[:, std <= 1e-9] = 0.0  # 값이 없거나 일정한 특성은 계수 0 (반올림 오차 제거)
+
+    design = np.column_stack([centered / scale, np.ones(len(matrix))])
+    penalty = np.full(design.shape[1], l2)
+    penalty[-1] = 0.0  # 절편은 정규화하지 않음
+    weights = np.zeros(design.shape[1])
+    for _ in range(max_iter):
+        probs = 1.0 / (1.0 + np.exp(-(design @ weights)))
+        gradient = design.T @ (probs - targets) + penalty * weights
+        hessian = (design * (probs * (1 - probs))[:, None]).T @ design + np.diag(penalty)
+        hessian[-1, -1] += 1e-9
+        step = np.linalg.solve(hessian, gradient)
+        weights -= step
+        if np.abs(step).max() < 1e-10:
+            break
+    return mean, scale, weights[:-1], float(weights[-1])
+
+
+def calibration_report(
+    probabilities: np.ndarray, targets: np.ndarray, bins: int = 5
+) -> dict[str, Any]:
+    """보정 지표: Brier, log loss, ECE, 구간별 평균 예측/실제"""
+    probabilities = np.clip(np.asarray(probabilities, dtype=float), 1e-6, 1 - 1e-6)
+    targets = np.asarray(targets, dtype=float)
+    edges = np.linspace(0, 1, bins + 1)
+    index = np.clip(np.digitize(probabilities, edges[1:-1]), 0, bins - 1)
+
+    reliability, ece = [], 0.0
+    for b in range(bins):
+        mask = index == b
+        if not mask.any():
+            continue
+        predicted, observed = float(probabilities[mask].mean()), float(targets[mask].mean())
+        ece += mask.mean() * abs(predicted - observed)
+        reliability.append(
+            {
+                "bin": f"{edges[b]:.1f}-{edges[b + 1]:.1f}",
+                "count": int(mask.sum()),
+                "mean_predicted": round(predicted, 4),
+                "observed_rate": round(observed, 4),
+            }
+        )
+    log_loss = -np.mean(targets * np.log(probabilities) + (1 - targets) * np.log(1 - probabilities))
+    return {
+        "count": len(targets),
+        "brier": round(float(np.mean((probabilities - targets) ** 2)), 4),
+        "log_loss": round(float(log_loss), 4),
+        "ece": round(float(ece), 4),
+        "reliability": reliability,
+    }
+
+
+def train_success_model(
+    training: TrainingSet, l2: float = 0.3, heuristic: SuccessProbabilityAgent | None = None
+) -> SuccessModel:
+    """
+    학습 + 지표 (학습셋, leave-one-out, 휴리스틱 기준선)
+
+    Args:
+        training: load_training_set 결과
+        l2: L2 정규화 강도 (표준화된 특성 기준)
+        heuristic: 비교할 휴리스틱 에이전트 (기본 SuccessProbabilityAgent)
+
+    Raises:
+        ValueError: 예제가 MIN_TRAINING_EXAMPLES 미만이거나 학습되는 특성이 없음
+    """
+    if len(training.targets) < MIN_TRAINING_EXAMPLES:
+        raise ValueError(
+            f"착수 시점 컨텍스트가 있는 프로젝트 라벨이 {len(training.targets)}건입니다 "
+            f"(최소 {MIN_TRAINING_EXAMPLES}건, 컨텍스트 없이 제외 {len(training.skipped)}건)"
+        )
+    started = time.perf_counter()
+    matrix, targets = feature_matrix(training.contexts), training.targets
+    unlearned = unlearned_features(matrix)
+    if len(unlearned) == len(FEATURES):
+        raise ValueError("학습셋에 값이 있는 특성이 없습니다 (모든 특성이 평균 대체 또는 상수)")
+    if unlearned:
+        logger.warning("학습되지 않는 특성 (계수 0, 값이 없거나 일정): %s", unlearned)
+    mean, scale, coef, intercept = fit_logistic(matrix, targets, l2=l2)
+    fit_ms = (time.perf_counter() - started) * 1000
+    model = SuccessModel(list(FEATURES), mean, scale, coef, intercept)
+
+    # 소표본 일반화 추정: 한 건씩 빼고 학습한 모델로 그 건을 예측
+    loo = np.empty(len(targets))
+    for i in range(len(targets)):
+        keep = np.arange(len(targets)) != i
+        fold = SuccessModel(list(FEATURES), *fit_logistic(matrix[keep], targets[keep], l2=l2))
+        loo[i] = fold.predict_proba(matrix[i : i + 1])[0]
+
+    heuristic = heuristic or SuccessProbabilityAgent()
+    baseline = heuristic.score_batch(training.contexts).success_probability
+    model.metrics = {
+        "examples": len(targets),
+        "skipped": len(training.skipped),
+        "unlearned_features": unlearned,
+        "l2": l2,
+        "fit_ms": round(fit_ms, 2),
+        "train": calibration_report(model.predict_proba(matrix), targets),
+        "leave_one_out": calibration_report(loo, targets),
+        "heuristic": calibration_report(baseline, targets),
+    }
+    model.trained_at = datetime.now().isoformat(timespec="seconds")
+    return model
@@ -3,14 +3,19 @@ HR DSS - Success Probability Agent
 
 프로젝트/의사결정의 성공 확률을 예측하는 에이전트
 휴리스틱 + ML 모델 기반 예측
+(calculate_batch/score_batch: 여러 대상의 컨텍스트를 열 단위 NumPy 연산으로 일괄 계산,
+ calculate_probability와 같은 값)
 """
 
 import logging
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,6 +100,22 @@ class ProbabilityResult:
     calculated_at: datetime = field(default_factory=datetime.now)
 
 
+@dataclass
+class BatchScores:
+    """일괄 계산 결과 (행: 컨텍스트, 열: SUCCESS_FACTORS / RISK_FACTORS 순서)"""
+
+    factor_scores: np.ndarray  # 성공 요인 점수 (0-100)
+    risk_probabilities: np.ndarray  # 리스크 발생 확률 (해당 없으면 0)
+    risk_present: np.ndarray  # 리스크 해당 여부
+    success_probability: np.ndarray  # 5-95% 범위 (반올림 전)
+    confidence: np.ndarray  # 반올림 전
+    overall_risk: np.ndarray  # 반올림 전
+
+    def probabilities(self) -> list[float]:
+        """ProbabilityResult.success_probability와 같은 반올림 값"""
+        return [round(value, 3) for value in self.success_probability.tolist()]
+
+
 class SuccessProbabilityAgent:
     """성공 확률 예측 에이전트"""
 
@@ -143,11 +164,52 @@ class SuccessProbabilityAgent:
         },
     }
 
+    # 리스크 요인 정의 (발생 확률은 컨텍스트에서 계산, 영향도는 고정)
+    RISK_FACTORS = {
+        "RISK-RES-01": {
+            "category": RiskCategory.RESOURCE,
+            "name": "리소스 부족",
+            "impact": 0.7,
+            "mitigation": "외주 인력 활용 또는 일정 연장",
+        },
+        "RISK-COMP-01": {
+            "category": RiskCategory.COMPETENCY,
+            "name": "역량 부족",
+            "impact": 0.6,
+            "mitigation": "교육 또는 외부 전문가 영입",
+        },
+        "RISK-SCH-01": {
+            "category": RiskCategory.SCHEDULE,
+            "name": "일정 촉박",
+            "impact": 0.5,
+            "mitigation": "범위 조정 또는 일정 협상",
+        },
+        "RISK-TECH-01": {
+            "category": RiskCategory.TECHNICAL,
+            "name": "기술 복잡성",
+            "impact": 0.6,
+            "mitigation": "PoC 선행 또는 전문가 투입",
+        },
+        "RISK-CUST-01": {
+            "category": RiskCategory.CUSTOMER,
+            "name": "신규 고객",
+            "impact": 0.4,
+            "mitigation": "철저한 요구사항 정의 및 변경 관리 프로세스",
+        },
+        "RISK-ORG-01": {
+            "category": RiskCategory.ORGANIZATIONAL,
+            "name": "조직 과부하",
+            "impact": 0.5,
+            "mitigation": "우선순위 조정 또는 증원",
+        },
+    }
+
     def __init__(self, kg_client: Any = None, ml_model: Any = None):
         """
         Args:
             kg_client: Knowledge Graph 클라이언트
-            ml_model: ML 예측 모델 (선택)
+            ml_model: ML 예측 모델 (선택, predict(contexts, subject_type, subject_ids) → 확률 배열
+                예: success_model.SuccessPredictor)
         """
         self.kg_client = kg_client
         self.ml_model = ml_model
@@ -179,6 +241,10 @@ class SuccessProbabilityAgent:
         risk_adjustment = self._calculate_risk_adjustment(risk_factors)
 
         success_probability = base_prob * (1 + factor_adjustment) * (1 - risk_adjustment)
+        if self.ml_model is not None:
+            # 학습 모델이 있으면 모델 확률 사용 (요인/리스크는 설명용으로 유지)
+            probabilities = self._model_probabilities([context], subject_type, [subject_id])
+            success_probability = float(probabilities[0])
         success_probability = max(0.05, min(0.95, success_probability))  # 5-95% 범위
 
         # 4. 신뢰도 계산
@@ -309,104 +375,76 @@ class SuccessProbabilityAgent:
         required_fte = context.get("required_fte", 1)
         if available_fte < required_fte:
             gap = required_fte - available_fte
-            probability = min(0.9, gap / required_fte)
-            risks.append(
-                RiskFactor(
-                    factor_id="RISK-RES-01",
-                    category=RiskCategory.RESOURCE,
-                    name="리소스 부족",
-                    description=f"필요 인력 대비 {gap:.1f} FTE 부족",
-                    probability=probability,
-                    impact=0.7,
-                    mitigation="외주 인력 활용 또는 일정 연장",
-                    evidence=[f"필요: {required_fte} FTE, 가용: {available_fte} FTE"],
-                )
-            )
+            risks.append(self._risk_factor("RISK-RES-01", min(0.9, gap / required_fte), context))
 
         # 역량 리스크
         competency_match = context.get("competency_match_score", 0.7)
         if competency_match < 0.8:
             probability = (0.8 - competency_match) / 0.8
-            risks.append(
-                RiskFactor(
-                    factor_id="RISK-COMP-01",
-                    category=RiskCategory.COMPETENCY,
-                    name="역량 부족",
-                    description=f"역량 매칭률 {competency_match * 100:.1f}%로 미달",
-                    probability=probability,
-                    impact=0.6,
-                    mitigation="교육 또는 외부 전문가 영입",
-                    evidence=[f"역량 매칭률: {competency_match * 100:.1f}%"],
-                )
-            )
+            risks.append(self._risk_factor("RISK-COMP-01", probability, context))
 
         # 일정 리스크
         buffer_weeks = context.get("buffer_weeks", 0)
         planned_duration = context.get("planned_duration_weeks", 12)
         if buffer_weeks < planned_duration * 0.1:
-            risks.append(
-                RiskFactor(
-                    factor_id="RISK-SCH-01",
-                    category=RiskCategory.SCHEDULE,
-                    name="일정 촉박",
-                    description="충분한 일정 버퍼가 없음",
-                    probability=0.5,
-                    impact=0.5,
-                    mitigation="범위 조정 또는 일정 협상",
-                    evidence=[f"버퍼: {buffer_weeks}주 / 전체: {planned_duration}주"],
-                )
-            )
+            risks.append(self._risk_factor("RISK-SCH-01", 0.5, context))
 
         # 기술 리스크
-        tech_complexity = context.get("tech_complexity", "MEDIUM")
-        if tech_complexity == "HIGH":
-            risks.append(
-                RiskFactor(
-                    factor_id="RISK-TECH-01",
-                    category=RiskCategory.TECHNICAL,
-                    name="기술 복잡성",
-                    description="높은 기술 난이도로 인한 리스크",
-                    probability=0.4,
-                    impact=0.6,
-                    mitigation="PoC 선행 또는 전문가 투입",
-                    evidence=[f"기술 복잡도: {tech_complexity}"],
-                )
-            )
+        if context.get("tech_complexity", "MEDIUM") == "HIGH":
+            risks.append(self._risk_factor("RISK-TECH-01", 0.4, context))
 
         # 고객 리스크
-        is_new_customer = not context.get("is_existing_customer", False)
-        if is_new_customer:
-            risks.append(
-                RiskFactor(
-                    factor_id="RISK-CUST-01",
-                    category=RiskCategory.CUSTOMER,
-                    name="신규 고객",
-                    description="신규 고객으로 요구사항 불확실성 존재",
-                    probability=0.3,
-                    impact=0.4,
-                    mitigation="철저한 요구사항 정의 및 변경 관리 프로세스",
-                    evidence=["신규 고객"],
-                )
-            )
+        if not context.get("is_existing_customer", False):
+            risks.append(self._risk_factor("RISK-CUST-01", 0.3, context))
 
         # 조직 리스크
-        utilization = context.get("current_utilization", 0.8)
-        if utilization > 0.9:
-            risks.append(
-                RiskFactor(
-                    factor_id="RISK-ORG-01",
-                    category=RiskCategory.ORGANIZATIONAL,
-                    name="조직 과부하",
-                    description=f"현재 가동률 {utilization * 100:.1f}%로 과부하 상태",
-                    probability=0.6,
-                    impact=0.5,
-                    mitigation="우선순위 조정 또는 증원",
-                    evidence=[f"현재 가동률: {utilization * 100:.1f}%"],
-                )
-            )
+        if context.get("current_utilization", 0.8) > 0.9:
+            risks.append(self._risk_factor("RISK-ORG-01", 0.6, context))
 
         return risks
 
+    def _risk_factor(
+        self, factor_id: str, probability: float, context: Mapping[str, Any]
+    ) -> RiskFactor:
+        """리스크 요인 생성 (설명/근거는 컨텍스트 값으로 작성)"""
+        if factor_id == "RISK-RES-01":
+            available_fte = context.get("available_fte", 0)
+            required_fte = context.get("required_fte", 1)
+            gap = required_fte - available_fte
+            description = f"필요 인력 대비 {gap:.1f} FTE 부족"
+            evidence = [f"필요: {required_fte} FTE, 가용: {available_fte} FTE"]
+        elif factor_id == "RISK-COMP-01":
+            competency_match = context.get("competency_match_score", 0.7)
+            description = f"역량 매칭률 {competency_match * 100:.1f}%로 미달"
+            evidence = [f"역량 매칭률: {competency_match * 100:.1f}%"]
+        elif factor_id == "RISK-SCH-01":
+            buffer_weeks = context.get("buffer_weeks", 0)
+            planned_duration = context.get("planned_duration_weeks", 12)
+            description = "충분한 일정 버퍼가 없음"
+            evidence = [f"버퍼: {buffer_weeks}주 / 전체: {planned_duration}주"]
+        elif factor_id == "RISK-TECH-01":
+            description = "높은 기술 난이도로 인한 리스크"
+            evidence = [f"기술 복잡도: {context.get('tech_complexity', 'MEDIUM')}"]
+        elif factor_id == "RISK-CUST-01":
+            description = "신규 고객으로 요구사항 불확실성 존재"
+            evidence = ["신규 고객"]
+        else:
+            utilization = context.get("current_utilization", 0.8)
+            description = f"현재 가동률 {utilization * 100:.1f}%로 과부하 상태"
+            evidence = [f"현재 가동률: {utilization * 100:.1f}%"]
+
+        definition = self.RISK_FACTORS[factor_id]
+        return RiskFactor(
+            factor_id=factor_id,
+            category=definition["category"],
+            name=definition["name"],
+            description=description,
+            probability=probability,
+            impact=definition["impact"],
+            mitigation=definition["mitigation"],
+            evidence=evidence,
+        )
+
     def _calculate_factor_adjustment(self, success_factors: list[SuccessFactor]) -> float:
         """성공 요인에 의한 조정값 계산"""
         if not success_factors:
@@ -496,6 +534,210 @@ class SuccessProbabilityAgent:
 
         return " ".join(parts)
 
+    def calculate_batch(
+        self,
+        subject_type: str,
+        subject_ids: Sequence[str],
+        subject_names: Sequence[str],
+        contexts: Sequence[Mapping[str, Any]],
+    ) -> list[ProbabilityResult]:
+        """
+        성공 확률 일괄 계산 (calculate_probability와 같은 결과)
+
+        수치는 score_batch로 한 번에 계산하고 결과 객체/문구만 대상별로 구성
+
+        Args:
+            subject_type: 대상 유형 (PROJECT, OPPORTUNITY, OPTION)
+            subject_ids: 대상 ID
+            subject_names: 대상 이름
+            contexts: 대상별 분석 컨텍스트
+
+        Returns:
+            list[ProbabilityResult]: 입력 순서대로
+        """
+        if not len(subject_ids) == len(subject_names) == len(contexts):
+            raise ValueError("subject_ids, subject_names, contexts 길이가 같아야 합니다")
+        scores = self.score_batch(contexts, subject_type, subject_ids)
+        factors = [
+            (factor_id, factor_def["name"], factor_def["weight"])
+            for factor_id, factor_def in self.SUCCESS_FACTORS.items()
+        ]
+        risk_ids = list(self.RISK_FACTORS)
+        factor_scores = scores.factor_scores.tolist()
+        risk_probabilities = scores.risk_probabilities.tolist()
+        risk_present = scores.risk_present.tolist()
+        probabilities = scores.success_probability.tolist()
+        confidences = scores.confidence.tolist()
+        overall_risks = scores.overall_risk.tolist()
+        calculated_at = datetime.now()
+
+        results = []
+        for i, context in enumerate(contexts):
+            success_factors = [
+                SuccessFactor(
+                    factor_id,
+                    name,
+                    weight,
+                    score,
+                    evidence=self._get_factor_evidence(factor_id, context),
+                )
+                for (factor_id, name, weight), score in zip(factors, factor_scores[i], strict=True)
+            ]
+            risk_factors = [
+                self._risk_factor(risk_id, probability, context)
+                for risk_id, probability, present in zip(
+                    risk_ids, risk_probabilities[i], risk_present[i], strict=True
+                )
+                if present
+            ]
+            results.append(
+                ProbabilityResult(
+                    subject_type=subject_type,
+                    subject_id=subject_ids[i],
+                    subject_name=subject_names[i],
+                    success_probability=round(probabilities[i], 3),
+                    confidence=round(confidences[i], 3),
+                    success_factors=success_factors,
+                    risk_factors=risk_factors,
+                    overall_risk_score=round(overall_risks[i], 3),
+                    recommendation=self._generate_recommendation(
+                        probabilities[i], overall_risks[i], success_factors, risk_factors
+                    ),
+                    calculated_at=calculated_at,
+                )
+            )
+        return results
+
+    def score_batch(
+        self,
+        contexts: Sequence[Mapping[str, Any]],
+        subject_type: str | None = None,
+        subject_ids: Sequence[str] | None = None,
+    ) -> BatchScores:
+        """
+        성공 요인/리스크/확률/신뢰도를 열 단위로 일괄 계산 (결과 객체 없이 수치만)
+
+        연산 순서를 calculate_probability와 맞춰 부동소수점 결과까지 같음
+        (subject_type/subject_ids는 학습 모델의 특성 캐시/KG 보충에만 사용)
+        """
+        n = len(contexts)
+
+        def column(key: str, default: float) -> np.ndarray:
+            return np.fromiter((context.get(key, default) for context in contexts), float, n)
+
+        def flag(values: Any) -> np.ndarray:
+            return np.fromiter(values, bool, n)
+
+        available_fte = column("available_fte", 0)
+        required_fte = column("required_fte", 1)
+        competency_match = column("competency_match_score", 0.7)
+        planned_duration = column("planned_duration_weeks", 12)
+        buffer_weeks = column("buffer_weeks", 0)
+        existing_customer = flag(
+            bool(context.get("is_existing_customer", False)) for context in contexts
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # 성공 요인 (_calculate_factor_score와 같은 식)
+            ratio = available_fte / required_fte
+            buffer_ratio = np.where(planned_duration > 0, buffer_weeks / planned_duration, 0.0)
+            customer = column("customer_relationship", 0.5) * 80
+            columns = {
+                "resource_match": np.where(required_fte == 0, 100.0, np.minimum(100, ratio * 100)),
+                "competency_match": competency_match * 100,
+                "historical_success": column("historical_success_rate", 0.7) * 100,
+                "customer_relationship": np.minimum(
+                    100, np.where(existing_customer, customer + 20, customer)
+                ),
+                "schedule_buffer": np.select(
+                    [buffer_ratio >= 0.2, buffer_ratio >= 0.1, buffer_ratio > 0],
+                    [100.0, 80.0, 60.0],
+                    40.0,
+                ),
+                "team_experience": np.minimum(50, column("team_avg_experience_years", 3) * 10)
+                + np.minimum(50, column("similar_project_count", 0) * 10),
+            }
+            factor_scores = np.column_stack(
+                [columns.get(factor_id, np.full(n, 50.0)) for factor_id in self.SUCCESS_FACTORS]
+            )
+
+            # 리스크 (_analyze_risk_factors와 같은 조건/확률)
+            risk_columns = {
+                "RISK-RES-01": (
+                    available_fte < required_fte,
+                    np.minimum(0.9, (required_fte - available_fte) / required_fte),
+                ),
+                "RISK-COMP-01": (competency_match < 0.8, (0.8 - competency_match) / 0.8),
+                "RISK-SCH-01": (buffer_weeks < planned_duration * 0.1, 0.5),
+                "RISK-TECH-01": (
+                    flag(
+                        context.get("tech_complexity", "MEDIUM") == "HIGH" for context in contexts
+                    ),
+                    0.4,
+                ),
+                "RISK-CUST-01": (~existing_customer, 0.3),
+                "RISK-ORG-01": (column("current_utilization", 0.8) > 0.9, 0.6),
+            }
+        risk_present = np.column_stack([risk_columns[r][0] for r in self.RISK_FACTORS])
+        risk_probabilities = np.column_stack(
+            [np.where(risk_columns[r][0], risk_columns[r][1], 0.0) for r in self.RISK_FACTORS]
+        )
+        impacts = [self.RISK_FACTORS[r]["impact"] for r in self.RISK_FACTORS]
+
+        # 합계는 Python sum과 같은 순서로 누적
+        weighted_total = np.zeros(n)
+        for j, factor_def in enumerate(self.SUCCESS_FACTORS.values()):
+            weighted_total = weighted_total + factor_def["weight"] * factor_scores[:, j]
+        total_weight = sum(factor_def["weight"] for factor_def in self.SUCCESS_FACTORS.values())
+        avg_score = weighted_total / total_weight if total_weight > 0 else np.full(n, 50.0)
+        factor_adjustment = (avg_score - 50) / 100
+
+        total_risk = np.zeros(n)
+        high_risk_count = np.zeros(n, dtype=np.int64)
+        for j, impact in enumerate(impacts):
+            risk_score = risk_probabilities[:, j] * impact
+            total_risk = total_risk + np.where(risk_present[:, j], risk_score, 0.0)
+            high_risk_count += risk_present[:, j] & (risk_score >= 0.4)
+        risk_count = risk_present.sum(axis=1)
+        risk_adjustment = np.where(risk_count > 0, np.minimum(total_risk / 5.0, 0.5), 0.0)
+        overall_risk = np.where(risk_count > 0, total_risk / np.maximum(risk_count, 1), 0.0)
+
+        base_prob = np.fromiter(
+            (self._get_base_probability(context) for context in contexts), float, n
+        )
+        success_probability = base_prob * (1 + factor_adjustment) * (1 - risk_adjustment)
+        if self.ml_model is not None:
+            success_probability = self._model_probabilities(contexts, subject_type, subject_ids)
+        success_probability = np.clip(success_probability, 0.05, 0.95)
+
+        # 신뢰도 (_calculate_confidence와 같은 식)
+        data_bonus = (column("data_completeness", 0.8) - 0.5) * 0.3
+        historical_bonus = np.where(column("historical_project_count", 0) > 5, 0.1, 0.0)
+        confidence = np.clip(
+            0.7 + data_bonus + historical_bonus - high_risk_count * 0.05, 0.3, 0.95
+        )
+
+        return BatchScores(
+            factor_scores=factor_scores,
+            risk_probabilities=risk_probabilities,
+            risk_present=risk_present,
+            success_probability=success_probability,
+            confidence=confidence,
+            overall_risk=overall_risk,
+        )
+
+    def _model_probabilities(
+        self,
+        contexts: Sequence[Mapping[str, Any]],
+        subject_type: str | None,
+        subject_ids: Sequence[str] | None,
+    ) -> np.ndarray:
+        """학습 모델 확률 (대상별, 행 단위 독립 계산)"""
+        return np.asarray(
+            self.ml_model.predict(contexts, subject_type=subject_type, subject_ids=subject_ids),
+            dtype=float,
+        )
+
     def to_dict(self, result: ProbabilityResult) -> dict:
         """결과를 딕셔너리로 변환"""
         return {
@@ -5,13 +5,20 @@ HR DSS - Workflow Builder Agent
 각 에이전트의 실행 순서와 데이터 흐름을 관리
 """
 
+import copy
 import logging
-from collections.abc import Callable
+import threading
+import uuid
+from collections.abc import Callable, Hashable, MutableMapping
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from backend.agent_runtime.metrics import WORKFLOW_STEP_SECONDS
+from backend.agent_runtime.ontology.singleflight import SingleFlight
+from backend.agent_runtime.state import StateStore, StoreMapping
+
 logger = logging.getLogger(__name__)
 
 
@@ -121,6 +128,50 @@ class WorkflowContext:
     hitl_decision: dict[str, Any] | None = None
 
 
+class KGLookupCache:
+    """
+    여러 워크플로가 공유하는 KG 조회 결과 (배치 분석용)
+
+    같은 (질문 유형, 조직) 조회는 한 번만 실행하고, 동시에 들어온 조회는 진행 중인
+    실행을 기다립니다. 호출자마다 사본을 돌려주므로 결과를 수정해도 서로 영향이 없습니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._results: dict[Hashable, dict] = {}
+        self._flight = SingleFlight()
+        self.lookups = 0
+        self.executions = 0
+
+    def get_or_load(self, key: Hashable, load: Callable[[], dict]) -> dict:
+        """캐시된 조회 결과 반환 (없으면 load 실행)"""
+        with self._lock:
+            self.lookups += 1
+            cached = self._results.get(key)
+        if cached is None:
+            cached = self._flight.do(key, lambda: self._load(key, load))
+        return copy.deepcopy(cached)
+
+    def _load(self, key: Hashable, load: Callable[[], dict]) -> dict:
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+        result = load()
+        with self._lock:
+            self._results[key] = result
+            self.executions += 1
+        return result
+
+    def stats(self) -> dict[str, int]:
+        """조회 수 / 실제 실행 수 / 공유된 조회 수"""
+        with self._lock:
+            return {
+                "lookups": self.lookups,
+                "executions": self.executions,
+                "shared": self.lookups - self.executions,
+            }
+
+
 class WorkflowBuilderAgent:
     """워크플로 빌더 에이전트"""
 
@@ -184,17 +235,28 @@ class WorkflowBuilderAgent:
         agents: dict[str, Any] | None = None,
         kg_client: Any = None,
         hitl_handler: Callable[[WorkflowExecution, WorkflowContext], dict] | None = None,
+        state_store: StateStore | None = None,
+        kg_cache: KGLookupCache | None = None,
     ):
         """
         Args:
             agents: 에이전트 인스턴스 딕셔너리
             kg_client: Knowledge Graph 클라이언트
             hitl_handler: HITL 승인 핸들러 함수
+            state_store: 실행 인스턴스 저장소 (미지정 시 이 인스턴스 안에서만 보관, 직렬화 없음)
+                공유 저장소를 쓰면 다른 워커에서 실행 상태 조회/재개 가능
+            kg_cache: 다른 워크플로와 공유할 KG 조회 결과 (미지정 시 매번 조회)
         """
         self.agents = agents or {}
         self.kg_client = kg_client
+        self.kg_cache = kg_cache
         self.hitl_handler = hitl_handler
-        self.executions: dict[str, WorkflowExecution] = {}
+        # 저장소가 주입된 경우에만 단계마다 영속화 (일회성 실행은 직렬화 비용을 들이지 않음)
+        self.executions: MutableMapping[str, WorkflowExecution] = (
+            StoreMapping(state_store, "workflow_executions", WorkflowExecution)
+            if state_store is not None
+            else {}
+        )
 
     def build_workflow(
         self,
@@ -262,7 +324,8 @@ class WorkflowBuilderAgent:
         Returns:
             WorkflowExecution: 실행 인스턴스
         """
-        execution_id = f"EXEC-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        # 여러 워커가 같은 저장소를 쓰므로 시각 뒤에 임의 접미사 추가
+        execution_id = f"EXEC-{datetime.now().strftime('%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:6]}"
 
         execution = WorkflowExecution(
             execution_id=execution_id,
@@ -331,7 +394,11 @@ class WorkflowBuilderAgent:
 
             logger.error(f"단계 실패: {step.step_id} - {e}")
 
+        WORKFLOW_STEP_SECONDS.observe(
+            result.duration_ms / 1000, step=step.step_type.value, status=result.status.value
+        )
         execution.step_results[step.step_id] = result
+        self.executions[execution.execution_id] = execution
         return result
 
     def _execute_step_by_type(
@@ -348,23 +415,30 @@ class WorkflowBuilderAgent:
                 return {
                     "query_type": result.query_type.value,
                     "sub_queries": [
-                        {"type": sq.query_type, "query": sq.query, "priority": sq.priority}
+                        {
+                            "type": sq.sub_query_id,
+                            "query": sq.description,
+                            "priority": sq.priority,
+                        }
                         for sq in result.sub_queries
                     ],
                     "intent": result.intent,
+                    "constraints": result.constraints,
                 }
             return self._mock_query_decomposition(context)
 
         elif step.step_type == StepType.KG_QUERY:
-            if self.kg_client:
-                # 실제 KG 쿼리 실행
-                query_type = (
-                    context.decomposed_query.get("query_type", "CAPACITY")
-                    if context.decomposed_query
-                    else "CAPACITY"
+            query_type = (
+                context.decomposed_query.get("query_type", "CAPACITY")
+                if context.decomposed_query
+                else "CAPACITY"
+            )
+            if self.kg_cache is not None:
+                return self.kg_cache.get_or_load(
+                    (query_type, context.org_unit_id, self._opportunity_id(context)),
+                    lambda: self._query_kg(query_type, context),
                 )
-                return self._execute_kg_query(query_type, context)
-            return self._mock_kg_query(context)
+            return self._query_kg(query_type, context)
 
         elif step.step_type == StepType.OPTION_GENERATION:
             agent = self.agents.get("option_generator")
@@ -376,7 +450,7 @@ class WorkflowBuilderAgent:
                 )
                 result = agent.generate_options(
                     query_type=query_type,
-                    context=context.kg_results or {},
+                    context=self._build_baseline(context),
                     constraints=context.constraints,
                 )
                 return agent.to_dict(result)
@@ -392,8 +466,8 @@ class WorkflowBuilderAgent:
                 )
                 result = agent.simulate(
                     query_type=query_type,
-                    options=context.options,
-                    baseline=context.kg_results or {},
+                    options=context.options.get("options", []),
+                    baseline=self._build_baseline(context),
                 )
                 return agent.to_dict(result)
             return self._mock_impact_simulation(context)
@@ -462,6 +536,7 @@ class WorkflowBuilderAgent:
         workflow: WorkflowDefinition,
         context: WorkflowContext,
         stop_on_hitl: bool = True,
+        on_step: Callable[[WorkflowStep, StepResult], None] | None = None,
     ) -> WorkflowExecution:
         """
         전체 워크플로 실행
@@ -470,53 +545,60 @@ class WorkflowBuilderAgent:
             workflow: 워크플로 정의
             context: 실행 컨텍스트
             stop_on_hitl: HITL 단계에서 중지 여부
+            on_step: 단계 완료 시 호출되는 진행 콜백 (단계, 결과)
 
         Returns:
             WorkflowExecution: 최종 실행 결과
         """
         execution = self.start_execution(workflow, context)
 
-        for step in workflow.steps:
-            execution.current_step_id = step.step_id
-
-            # 의존성 확인
-            for dep_id in step.depends_on:
-                dep_result = execution.step_results.get(dep_id)
-                if dep_result and dep_result.status == StepStatus.FAILED:
-                    if step.required:
-                        execution.status = WorkflowStatus.FAILED
-                        execution.error = f"의존 단계 실패: {dep_id}"
-                        return execution
-                    else:
-                        # 선택적 단계는 스킵
-                        skip_result = StepResult(
-                            step_id=step.step_id,
-                            step_type=step.step_type,
-                            status=StepStatus.SKIPPED,
-                        )
-                        execution.step_results[step.step_id] = skip_result
-                        continue
-
-            # HITL 단계에서 중지
-            if step.step_type == StepType.HITL_APPROVAL and stop_on_hitl:
-                execution.status = WorkflowStatus.PAUSED
-                logger.info(f"HITL 승인 대기 중: {execution.execution_id}")
-                return execution
-
-            # 단계 실행
-            result = self.execute_step(execution, step, context)
-
-            if result.status == StepStatus.FAILED and step.required:
-                execution.status = WorkflowStatus.FAILED
-                execution.error = result.error
-                return execution
-
-        execution.status = WorkflowStatus.COMPLETED
-        execution.completed_at = datetime.now()
-
-        logger.info(f"워크플로 완료: {execution.execution_id}")
-
-        return execution
+        try:
+            for step in workflow.steps:
+                execution.current_step_id = step.step_id
+
+                # 의존성 확인
+                for dep_id in step.depends_on:
+                    dep_result = execution.step_results.get(dep_id)
+                    if dep_result and dep_result.status == StepStatus.FAILED:
+                        if step.required:
+                            execution.status = WorkflowStatus.FAILED
+                            execution.error = f"의존 단계 실패: {dep_id}"
+                            return execution
+                        else:
+                            # 선택적 단계는 스킵
+                            skip_result = StepResult(
+                                step_id=step.step_id,
+                                step_type=step.step_type,
+                                status=StepStatus.SKIPPED,
+                            )
+                            execution.step_results[step.step_id] = skip_result
+                            continue
+
+                # HITL 단계에서 중지
+                if step.step_type == StepType.HITL_APPROVAL and stop_on_hitl:
+                    execution.status = WorkflowStatus.PAUSED
+                    logger.info(f"HITL 승인 대기 중: {execution.execution_id}")
+                    return execution
+
+                # 단계 실행
+                result = self.execute_step(execution, step, context)
+                if on_step:
+                    on_step(step, result)
+
+                if result.status == StepStatus.FAILED and step.required:
+                    execution.status = WorkflowStatus.FAILED
+                    execution.error = result.error
+                    return execution
+
+            execution.status = WorkflowStatus.COMPLETED
+            execution.completed_at = datetime.now()
+
+            logger.info(f"워크플로 완료: {execution.execution_id}")
+
+            return execution
+        finally:
+            # 중단/실패/완료 모두 저장소에 반영
+            self.executions[execution.execution_id] = execution
 
     def resume_workflow(
         self,
@@ -544,45 +626,50 @@ class WorkflowBuilderAgent:
         if execution.status != WorkflowStatus.PAUSED:
             raise ValueError(f"재개 불가능한 상태: {execution.status}")
 
-        # HITL 결과 기록
-        context.hitl_decision = hitl_result
-
-        # 현재 HITL 단계 완료 처리
-        hitl_step = next((s for s in workflow.steps if s.step_type == StepType.HITL_APPROVAL), None)
-        if hitl_step:
-            hitl_result_obj = StepResult(
-                step_id=hitl_step.step_id,
-                step_type=StepType.HITL_APPROVAL,
-                status=StepStatus.COMPLETED,
-                output=hitl_result,
-                completed_at=datetime.now(),
+        try:
+            # HITL 결과 기록
+            context.hitl_decision = hitl_result
+
+            # 현재 HITL 단계 완료 처리
+            hitl_step = next(
+                (s for s in workflow.steps if s.step_type == StepType.HITL_APPROVAL), None
             )
-            execution.step_results[hitl_step.step_id] = hitl_result_obj
+            if hitl_step:
+                hitl_result_obj = StepResult(
+                    step_id=hitl_step.step_id,
+                    step_type=StepType.HITL_APPROVAL,
+                    status=StepStatus.COMPLETED,
+                    output=hitl_result,
+                    completed_at=datetime.now(),
+                )
+                execution.step_results[hitl_step.step_id] = hitl_result_obj
 
-        # 나머지 단계 실행
-        execution.status = WorkflowStatus.RUNNING
-        hitl_found = False
+            # 나머지 단계 실행
+            execution.status = WorkflowStatus.RUNNING
+            hitl_found = False
 
-        for step in workflow.steps:
-            if step.step_type == StepType.HITL_APPROVAL:
-                hitl_found = True
-                continue
+            for step in workflow.steps:
+                if step.step_type == StepType.HITL_APPROVAL:
+                    hitl_found = True
+                    continue
 
-            if not hitl_found:
-                continue
+                if not hitl_found:
+                    continue
 
-            execution.current_step_id = step.step_id
-            result = self.execute_step(execution, step, context)
+                execution.current_step_id = step.step_id
+                result = self.execute_step(execution, step, context)
 
-            if result.status == StepStatus.FAILED and step.required:
-                execution.status = WorkflowStatus.FAILED
-                execution.error = result.error
-                return execution
+                if result.status == StepStatus.FAILED and step.required:
+                    execution.status = WorkflowStatus.FAILED
+                    execution.error = result.error
+                    return execution
 
-        execution.status = WorkflowStatus.COMPLETED
-        execution.completed_at = datetime.now()
+            execution.status = WorkflowStatus.COMPLETED
+            execution.completed_at = datetime.now()
 
-        return execution
+            return execution
+        finally:
+            self.executions[execution.execution_id] = execution
 
     # ============================================================
     # Mock 데이터 생성 메서드 (에이전트 미연결 시 사용)
@@ -671,11 +758,143 @@ class WorkflowBuilderAgent:
             "unverified_claims": [],
         }
 
+    def _query_kg(self, query_type: str, context: WorkflowContext) -> dict:
+        """KG 조회 (클라이언트가 없으면 Mock)"""
+        if self.kg_client:
+            return self._execute_kg_query(query_type, context)
+        return self._mock_kg_query(context)
+
+    @staticmethod
+    def _opportunity_id(context: WorkflowContext) -> str | None:
+        """Go/No-go 대상 기회 ID (질문 분해 제약조건 또는 요청 제약조건)"""
+        decomposed = (context.decomposed_query or {}).get("constraints") or {}
+        return decomposed.get("opportunityId") or context.constraints.get("opportunity_id")
+
     def _execute_kg_query(self, query_type: str, context: WorkflowContext) -> dict:
-        """실제 KG 쿼리 실행"""
-        # 실제 구현은 kg_client 사용
+        """
+        실제 KG 쿼리 실행 (KnowledgeGraphQuery 인터페이스)
+
+        질문 유형별 조회 결과를 Mock과 같은 baseline 키로 변환합니다.
+        대상(조직/기회)이 없어 조회할 수 없으면 Mock 결과를 사용합니다.
+        """
+        org_unit_id = context.org_unit_id
+        if query_type == "GO_NOGO":
+            opportunity_id = self._opportunity_id(context)
+            if opportunity_id:
+                return self._kg_opportunity(opportunity_id)
+        elif query_type == "COMPETENCY_GAP":
+            return self._kg_competency_gap(org_unit_id)
+        elif org_unit_id:
+            result = self._kg_capacity(org_unit_id)
+            if query_type == "HEADCOUNT":
+                result.update(self._kg_headcount(org_unit_id))
+            return result
+        logger.info("KG 조회 대상 없음 (%s), Mock 결과 사용", query_type)
         return self._mock_kg_query(context)
 
+    def _kg_capacity(self, org_unit_id: str, weeks: int = 12) -> dict:
+        """
+        현재 가동률 + 주차별 Capacity 예측 (가동률 90% 초과 주차가 병목)
+
+        재배치 입력도 함께 구성합니다: 후보 직원의 주차별 가용 FTE(available_resources)와
+        예측상 부족 FTE가 있는 주차의 수요(weekly_demand). 두 쿼리 모두 TimeBucket.label을
+        주차 키로 쓰므로 그대로 맞물립니다.
+        """
+        today = date.today()
+        current = self.kg_client.get_org_utilization(
+            org_unit_id, today, today + timedelta(weeks=weeks)
+        ).data
+        forecast = self.kg_client.get_capacity_forecast(org_unit_id, weeks).data
+        candidates = self.kg_client.get_reallocation_candidates(org_unit_id, weeks).data
+        series = [float(week.get("utilization") or 0.0) for week in forecast]
+        shortfall = [max(0.0, -float(week.get("gapFTE") or 0.0)) for week in forecast]
+        if len(series) >= 2 and abs(series[-1] - series[0]) >= 0.02:
+            trend = "INCREASING" if series[-1] > series[0] else "DECREASING"
+        else:
+            trend = "STABLE"
+        return {
+            "org_unit_id": org_unit_id,
+            "org_unit": current[0].get("orgUnitName") if current else None,
+            "utilization": {
+                "current": float(current[0].get("utilization") or 0.0) if current else 0.0,
+                "trend": trend,
+            },
+            "bottleneck_weeks": [
+                week.get("weekLabel")
+                for week, value in zip(forecast, series, strict=True)
+                if value > 0.9
+            ],
+            "gap_fte": max(shortfall, default=0.0),
+            "gap_series": shortfall,
+            "gap_weeks": [week.get("weekLabel") for week in forecast],
+            "available_resources": [self._candidate_resource(row) for row in candidates],
+            "weekly_demand": [
+                {"week": week.get("weekLabel"), "gap_fte": gap}
+                for week, gap in zip(forecast, shortfall, strict=True)
+                if gap > 0
+            ],
+        }
+
+    @staticmethod
+    def _candidate_resource(row: dict) -> dict:
+        """재배치 후보 행 → available_resources 항목 (available_fte는 기간 내 최소 가용량)"""
+        weekly = {
+            str(item["week"]): max(0.0, float(item.get("availableFTE") or 0.0))
+            for item in row.get("availableFTEByWeek") or []
+        }
+        return {
+            "employee_id": row.get("employeeId"),
+            "name": row.get("name", ""),
+            "org_unit_id": row.get("orgUnitId"),
+            "same_org": bool(row.get("sameOrg")),
+            "competencies": [
+                {"competency_id": c.get("competencyId"), "level": c.get("level")}
+                for c in row.get("competencies") or []
+                if c.get("competencyId")
+            ],
+            "available_fte_by_week": weekly,
+            "available_fte": min(weekly.values(), default=0.0),
+        }
+
+    def _kg_headcount(self, org_unit_id: str) -> dict:
+        """증원 필요성 (파이프라인 수요, 예상 부족 FTE)"""
+        data = self.kg_client.analyze_headcount_need(org_unit_id).data
+        analysis = data[0] if data else {}
+        return {
+            "pipeline_demand": float(analysis.get("pipelineDemandFTE") or 0.0),
+            "projected_gap_fte": float(analysis.get("projectedGap") or 0.0),
+            "headcount_recommendation": analysis.get("headcountRecommendation"),
+        }
+
+    def _kg_opportunity(self, opportunity_id: str) -> dict:
+        """기회 평가 (필요 FTE 대비 가용 인력 비율이 resource_fit)"""
+        data = self.kg_client.evaluate_opportunity(opportunity_id).data
+        opportunity = data[0] if data else {}
+        required = float(opportunity.get("requiredFTE") or 0.0)
+        available = float(opportunity.get("availableStaff") or 0.0)
+        return {
+            "opportunity": opportunity,
+            "resource_fit": min(1.0, available / required) if required > 0 else 1.0,
+        }
+
+    def _kg_competency_gap(self, org_unit_id: str | None) -> dict:
+        """역량 갭 (심각도 HIGH 이상)"""
+        data = self.kg_client.analyze_competency_gap(org_unit_id).data
+        return {
+            "org_unit_id": org_unit_id,
+            "gap_competencies": [
+                gap for gap in data if gap.get("gapSeverity") in ("CRITICAL", "HIGH")
+            ],
+        }
+
+    def _build_baseline(self, context: WorkflowContext) -> dict[str, Any]:
+        """KG 결과를 시뮬레이션 baseline(스칼라 값)으로 변환"""
+        baseline = dict(context.kg_results or {})
+        utilization = baseline.get("utilization")
+        if isinstance(utilization, dict):
+            baseline["utilization"] = utilization.get("current", 0.85)
+        return baseline
+
     def _build_response_text(self, context: WorkflowContext) -> str:
         """컨텍스트에서 응답 텍스트 생성"""
         parts = []
@@ -1,36 +1,40 @@
-"""Ontology Package - Knowledge Graph 관리 모듈"""
+"""
+Ontology Package - Knowledge Graph 관리 모듈
 
-from backend.agent_runtime.ontology.data_loader import (
-    LoadResult,
-    LoadSummary,
-    Neo4jDataLoader,
-)
-from backend.agent_runtime.ontology.kg_query import (
-    Evidence,
-    KnowledgeGraphQuery,
-    QueryResult,
-)
-from backend.agent_runtime.ontology.validator import (
-    PredicateConstraint,
-    TripleValidator,
-    ValidationError,
-    ValidationErrorCode,
-    ValidationResult,
-)
+하위 모듈은 처음 사용할 때 로드합니다 (neo4j 드라이버 import 지연).
+"""
 
-__all__ = [
+import importlib
+from typing import Any
+
+_EXPORTS = {
     # Validator
-    "TripleValidator",
-    "ValidationResult",
-    "ValidationError",
-    "ValidationErrorCode",
-    "PredicateConstraint",
+    "TripleValidator": "validator",
+    "ValidationResult": "validator",
+    "ValidationError": "validator",
+    "ValidationErrorCode": "validator",
+    "PredicateConstraint": "validator",
     # Data Loader
-    "Neo4jDataLoader",
-    "LoadResult",
-    "LoadSummary",
+    "Neo4jDataLoader": "data_loader",
+    "LoadResult": "data_loader",
+    "LoadSummary": "data_loader",
     # KG Query
-    "KnowledgeGraphQuery",
-    "QueryResult",
-    "Evidence",
-]
+    "KnowledgeGraphQuery": "kg_query",
+    "QueryResult": "kg_query",
+    "Evidence": "kg_query",
+    # Single-flight
+    "SingleFlight": "singleflight",
+    "AsyncSingleFlight": "singleflight",
+    "kg_flight": "singleflight",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
@@ -223,6 +223,9 @@ class Neo4jDataLoader:
 
         completed_at = datetime.now()
 
+        # 12. 그래프 버전 갱신 (API 캐시/ETag 무효화 기준)
+        self.update_graph_version(completed_at.isoformat())
+
         return LoadSummary(
             started_at=started_at,
             completed_at=completed_at,
@@ -232,6 +235,15 @@ class Neo4jDataLoader:
             success=all(len(r.errors) == 0 for r in results),
         )
 
+    def update_graph_version(self, version: str) -> None:
+        """그래프 버전 기록 (적재 완료 시점)"""
+        with self._driver.session(database=self.database) as session:
+            session.run(
+                "MERGE (m:GraphMeta {key: 'graph'}) SET m.version = $version, m.updatedAt = datetime()",
+                version=version,
+            )
+        logger.info(f"그래프 버전 갱신: {version}")
+
     def _load_orgs(self, filepath: Path) -> LoadResult:
         """조직 데이터 로드"""
         start_time = datetime.now()
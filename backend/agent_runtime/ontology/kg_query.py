@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Any
 
+from backend.agent_runtime.ontology.singleflight import coalesced
+
 try:
     from neo4j import Driver, GraphDatabase
 
@@ -85,6 +87,7 @@ class KnowledgeGraphQuery:
     # A-1: Capacity/Utilization 관련 쿼리
     # =========================================================
 
+    @coalesced
     def get_org_utilization(
         self, org_unit_id: str, start_date: date, end_date: date
     ) -> QueryResult:
@@ -142,6 +145,7 @@ class KnowledgeGraphQuery:
             total_count=len(data),
         )
 
+    @coalesced
     def get_capacity_forecast(self, org_unit_id: str, weeks: int = 12) -> QueryResult:
         """조직별 Capacity 예측 (12주)"""
         start_time = datetime.now()
@@ -205,6 +209,7 @@ class KnowledgeGraphQuery:
             total_count=len(data),
         )
 
+    @coalesced
     def find_bottleneck_competencies(self, org_unit_id: str | None = None) -> QueryResult:
         """병목 역량 식별"""
         start_time = datetime.now()
@@ -272,6 +277,7 @@ class KnowledgeGraphQuery:
     # B-1: Go/No-go 의사결정 관련 쿼리
     # =========================================================
 
+    @coalesced
     def evaluate_opportunity(self, opportunity_id: str) -> QueryResult:
         """기회 평가 (Go/No-go 분석)"""
         start_time = datetime.now()
@@ -335,6 +341,7 @@ class KnowledgeGraphQuery:
             total_count=len(data),
         )
 
+    @coalesced
     def find_matching_resources(self, opportunity_id: str, limit: int = 10) -> QueryResult:
         """기회에 맞는 리소스 매칭"""
         start_time = datetime.now()
@@ -394,10 +401,68 @@ class KnowledgeGraphQuery:
             total_count=len(data),
         )
 
+    @coalesced
+    def get_reallocation_candidates(self, org_unit_id: str, weeks: int = 12) -> QueryResult:
+        """재배치 후보 직원별 주차 가용 FTE와 보유 역량 (병목 조직 외 전사 대상)"""
+        start_time = datetime.now()
+
+        query = """
+        MATCH (e:Employee {status: 'ACTIVE'})-[:BELONGS_TO]->(ou:OrgUnit)
+        OPTIONAL MATCH (e)-[r:HAS_COMPETENCY]->(c:Competency)
+        WITH e, ou, COLLECT({competencyId: c.competencyId, level: r.level}) AS competencies
+
+        MATCH (tb:TimeBucket)
+        WHERE tb.bucketType = 'WEEK'
+          AND tb.bucketStart >= date()
+          AND tb.bucketStart < date() + duration({weeks: $weeks})
+        OPTIONAL MATCH (e)-[a:ASSIGNED_TO]->(:Project)
+        WHERE date(a.startDate) <= tb.bucketEnd
+          AND date(a.endDate) >= tb.bucketStart
+        WITH e, ou, competencies, tb, COALESCE(SUM(a.allocationFTE), 0) AS allocated
+        ORDER BY tb.bucketStart
+
+        WITH e, ou, competencies,
+             COLLECT({week: tb.label, availableFTE: 1.0 - allocated}) AS weekly
+        WHERE ANY(w IN weekly WHERE w.availableFTE > 0)
+
+        RETURN e.employeeId AS employeeId,
+               e.name AS name,
+               ou.orgUnitId AS orgUnitId,
+               ou.orgUnitId = $orgUnitId AS sameOrg,
+               competencies,
+               weekly AS availableFTEByWeek
+        """
+
+        with self._driver.session(database=self.database) as session:
+            result = session.run(query, orgUnitId=org_unit_id, weeks=weeks)
+            data = [dict(record) for record in result]
+
+        evidence = [
+            Evidence(
+                evidence_id=f"EV-REALLOC-{org_unit_id}",
+                evidence_type="REALLOCATION_CANDIDATES",
+                source="KG_QUERY",
+                description=f"{org_unit_id} 병목 지원 가능 인력 {weeks}주 가용량",
+                value={"candidates_found": len(data)},
+                timestamp=datetime.now(),
+            )
+        ]
+
+        duration = (datetime.now() - start_time).total_seconds() * 1000
+
+        return QueryResult(
+            query_type="REALLOCATION_CANDIDATES",
+            data=data,
+            evidence=evidence,
+            execution_time_ms=duration,
+            total_count=len(data),
+        )
+
     # =========================================================
     # C-1: 증원 분석 관련 쿼리
     # =========================================================
 
+    @coalesced
     def analyze_headcount_need(self, org_unit_id: str) -> QueryResult:
         """증원 필요성 분석"""
         start_time = datetime.now()
@@ -476,6 +541,7 @@ class KnowledgeGraphQuery:
     # D-1: 역량 갭 분석 관련 쿼리
     # =========================================================
 
+    @coalesced
     def analyze_competency_gap(self, org_unit_id: str | None = None) -> QueryResult:
         """역량 갭 분석"""
         start_time = datetime.now()
@@ -551,6 +617,7 @@ class KnowledgeGraphQuery:
     # 그래프 탐색 쿼리
     # =========================================================
 
+    @coalesced
     def get_employee_network(self, employee_id: str, depth: int = 2) -> QueryResult:
         """직원 중심 네트워크 조회"""
         start_time = datetime.now()
@@ -612,6 +679,7 @@ class KnowledgeGraphQuery:
             total_count=len(data),
         )
 
+    @coalesced
     def get_project_team(self, project_id: str) -> QueryResult:
         """프로젝트 팀 구성 조회"""
         start_time = datetime.now()
@@ -662,6 +730,69 @@ class KnowledgeGraphQuery:
             total_count=len(data),
         )
 
+    # =========================================================
+    # 성공 확률 모델 학습 쿼리
+    # =========================================================
+
+    def get_project_start_contexts(self, project_ids: list[str]) -> QueryResult:
+        """
+        프로젝트별 착수 시점 컨텍스트 (결과 라벨이 붙기 전에 알 수 있던 값만)
+
+        필요 FTE(작업 패키지 추정), 착수일까지 입사한 소유 조직 인원, 계획 기간,
+        투입 인력의 착수일 기준 평균 경력, 착수 전에 끝난 같은 조직 프로젝트 수
+        """
+        start_time = datetime.now()
+
+        query = """
+        UNWIND $projectIds AS projectId
+        MATCH (p:Project {projectId: projectId})
+        OPTIONAL MATCH (p)-[:CONTAINS]->(wp:WorkPackage)
+        WITH p, SUM(wp.estimatedFTE) AS requiredFTE
+
+        OPTIONAL MATCH (p)-[:OWNED_BY]->(ou:OrgUnit)
+        OPTIONAL MATCH (ou)<-[:BELONGS_TO]-(e:Employee)
+        WHERE e.hireDate <= p.startDate
+        WITH p, ou, requiredFTE, COUNT(e) AS availableFTE
+
+        OPTIONAL MATCH (p)<-[:ASSIGNED_TO]-(m:Employee)
+        WITH p, ou, requiredFTE, availableFTE,
+             AVG(duration.inDays(m.hireDate, p.startDate).days / 365.25) AS teamExperience
+
+        OPTIONAL MATCH (ou)<-[:OWNED_BY]-(prev:Project)
+        WHERE prev.endDate < p.startDate
+        RETURN p.projectId AS projectId,
+               requiredFTE,
+               availableFTE,
+               duration.inDays(p.startDate, p.endDate).days / 7.0 AS plannedDurationWeeks,
+               teamExperience AS teamAvgExperienceYears,
+               COUNT(prev) AS similarProjectCount
+        """
+
+        with self._driver.session(database=self.database) as session:
+            result = session.run(query, projectIds=list(project_ids))
+            data = [dict(record) for record in result]
+
+        evidence = [
+            Evidence(
+                evidence_id="EV-PRJ-START",
+                evidence_type="PROJECT_START_CONTEXT",
+                source="KG_QUERY",
+                description=f"프로젝트 {len(project_ids)}건 착수 시점 컨텍스트",
+                value={"projects_found": len(data)},
+                timestamp=datetime.now(),
+            )
+        ]
+
+        duration = (datetime.now() - start_time).total_seconds() * 1000
+
+        return QueryResult(
+            query_type="PROJECT_START_CONTEXT",
+            data=data,
+            evidence=evidence,
+            execution_time_ms=duration,
+            total_count=len(data),
+        )
+
 
 # CLI 테스트용
 if __name__ == "__main__":
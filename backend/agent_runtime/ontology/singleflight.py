@@ -0,0 +1,165 @@
+"""
+Single-flight 요청 병합
+
+동일한 키로 동시에 들어온 조회를 하나의 실제 실행으로 합치고 결과를 공유
+- SingleFlight: 동기 코드(스레드)용 - KnowledgeGraphQuery
+- AsyncSingleFlight: asyncio용 - Neo4jService
+- 실행이 끝나면 키를 비우므로 캐시가 아니라 "진행 중 중복 제거"만 수행
+- 공유된 결과 객체는 호출자 간에 동일하므로 변경하지 않아야 함
+"""
+
+import asyncio
+import functools
+import json
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from backend.agent_runtime.metrics import KG_QUERY_SECONDS
+
+T = TypeVar("T")
+
+
+def make_flight_key(name: str, *args: Any, **kwargs: Any) -> str:
+    """함수 이름과 인자로 병합 키 생성"""
+    return json.dumps([name, args, kwargs], sort_keys=True, ensure_ascii=False, default=str)
+
+
+class _FlightStats:
+    """병합 통계"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def to_dict(self, in_flight: int) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "in_flight": in_flight,
+            "coalesce_rate": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+        }
+
+
+class _Call:
+    """진행 중인 동기 호출"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """스레드 기반 single-flight"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._stats = _FlightStats()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        key 기준으로 func 실행 (동시 호출은 첫 실행 결과를 대기)
+
+        Raises:
+            func에서 발생한 예외 (대기 중이던 호출자에게도 동일하게 전달)
+        """
+        with self._lock:
+            self._stats.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self._stats.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self._stats.errors += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict[str, Any]:
+        """병합 통계"""
+        with self._lock:
+            return self._stats.to_dict(len(self._calls))
+
+
+class AsyncSingleFlight:
+    """asyncio 기반 single-flight"""
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._stats = _FlightStats()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        key 기준으로 func 실행 (동시 호출은 첫 실행 결과를 대기)
+
+        실제 실행은 별도 태스크에서 진행되므로 첫 호출자가 취소되어도
+        대기 중인 다른 호출자는 결과를 받습니다.
+        """
+        self._stats.calls += 1
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(key)
+
+        if task is not None and task.get_loop() is loop:
+            self._stats.coalesced += 1
+        else:
+            self._stats.executions += 1
+            task = loop.create_task(func())
+            self._tasks[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            self._stats.errors += 1
+
+    def stats(self) -> dict[str, Any]:
+        """병합 통계"""
+        return self._stats.to_dict(len(self._tasks))
+
+
+# KnowledgeGraphQuery 공용 인스턴스
+kg_flight = SingleFlight()
+
+
+def coalesced(method: Callable[..., T]) -> Callable[..., T]:
+    """KnowledgeGraphQuery 조회 메서드 병합 데코레이터 (접속 대상 + 인자 기준, 지연 시간 기록)"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args: Any, **kwargs: Any) -> T:
+        key = make_flight_key(method.__name__, self.uri, self.database, *args, **kwargs)
+
+        def run() -> T:
+            with KG_QUERY_SECONDS.time(query=method.__name__):
+                return method(self, *args, **kwargs)
+
+        return kg_flight.do(key, run)
+
+    return wrapper
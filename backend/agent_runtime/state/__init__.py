@@ -0,0 +1,21 @@
+"""State Package - 프로세스 간 공유 상태 저장소"""
+
+from backend.agent_runtime.state.mapping import StoreMapping, from_jsonable, to_jsonable
+from backend.agent_runtime.state.store import (
+    InMemoryStateStore,
+    PostgresStateStore,
+    SQLiteStateStore,
+    StateStore,
+    create_state_store,
+)
+
+__all__ = [
+    "StateStore",
+    "InMemoryStateStore",
+    "SQLiteStateStore",
+    "PostgresStateStore",
+    "create_state_store",
+    "StoreMapping",
+    "to_jsonable",
+    "from_jsonable",
+]
@@ -0,0 +1,124 @@
+"""
+상태 저장소 딕셔너리 어댑터
+
+기존 dict[str, 데이터클래스] 속성을 StateStore 위로 옮기기 위한 MutableMapping
+- 데이터클래스는 타입 힌트 기반으로 JSON 변환 (Enum, datetime, 중첩 데이터클래스, Optional)
+- 조회 결과는 복사본이므로 변경 후에는 다시 대입해야 저장됨
+"""
+
+import dataclasses
+import types
+import typing
+from collections.abc import Iterator, MutableMapping
+from datetime import date, datetime
+from enum import Enum
+from functools import cache
+from typing import Any, Generic, TypeVar
+
+from backend.agent_runtime.state.store import StateStore
+
+T = TypeVar("T")
+
+
+def to_jsonable(value: Any) -> Any:
+    """데이터클래스/Enum/datetime/NumPy 배열을 JSON 호환 값으로 변환"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: to_jsonable(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, list | tuple | set | frozenset):
+        return [to_jsonable(v) for v in value]
+    if hasattr(value, "tolist"):  # NumPy 배열/스칼라 (numpy를 import하지 않고 처리)
+        return value.tolist()
+    return value
+
+
+@cache
+def _type_hints(cls: type) -> dict[str, Any]:
+    return typing.get_type_hints(cls)
+
+
+def from_jsonable(tp: Any, value: Any) -> Any:
+    """타입 힌트에 맞춰 JSON 값을 복원"""
+    if value is None or tp is Any:
+        return value
+
+    origin = typing.get_origin(tp)
+    if origin is typing.Union or origin is types.UnionType:
+        candidates = [arg for arg in typing.get_args(tp) if arg is not type(None)]
+        return from_jsonable(candidates[0], value) if len(candidates) == 1 else value
+    if origin in (list, set, frozenset, tuple):
+        (item_type, *_) = typing.get_args(tp) or (Any,)
+        return origin(from_jsonable(item_type, v) for v in value)
+    if origin is dict:
+        _, value_type = typing.get_args(tp) or (Any, Any)
+        return {k: from_jsonable(value_type, v) for k, v in value.items()}
+
+    if isinstance(tp, type):
+        if dataclasses.is_dataclass(tp):
+            hints = _type_hints(tp)
+            return tp(
+                **{
+                    f.name: from_jsonable(hints[f.name], value[f.name])
+                    for f in dataclasses.fields(tp)
+                    if f.init and f.name in value
+                }
+            )
+        if issubclass(tp, Enum):
+            return tp(value)
+        if issubclass(tp, datetime):
+            return datetime.fromisoformat(value)
+        if issubclass(tp, date):
+            return date.fromisoformat(value)
+    return value
+
+
+class StoreMapping(MutableMapping[str, T], Generic[T]):
+    """
+    StateStore 네임스페이스를 dict처럼 사용
+
+    Example:
+        executions = StoreMapping(store, "workflow_executions", WorkflowExecution)
+        executions[execution.execution_id] = execution
+    """
+
+    def __init__(self, store: StateStore, namespace: str, value_type: type[T]):
+        self.store = store
+        self.namespace = namespace
+        self.value_type = value_type
+
+    def __getitem__(self, key: str) -> T:
+        raw = self.store.get(self.namespace, key)
+        if raw is None:
+            raise KeyError(key)
+        return from_jsonable(self.value_type, raw)
+
+    def __setitem__(self, key: str, value: T) -> None:
+        self.store.put(self.namespace, key, to_jsonable(value))
+
+    def __delitem__(self, key: str) -> None:
+        if not self.store.delete(self.namespace, key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.store.get(self.namespace, key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.keys(self.namespace))
+
+    def __len__(self) -> int:
+        return self.store.count(self.namespace)
+
+    def values(self) -> list[T]:  # type: ignore[override]
+        """모든 값 (한 번의 조회)"""
+        return [from_jsonable(self.value_type, raw) for _, raw in self.store.items(self.namespace)]
+
+    def clear(self) -> None:
+        self.store.clear(self.namespace)
+
+    def __repr__(self) -> str:
+        return f"StoreMapping({self.namespace!r}, {type(self.store).__name__})"
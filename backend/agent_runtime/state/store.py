@@ -0,0 +1,332 @@
+"""
+상태 저장소
+
+워크플로 실행, HITL 승인 요청 등 프로세스 간에 공유해야 하는 상태를 저장
+- (namespace, key) → JSON 값
+- InMemoryStateStore: 단일 프로세스 (테스트/개발 기본값)
+- SQLiteStateStore: 단일 호스트 다중 워커 (WAL 모드)
+- PostgresStateStore: 다중 호스트
+- 값은 저장 시 직렬화되므로 조회 결과를 변경해도 저장소에는 반영되지 않음 (다시 put 필요)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+
+class StateStore(ABC):
+    """상태 저장소 인터페이스"""
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Any | None:
+        """값 조회 (없으면 None)"""
+
+    @abstractmethod
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        """값 저장 (덮어쓰기)"""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> bool:
+        """값 삭제 (삭제 여부 반환)"""
+
+    @abstractmethod
+    def items(self, namespace: str) -> Iterator[tuple[str, Any]]:
+        """네임스페이스의 (키, 값) 목록"""
+
+    @abstractmethod
+    def count(self, namespace: str) -> int:
+        """네임스페이스의 항목 수"""
+
+    @abstractmethod
+    def clear(self, namespace: str) -> None:
+        """네임스페이스 비우기"""
+
+    def keys(self, namespace: str) -> list[str]:
+        """네임스페이스의 키 목록"""
+        return [key for key, _ in self.items(namespace)]
+
+    @abstractmethod
+    def prune(self, namespace: str, keep: int) -> int:
+        """최근 저장된 keep개만 남기고 오래된 항목 삭제 (삭제 수 반환)"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """연결 정리"""
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+class InMemoryStateStore(StateStore):
+    """프로세스 메모리 저장소"""
+
+    def __init__(self) -> None:
+        self._data: dict[str, dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        with self._lock:
+            raw = self._data.get(namespace, {}).get(key)
+        return None if raw is None else json.loads(raw)
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        raw = _encode(value)
+        with self._lock:
+            entries = self._data.setdefault(namespace, {})
+            entries.pop(key, None)  # 저장 순서 유지 (prune 기준)
+            entries[key] = raw
+
+    def delete(self, namespace: str, key: str) -> bool:
+        with self._lock:
+            return self._data.get(namespace, {}).pop(key, None) is not None
+
+    def items(self, namespace: str) -> Iterator[tuple[str, Any]]:
+        with self._lock:
+            snapshot = list(self._data.get(namespace, {}).items())
+        for key, raw in snapshot:
+            yield key, json.loads(raw)
+
+    def count(self, namespace: str) -> int:
+        with self._lock:
+            return len(self._data.get(namespace, {}))
+
+    def clear(self, namespace: str) -> None:
+        with self._lock:
+            self._data.pop(namespace, None)
+
+    def prune(self, namespace: str, keep: int) -> int:
+        with self._lock:
+            entries = self._data.get(namespace, {})
+            stale = list(entries)[: max(0, len(entries) - keep)]
+            for key in stale:
+                del entries[key]
+        return len(stale)
+
+    def close(self) -> None:
+        return None
+
+
+class SQLiteStateStore(StateStore):
+    """SQLite 저장소 (스레드별 연결, WAL 모드)"""
+
+    def __init__(self, path: str | Path, busy_timeout_ms: int = 5000):
+        """
+        Args:
+            path: 데이터베이스 파일 경로
+            busy_timeout_ms: 다른 프로세스가 쓰기 잠금을 잡고 있을 때 대기 시간
+        """
+        self.path = str(path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._conn().execute(
+            """
+            CREATE TABLE IF NOT EXISTS agent_state (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT value FROM agent_state WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+            .fetchone()
+        )
+        return None if row is None else json.loads(row[0])
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        self._conn().execute(
+            "INSERT INTO agent_state (namespace, key, value, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (namespace, key) DO UPDATE "
+            "SET value = excluded.value, updated_at = excluded.updated_at",
+            (namespace, key, _encode(value), time.time()),
+        )
+
+    def delete(self, namespace: str, key: str) -> bool:
+        cursor = self._conn().execute(
+            "DELETE FROM agent_state WHERE namespace = ? AND key = ?", (namespace, key)
+        )
+        return cursor.rowcount > 0
+
+    def items(self, namespace: str) -> Iterator[tuple[str, Any]]:
+        rows = (
+            self._conn()
+            .execute(
+                "SELECT key, value FROM agent_state WHERE namespace = ? ORDER BY updated_at",
+                (namespace,),
+            )
+            .fetchall()
+        )
+        for key, raw in rows:
+            yield key, json.loads(raw)
+
+    def count(self, namespace: str) -> int:
+        row = (
+            self._conn()
+            .execute("SELECT COUNT(*) FROM agent_state WHERE namespace = ?", (namespace,))
+            .fetchone()
+        )
+        return row[0]
+
+    def clear(self, namespace: str) -> None:
+        self._conn().execute("DELETE FROM agent_state WHERE namespace = ?", (namespace,))
+
+    def prune(self, namespace: str, keep: int) -> int:
+        cursor = self._conn().execute(
+            "DELETE FROM agent_state WHERE namespace = ? AND key IN ("
+            "SELECT key FROM agent_state WHERE namespace = ? "
+            "ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (namespace, namespace, max(0, keep)),
+        )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class PostgresStateStore(StateStore):
+    """PostgreSQL 저장소 (psycopg, 스레드별 연결)"""
+
+    def __init__(self, dsn: str):
+        """
+        Args:
+            dsn: 접속 문자열 (postgresql://...)
+        """
+        self.dsn = dsn
+        self._local = threading.local()
+        self._conn().execute(
+            """
+            CREATE TABLE IF NOT EXISTS agent_state (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value JSONB NOT NULL,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+
+    def _conn(self) -> Any:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn.closed:
+            import psycopg
+
+            conn = psycopg.connect(self.dsn, autocommit=True)
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT value::text FROM agent_state WHERE namespace = %s AND key = %s",
+                (namespace, key),
+            )
+            .fetchone()
+        )
+        return None if row is None else json.loads(row[0])
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        self._conn().execute(
+            "INSERT INTO agent_state (namespace, key, value, updated_at) "
+            "VALUES (%s, %s, %s::jsonb, now()) "
+            "ON CONFLICT (namespace, key) DO UPDATE "
+            "SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at",
+            (namespace, key, _encode(value)),
+        )
+
+    def delete(self, namespace: str, key: str) -> bool:
+        cursor = self._conn().execute(
+            "DELETE FROM agent_state WHERE namespace = %s AND key = %s", (namespace, key)
+        )
+        return cursor.rowcount > 0
+
+    def items(self, namespace: str) -> Iterator[tuple[str, Any]]:
+        rows = (
+            self._conn()
+            .execute(
+                "SELECT key, value::text FROM agent_state WHERE namespace = %s ORDER BY updated_at",
+                (namespace,),
+            )
+            .fetchall()
+        )
+        for key, raw in rows:
+            yield key, json.loads(raw)
+
+    def count(self, namespace: str) -> int:
+        row = (
+            self._conn()
+            .execute("SELECT COUNT(*) FROM agent_state WHERE namespace = %s", (namespace,))
+            .fetchone()
+        )
+        return row[0]
+
+    def clear(self, namespace: str) -> None:
+        self._conn().execute("DELETE FROM agent_state WHERE namespace = %s", (namespace,))
+
+    def prune(self, namespace: str, keep: int) -> int:
+        cursor = self._conn().execute(
+            "DELETE FROM agent_state WHERE namespace = %s AND key IN ("
+            "SELECT key FROM agent_state WHERE namespace = %s "
+            "ORDER BY updated_at DESC OFFSET %s)",
+            (namespace, namespace, max(0, keep)),
+        )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def create_state_store(url: str) -> StateStore:
+    """
+    URL로 상태 저장소 생성
+
+    - "" / memory:// → InMemoryStateStore
+    - sqlite:///path (sqlite+aiosqlite 포함) → SQLiteStateStore
+    - postgresql://... (postgres://, +psycopg 포함) → PostgresStateStore
+    """
+    if not url or url.startswith("memory://"):
+        return InMemoryStateStore()
+
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        raise ValueError(f"지원하지 않는 상태 저장소 URL: {url}")
+    dialect = scheme.split("+", 1)[0]
+
+    if dialect == "sqlite":
+        path = rest[1:] if rest.startswith("/") else rest
+        if path in ("", ":memory:"):
+            return InMemoryStateStore()
+        return SQLiteStateStore(path)
+    if dialect in ("postgres", "postgresql"):
+        return PostgresStateStore(f"postgresql://{rest}")
+
+    raise ValueError(f"지원하지 않는 상태 저장소 URL: {url}")
@@ -13,6 +13,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from backend.agent_runtime.state import InMemoryStateStore, StateStore, StoreMapping
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,17 +141,26 @@ class HITLApprovalSystem:
         self,
         notification_handler: Callable[[str, dict], None] | None = None,
         approval_timeout_hours: int = 24,
+        state_store: StateStore | None = None,
     ):
         """
         Args:
             notification_handler: 알림 전송 핸들러
             approval_timeout_hours: 승인 타임아웃 시간
+            state_store: 승인 요청/응답/로그 저장소 (미지정 시 프로세스 메모리)
         """
         self.notification_handler = notification_handler
         self.approval_timeout_hours = approval_timeout_hours
-        self.pending_requests: dict[str, ApprovalRequest] = {}
-        self.responses: dict[str, ApprovalResponse] = {}
-        self.decision_logs: dict[str, DecisionLog] = {}
+        store = state_store or InMemoryStateStore()
+        self.pending_requests: StoreMapping[ApprovalRequest] = StoreMapping(
+            store, "hitl_pending_requests", ApprovalRequest
+        )
+        self.responses: StoreMapping[ApprovalResponse] = StoreMapping(
+            store, "hitl_responses", ApprovalResponse
+        )
+        self.decision_logs: StoreMapping[DecisionLog] = StoreMapping(
+            store, "hitl_decision_logs", DecisionLog
+        )
 
     def create_approval_request(
         self,
@@ -157,6 +168,7 @@ class HITLApprovalSystem:
         decision_type: DecisionType,
         workflow_context: dict[str, Any],
         requester_id: str,
+        metadata: dict[str, Any] | None = None,
     ) -> ApprovalRequest:
         """
         승인 요청 생성
@@ -166,6 +178,7 @@ class HITLApprovalSystem:
             decision_type: 의사결정 유형
             workflow_context: 워크플로 컨텍스트
             requester_id: 요청자 ID
+            metadata: 추가 정보 (예: 연결된 의사결정 ID)
 
         Returns:
             ApprovalRequest: 승인 요청
@@ -195,6 +208,7 @@ class HITLApprovalSystem:
             requester_id=requester_id,
             required_level=required_level,
             deadline=self._calculate_deadline(),
+            metadata=dict(metadata or {}),
         )
 
         self.pending_requests[request_id] = request
@@ -302,11 +316,15 @@ class HITLApprovalSystem:
             conditions=conditions or [],
         )
 
-        self.responses[response_id] = response
-
         # 승인 완료 시 대기 목록에서 제거
+        # 삭제는 저장소에서 원자적이므로 여러 워커가 동시에 처리해도 한 번만 성공
         if status in [ApprovalStatus.APPROVED, ApprovalStatus.REJECTED, ApprovalStatus.MODIFIED]:
-            del self.pending_requests[request_id]
+            try:
+                del self.pending_requests[request_id]
+            except KeyError:
+                raise ValueError(f"이미 처리된 승인 요청: {request_id}") from None
+
+        self.responses[response_id] = response
 
         logger.info(f"승인 응답: {response_id} - {status.value} by {approver_name}")
 
@@ -362,6 +380,7 @@ class HITLApprovalSystem:
                 "timestamp": datetime.now().isoformat(),
             }
         )
+        self.pending_requests[request_id] = request
 
         # 새 승인자에게 알림
         self._send_notification(request)
@@ -0,0 +1,105 @@
+"""
+응답 캐시
+
+에이전트 쿼리 등 비용이 큰 결과를 프로세스 메모리에 보관하는 LRU 캐시
+키는 정규화된 입력 + 그래프 버전으로 구성하여 KG 재적재 시 자연스럽게 무효화
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any
+
+from backend.api.config import settings
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """질문 정규화 (유니코드 NFKC, 공백 축약, 소문자, 끝 문장부호 제거)"""
+    text = unicodedata.normalize("NFKC", question)
+    text = _WHITESPACE.sub(" ", text).strip().lower()
+    return text.rstrip("?!. ")
+
+
+def make_cache_key(*parts: Any) -> str:
+    """입력값으로부터 안정적인 캐시 키 생성"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """TTL 지원 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float | None = None):
+        """
+        Args:
+            max_size: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl_seconds: 항목 유효 시간 (None이면 만료 없음)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """조회 (없거나 만료 시 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """저장"""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str | None = None) -> None:
+        """항목 삭제 (key 미지정 시 전체)"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# 에이전트 쿼리 결과 캐시
+query_cache = LRUCache(
+    max_size=settings.query_cache_size,
+    ttl_seconds=settings.query_cache_ttl_seconds,
+)
@@ -19,14 +19,68 @@ class Settings(BaseSettings):
     neo4j_uri: str = ""
     neo4j_user: str = "neo4j"
     neo4j_password: str = ""
+    neo4j_max_pool_size: int = 50
+    # 워커 간 공유 상태 (워크플로 실행, HITL 승인, 작업 상태). 비우면 database_url 사용
+    state_store_url: str = ""
 
     # AI
     anthropic_api_key: str = ""
 
+    # 백그라운드 작업
+    job_max_workers: int = 4
+    job_queue_size: int = 100
+    # 배치 분석 (요청당 최대 항목 수, 동시 분석 수)
+    batch_max_items: int = 100
+    batch_max_parallel: int = 4
+    # 영향도 시뮬레이션 Monte Carlo (대안별 샘플 수, 0이면 끔 / 시드 고정으로 재현 가능)
+    impact_mc_samples: int = 10000
+    impact_mc_seed: int | None = 0
+    # 영향도 시뮬레이션 결과 캐시 (공유 상태 저장소, 최대 항목 수 / 0이면 끔)
+    impact_cache_size: int = 512
+    # 파라미터 스윕 최대 그리드 지점 수
+    sweep_max_points: int = 100_000
+    # 학습된 성공 확률 모델 (scripts/train_success_model.py 출력 JSON, 비우면 휴리스틱)
+    success_model_path: str = ""
+
+    # 동시 실행 제한 (라우트 그룹별 동시 실행 수 / 대기열 크기)
+    graph_query_max_concurrency: int = 4
+    graph_query_max_queue: int = 16
+    graph_read_max_concurrency: int = 16
+    graph_read_max_queue: int = 64
+    agent_max_concurrency: int = 4
+    agent_max_queue: int = 16
+    limiter_queue_timeout_seconds: float = 5.0
+
+    # 기동 후 백그라운드 워밍업 (지연 로드 모듈, 에이전트, 그래프 버전)
+    startup_warmup: bool = True
+
+    # 관리자 요청 프로파일링 (X-Profile: 1)
+    profiler_enabled: bool = True
+    profiler_interval_ms: float = 5.0
+    profiler_min_interval_seconds: float = 60.0
+    profiler_max_stored: int = 50
+
+    # 준비 상태 점검
+    readiness_timeout_seconds: float = 1.0
+    readiness_cache_seconds: float = 2.0
+
+    # 응답 압축
+    compression_minimum_size: int = 1024
+    gzip_level: int = 6
+    brotli_quality: int = 4
+
+    # 캐시
+    query_cache_size: int = 256
+    query_cache_ttl_seconds: float = 600.0
+    graph_version_ttl_seconds: float = 5.0
+
     # 보안
     jwt_secret_key: str = "dev-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    # 검증된 토큰 캐시 (exp와 TTL 중 먼저 도래하는 시각까지 재사용)
+    token_cache_size: int = 1024
+    token_cache_ttl_seconds: float = 300.0
 
     # CORS
     allowed_origins: list[str] = [
@@ -1,23 +1,35 @@
 """공통 의존성"""
 
+import hashlib
+import importlib.util
+import re
+import threading
+import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
 from pydantic import BaseModel
-
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.agent_runtime.metrics import REGISTRY
+from backend.agent_runtime.ontology.singleflight import (
+    AsyncSingleFlight,
+    kg_flight,
+    make_flight_key,
+)
+from backend.agent_runtime.state import StateStore, create_state_store
+from backend.api.cache import LRUCache
 from backend.api.config import settings
+from backend.api.tracing import stage
+from backend.database.session import get_session, normalize_database_url
 
-# Neo4j 드라이버
-try:
-    from neo4j import AsyncDriver, AsyncGraphDatabase
-
-    NEO4J_AVAILABLE = True
-except ImportError:
-    NEO4J_AVAILABLE = False
-    AsyncDriver = Any  # type: ignore[misc,assignment]
+# Neo4j 드라이버 (import 비용이 커서 첫 연결 시 로드)
+NEO4J_AVAILABLE = importlib.util.find_spec("neo4j") is not None
+if TYPE_CHECKING:
+    from neo4j import AsyncDriver
 
 security = HTTPBearer(auto_error=False)
 
@@ -44,11 +56,74 @@ def create_access_token(data: TokenPayload, expires_delta: timedelta | None = No
         expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
     )
     to_encode.update({"exp": expire})
+    from jose import jwt
+
     return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
+# 검증된 토큰 캐시 (토큰 SHA-256 → (exp epoch, TokenData))
+# 대시보드처럼 같은 토큰으로 반복 호출할 때 서명 검증/디코딩을 생략
+token_cache = LRUCache(
+    max_size=settings.token_cache_size,
+    ttl_seconds=settings.token_cache_ttl_seconds,
+)
+# 폐기된 토큰 (digest → exp epoch, 만료 후 정리)
+_revoked_tokens: dict[str, float] = {}
+_revoked_lock = threading.Lock()
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def revoke_token(token: str) -> None:
+    """
+    토큰 폐기 (로그아웃, 유출 등)
+
+    캐시에서 제거하고 만료 시각까지 검증을 거부합니다. 프로세스 단위이므로 여러 워커에서
+    폐기하려면 각 워커에서 호출해야 합니다.
+    """
+    digest = _token_digest(token)
+    token_cache.invalidate(digest)
+    try:
+        exp = _decode_token(token).exp
+    except HTTPException:
+        return  # 이미 유효하지 않은 토큰
+    now = time.time()
+    with _revoked_lock:
+        for key in [k for k, until in _revoked_tokens.items() if until <= now]:
+            del _revoked_tokens[key]
+        _revoked_tokens[digest] = exp.timestamp() if exp else now + 86400
+
+
 def verify_token(token: str) -> TokenData:
-    """JWT 토큰 검증 및 디코딩"""
+    """JWT 토큰 검증 및 디코딩 (검증 결과는 exp까지 캐시)"""
+    with stage("auth"):
+        digest = _token_digest(token)
+        if digest in _revoked_tokens:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="폐기된 토큰입니다",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        cached = token_cache.get(digest)
+        if cached is not None:
+            exp, data = cached
+            if time.time() < exp:
+                return data
+            token_cache.invalidate(digest)  # 만료: 전체 검증 경로에서 401
+
+        data = _decode_token(token)
+        exp = data.exp.timestamp() if data.exp else 0.0
+        if exp > time.time():
+            token_cache.set(digest, (exp, data))
+        return data
+
+
+def _decode_token(token: str) -> TokenData:
+    # python-jose는 cryptography 백엔드까지 로드하므로 첫 인증 요청 때 import
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(
             token,
@@ -97,29 +172,82 @@ async def require_auth(
     return verify_token(credentials.credentials)
 
 
+async def require_admin(user: Annotated[TokenData, Depends(require_auth)]) -> TokenData:
+    """관리자 권한 필수"""
+    if user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다",
+        )
+    return user
+
+
 # =============================================================================
 # Neo4j 연결 서비스
 # =============================================================================
 
 
+NEO4J_POOL_WAIT_SECONDS = REGISTRY.histogram(
+    "hr_dss_neo4j_pool_acquire_wait_seconds",
+    "Time spent waiting for a Neo4j pooled connection",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+
+# 쓰기 쿼리 판별 (병합 대상에서 제외)
+_WRITE_CLAUSE = re.compile(r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP)\b", re.IGNORECASE)
+
+
 class Neo4jService:
     """Neo4j 데이터베이스 서비스"""
 
-    _driver: AsyncDriver | None = None
+    _driver: "AsyncDriver | None" = None
+    _flight = AsyncSingleFlight()
+    _graph_version: str | None = None
+    _graph_version_checked_at: float = 0.0
 
     @classmethod
-    async def get_driver(cls) -> AsyncDriver | None:
+    async def get_driver(cls) -> "AsyncDriver | None":
         """Neo4j 드라이버 반환 (싱글톤)"""
         if not NEO4J_AVAILABLE:
             return None
 
         if cls._driver is None and settings.neo4j_uri:
+            from neo4j import AsyncGraphDatabase
+
             cls._driver = AsyncGraphDatabase.driver(
                 settings.neo4j_uri,
                 auth=(settings.neo4j_user, settings.neo4j_password),
+                max_connection_pool_size=settings.neo4j_max_pool_size,
             )
+            cls._instrument_pool(cls._driver)
         return cls._driver
 
+    @staticmethod
+    def _instrument_pool(driver: "AsyncDriver") -> None:
+        """커넥션 획득 대기 시간 측정 (드라이버 내부 풀이 없으면 생략)"""
+        pool = getattr(driver, "_pool", None)
+        acquire = getattr(pool, "acquire", None)
+        if acquire is None:
+            return
+
+        async def timed_acquire(*args: Any, **kwargs: Any) -> Any:
+            with NEO4J_POOL_WAIT_SECONDS.time():
+                return await acquire(*args, **kwargs)
+
+        pool.acquire = timed_acquire
+
+    @classmethod
+    def get_pool_stats(cls) -> dict[str, int]:
+        """커넥션 풀 사용 현황 (in_use / idle / max_size)"""
+        stats = {"in_use": 0, "idle": 0, "max_size": settings.neo4j_max_pool_size}
+        connections = getattr(getattr(cls._driver, "_pool", None), "connections", None)
+        if not connections:
+            return stats
+        for conns in list(connections.values()):
+            for conn in list(conns):
+                stats["in_use" if getattr(conn, "in_use", False) else "idle"] += 1
+        return stats
+
     @classmethod
     async def close(cls) -> None:
         """드라이버 연결 종료"""
@@ -134,7 +262,12 @@ class Neo4jService:
         params: dict | None = None,
         database: str = "neo4j",
     ) -> list[dict]:
-        """Cypher 쿼리 실행"""
+        """
+        Cypher 쿼리 실행
+
+        동시에 들어온 동일한 읽기 쿼리(쿼리 + 파라미터 + DB)는 한 번만 실행하고
+        결과를 공유합니다. 반환된 레코드는 호출자 간에 공유되므로 변경하지 마세요.
+        """
         driver = await cls.get_driver()
         if not driver:
             raise HTTPException(
@@ -142,14 +275,32 @@ class Neo4jService:
                 detail="Neo4j 서비스를 사용할 수 없습니다",
             )
 
-        async with driver.session(database=database) as session:
-            result = await session.run(query, params or {})
-            records = await result.data()
-            return records
+        async def run() -> list[dict]:
+            async with driver.session(database=database) as session:
+                result = await session.run(query, params or {})
+                return await result.data()
+
+        with stage("neo4j"):
+            if _WRITE_CLAUSE.search(query):
+                return await run()
+            key = make_flight_key("execute_query", query, params or {}, database)
+            return await cls._flight.do(key, run)
+
+    @classmethod
+    def get_coalescing_stats(cls) -> dict[str, Any]:
+        """요청 병합 통계 (Neo4jService / KnowledgeGraphQuery)"""
+        return {
+            "neo4j": cls._flight.stats(),
+            "kg_query": kg_flight.stats(),
+        }
 
     @classmethod
     async def get_stats(cls) -> dict:
-        """그래프 통계 조회"""
+        """그래프 통계 조회 (동시 호출 병합)"""
+        return await cls._flight.do("get_stats", cls._compute_stats)
+
+    @classmethod
+    async def _compute_stats(cls) -> dict:
         driver = await cls.get_driver()
         if not driver:
             return {
@@ -206,6 +357,37 @@ class Neo4jService:
                 "relationship_types": {},
             }
 
+    @classmethod
+    async def get_graph_version(cls) -> str:
+        """
+        그래프 버전 조회
+
+        데이터 적재기가 (:GraphMeta {key: 'graph'}) 노드에 기록한 버전을 반환합니다.
+        settings.graph_version_ttl_seconds 동안 프로세스 내에서 재사용합니다.
+        """
+        now = time.monotonic()
+        if (
+            cls._graph_version is not None
+            and now - cls._graph_version_checked_at < settings.graph_version_ttl_seconds
+        ):
+            return cls._graph_version
+
+        driver = await cls.get_driver()
+        if not driver:
+            version = "offline"
+        else:
+            try:
+                records = await cls.execute_query(
+                    "MATCH (m:GraphMeta {key: 'graph'}) RETURN m.version AS version"
+                )
+                version = str(records[0]["version"]) if records else "unversioned"
+            except Exception:
+                version = "unavailable"
+
+        cls._graph_version = version
+        cls._graph_version_checked_at = now
+        return version
+
     @classmethod
     async def search(
         cls,
@@ -248,3 +430,36 @@ class Neo4jService:
 async def get_neo4j_service() -> Neo4jService:
     """Neo4j 서비스 의존성"""
     return Neo4jService()
+
+
+# =============================================================================
+# 관계형 DB 세션
+# =============================================================================
+
+
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """DB 세션 의존성"""
+    async for session in get_session():
+        yield session
+
+
+# =============================================================================
+# 공유 상태 저장소
+# =============================================================================
+
+_state_store: StateStore | None = None
+
+
+def get_state_store() -> StateStore:
+    """
+    워커 간 공유 상태 저장소 (싱글톤)
+
+    settings.state_store_url이 비어 있으면 관계형 DB(database_url)를 사용하므로
+    SQLite 파일 또는 PostgreSQL을 공유하는 모든 워커가 같은 상태를 봅니다.
+    """
+    global _state_store
+    if _state_store is None:
+        _state_store = create_state_store(
+            settings.state_store_url or normalize_database_url(settings.database_url)
+        )
+    return _state_store
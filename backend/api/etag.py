@@ -0,0 +1,74 @@
+"""
+조건부 GET (ETag / If-None-Match)
+
+읽기 엔드포인트가 데이터 버전으로부터 ETag를 만들고, 클라이언트나 엣지(api-gateway)가
+보낸 If-None-Match와 일치하면 본문 없이 304를 반환
+- 그래프 조회: 데이터 적재기가 기록한 그래프 버전 (버전을 모르면 ETag 생략)
+- 의사결정 조회: 저장소 리비전 (건수 + 최종 갱신 시각)
+- 압축 등으로 본문 바이트가 달라질 수 있으므로 약한(W/) ETag 사용
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from backend.api.dependencies import Neo4jService
+
+# 매 요청마다 재검증 (If-None-Match) 하도록 지시
+CACHE_CONTROL = "no-cache"
+# 사용자 데이터: 공유 캐시(엣지)에는 저장하지 않고 재검증만 허용
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+# 적재기가 버전을 기록하지 않았거나 조회에 실패한 경우: 변경 여부를 알 수 없음
+_UNKNOWN_GRAPH_VERSIONS = {"unversioned", "unavailable"}
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 구성 요소로 약한 ETag 생성"""
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 약한 비교"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(
+    request: Request, etag: str | None, cache_control: str = CACHE_CONTROL
+) -> Response | None:
+    """If-None-Match가 일치하면 304 응답, 아니면 None"""
+    if etag is None or not etag_matches(request.headers.get("If-None-Match"), etag):
+        return None
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def apply_etag(
+    response: Response, etag: str | None, cache_control: str = CACHE_CONTROL
+) -> Response:
+    """응답에 ETag/Cache-Control 헤더 설정"""
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
+    return response
+
+
+async def graph_etag(*parts: Any) -> str | None:
+    """
+    그래프 버전 기반 ETag (버전을 알 수 없으면 None)
+
+    그래프 버전은 settings.graph_version_ttl_seconds 동안 재사용되므로
+    적재 직후 그 시간만큼은 이전 ETag가 유지될 수 있습니다.
+    """
+    version = await Neo4jService.get_graph_version()
+    if version in _UNKNOWN_GRAPH_VERSIONS:
+        return None
+    return make_etag("graph", version, *parts)
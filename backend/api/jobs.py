@@ -0,0 +1,376 @@
+"""
+백그라운드 작업 실행기
+
+장시간 걸리는 분석 작업을 제한된 워커 풀에서 실행하고 단계별 진행 이벤트를 보관
+- 작업 큐가 가득 차면 JobQueueFullError (API에서 503 + Retry-After)
+- 에이전트 연산(동기 코드)은 스레드 풀에서 실행
+- 진행 이벤트는 /api/v1/jobs/{job_id}/events SSE로 스트리밍
+- 작업 상태 스냅샷과 이벤트는 공유 상태 저장소에 기록되어 다른 워커에서도 조회 가능
+  (이벤트는 하나씩 추가 기록, 스냅샷은 상태가 바뀔 때만 기록.
+  다른 워커의 작업 스트림은 저장소 폴링으로 전달)
+"""
+
+import asyncio
+import contextvars
+import logging
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+
+from backend.agent_runtime.state import StateStore
+from backend.api.config import settings
+from backend.api.dependencies import get_state_store
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(Enum):
+    """작업 상태"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+JOB_STATE_NAMESPACE = "jobs"
+# 작업별 이벤트 네임스페이스 접두사 ("job_events:{job_id}", 키는 이벤트 ID)
+JOB_EVENTS_NAMESPACE = "job_events"
+_DONE_STATUSES = (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
+# 부분 결과 이벤트 (단건 분석의 단계, 일괄 분석의 항목)
+_PROGRESS_EVENTS = ("step", "item")
+# 작업 상태가 바뀌는 이벤트 (이때만 스냅샷 기록)
+_STATUS_EVENTS = ("queued", "started", "completed", "failed")
+
+
+class JobQueueFullError(Exception):
+    """작업 큐 포화"""
+
+
+@dataclass
+class Job:
+    """백그라운드 작업"""
+
+    job_id: str
+    kind: str
+    subject_id: str | None = None
+    status: JobStatus = JobStatus.QUEUED
+    events: list[dict[str, Any]] = field(default_factory=list)
+    result: Any = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "subject_id": self.subject_id,
+            "status": self.status.value,
+            "progress": [e for e in self.events if e["event"] in _PROGRESS_EVENTS],
+            "event_count": len(self.events),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+
+
+class JobContext:
+    """작업 함수에 전달되는 진행 보고 핸들"""
+
+    def __init__(self, runner: "JobRunner", job: Job, loop: asyncio.AbstractEventLoop):
+        self.runner = runner
+        self.job = job
+        self._loop = loop
+
+    def report(self, event: str, data: dict[str, Any]) -> None:
+        """진행 이벤트 발행 (스레드 안전)"""
+        self._loop.call_soon_threadsafe(self.runner._publish, self.job, event, data)
+
+    async def run_sync(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """동기 함수를 작업 스레드 풀에서 실행"""
+        return await self._loop.run_in_executor(self.runner.executor, lambda: func(*args, **kwargs))
+
+
+JobFunc = Callable[[JobContext], Awaitable[Any]]
+
+
+class JobRunner:
+    """제한된 워커 풀 기반 작업 실행기"""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 100,
+        max_retained: int = 1000,
+        store_factory: Callable[[], StateStore] | None = None,
+        poll_interval: float = 0.5,
+    ):
+        """
+        Args:
+            max_workers: 동시 실행 작업 수
+            max_queue: 대기 큐 크기 (초과 시 거절)
+            max_retained: 보관할 작업 수 (초과 시 오래된 완료 작업부터 제거)
+            store_factory: 공유 상태 저장소 (None이면 이 프로세스에서만 조회 가능)
+            poll_interval: 다른 워커 작업 스트림의 저장소 폴링 간격(초)
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.max_retained = max_retained
+        self.store_factory = store_factory
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="hr-dss-job")
+        # 스냅샷 기록은 순서 보장을 위해 단일 스레드에서 처리
+        self._persister = ThreadPoolExecutor(1, thread_name_prefix="hr-dss-job-state")
+        self._jobs: dict[str, Job] = {}
+        self._queue: asyncio.Queue[tuple[Job, JobFunc]] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_started(self) -> None:
+        """현재 이벤트 루프에 워커 시작"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        # 워커는 요청 컨텍스트(추적 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+        self._workers = [
+            loop.create_task(self._worker(), context=contextvars.Context())
+            for _ in range(self.max_workers)
+        ]
+
+    async def start(self) -> None:
+        """워커 시작 (lifespan)"""
+        self._ensure_started()
+
+    async def stop(self) -> None:
+        """워커 종료"""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+
+    def submit(self, kind: str, func: JobFunc, subject_id: str | None = None) -> Job:
+        """
+        작업 제출
+
+        Raises:
+            JobQueueFullError: 대기 큐가 가득 찬 경우
+        """
+        self._ensure_started()
+        assert self._queue is not None
+
+        job = Job(job_id=f"JOB-{uuid.uuid4().hex[:12].upper()}", kind=kind, subject_id=subject_id)
+        try:
+            self._queue.put_nowait((job, func))
+        except asyncio.QueueFull as e:
+            raise JobQueueFullError(f"작업 큐가 가득 찼습니다 ({self.max_queue})") from e
+
+        self._jobs[job.job_id] = job
+        self._evict()
+        self._publish(job, "queued", {"kind": kind, "subject_id": subject_id})
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """작업 조회 (이 프로세스에서 실행한 작업)"""
+        return self._jobs.get(job_id)
+
+    def active_for(self, subject_id: str) -> Job | None:
+        """대상에 대해 대기/실행 중인 작업 (이 프로세스에서 제출한 작업)"""
+        return next(
+            (j for j in self._jobs.values() if j.subject_id == subject_id and not j.done), None
+        )
+
+    async def snapshot(self, job_id: str) -> dict[str, Any] | None:
+        """작업 상태 조회 (다른 워커의 작업은 공유 저장소에서)"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job.to_dict()
+        stored = await self._load(job_id)
+        if stored is None or stored["status"] in _DONE_STATUSES:
+            return stored
+        # 실행 중 스냅샷은 진행 이벤트를 담지 않으므로 기록된 이벤트로 채움
+        events = await self._load_events(job_id, 0)
+        stored["progress"] = [e for e in events if e["event"] in _PROGRESS_EVENTS]
+        stored["event_count"] = len(events)
+        return stored
+
+    async def stream(self, job_id: str, last_event_id: int = -1) -> AsyncIterator[dict[str, Any]]:
+        """
+        작업 이벤트 스트림 (완료 시 종료)
+
+        Args:
+            job_id: 작업 ID
+            last_event_id: 이미 수신한 마지막 이벤트 ID (재연결용)
+        """
+        index = last_event_id + 1
+        job = self._jobs.get(job_id)
+        if job is None:
+            async for event in self._stream_stored(job_id, index):
+                yield event
+            return
+
+        while True:
+            changed = job._changed
+            while index < len(job.events):
+                yield job.events[index]
+                index += 1
+            if job.done:
+                return
+            await changed.wait()
+
+    async def _stream_stored(self, job_id: str, index: int) -> AsyncIterator[dict[str, Any]]:
+        """다른 워커에서 실행 중인 작업의 이벤트 (저장소 폴링)"""
+        while True:
+            stored = await self._load(job_id)
+            if stored is None:
+                return
+            # 이벤트가 스냅샷보다 먼저 기록되므로 완료 스냅샷을 봤다면 남은 이벤트도 모두 있음
+            for event in await self._load_events(job_id, index):
+                yield event
+                index += 1
+            if stored["status"] in _DONE_STATUSES:
+                return
+            await asyncio.sleep(self.poll_interval)
+
+    async def _load(self, job_id: str) -> dict[str, Any] | None:
+        if self.store_factory is None:
+            return None
+        store = self.store_factory()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._persister, store.get, JOB_STATE_NAMESPACE, job_id)
+
+    async def _load_events(self, job_id: str, start: int) -> list[dict[str, Any]]:
+        """저장소에 기록된 start번 이후 이벤트"""
+        assert self.store_factory is not None
+        store = self.store_factory()
+        namespace = _events_namespace(job_id)
+
+        def read() -> list[dict[str, Any]]:
+            events = []
+            while (event := store.get(namespace, str(start + len(events)))) is not None:
+                events.append(event)
+            return events
+
+        return await asyncio.get_running_loop().run_in_executor(self._persister, read)
+
+    def stats(self) -> dict[str, int]:
+        """실행기 상태"""
+        return {
+            "workers": self.max_workers,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "running": sum(1 for j in self._jobs.values() if j.status == JobStatus.RUNNING),
+            "retained": len(self._jobs),
+        }
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            job, func = await queue.get()
+            try:
+                await self._run(job, func)
+            finally:
+                queue.task_done()
+
+    async def _run(self, job: Job, func: JobFunc) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now(UTC)
+        self._publish(job, "started", {})
+
+        context = JobContext(self, job, asyncio.get_running_loop())
+        try:
+            job.result = await func(context)
+            job.status = JobStatus.COMPLETED
+            job.completed_at = datetime.now(UTC)
+            self._publish(job, "completed", {"result": job.result})
+        except Exception as e:
+            logger.exception(f"작업 실패: {job.job_id}")
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+            job.completed_at = datetime.now(UTC)
+            self._publish(job, "failed", {"error": job.error})
+
+    def _publish(self, job: Job, event: str, data: dict[str, Any]) -> None:
+        job.events.append(
+            {
+                "id": len(job.events),
+                "event": event,
+                "data": data,
+                "timestamp": datetime.now(UTC).isoformat(),
+            }
+        )
+        # 대기 중인 스트림 깨우기
+        changed, job._changed = job._changed, asyncio.Event()
+        changed.set()
+        self._persist(job, job.events[-1])
+
+    def _persist(self, job: Job, event: dict[str, Any]) -> None:
+        """
+        새 이벤트를 공유 저장소에 추가 기록 (백그라운드)
+
+        상태 스냅샷은 상태가 바뀌는 이벤트에서만 다시 기록해 진행 이벤트가 쌓여도
+        이벤트마다 전체를 다시 쓰지 않습니다.
+        """
+        if self.store_factory is None:
+            return
+        snapshot = job.to_dict() if event["event"] in _STATUS_EVENTS else None
+        self._persister.submit(self._write, job.job_id, event, snapshot)
+
+    def _write(
+        self, job_id: str, event: dict[str, Any] | None, snapshot: dict[str, Any] | None
+    ) -> None:
+        assert self.store_factory is not None
+        store = self.store_factory()
+        try:
+            if event is not None:
+                store.put(_events_namespace(job_id), str(event["id"]), event)
+            if snapshot is not None:
+                store.put(JOB_STATE_NAMESPACE, job_id, snapshot)
+        except Exception:
+            logger.exception(f"작업 상태 저장 실패: {job_id}")
+
+    def _remove(self, job_id: str) -> None:
+        assert self.store_factory is not None
+        store = self.store_factory()
+        try:
+            store.delete(JOB_STATE_NAMESPACE, job_id)
+            store.clear(_events_namespace(job_id))
+        except Exception:
+            logger.exception(f"작업 상태 삭제 실패: {job_id}")
+
+    def _evict(self) -> None:
+        overflow = len(self._jobs) - self.max_retained
+        if overflow <= 0:
+            return
+        for job_id in [jid for jid, j in self._jobs.items() if j.done][:overflow]:
+            del self._jobs[job_id]
+            if self.store_factory is not None:
+                self._persister.submit(self._remove, job_id)
+
+
+def _events_namespace(job_id: str) -> str:
+    return f"{JOB_EVENTS_NAMESPACE}:{job_id}"
+
+
+job_runner = JobRunner(
+    max_workers=settings.job_max_workers,
+    max_queue=settings.job_queue_size,
+    store_factory=get_state_store,
+)
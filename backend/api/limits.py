@@ -0,0 +1,238 @@
+"""
+동시 실행 제한 및 부하 차단
+
+라우트 그룹별로 동시 실행 수를 제한하고, 초과 요청은 제한된 대기열에서 순서대로 대기
+- graph_query: 임의 Cypher 실행 (POST /graph/query)
+- graph_read: 그래프 조회 (노드/스키마/통계/검색)
+- agent: 에이전트 워크플로 실행 (POST /agents/query, 캐시 미스만)
+- 대기열이 가득 찼거나 대기 시간이 초과되면 즉시 503 + Retry-After
+- 한 그룹의 폭주가 Neo4j 커넥션 풀을 독점해 다른 그룹까지 느려지는 것을 방지
+- 상태(실행 중, 대기 중, 거절 수)는 /metrics로 노출
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import HTTPException
+
+from backend.agent_runtime.metrics import REGISTRY
+from backend.api.config import settings
+
+LIMITER_WAIT_SECONDS = REGISTRY.histogram(
+    "hr_dss_limiter_wait_seconds",
+    "Time spent waiting for a concurrency slot",
+    ["group"],
+)
+
+
+class ConcurrencyLimitError(Exception):
+    """동시 실행 제한 초과 (대기열 포화 또는 대기 시간 초과)"""
+
+    def __init__(self, group: str, reason: str, retry_after: int):
+        super().__init__(f"요청이 많아 처리할 수 없습니다 ({group}: {reason})")
+        self.group = group
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimiter:
+    """
+    대기열이 있는 동시 실행 제한기
+
+    이벤트 루프에 묶이지 않도록 카운터는 스레드 락으로 보호하고, 대기자는 각자의 루프
+    Future로 깨웁니다. 슬롯은 반환 시 대기열 맨 앞 요청에 바로 넘겨 순서를 보장합니다.
+    """
+
+    def __init__(
+        self,
+        group: str,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+    ):
+        """
+        Args:
+            group: 라우트 그룹 이름 (메트릭 라벨)
+            max_concurrent: 동시 실행 수
+            max_queue: 대기열 크기 (초과 시 즉시 거절)
+            queue_timeout: 대기 제한 시간(초)
+        """
+        self.group = group
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._hold_seconds = 0.0  # 슬롯 점유 시간 EWMA (Retry-After 추정용)
+        self.admitted = 0
+        self.rejected: dict[str, int] = {"queue_full": 0, "timeout": 0}
+
+    @property
+    def in_flight(self) -> int:
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """대기열이 빠지는 데 걸릴 예상 시간(초, 1~60)"""
+        backlog = (self.queue_depth + 1) / max(self.max_concurrent, 1)
+        return min(60, max(1, math.ceil(backlog * self._hold_seconds)))
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        슬롯 점유
+
+        Raises:
+            ConcurrencyLimitError: 대기열이 가득 찼거나 대기 시간 초과
+        """
+        acquired_at = await self.acquire()
+        try:
+            yield
+        finally:
+            self.release(acquired_at)
+
+    async def acquire(self) -> float:
+        """
+        슬롯 획득 (반환값을 release에 전달)
+
+        Raises:
+            ConcurrencyLimitError: 대기열이 가득 찼거나 대기 시간 초과
+        """
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                self.admitted += 1
+                return started
+            if len(self._waiters) >= self.max_queue:
+                self.rejected["queue_full"] += 1
+                raise ConcurrencyLimitError(self.group, "queue_full", self.retry_after())
+            waiter: asyncio.Future[None] = loop.create_future()
+            self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout)
+        except BaseException as e:
+            # 대기열에 남아 있으면 제거, 이미 슬롯을 넘겨받았다면 _wake에서 반환
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                if isinstance(e, TimeoutError):
+                    self.rejected["timeout"] += 1
+            if isinstance(e, TimeoutError):
+                raise ConcurrencyLimitError(self.group, "timeout", self.retry_after()) from None
+            raise
+
+        acquired_at = time.perf_counter()
+        LIMITER_WAIT_SECONDS.observe(acquired_at - started, group=self.group)
+        with self._lock:
+            self.admitted += 1
+        return acquired_at
+
+    def release(self, acquired_at: float) -> None:
+        """슬롯 반환"""
+        held = time.perf_counter() - acquired_at
+        self._hold_seconds = (
+            held if not self._hold_seconds else 0.8 * self._hold_seconds + 0.2 * held
+        )
+        self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            if self._waiters:
+                # 슬롯을 대기자에게 그대로 넘김 (_active 유지)
+                waiter = self._waiters.popleft()
+            else:
+                self._active -= 1
+                return
+        waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+
+    def _wake(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done():
+            # 대기자가 이미 취소/시간 초과됨: 넘겨받은 슬롯 반환
+            self._release()
+        else:
+            waiter.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        """제한기 상태"""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+        }
+
+
+limiters: dict[str, ConcurrencyLimiter] = {
+    "graph_query": ConcurrencyLimiter(
+        "graph_query",
+        max_concurrent=settings.graph_query_max_concurrency,
+        max_queue=settings.graph_query_max_queue,
+        queue_timeout=settings.limiter_queue_timeout_seconds,
+    ),
+    "graph_read": ConcurrencyLimiter(
+        "graph_read",
+        max_concurrent=settings.graph_read_max_concurrency,
+        max_queue=settings.graph_read_max_queue,
+        queue_timeout=settings.limiter_queue_timeout_seconds,
+    ),
+    "agent": ConcurrencyLimiter(
+        "agent",
+        max_concurrent=settings.agent_max_concurrency,
+        max_queue=settings.agent_max_queue,
+        queue_timeout=settings.limiter_queue_timeout_seconds,
+    ),
+}
+
+
+def overloaded(error: ConcurrencyLimitError) -> HTTPException:
+    """제한 초과를 503 + Retry-After 응답으로 변환"""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
+@asynccontextmanager
+async def limited(group: str) -> AsyncIterator[None]:
+    """
+    라우트 그룹 슬롯 점유 (초과 시 HTTPException 503)
+
+    Example:
+        async with limited("agent"):
+            result = await run_in_threadpool(run_query, question)
+    """
+    limiter = limiters[group]
+    try:
+        acquired_at = await limiter.acquire()
+    except ConcurrencyLimitError as e:
+        raise overloaded(e) from e
+    try:
+        yield
+    finally:
+        limiter.release(acquired_at)
+
+
+def limit_concurrency(group: str) -> Callable[[], AsyncIterator[None]]:
+    """라우트 의존성: 핸들러 실행 동안 그룹 슬롯 점유"""
+
+    async def dependency() -> AsyncIterator[None]:
+        async with limited(group):
+            yield
+
+    return dependency
@@ -4,13 +4,21 @@ HR-DSS Backend API
 FastAPI 기반 REST API 서버
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.api.config import settings
-from backend.api.routers import agents, decisions, graph, health
+from backend.api.jobs import job_runner
+from backend.api.metrics import MetricsMiddleware
+from backend.api.profiling import ProfilingMiddleware
+from backend.api.responses import CompressionMiddleware, ORJSONResponse
+from backend.api.routers import agents, decisions, graph, health, jobs, profiles
+from backend.api.tracing import TracingMiddleware
+from backend.api.warmup import warm_up
+from backend.database.session import dispose_engine, init_db
 
 
 @asynccontextmanager
@@ -18,8 +26,17 @@ async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # Startup
     print(f"🚀 HR-DSS API 시작 (환경: {settings.environment})")
+    await init_db()
+    await job_runner.start()
+    warmup = asyncio.create_task(warm_up()) if settings.startup_warmup else None
     yield
     # Shutdown
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+    await job_runner.stop()
+    await dispose_engine()
     print("👋 HR-DSS API 종료")
 
 
@@ -28,6 +45,7 @@ app = FastAPI(
     description="HR 의사결정 지원 시스템 API",
     version="0.2.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.environment == "development" else None,
     redoc_url="/redoc" if settings.environment == "development" else None,
 )
@@ -39,13 +57,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 브라우저에서 조건부 GET(If-None-Match)에 쓸 수 있도록 노출
+    expose_headers=["ETag"],
 )
 
+# 응답 압축 (brotli/gzip, 임계 크기 이상)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    compresslevel=settings.gzip_level,
+    brotli_quality=settings.brotli_quality,
+)
+
+# 관리자 요청 옵트인 프로파일링 (추적 미들웨어 안쪽: 요청 ID를 프로파일 ID로 사용)
+app.add_middleware(ProfilingMiddleware)
+
+# 요청 추적 (요청 ID, Server-Timing)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(health.router)
 app.include_router(agents.router, prefix="/api/v1/agents", tags=["Agents"])
 app.include_router(decisions.router, prefix="/api/v1/decisions", tags=["Decisions"])
 app.include_router(graph.router, prefix="/api/v1/graph", tags=["Graph"])
+app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["Jobs"])
+app.include_router(profiles.router, prefix="/api/v1/profiles", tags=["Profiles"])
 
 
 @app.get("/api")
@@ -57,10 +94,13 @@ async def api_info():
         "environment": settings.environment,
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "docs": "/docs",
             "agents": "/api/v1/agents",
             "decisions": "/api/v1/decisions",
             "graph": "/api/v1/graph",
+            "jobs": "/api/v1/jobs",
+            "profiles": "/api/v1/profiles",
         },
     }
 
@@ -0,0 +1,239 @@
+"""
+API 메트릭
+
+/metrics (Prometheus 텍스트 형식)로 노출되는 API 계층 메트릭
+- 라우트별 요청 지연 히스토그램 (MetricsMiddleware)
+- Neo4j 커넥션 풀 사용/유휴 수 (획득 대기 시간은 Neo4jService에서 기록)
+- 캐시 적중률 (에이전트 쿼리, 검증된 JWT, 영향도 시뮬레이션), 요청 병합 수, 작업 큐 상태
+- 라우트 그룹별 동시 실행 제한 상태 (실행 중, 대기열 깊이, 거절 수)
+- HITL 승인 대기 건수 (공유 상태 저장소 기준, 모든 워커에서 동일)
+에이전트 런타임 메트릭(KG 쿼리, 워크플로 단계)은 backend.agent_runtime.metrics 참고
+"""
+
+import time
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.agent_runtime.metrics import REGISTRY, Sample
+from backend.api.cache import query_cache
+from backend.api.dependencies import Neo4jService, token_cache
+from backend.api.jobs import job_runner
+from backend.api.limits import limiters
+from backend.api.pipeline import get_hitl_system, get_simulation_cache
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "hr_dss_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+HITL_PENDING = REGISTRY.gauge(
+    "hr_dss_hitl_pending_requests",
+    "Approval requests awaiting human review",
+)
+
+
+def _route_template(scope: Scope) -> str:
+    """
+    매칭된 라우트 템플릿 (예: /api/v1/decisions/{decision_id})
+
+    경로 파라미터 값으로 시계열이 늘지 않도록 실제 경로 대신 사용합니다.
+    include_router 접두사가 반영된 경로를 우선 사용합니다.
+    """
+    effective = scope.get("fastapi", {}).get("effective_route_context")
+    for candidate in (effective, scope.get("route")):
+        template = getattr(candidate, "path_format", None)
+        if template:
+            return template
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """라우트별 요청 지연 측정 미들웨어 (ASGI)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=_route_template(scope),
+                status=str(status_code),
+            )
+
+
+def _collect_runtime() -> list[tuple[str, str, str, list[Sample]]]:
+    """수집 시점 메트릭 (풀/캐시/병합/작업 큐/동시 실행 제한)"""
+    families: list[tuple[str, str, str, list[Sample]]] = []
+
+    pool = Neo4jService.get_pool_stats()
+    families.append(
+        (
+            "hr_dss_neo4j_pool_connections",
+            "gauge",
+            "Neo4j pooled connections by state",
+            [
+                Sample("hr_dss_neo4j_pool_connections", {"state": "in_use"}, pool["in_use"]),
+                Sample("hr_dss_neo4j_pool_connections", {"state": "idle"}, pool["idle"]),
+            ],
+        )
+    )
+    families.append(
+        (
+            "hr_dss_neo4j_pool_max_size",
+            "gauge",
+            "Configured Neo4j connection pool size",
+            [Sample("hr_dss_neo4j_pool_max_size", {}, pool["max_size"])],
+        )
+    )
+
+    caches = {
+        "agent_query": query_cache.stats(),
+        "jwt": token_cache.stats(),
+        "impact_simulation": get_simulation_cache().stats(),
+    }
+    families.extend(
+        [
+            (
+                "hr_dss_cache_requests_total",
+                "counter",
+                "Cache lookups by result",
+                [
+                    Sample(
+                        "hr_dss_cache_requests_total",
+                        {"cache": name, "result": result},
+                        stats[key],
+                    )
+                    for name, stats in caches.items()
+                    for result, key in (("hit", "hits"), ("miss", "misses"))
+                ],
+            ),
+            (
+                "hr_dss_cache_hit_ratio",
+                "gauge",
+                "Cache hit ratio since process start",
+                [
+                    Sample("hr_dss_cache_hit_ratio", {"cache": name}, stats["hit_rate"])
+                    for name, stats in caches.items()
+                ],
+            ),
+            (
+                "hr_dss_cache_entries",
+                "gauge",
+                "Cached entries",
+                [
+                    Sample("hr_dss_cache_entries", {"cache": name}, stats["size"])
+                    for name, stats in caches.items()
+                ],
+            ),
+            (
+                "hr_dss_cache_evictions_total",
+                "counter",
+                "Cache evictions",
+                [
+                    Sample("hr_dss_cache_evictions_total", {"cache": name}, stats["evictions"])
+                    for name, stats in caches.items()
+                ],
+            ),
+        ]
+    )
+
+    coalescing = Neo4jService.get_coalescing_stats()
+    families.append(
+        (
+            "hr_dss_coalesced_requests_total",
+            "counter",
+            "Calls that joined an in-flight identical query",
+            [
+                Sample("hr_dss_coalesced_requests_total", {"layer": layer}, stats["coalesced"])
+                for layer, stats in coalescing.items()
+            ],
+        )
+    )
+
+    jobs = job_runner.stats()
+    families.append(
+        (
+            "hr_dss_jobs",
+            "gauge",
+            "Background analysis jobs by state",
+            [
+                Sample("hr_dss_jobs", {"state": "queued"}, jobs["queued"]),
+                Sample("hr_dss_jobs", {"state": "running"}, jobs["running"]),
+            ],
+        )
+    )
+
+    limits = {group: limiter.stats() for group, limiter in limiters.items()}
+    families.extend(
+        [
+            (
+                "hr_dss_limiter_in_flight",
+                "gauge",
+                "Requests holding a concurrency slot by route group",
+                [
+                    Sample("hr_dss_limiter_in_flight", {"group": group}, stats["in_flight"])
+                    for group, stats in limits.items()
+                ],
+            ),
+            (
+                "hr_dss_limiter_queue_depth",
+                "gauge",
+                "Requests waiting for a concurrency slot by route group",
+                [
+                    Sample("hr_dss_limiter_queue_depth", {"group": group}, stats["queue_depth"])
+                    for group, stats in limits.items()
+                ],
+            ),
+            (
+                "hr_dss_limiter_max_concurrency",
+                "gauge",
+                "Configured concurrency limit by route group",
+                [
+                    Sample(
+                        "hr_dss_limiter_max_concurrency", {"group": group}, stats["max_concurrent"]
+                    )
+                    for group, stats in limits.items()
+                ],
+            ),
+            (
+                "hr_dss_limiter_rejected_total",
+                "counter",
+                "Requests shed by the concurrency limiter",
+                [
+                    Sample(
+                        "hr_dss_limiter_rejected_total", {"group": group, "reason": reason}, count
+                    )
+                    for group, stats in limits.items()
+                    for reason, count in stats["rejected"].items()
+                ],
+            ),
+        ]
+    )
+    return families
+
+
+REGISTRY.register_collector(_collect_runtime)
+
+
+async def render_metrics() -> str:
+    """메트릭 출력 (공유 저장소 기반 게이지 갱신 후)"""
+    HITL_PENDING.set(await run_in_threadpool(len, get_hitl_system().pending_requests))
+    return REGISTRY.render()
@@ -0,0 +1,231 @@
+"""
+에이전트 파이프라인
+
+API에서 사용하는 실제 에이전트 워크플로 실행 헬퍼
+질문 분해 → KG 조회 → 대안 생성 → 영향 분석 → 성공 확률 → 검증
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from backend.agent_runtime.agents.simulation_cache import SimulationCache
+from backend.agent_runtime.agents.workflow_builder import (
+    KGLookupCache,
+    StepResult,
+    WorkflowBuilderAgent,
+    WorkflowContext,
+    WorkflowExecution,
+    WorkflowStep,
+)
+from backend.agent_runtime.state import StateStore
+from backend.agent_runtime.workflows.hitl_approval import HITLApprovalSystem
+from backend.api.config import settings
+from backend.api.dependencies import get_state_store
+from backend.api.tracing import record_stage, stage
+
+if TYPE_CHECKING:
+    from backend.agent_runtime.agents.query_decomposition import DecomposedQuery
+
+logger = logging.getLogger(__name__)
+
+StepCallback = Callable[[WorkflowStep, StepResult], None]
+
+_agents: dict[str, Any] | None = None
+_hitl_system: HITLApprovalSystem | None = None
+_simulation_cache: SimulationCache | None = None
+_kg_client: Any = None
+_kg_client_lock = threading.Lock()
+_kg_client_checked = False
+
+
+def get_simulation_cache() -> SimulationCache:
+    """영향도 시뮬레이션 결과 캐시 (공유 상태 저장소 사용)"""
+    global _simulation_cache
+    if _simulation_cache is None:
+        _simulation_cache = SimulationCache(get_state_store(), settings.impact_cache_size)
+    return _simulation_cache
+
+
+def get_agents() -> dict[str, Any]:
+    """에이전트 인스턴스 (프로세스 공유, 무상태 / 첫 호출 시 모듈 로드)"""
+    global _agents
+    if _agents is None:
+        from backend.agent_runtime.agents.impact_simulator import ImpactSimulatorAgent
+        from backend.agent_runtime.agents.option_generator import OptionGeneratorAgent
+        from backend.agent_runtime.agents.query_decomposition import QueryDecompositionAgent
+        from backend.agent_runtime.agents.success_probability import SuccessProbabilityAgent
+        from backend.agent_runtime.agents.validator import ValidatorAgent
+
+        _agents = {
+            "query_decomposition": QueryDecompositionAgent(),
+            "option_generator": OptionGeneratorAgent(),
+            "impact_simulator": ImpactSimulatorAgent(
+                mc_samples=settings.impact_mc_samples,
+                mc_seed=settings.impact_mc_seed,
+                cache=get_simulation_cache() if settings.impact_cache_size > 0 else None,
+            ),
+            "success_probability": SuccessProbabilityAgent(ml_model=_load_success_model()),
+            "validator": ValidatorAgent(),
+        }
+    return _agents
+
+
+def _load_success_model() -> Any:
+    """설정된 학습 모델 (없거나 읽을 수 없으면 None → 휴리스틱)"""
+    if not settings.success_model_path:
+        return None
+    from backend.agent_runtime.agents.success_model import SuccessPredictor
+
+    try:
+        return SuccessPredictor.load(settings.success_model_path, kg_client=get_kg_client())
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("성공 확률 모델 로드 실패, 휴리스틱 사용: %s", e)
+        return None
+
+
+def get_kg_client() -> Any:
+    """
+    워크플로 KG 조회용 KnowledgeGraphQuery (프로세스 공유, 첫 호출 시 연결)
+
+    에이전트 단계는 작업 스레드에서 동기로 실행되므로 비동기 Neo4jService 대신
+    동기 드라이버를 씁니다. NEO4J_URI가 없거나 연결에 실패하면 None (Mock 조회)이며,
+    연결 시도는 프로세스당 한 번입니다.
+    """
+    global _kg_client, _kg_client_checked
+    if _kg_client_checked or not settings.neo4j_uri:
+        return _kg_client
+    with _kg_client_lock:
+        if not _kg_client_checked:
+            from backend.agent_runtime.ontology.kg_query import KnowledgeGraphQuery
+
+            try:
+                client = KnowledgeGraphQuery(
+                    settings.neo4j_uri, settings.neo4j_user, settings.neo4j_password
+                )
+                client.connect()
+                _kg_client = client
+            except Exception as e:
+                logger.warning("KG 연결 실패, Mock 조회 사용: %s", e)
+            _kg_client_checked = True
+    return _kg_client
+
+
+def get_hitl_system() -> HITLApprovalSystem:
+    """HITL 승인 시스템 (공유 상태 저장소 사용)"""
+    global _hitl_system
+    if _hitl_system is None:
+        _hitl_system = HITLApprovalSystem(state_store=get_state_store())
+    return _hitl_system
+
+
+def run_analysis(
+    question: str,
+    org_unit_id: str | None = None,
+    constraints: dict[str, Any] | None = None,
+    on_step: StepCallback | None = None,
+    decomposed: "DecomposedQuery | None" = None,
+    state_store: StateStore | None = None,
+    kg_cache: KGLookupCache | None = None,
+) -> tuple[WorkflowExecution, WorkflowContext]:
+    """
+    의사결정 분석 워크플로 실행 (HITL 단계 전까지)
+
+    Args:
+        question: 자연어 질문
+        org_unit_id: 대상 조직 ID
+        constraints: 제약조건
+        on_step: 단계 완료 콜백
+        decomposed: 이미 분해된 질문 (없으면 분해 수행)
+        state_store: 실행 인스턴스 저장소 (없으면 기록하지 않는 일회성 실행)
+        kg_cache: 다른 분석과 공유할 KG 조회 결과 (배치 분석)
+
+    Returns:
+        tuple[WorkflowExecution, WorkflowContext]: 실행 결과와 최종 컨텍스트
+    """
+    agents = get_agents()
+    if decomposed is None:
+        with stage("agent.query_decomposition"):
+            decomposed = agents["query_decomposition"].decompose(
+                question, {"org_unit_id": org_unit_id}
+            )
+
+    builder = WorkflowBuilderAgent(
+        agents=agents, kg_client=get_kg_client(), state_store=state_store, kg_cache=kg_cache
+    )
+    workflow = builder.build_workflow(decomposed.query_type.value)
+    context = WorkflowContext(
+        user_query=question,
+        org_unit_id=org_unit_id,
+        constraints=constraints or {},
+    )
+
+    def record_step(step: WorkflowStep, result: StepResult) -> None:
+        record_stage(f"agent.{step.step_type.value.lower()}", result.duration_ms)
+        if on_step is not None:
+            on_step(step, result)
+
+    execution = builder.run_workflow(workflow, context, stop_on_hitl=True, on_step=record_step)
+    return execution, context
+
+
+def run_query(question: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
+    """
+    에이전트 쿼리 실행 (/agents/query)
+
+    Args:
+        question: 자연어 질문
+        context: 추가 컨텍스트 (org_unit_id, constraints)
+
+    Returns:
+        dict: 질문 분해, 워크플로 실행 요약, 대안 및 추천 결과
+    """
+    context = context or {}
+    agents = get_agents()
+    with stage("agent.query_decomposition"):
+        decomposed = agents["query_decomposition"].decompose(question, context)
+    execution, workflow_context = run_analysis(
+        question,
+        org_unit_id=context.get("org_unit_id"),
+        constraints=context.get("constraints"),
+        decomposed=decomposed,
+    )
+    builder = WorkflowBuilderAgent(agents=agents)
+
+    return {
+        "question": question,
+        "decomposed": agents["query_decomposition"].to_dict(decomposed),
+        "workflow": builder.execution_to_dict(execution),
+        "options": summarize_options(workflow_context),
+        "recommendation": (workflow_context.options or {}).get("recommendation"),
+        "recommendation_reason": (workflow_context.options or {}).get("recommendation_reason"),
+    }
+
+
+def summarize_options(context: WorkflowContext) -> list[dict[str, Any]]:
+    """워크플로 결과를 의사결정 대안 목록으로 요약"""
+    options = (context.options or {}).get("options", [])
+    probabilities = {
+        p.get("subject_id"): p.get("success_probability")
+        for p in (context.probabilities or {}).get("probabilities", [])
+    }
+    impact_scores = {
+        a.get("option_id"): a.get("overall_impact_score")
+        for a in (context.impact_analysis or {}).get("analyses", [])
+    }
+
+    return [
+        {
+            "id": opt.get("option_id"),
+            "type": opt.get("option_type"),
+            "name": opt.get("name"),
+            "description": opt.get("description"),
+            "success_probability": probabilities.get(opt.get("option_id")),
+            "impact_score": impact_scores.get(opt.get("option_id")),
+            "cost": opt.get("estimated_cost"),
+            "risk": str(opt.get("risk_level", "")).lower(),
+            "actions": opt.get("actions", []),
+        }
+        for opt in options
+    ]
@@ -0,0 +1,206 @@
+"""
+요청 단위 프로파일링 (관리자 전용, 옵트인)
+
+X-Profile: 1 헤더 또는 ?_profile=1 쿼리가 붙은 관리자(role=admin) 요청을 샘플링 프로파일러로
+실행하고, 결과를 공유 상태 저장소에 collapsed stack 형식으로 보관
+- 형식: "스레드;모듈:함수;... 샘플수" (flamegraph.pl, speedscope, inferno 호환)
+- 응답 헤더 X-Profile-ID로 조회 키 전달 → GET /api/v1/profiles/{profile_id}
+- 프로세스 전체에서 동시에 1건, settings.profiler_min_interval_seconds 간격으로만 허용
+  (제한되면 프로파일 없이 정상 처리하고 X-Profile-Status: rate_limited)
+- 관리자가 아니면 플래그를 무시 (존재 여부를 드러내지 않음)
+- 샘플러는 모든 스레드를 보므로 동시에 처리 중인 다른 요청의 스택도 섞일 수 있음
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.api.config import settings
+from backend.api.dependencies import get_state_store, verify_token
+from backend.api.tracing import current_trace
+
+logger = logging.getLogger(__name__)
+
+PROFILE_NAMESPACE = "profiles"
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY = "_profile"
+
+# 대기 중(유휴) 스레드로 보고 샘플에서 제외할 말단 모듈
+_IDLE_MODULES = {"threading", "queue", "selectors", "concurrent.futures.thread"}
+
+
+class SamplingProfiler:
+    """sys._current_frames() 기반 주기적 스택 샘플러"""
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 128):
+        """
+        Args:
+            interval: 샘플링 간격(초)
+            max_depth: 기록할 최대 스택 깊이
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="hr-dss-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def folded(self) -> str:
+        """collapsed stack 형식 출력"""
+        return "\n".join(f"{stack} {count}" for stack, count in sorted(self.stacks.items()))
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = self._stack(frame)
+                if stack is not None:
+                    self.stacks[";".join([names.get(ident, str(ident)), *stack])] += 1
+            self.samples += 1
+
+    def _stack(self, frame: Any) -> list[str] | None:
+        """루트→말단 프레임 이름 (유휴 스레드면 None)"""
+        if frame.f_globals.get("__name__") in _IDLE_MODULES:
+            return None
+        names = []
+        while frame is not None and len(names) < self.max_depth:
+            module = frame.f_globals.get("__name__", "?")
+            names.append(f"{module}:{frame.f_code.co_qualname}")
+            frame = frame.f_back
+        return names[::-1]
+
+
+class ProfileGate:
+    """프로파일링 허용 여부 (동시 1건 + 최소 간격)"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._active = False
+        self._last_started: float | None = None
+
+    def try_acquire(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._active:
+                return False
+            if self._last_started is not None and now - self._last_started < self.min_interval:
+                return False
+            self._active = True
+            self._last_started = now
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._active = False
+
+
+profile_gate = ProfileGate(settings.profiler_min_interval_seconds)
+
+
+def _is_admin(headers: Headers) -> bool:
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        return verify_token(token).role == "admin"
+    except HTTPException:
+        return False
+
+
+def _profile_requested(scope: Scope, headers: Headers) -> bool:
+    flag = headers.get(PROFILE_HEADER) or QueryParams(scope["query_string"]).get(PROFILE_QUERY)
+    return flag in ("1", "true")
+
+
+def save_profile(profile: dict[str, Any]) -> None:
+    """프로파일 저장 (보관 개수 초과 시 오래된 것부터 삭제)"""
+    store = get_state_store()
+    store.put(PROFILE_NAMESPACE, profile["profile_id"], profile)
+    stored = sorted((value["created_at"], key) for key, value in store.items(PROFILE_NAMESPACE))
+    for _, key in stored[: max(0, len(stored) - settings.profiler_max_stored)]:
+        store.delete(PROFILE_NAMESPACE, key)
+
+
+class ProfilingMiddleware:
+    """관리자 요청 옵트인 프로파일링 미들웨어 (ASGI)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.profiler_enabled:
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if not _profile_requested(scope, headers) or not _is_admin(headers):
+            await self.app(scope, receive, send)
+            return
+
+        if not profile_gate.try_acquire():
+
+            async def send_rate_limited(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    extra = [(b"x-profile-status", b"rate_limited")]
+                    message = {**message, "headers": [*message.get("headers", []), *extra]}
+                await send(message)
+
+            await self.app(scope, receive, send_rate_limited)
+            return
+
+        trace = current_trace()
+        profile_id = trace.request_id if trace else f"{time.time_ns():x}"
+        status_code = 500
+
+        async def send_with_profile(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                extra = [(b"x-profile-id", profile_id.encode())]
+                message = {**message, "headers": [*message.get("headers", []), *extra]}
+            await send(message)
+
+        profiler = SamplingProfiler(interval=settings.profiler_interval_ms / 1000)
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            profiler.stop()
+            profile_gate.release()
+            profile = {
+                "profile_id": profile_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "interval_ms": settings.profiler_interval_ms,
+                "samples": profiler.samples,
+                "created_at": datetime.now(UTC).isoformat(),
+                "folded": profiler.folded(),
+            }
+            try:
+                await run_in_threadpool(save_profile, profile)
+            except Exception:
+                logger.exception(f"프로파일 저장 실패: {profile_id}")
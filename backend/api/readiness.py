@@ -0,0 +1,127 @@
+"""
+준비 상태(readiness) 점검
+
+오케스트레이터 프로브용 의존성 점검
+- 관계형 DB: 커넥션 풀에서 SELECT 1
+- Neo4j: 드라이버 풀에서 RETURN 1 (미설정 시 not_configured, 준비 상태 판단에서 제외)
+- 각 점검은 settings.readiness_timeout_seconds 안에 끝나야 함
+- 결과는 settings.readiness_cache_seconds 동안 재사용하고, 동시 프로브는 한 번만 점검
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import text
+
+from backend.agent_runtime.ontology.singleflight import AsyncSingleFlight
+from backend.api.config import settings
+from backend.api.dependencies import Neo4jService
+from backend.database.session import get_engine
+
+
+@dataclass
+class CheckResult:
+    """단일 의존성 점검 결과"""
+
+    status: str  # ok | error | timeout | not_configured
+    latency_ms: float
+    error: str | None = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.status in ("ok", "not_configured")
+
+    def to_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {"status": self.status, "latency_ms": round(self.latency_ms, 2)}
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+async def _timed(check: Callable[[], Awaitable[None]], timeout: float) -> CheckResult:
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(check(), timeout=timeout)
+        status, error = "ok", None
+    except TimeoutError:
+        status, error = "timeout", f"{timeout}s 내 응답 없음"
+    except Exception as e:
+        status, error = "error", str(e)
+    return CheckResult(status, (time.perf_counter() - started) * 1000, error)
+
+
+async def check_database(timeout: float) -> CheckResult:
+    """관계형 DB 점검 (SELECT 1)"""
+
+    async def ping() -> None:
+        async with get_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    return await _timed(ping, timeout)
+
+
+async def check_neo4j(timeout: float) -> CheckResult:
+    """Neo4j 점검 (RETURN 1)"""
+    if await Neo4jService.get_driver() is None:
+        return CheckResult("not_configured", 0.0)
+
+    async def ping() -> None:
+        await Neo4jService.execute_query("RETURN 1 AS ok")
+
+    return await _timed(ping, timeout)
+
+
+class ReadinessProbe:
+    """캐시되는 준비 상태 점검"""
+
+    def __init__(self, ttl_seconds: float, timeout_seconds: float):
+        """
+        Args:
+            ttl_seconds: 결과 재사용 시간
+            timeout_seconds: 의존성별 점검 제한 시간
+        """
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self._flight = AsyncSingleFlight()
+        self._result: dict[str, Any] | None = None
+        self._checked_at = 0.0
+
+    async def check(self) -> tuple[dict[str, Any], bool]:
+        """
+        준비 상태 점검
+
+        Returns:
+            tuple[dict, bool]: (점검 결과, 캐시 사용 여부)
+        """
+        if self._result is not None and time.monotonic() - self._checked_at < self.ttl_seconds:
+            return self._result, True
+        return await self._flight.do("readiness", self._run), False
+
+    def invalidate(self) -> None:
+        """캐시 초기화"""
+        self._result = None
+
+    async def _run(self) -> dict[str, Any]:
+        database, neo4j = await asyncio.gather(
+            check_database(self.timeout_seconds),
+            check_neo4j(self.timeout_seconds),
+        )
+        checks = {"database": database, "neo4j": neo4j}
+        result = {
+            "status": "ready" if all(c.healthy for c in checks.values()) else "not_ready",
+            "checks": {name: c.to_dict() for name, c in checks.items()},
+            "checked_at": datetime.now(UTC).isoformat(),
+        }
+        self._result = result
+        self._checked_at = time.monotonic()
+        return result
+
+
+readiness_probe = ReadinessProbe(
+    ttl_seconds=settings.readiness_cache_seconds,
+    timeout_seconds=settings.readiness_timeout_seconds,
+)
@@ -1,5 +1,5 @@
 """API 라우터"""
 
-from backend.api.routers import agents, decisions, graph, health
+from backend.api.routers import agents, decisions, graph, health, jobs, profiles
 
-__all__ = ["health", "agents", "decisions", "graph"]
+__all__ = ["health", "agents", "decisions", "graph", "jobs", "profiles"]
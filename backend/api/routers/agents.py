@@ -3,9 +3,16 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
+from backend.api.cache import make_cache_key, normalize_question, query_cache
+from backend.api.config import settings
+from backend.api.dependencies import Neo4jService
+from backend.api.limits import limited
+from backend.api.pipeline import get_agents, run_query
+
 router = APIRouter()
 
 
@@ -27,34 +34,177 @@ class QueryResponse(BaseModel):
 
 
 @router.post("/query", response_model=QueryResponse)
-async def execute_query(request: QueryRequest):
+async def execute_query(request: QueryRequest, response: Response):
     """
     에이전트 쿼리 실행
 
-    자연어 질문을 받아 적절한 에이전트를 호출하고 결과를 반환합니다.
+    자연어 질문을 받아 에이전트 파이프라인(분해 → 대안 생성 → 영향 분석 → 성공 확률 → 검증)을
+    실행하고 결과를 반환합니다. 정규화된 질문 + 컨텍스트 + 그래프 버전 기준으로 결과를 캐시하며
+    X-Cache 헤더(HIT/MISS/BYPASS)로 캐시 여부를 알려줍니다. options.cache=false면 캐시를
+    읽지도 쓰지도 않습니다.
     """
     request_id = str(uuid.uuid4())
+    context = request.context or {}
+    use_cache = (request.options or {}).get("cache", True)
 
-    try:
-        # TODO: 실제 에이전트 호출 구현
-        # from backend.agent_runtime.agents import query_decomposition
-        # result = await query_decomposition.process(request.question)
-
-        return QueryResponse(
-            request_id=request_id,
-            status="success",
-            result={
-                "question": request.question,
-                "decomposed": {
-                    "goal": "분석 목표",
-                    "constraints": ["제약조건1", "제약조건2"],
-                    "period": "12주",
-                },
-                "message": "쿼리 분해 완료 (Mock 응답)",
-            },
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    graph_version = await Neo4jService.get_graph_version()
+    cache_key = make_cache_key(normalize_question(request.question), context, graph_version)
+
+    if use_cache:
+        cached = query_cache.get(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return QueryResponse(request_id=request_id, status="success", result=cached)
+
+    # 캐시 미스만 동시 실행 제한 (초과 시 503 + Retry-After)
+    async with limited("agent"):
+        try:
+            result = await run_in_threadpool(run_query, request.question, context)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e)) from e
+
+    result["graph_version"] = graph_version
+    # 우회 요청은 공유 캐시 항목을 덮어쓰지 않음
+    if use_cache:
+        query_cache.set(cache_key, result)
+    response.headers["X-Cache"] = "MISS" if use_cache else "BYPASS"
+    return QueryResponse(request_id=request_id, status="success", result=result)
+
+
+class SweepRange(BaseModel):
+    """스윕 범위 (low~high를 steps개 등간격으로)"""
+
+    low: float
+    high: float
+    steps: int = Field(default=11, ge=2, le=1001)
+
+
+class SweepRequest(BaseModel):
+    """파라미터 스윕 요청"""
+
+    query_type: str = Field(..., description="질문 유형 (CAPACITY, GO_NOGO, HEADCOUNT, ...)")
+    options: list[dict[str, Any]] = Field(..., min_length=1, description="대안 목록")
+    baseline: dict[str, Any] = Field(default_factory=dict, description="현재 상태 (As-Is)")
+    ranges: dict[str, list[float] | SweepRange] = Field(
+        ..., min_length=1, description="파라미터별 값 목록 또는 범위 (질문 유형 지표 모델의 입력만)"
+    )
+    horizon_weeks: int = Field(default=12, ge=1, le=104)
+
+
+def _run_sweep(request: SweepRequest) -> dict[str, Any]:
+    agent = get_agents()["impact_simulator"]
+    ranges = {
+        key: spec.model_dump() if isinstance(spec, SweepRange) else spec
+        for key, spec in request.ranges.items()
+    }
+    result = agent.sweep(
+        query_type=request.query_type,
+        options=request.options,
+        baseline=request.baseline,
+        ranges=ranges,
+        horizon_weeks=request.horizon_weeks,
+        max_points=settings.sweep_max_points,
+    )
+    return result.to_dict()
+
+
+@router.post("/impact-simulator/sweep")
+async def sweep_impact(request: SweepRequest):
+    """
+    영향도 파라미터 스윕 (민감도 분석)
+
+    baseline 파라미터 범위의 전체 그리드 × 대안을 한 번의 배열 연산으로 평가하고
+    그리드 점수, 토네이도(파라미터별 점수 변화폭), 손익분기점(최적 대안 전환/50점 교차)을 반환
+    """
+    async with limited("agent"):
+        try:
+            return await run_in_threadpool(_run_sweep, request)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+class PortfolioRequest(BaseModel):
+    """포트폴리오 Go/No-go 요청"""
+
+    opportunities: list[dict[str, Any]] = Field(
+        ..., min_length=1, max_length=2000, description="기회 목록 (deal_value, 주차별 필요 FTE 등)"
+    )
+    capacity_fte: float | list[float] | dict[str, float] = Field(..., description="주차별 가용 FTE")
+    committed_fte: float | list[float] | dict[str, float] = Field(
+        default=0.0, description="주차별 기존 투입 FTE"
+    )
+    weeks: int | list[str] = Field(default=12, description="계획 주차 수 또는 주차 라벨")
+    utilization_caps: list[float] | None = Field(
+        default=None, max_length=50, description="효율적 경계를 그릴 가동률 상한"
+    )
+    target_utilization: float = Field(default=0.9, gt=0)
+
+
+def _run_portfolio(request: PortfolioRequest) -> dict[str, Any]:
+    from backend.agent_runtime.agents.portfolio import DEFAULT_UTILIZATION_CAPS, PortfolioOptimizer
+
+    optimizer = PortfolioOptimizer(get_agents()["success_probability"])
+    result = optimizer.evaluate(
+        opportunities=request.opportunities,
+        capacity_fte=request.capacity_fte,
+        committed_fte=request.committed_fte,
+        weeks=request.weeks,
+        utilization_caps=request.utilization_caps or DEFAULT_UTILIZATION_CAPS,
+        target_utilization=request.target_utilization,
+    )
+    return result.to_dict()
+
+
+@router.post("/go-nogo/portfolio")
+async def optimize_portfolio(request: PortfolioRequest):
+    """
+    파이프라인 포트폴리오 Go/No-go
+
+    기회를 일괄 평가(성공 확률 × 계약 금액)하고 주차별 가용 FTE 안에서 수주할 조합을 선택하여
+    기대 매출 vs 최대 가동률의 효율적 경계와 목표 가동률 이내 추천 조합을 반환
+    """
+    async with limited("agent"):
+        try:
+            return await run_in_threadpool(_run_portfolio, request)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+class OptionRankRequest(BaseModel):
+    """대안 순위화 요청"""
+
+    options: list[dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=20000,
+        description="대안 목록 (option_id, scores: impact/feasibility/risk/cost/time)",
+    )
+    weight_profile: str | dict[str, Any] | None = Field(
+        default=None, description="가중치 프로필 이름 또는 기준별 가중치"
+    )
+    top_k: int | None = Field(default=100, ge=1, description="반환할 상위 순위 수")
+
+
+def _run_option_rank(request: OptionRankRequest) -> dict[str, Any]:
+    from backend.agent_runtime.agents.option_ranking import OptionRanker
+
+    ranking = OptionRanker().rank(request.options, profile=request.weight_profile)
+    return {"recommendation": ranking.recommended, **ranking.to_dict(top_k=request.top_k)}
+
+
+@router.post("/options/rank")
+async def rank_options(request: OptionRankRequest):
+    """
+    대안 순위화 (파레토 프런티어)
+
+    대안 수에 제한 없이 5개 기준의 파레토 최적(비지배) 집합을 구하고
+    가중치 프로필 종합 점수로 순위를 매겨 상위 top_k개를 반환
+    """
+    async with limited("agent"):
+        try:
+            return await run_in_threadpool(_run_option_rank, request)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.get("/types")
@@ -1,14 +1,47 @@
 """의사결정 API 라우터"""
 
+import asyncio
+import logging
 import uuid
+from collections.abc import Callable
+from dataclasses import asdict
 from datetime import UTC, datetime
-from typing import Any
+from functools import partial
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from backend.agent_runtime.agents.workflow_builder import (
+    KGLookupCache,
+    StepResult,
+    WorkflowContext,
+    WorkflowStatus,
+    WorkflowStep,
+)
+from backend.agent_runtime.workflows.hitl_approval import (
+    ApprovalRequest,
+    ApprovalStatus,
+    DecisionType,
+)
+from backend.api.config import settings
+from backend.api.dependencies import get_db_session, get_state_store
+from backend.api.etag import PRIVATE_CACHE_CONTROL, apply_etag, make_etag, not_modified
+from backend.api.jobs import JobContext, JobQueueFullError, job_runner
+from backend.api.pipeline import get_hitl_system, run_analysis, summarize_options
+from backend.database.models.decision import DecisionRecord
+from backend.database.repositories.decision import DecisionRepository
+from backend.database.session import get_sessionmaker
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 의사결정 ID → 대기 중 승인 요청 ID (공유 상태 저장소, 승인 요청을 한 번에 조회)
+_APPROVAL_INDEX_NAMESPACE = "decision_pending_approvals"
+
 
 class Decision(BaseModel):
     """의사결정"""
@@ -36,6 +69,21 @@ class DecisionAnalyzeRequest(BaseModel):
     agent_type: str | None = Field(default=None, description="사용할 에이전트 타입")
 
 
+class BatchAnalyzeItem(BaseModel):
+    """일괄 분석 항목 (기존 의사결정 ID 또는 새 질문 중 하나)"""
+
+    decision_id: str | None = Field(default=None, description="분석할 의사결정 ID")
+    question: str | None = Field(default=None, description="새로 분석할 질문 (의사결정 생성)")
+    title: str | None = Field(default=None, description="새 의사결정 제목 (기본값: 질문)")
+    org_unit_id: str | None = Field(default=None, description="대상 조직 ID")
+
+
+class BatchAnalyzeRequest(BaseModel):
+    """의사결정 일괄 분석 요청"""
+
+    items: list[BatchAnalyzeItem] = Field(..., description="분석 항목")
+
+
 class DecisionApproveRequest(BaseModel):
     """의사결정 승인 요청"""
 
@@ -43,153 +91,449 @@ class DecisionApproveRequest(BaseModel):
     comment: str | None = Field(default=None, description="승인 코멘트")
 
 
-# In-memory 저장소 (프로토타입용)
-_decisions: dict[str, Decision] = {}
+def get_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> DecisionRepository:
+    """의사결정 저장소 의존성"""
+    return DecisionRepository(session)
+
+
+Repository = Annotated[DecisionRepository, Depends(get_repository)]
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite 등 naive datetime 반환 시 UTC로 보정"""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _to_schema(record: DecisionRecord) -> Decision:
+    """DB 레코드를 API 스키마로 변환"""
+    return Decision(
+        id=record.id,
+        title=record.title,
+        status=record.status,
+        question=record.question,
+        options=record.options,
+        selected_option=record.selected_option,
+        created_at=_as_utc(record.created_at),
+        updated_at=_as_utc(record.updated_at),
+    )
+
+
+async def _get_or_404(repo: DecisionRepository, decision_id: str) -> DecisionRecord:
+    """의사결정 조회 (없으면 404)"""
+    record = await repo.get(decision_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="의사결정을 찾을 수 없습니다")
+    return record
 
 
 @router.get("")
 async def list_decisions(
+    request: Request,
+    response: Response,
+    repo: Repository,
     status: str | None = Query(None, description="상태 필터"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
 ):
-    """의사결정 목록 조회"""
-    decisions = list(_decisions.values())
+    """
+    의사결정 목록 조회
 
-    if status:
-        decisions = [d for d in decisions if d.status == status]
+    저장소 리비전 기반 ETag를 반환하며, If-None-Match가 일치하면 304를 반환합니다.
+    """
+    etag = make_etag("decisions", await repo.revision(), status, limit, offset)
+    if (unchanged := not_modified(request, etag, PRIVATE_CACHE_CONTROL)) is not None:
+        return unchanged
 
-    # 최신순 정렬
-    decisions.sort(key=lambda x: x.updated_at, reverse=True)
+    total, records = await repo.list(status=status, limit=limit, offset=offset)
 
+    apply_etag(response, etag, PRIVATE_CACHE_CONTROL)
     return {
-        "total": len(decisions),
+        "total": total,
         "limit": limit,
         "offset": offset,
-        "items": decisions[offset : offset + limit],
+        "items": [_to_schema(r) for r in records],
     }
 
 
 @router.post("", response_model=Decision)
-async def create_decision(request: DecisionCreate):
+async def create_decision(request: DecisionCreate, repo: Repository):
     """의사결정 생성"""
-    decision_id = str(uuid.uuid4())
-    now = datetime.now(UTC)
-
-    decision = Decision(
-        id=decision_id,
+    record = await repo.create(
+        decision_id=str(uuid.uuid4()),
         title=request.title,
         question=request.question,
-        status="pending",
-        options=None,
-        selected_option=None,
-        created_at=now,
-        updated_at=now,
     )
-
-    _decisions[decision_id] = decision
-    return decision
+    return _to_schema(record)
 
 
 @router.get("/{decision_id}", response_model=Decision)
-async def get_decision(decision_id: str):
+async def get_decision(decision_id: str, request: Request, response: Response, repo: Repository):
     """의사결정 상세 조회"""
-    if decision_id not in _decisions:
-        raise HTTPException(status_code=404, detail="의사결정을 찾을 수 없습니다")
-    return _decisions[decision_id]
+    record = await _get_or_404(repo, decision_id)
+    etag = make_etag("decision", record.id, record.updated_at)
+    if (unchanged := not_modified(request, etag, PRIVATE_CACHE_CONTROL)) is not None:
+        return unchanged
+
+    apply_etag(response, etag, PRIVATE_CACHE_CONTROL)
+    return _to_schema(record)
 
 
 @router.delete("/{decision_id}")
-async def delete_decision(decision_id: str):
+async def delete_decision(decision_id: str, repo: Repository):
     """의사결정 삭제"""
-    if decision_id not in _decisions:
+    if not await repo.delete(decision_id):
         raise HTTPException(status_code=404, detail="의사결정을 찾을 수 없습니다")
-
-    del _decisions[decision_id]
+    await run_in_threadpool(_cancel_pending_approval, decision_id)
     return {"status": "deleted", "id": decision_id}
 
 
-@router.post("/{decision_id}/analyze")
-async def analyze_decision(decision_id: str, request: DecisionAnalyzeRequest | None = None):
-    """의사결정 분석 실행"""
-    if decision_id not in _decisions:
-        raise HTTPException(status_code=404, detail="의사결정을 찾을 수 없습니다")
+@router.post("/batch-analyze", status_code=202)
+async def batch_analyze_decisions(request: BatchAnalyzeRequest, repo: Repository):
+    """
+    의사결정 일괄 분석 작업 제출
+
+    기존 의사결정 ID 또는 새 질문(의사결정 생성) 목록을 하나의 백그라운드 작업으로 분석합니다.
+    항목은 작업 워커 풀에서 병렬로 실행되며, 같은 (질문 유형, 조직)의 KG 조회는 한 번만
+    수행해 공유합니다. 항목별 결과는 완료 순서대로 events_url(SSE)의 item 이벤트와
+    status_url의 progress로 전달됩니다.
+    """
+    items = request.items
+    if not items:
+        raise HTTPException(status_code=400, detail="분석할 항목이 없습니다")
+    if len(items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.batch_max_items}건까지 분석할 수 있습니다",
+        )
+    if any((item.decision_id is None) == (item.question is None) for item in items):
+        raise HTTPException(
+            status_code=400, detail="각 항목은 decision_id 또는 question 중 하나만 지정해야 합니다"
+        )
+    existing_ids = [item.decision_id for item in items if item.decision_id is not None]
+    if len(set(existing_ids)) != len(existing_ids):
+        raise HTTPException(status_code=400, detail="중복된 decision_id가 있습니다")
+
+    # 존재 여부를 먼저 모두 확인한 뒤 새 의사결정 생성
+    existing = {decision_id: await _get_or_404(repo, decision_id) for decision_id in existing_ids}
+    for record in existing.values():
+        _ensure_not_analyzing(record)
+    records = []
+    for item in items:
+        if item.decision_id is not None:
+            records.append(existing[item.decision_id])
+        else:
+            assert item.question is not None
+            records.append(
+                await repo.create(
+                    decision_id=str(uuid.uuid4()),
+                    title=item.title or item.question,
+                    question=item.question,
+                )
+            )
+
+    targets = [
+        {"decision_id": record.id, "question": record.question, "org_unit_id": item.org_unit_id}
+        for item, record in zip(items, records, strict=True)
+    ]
+    # 항목이 많아 작업이 먼저 끝날 수 있으므로 제출 전에 상태 변경 (큐 포화 시 복원)
+    previous = {record.id: record.status for record in records}
+    for record in records:
+        await repo.update(record, status="analyzing")
+    try:
+        job = job_runner.submit(
+            "decision_batch_analysis", partial(_run_batch_analysis_job, targets=targets)
+        )
+    except JobQueueFullError as e:
+        for record in records:
+            await repo.update(record, status=previous[record.id])
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"}) from e
 
-    decision = _decisions[decision_id]
-    decision.status = "analyzing"
-    decision.updated_at = datetime.now(UTC)
-
-    # TODO: 실제 분석 에이전트 호출
-    # Mock 옵션 생성
-    decision.options = [
-        {
-            "id": "opt-1",
-            "type": "internal",
-            "name": "내부 역량 활용",
-            "description": "기존 인력으로 프로젝트 수행",
-            "success_probability": 0.75,
-            "cost": 50000000,
-            "risk": "medium",
-        },
-        {
-            "id": "opt-2",
-            "type": "hybrid",
-            "name": "혼합 수행",
-            "description": "내부 + 외부 협력사 혼합",
-            "success_probability": 0.85,
-            "cost": 80000000,
-            "risk": "low",
-        },
-        {
-            "id": "opt-3",
-            "type": "external",
-            "name": "외부 위탁",
-            "description": "전문 협력사에 위탁",
-            "success_probability": 0.90,
-            "cost": 120000000,
-            "risk": "low",
+    return {
+        "status": "queued",
+        "decision_ids": [record.id for record in records],
+        "job_id": job.job_id,
+        "status_url": f"/api/v1/jobs/{job.job_id}",
+        "events_url": f"/api/v1/jobs/{job.job_id}/events",
+    }
+
+
+@router.post("/{decision_id}/analyze", status_code=202)
+async def analyze_decision(
+    decision_id: str,
+    repo: Repository,
+    request: DecisionAnalyzeRequest | None = None,
+):
+    """
+    의사결정 분석 작업 제출
+
+    분석은 백그라운드 작업으로 실행되며, 진행 상황은 반환된 status_url(폴링) 또는
+    events_url(SSE)로 확인합니다. 이미 분석 중인 의사결정이면 409를 반환합니다.
+    """
+    record = await _get_or_404(repo, decision_id)
+    _ensure_not_analyzing(record)
+
+    # 작업이 먼저 끝나 "analyzed"를 덮어쓰지 않도록 제출 전에 상태 변경 (큐 포화 시 복원)
+    previous = record.status
+    await repo.update(record, status="analyzing")
+    try:
+        job = job_runner.submit(
+            "decision_analysis",
+            partial(_run_analysis_job, decision_id=decision_id, question=record.question),
+            subject_id=decision_id,
+        )
+    except JobQueueFullError as e:
+        await repo.update(record, status=previous)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"}) from e
+
+    return {
+        "status": "queued",
+        "decision_id": decision_id,
+        "job_id": job.job_id,
+        "status_url": f"/api/v1/jobs/{job.job_id}",
+        "events_url": f"/api/v1/jobs/{job.job_id}/events",
+    }
+
+
+def _ensure_not_analyzing(record: DecisionRecord) -> None:
+    """분석 중인 의사결정의 중복 분석 방지 (작업과 승인 요청이 이중으로 생기지 않도록)"""
+    if record.status == "analyzing" or job_runner.active_for(record.id) is not None:
+        raise HTTPException(status_code=409, detail=f"이미 분석 중인 의사결정입니다: {record.id}")
+
+
+async def _set_decision_fields(decision_id: str, **fields: Any) -> None:
+    """작업 컨텍스트에서 의사결정 갱신 (요청 세션과 별도)"""
+    async with get_sessionmaker()() as session:
+        repo = DecisionRepository(session)
+        record = await repo.get(decision_id)
+        if record is None:
+            raise RuntimeError(f"의사결정이 삭제되었습니다: {decision_id}")
+        await repo.update(record, **fields)
+
+
+def _find_pending_approval(decision_id: str) -> ApprovalRequest | None:
+    """의사결정에 연결된 대기 중 승인 요청"""
+    request_id = get_state_store().get(_APPROVAL_INDEX_NAMESPACE, decision_id)
+    if request_id is None:
+        return None
+    return get_hitl_system().pending_requests.get(request_id)
+
+
+def _cancel_pending_approval(decision_id: str) -> None:
+    """의사결정에 연결된 대기 중 승인 요청 제거"""
+    request = _find_pending_approval(decision_id)
+    if request is not None:
+        get_hitl_system().pending_requests.pop(request.request_id, None)
+    get_state_store().delete(_APPROVAL_INDEX_NAMESPACE, decision_id)
+
+
+def _request_approval(
+    decision_id: str, execution_id: str, context: WorkflowContext
+) -> ApprovalRequest:
+    """HITL 단계에서 멈춘 분석 결과로 승인 요청 생성 (재분석 시 이전 요청 취소)"""
+    _cancel_pending_approval(decision_id)
+    try:
+        decision_type = DecisionType((context.decomposed_query or {}).get("query_type"))
+    except ValueError:
+        decision_type = DecisionType.OTHER
+    request = get_hitl_system().create_approval_request(
+        execution_id=execution_id,
+        decision_type=decision_type,
+        workflow_context={k: v for k, v in asdict(context).items() if v is not None},
+        requester_id="api",
+        metadata={"decision_id": decision_id},
+    )
+    get_state_store().put(_APPROVAL_INDEX_NAMESPACE, decision_id, request.request_id)
+    return request
+
+
+def _resolve_approval(
+    decision_id: str, question: str, status: ApprovalStatus, option_id: str | None, rationale: str
+) -> str | None:
+    """
+    대기 중 승인 요청에 응답하고 의사결정 로그 기록
+
+    Returns:
+        str | None: 의사결정 로그 ID (연결된 승인 요청이 없으면 None)
+
+    Raises:
+        ValueError: 다른 워커가 이미 처리한 경우
+    """
+    request = _find_pending_approval(decision_id)
+    if request is None:
+        return None
+
+    hitl = get_hitl_system()
+    response = hitl.submit_response(
+        request_id=request.request_id,
+        status=status,
+        approver_id="api",
+        approver_name="api",
+        approval_level=request.required_level,
+        selected_option_id=option_id,
+        rationale=rationale,
+    )
+    get_state_store().delete(_APPROVAL_INDEX_NAMESPACE, decision_id)
+    log = hitl.create_decision_log(
+        execution_id=request.execution_id,
+        decision_type=request.decision_type,
+        workflow_context={
+            "user_query": question,
+            "options": {
+                "options": request.options,
+                "recommendation": request.recommendation.get("option_id"),
+                "recommendation_reason": request.recommendation.get("reason", ""),
+            },
+            "impact_analysis": request.impact_analysis,
+            "validation_result": request.validation_result,
         },
-    ]
-    decision.status = "analyzed"
-    decision.updated_at = datetime.now(UTC)
+        approval_responses=[response],
+    )
+    log.metadata["decision_id"] = decision_id
+    hitl.decision_logs[log.log_id] = log
+    return log.log_id
+
+
+async def _analyze_decision(
+    ctx: JobContext,
+    decision_id: str,
+    question: str,
+    org_unit_id: str | None = None,
+    on_step: Callable[[WorkflowStep, StepResult], None] | None = None,
+    kg_cache: KGLookupCache | None = None,
+) -> dict[str, Any]:
+    """분석 워크플로 실행 후 결과 저장 (HITL 단계에서 멈추면 승인 요청 생성)"""
+    try:
+        execution, context = await ctx.run_sync(
+            run_analysis,
+            question,
+            org_unit_id=org_unit_id,
+            on_step=on_step,
+            state_store=get_state_store(),
+            kg_cache=kg_cache,
+        )
+        if execution.status == WorkflowStatus.FAILED:
+            raise RuntimeError(execution.error or "분석 워크플로 실패")
+        options = summarize_options(context)
+        approval = None
+        if execution.status == WorkflowStatus.PAUSED:
+            approval = await ctx.run_sync(
+                _request_approval, decision_id, execution.execution_id, context
+            )
+        await _set_decision_fields(decision_id, options=options, status="analyzed")
+    except Exception:
+        await _set_decision_fields(decision_id, status="failed")
+        raise
+
+    return {
+        "decision_id": decision_id,
+        "execution_id": execution.execution_id,
+        "approval_request_id": approval.request_id if approval else None,
+        "query_type": (context.decomposed_query or {}).get("query_type"),
+        "options_count": len(options),
+        "recommendation": (context.options or {}).get("recommendation"),
+    }
+
 
+async def _run_analysis_job(ctx: JobContext, decision_id: str, question: str) -> dict[str, Any]:
+    """단건 분석 작업 (단계별 진행 이벤트 발행)"""
+
+    def on_step(step: WorkflowStep, result: StepResult) -> None:
+        ctx.report(
+            "step",
+            {
+                "step_id": step.step_id,
+                "step_type": step.step_type.value,
+                "name": step.name,
+                "status": result.status.value,
+                "duration_ms": round(result.duration_ms, 2),
+                "output": result.output,
+                "error": result.error,
+            },
+        )
+
+    return await _analyze_decision(ctx, decision_id, question, on_step=on_step)
+
+
+async def _run_batch_analysis_job(ctx: JobContext, targets: list[dict[str, Any]]) -> dict[str, Any]:
+    """일괄 분석 작업 (항목별 완료 이벤트 발행, 항목 실패는 다른 항목에 영향 없음)"""
+    kg_cache = KGLookupCache()
+    semaphore = asyncio.Semaphore(settings.batch_max_parallel)
+
+    async def analyze(index: int, target: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                summary = await _analyze_decision(ctx, **target, kg_cache=kg_cache)
+                item = {"index": index, "status": "completed", **summary}
+            except Exception as e:
+                logger.exception(f"일괄 분석 항목 실패: {target['decision_id']}")
+                item = {
+                    "index": index,
+                    "status": "failed",
+                    "decision_id": target["decision_id"],
+                    "error": str(e),
+                }
+        ctx.report("item", item)
+        return item
+
+    items = await asyncio.gather(*(analyze(i, t) for i, t in enumerate(targets)))
     return {
-        "status": "analyzed",
-        "message": "분석이 완료되었습니다",
-        "options_count": len(decision.options),
+        "total": len(items),
+        "completed": sum(1 for item in items if item["status"] == "completed"),
+        "failed": sum(1 for item in items if item["status"] == "failed"),
+        "items": items,
+        "kg_lookups": kg_cache.stats(),
     }
 
 
 @router.post("/{decision_id}/approve")
-async def approve_decision(decision_id: str, request: DecisionApproveRequest):
+async def approve_decision(decision_id: str, request: DecisionApproveRequest, repo: Repository):
     """의사결정 승인"""
-    if decision_id not in _decisions:
-        raise HTTPException(status_code=404, detail="의사결정을 찾을 수 없습니다")
-
-    decision = _decisions[decision_id]
+    record = await _get_or_404(repo, decision_id)
 
-    if decision.status != "analyzed":
+    if record.status != "analyzed":
         raise HTTPException(status_code=400, detail="분석이 완료된 의사결정만 승인할 수 있습니다")
 
-    decision.status = "approved"
-    decision.selected_option = request.option_id
-    decision.updated_at = datetime.now(UTC)
+    try:
+        log_id = await run_in_threadpool(
+            _resolve_approval,
+            decision_id,
+            record.question,
+            ApprovalStatus.APPROVED,
+            request.option_id,
+            request.comment or "",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+    await repo.update(record, status="approved", selected_option=request.option_id)
 
     return {
         "status": "approved",
         "selected_option": request.option_id,
         "comment": request.comment,
+        "decision_log_id": log_id,
     }
 
 
 @router.post("/{decision_id}/reject")
-async def reject_decision(decision_id: str, reason: str | None = None):
+async def reject_decision(decision_id: str, repo: Repository, reason: str | None = None):
     """의사결정 반려"""
-    if decision_id not in _decisions:
-        raise HTTPException(status_code=404, detail="의사결정을 찾을 수 없습니다")
-
-    decision = _decisions[decision_id]
-    decision.status = "rejected"
-    decision.updated_at = datetime.now(UTC)
-
-    return {"status": "rejected", "reason": reason}
+    record = await _get_or_404(repo, decision_id)
+
+    try:
+        log_id = await run_in_threadpool(
+            _resolve_approval,
+            decision_id,
+            record.question,
+            ApprovalStatus.REJECTED,
+            None,
+            reason or "",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+    await repo.update(record, status="rejected")
+
+    return {"status": "rejected", "reason": reason, "decision_log_id": log_id}
@@ -3,13 +3,20 @@
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from backend.api.dependencies import Neo4jService
+from backend.api.etag import apply_etag, graph_etag, not_modified
+from backend.api.limits import limit_concurrency
+from backend.api.responses import ORJSONResponse
 
 router = APIRouter()
 
+# Neo4j 커넥션 풀 보호: 임의 쿼리와 일반 조회를 별도 그룹으로 제한
+graph_query_limit = [Depends(limit_concurrency("graph_query"))]
+graph_read_limit = [Depends(limit_concurrency("graph_read"))]
+
 
 class GraphQuery(BaseModel):
     """그래프 쿼리"""
@@ -41,7 +48,7 @@ def validate_query(cypher: str) -> None:
             )
 
 
-@router.post("/query", response_model=GraphQueryResult)
+@router.post("/query", response_model=GraphQueryResult, dependencies=graph_query_limit)
 async def execute_query(request: GraphQuery):
     """
     Cypher 쿼리 실행
@@ -68,9 +75,13 @@ async def execute_query(request: GraphQuery):
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@router.get("/nodes")
-async def list_node_types():
+@router.get("/nodes", dependencies=graph_read_limit)
+async def list_node_types(request: Request, response: Response):
     """노드 타입 목록"""
+    etag = await graph_etag("node_types")
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+
     try:
         stats = await Neo4jService.get_stats()
         labels = stats.get("labels", {})
@@ -101,6 +112,7 @@ async def list_node_types():
             for label, count in labels.items()
         ]
 
+        apply_etag(response, etag)
         return {"node_types": node_types}
     except Exception:
         # 연결 실패 시 기본값 반환
@@ -118,13 +130,18 @@ async def list_node_types():
         }
 
 
-@router.get("/nodes/{label}")
+@router.get("/nodes/{label}", dependencies=graph_read_limit)
 async def get_nodes_by_label(
+    request: Request,
     label: str,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
 ):
     """특정 라벨의 노드 목록 조회"""
+    etag = await graph_etag("nodes", label, limit, offset)
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+
     try:
         # 먼저 전체 개수 조회
         count_query = f"MATCH (n:`{label}`) RETURN count(n) as total"
@@ -144,22 +161,32 @@ async def get_nodes_by_label(
 
         nodes = [record["properties"] for record in nodes_result]
 
-        return {
-            "label": label,
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-            "nodes": nodes,
-        }
+        # 노드 속성(Neo4j 날짜 등 포함)을 jsonable_encoder 없이 바로 직렬화
+        return apply_etag(
+            ORJSONResponse(
+                {
+                    "label": label,
+                    "total": total,
+                    "limit": limit,
+                    "offset": offset,
+                    "nodes": nodes,
+                }
+            ),
+            etag,
+        )
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@router.get("/schema")
-async def get_schema():
+@router.get("/schema", dependencies=graph_read_limit)
+async def get_schema(request: Request, response: Response):
     """그래프 스키마 조회"""
+    etag = await graph_etag("schema")
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+
     try:
         # 노드 라벨 및 속성 조회
         labels_query = """
@@ -211,6 +238,7 @@ async def get_schema():
             except Exception:
                 relationships.append({"type": rel_type, "from": "Unknown", "to": "Unknown"})
 
+        apply_etag(response, etag)
         return {"nodes": nodes, "relationships": relationships}
     except Exception:
         # 연결 실패 시 기본 스키마 반환
@@ -242,11 +270,20 @@ async def get_schema():
         }
 
 
-@router.get("/stats")
-async def get_stats():
-    """그래프 통계"""
+@router.get("/stats", dependencies=graph_read_limit)
+async def get_stats(request: Request, response: Response):
+    """
+    그래프 통계
+
+    그래프 버전 기반 ETag를 반환하며, If-None-Match가 일치하면 304를 반환합니다.
+    """
+    etag = await graph_etag("stats")
+    if (unchanged := not_modified(request, etag)) is not None:
+        return unchanged
+
     try:
         stats = await Neo4jService.get_stats()
+        apply_etag(response, etag)
         return stats
     except Exception:
         return {
@@ -257,7 +294,13 @@ async def get_stats():
         }
 
 
-@router.get("/search")
+@router.get("/coalescing")
+async def get_coalescing_stats():
+    """동일 조회 병합(single-flight) 통계"""
+    return Neo4jService.get_coalescing_stats()
+
+
+@router.get("/search", dependencies=graph_read_limit)
 async def search_graph(
     q: str = Query(..., description="검색어"),
     labels: list[str] | None = Query(None, description="검색할 노드 라벨"),
@@ -266,11 +309,13 @@ async def search_graph(
     """그래프 검색"""
     try:
         results = await Neo4jService.search(q, labels, limit)
-        return {
-            "query": q,
-            "labels": labels,
-            "total": len(results),
-            "results": results,
-        }
+        return ORJSONResponse(
+            {
+                "query": q,
+                "labels": labels,
+                "total": len(results),
+                "results": results,
+            }
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
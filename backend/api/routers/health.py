@@ -1,10 +1,15 @@
 """헬스 체크 라우터"""
 
+import os
+import socket
 from datetime import UTC, datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from fastapi.responses import PlainTextResponse
 
 from backend.api.config import settings
+from backend.api.metrics import render_metrics
+from backend.api.readiness import readiness_probe
 
 router = APIRouter(tags=["Health"])
 
@@ -17,20 +22,30 @@ async def health_check():
         "service": "hr-dss-api",
         "version": "0.2.0",
         "environment": settings.environment,
+        "instance": f"{socket.gethostname()}:{os.getpid()}",
         "timestamp": datetime.now(UTC).isoformat(),
     }
 
 
 @router.get("/ready")
-async def readiness_check():
-    """준비 상태 체크"""
-    # TODO: DB 연결 상태 확인
-    checks = {
-        "database": "ok",  # TODO: 실제 확인
-        "neo4j": "ok",  # TODO: 실제 확인
-    }
-    all_ok = all(v == "ok" for v in checks.values())
-    return {
-        "status": "ready" if all_ok else "not_ready",
-        "checks": checks,
-    }
+async def readiness_check(response: Response):
+    """
+    준비 상태 체크
+
+    관계형 DB(SELECT 1)와 Neo4j(RETURN 1)를 커넥션 풀로 점검합니다.
+    준비되지 않았으면 503을 반환하며, 결과는 짧게 캐시됩니다(X-Cache 헤더).
+    """
+    result, cached = await readiness_probe.check()
+    response.headers["X-Cache"] = "HIT" if cached else "MISS"
+    if result["status"] != "ready":
+        response.status_code = 503
+    return result
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """운영 메트릭 (Prometheus 텍스트 형식)"""
+    return PlainTextResponse(
+        await render_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
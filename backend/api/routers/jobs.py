@@ -0,0 +1,46 @@
+"""백그라운드 작업 API 라우터"""
+
+from fastapi import APIRouter, Header, HTTPException
+
+from backend.api.jobs import job_runner
+from backend.api.responses import ORJSONResponse, dumps
+
+router = APIRouter()
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """작업 상태 조회"""
+    snapshot = await job_runner.snapshot(job_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    # 분석 결과(대안별 시계열 등)가 커질 수 있어 바로 직렬화
+    return ORJSONResponse(snapshot)
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    last_event_id: int = Header(-1, alias="Last-Event-ID"),
+):
+    """
+    작업 진행 이벤트 스트림 (Server-Sent Events)
+
+    queued → started → step(단계별 부분 결과) → completed | failed 순으로 전송하며
+    작업이 끝나면 스트림을 종료합니다. Last-Event-ID 헤더로 재연결 시 이어받기 가능.
+    다른 워커에서 실행 중인 작업은 공유 저장소를 폴링해 전달합니다.
+    """
+    from sse_starlette.sse import EventSourceResponse
+
+    if await job_runner.snapshot(job_id) is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+    async def event_generator():
+        async for event in job_runner.stream(job_id, last_event_id):
+            yield {
+                "id": str(event["id"]),
+                "event": event["event"],
+                "data": dumps({**event["data"], "timestamp": event["timestamp"]}).decode(),
+            }
+
+    return EventSourceResponse(event_generator(), ping=15)
@@ -0,0 +1,40 @@
+"""프로파일 조회 API 라우터 (관리자 전용)"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+
+from backend.api.dependencies import get_state_store, require_admin
+from backend.api.profiling import PROFILE_NAMESPACE
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+def _list_profiles() -> list[dict]:
+    profiles = [
+        {k: v for k, v in profile.items() if k != "folded"}
+        for _, profile in get_state_store().items(PROFILE_NAMESPACE)
+    ]
+    return sorted(profiles, key=lambda p: p["created_at"], reverse=True)
+
+
+@router.get("")
+async def list_profiles():
+    """저장된 프로파일 목록 (최신순)"""
+    return {"items": await run_in_threadpool(_list_profiles)}
+
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str):
+    """
+    프로파일 조회 (collapsed stack 형식)
+
+    flamegraph.pl, speedscope 등에 그대로 입력할 수 있습니다.
+    """
+    profile = await run_in_threadpool(get_state_store().get, PROFILE_NAMESPACE, profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다")
+    return PlainTextResponse(
+        profile["folded"],
+        headers={"X-Profile-Samples": str(profile["samples"])},
+    )
@@ -0,0 +1,148 @@
+"""
+요청 추적
+
+요청마다 ID를 부여하고 단계별(인증, Neo4j, 에이전트, 직렬화) 소요 시간을 기록
+- 구조화 로그(structlog): request_completed 이벤트에 단계 목록 포함
+- 응답 헤더: X-Request-ID, Server-Timing (단계 이름별 합계)
+- 직렬화 단계는 backend.api.responses.ORJSONResponse에서 기록
+- 추적 컨텍스트는 contextvar로 전달되어 스레드 풀(run_in_threadpool)에서도 기록됨
+"""
+
+import re
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = structlog.get_logger("hr_dss.trace")
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._\-]{1,128}$")
+
+
+@dataclass
+class Span:
+    """단계 기록"""
+
+    name: str
+    duration_ms: float
+
+
+@dataclass
+class Trace:
+    """요청 단위 추적 정보"""
+
+    request_id: str
+    started_at: float = field(default_factory=time.perf_counter)
+    spans: list[Span] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, name: str, duration_ms: float) -> None:
+        """단계 소요 시간 기록 (스레드 안전)"""
+        with self._lock:
+            self.spans.append(Span(name, duration_ms))
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def totals(self) -> dict[str, tuple[float, int]]:
+        """단계 이름별 (합계 ms, 횟수)"""
+        totals: dict[str, tuple[float, int]] = {}
+        with self._lock:
+            for span in self.spans:
+                total, count = totals.get(span.name, (0.0, 0))
+                totals[span.name] = (total + span.duration_ms, count + 1)
+        return totals
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값"""
+        entries = [
+            f'{name};dur={total:.2f};desc="x{count}"' if count > 1 else f"{name};dur={total:.2f}"
+            for name, (total, count) in self.totals().items()
+        ]
+        entries.append(f"total;dur={self.elapsed_ms:.2f}")
+        return ", ".join(entries)
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("hr_dss_trace", default=None)
+
+
+def current_trace() -> Trace | None:
+    """현재 요청의 추적 정보 (요청 밖이면 None)"""
+    return _current_trace.get()
+
+
+def record_stage(name: str, duration_ms: float) -> None:
+    """이미 측정된 단계 시간 기록"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.record(name, duration_ms)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    단계 시간 측정
+
+    Example:
+        with stage("neo4j"):
+            records = await session.run(query)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.record(name, (time.perf_counter() - started) * 1000)
+
+
+class TracingMiddleware:
+    """요청 ID 부여 및 단계별 시간 기록 미들웨어 (ASGI)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = dict(scope["headers"]).get(REQUEST_ID_HEADER.lower().encode(), b"").decode()
+        request_id = incoming if _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+        trace = Trace(request_id=request_id)
+        token = _current_trace.set(trace)
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER.lower().encode(), request_id.encode()))
+                headers.append((b"server-timing", trace.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_trace.reset(token)
+            logger.info(
+                "request_completed",
+                request_id=request_id,
+                method=scope["method"],
+                path=scope["path"],
+                status=status_code,
+                duration_ms=round(trace.elapsed_ms, 2),
+                stages=[{"name": s.name, "ms": round(s.duration_ms, 2)} for s in trace.spans],
+            )
@@ -0,0 +1,42 @@
+"""
+기동 후 워밍업
+
+무거운 모듈(에이전트, neo4j 드라이버, JWT/cryptography, SSE)은 첫 사용 시 로드하도록
+지연시켰으므로, 서버가 포트를 연 뒤 백그라운드에서 미리 로드해 첫 요청 지연을 줄임
+- /health는 워밍업 완료를 기다리지 않음 (실패해도 첫 요청에서 다시 로드)
+- settings.startup_warmup=false로 비활성화
+"""
+
+import logging
+from collections.abc import Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.api.dependencies import Neo4jService
+from backend.api.pipeline import get_agents
+
+logger = logging.getLogger(__name__)
+
+
+def _import_lazy_modules() -> None:
+    import jose.jwt  # noqa: F401
+    import sse_starlette.sse  # noqa: F401
+
+
+_SYNC_STEPS: list[tuple[str, Callable[[], object]]] = [
+    ("agents", get_agents),
+    ("modules", _import_lazy_modules),
+]
+
+
+async def warm_up() -> None:
+    """지연 로드 대상 모듈/에이전트/그래프 버전 미리 준비 (단계별 실패는 무시)"""
+    for name, step in _SYNC_STEPS:
+        try:
+            await run_in_threadpool(step)
+        except Exception:
+            logger.exception(f"워밍업 실패: {name}")
+    try:
+        await Neo4jService.get_graph_version()
+    except Exception:
+        logger.exception("워밍업 실패: graph_version")
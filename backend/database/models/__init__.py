@@ -1,5 +1,6 @@
 """Database Models"""
 
+from backend.database.models.decision import DecisionRecord
 from backend.database.models.entity import Entity, EntityType, SyncStatus
 from backend.database.models.triple import (
     AssertionType,
@@ -9,6 +10,7 @@ from backend.database.models.triple import (
 )
 
 __all__ = [
+    "DecisionRecord",
     "Entity",
     "EntityType",
     "SyncStatus",
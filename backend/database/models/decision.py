@@ -0,0 +1,67 @@
+"""
+Decision 모델
+
+의사결정 API(/api/v1/decisions)의 영속 저장소
+상태 필터 + 최신순 정렬 목록 조회를 위한 인덱스 포함
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import JSON, DateTime, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.database.base import Base
+
+
+class DecisionRecord(Base):
+    """
+    Decision 테이블
+
+    목록 조회 패턴:
+    - 전체 최신순: ORDER BY updated_at DESC → idx_decision_updated_at
+    - 상태별 최신순: WHERE status = ? ORDER BY updated_at DESC → idx_decision_status_updated_at
+    """
+
+    __tablename__ = "decisions"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    question: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+
+    # 분석 결과 대안 목록
+    options: Mapped[list | None] = mapped_column(JSON)
+    selected_option: Mapped[str | None] = mapped_column(String(100))
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_decision_status", "status"),
+        Index("idx_decision_updated_at", "updated_at"),
+        Index("idx_decision_status_updated_at", "status", "updated_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<DecisionRecord(id='{self.id}', status='{self.status}')>"
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "question": self.question,
+            "status": self.status,
+            "options": self.options,
+            "selected_option": self.selected_option,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
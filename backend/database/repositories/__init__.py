@@ -0,0 +1,5 @@
+"""Database Repositories"""
+
+from backend.database.repositories.decision import DecisionRepository
+
+__all__ = ["DecisionRepository"]
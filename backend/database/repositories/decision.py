@@ -0,0 +1,108 @@
+"""
+Decision Repository
+
+decisions 테이블 CRUD 및 페이지네이션 조회
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database.models.decision import DecisionRecord
+
+
+class DecisionRepository:
+    """의사결정 저장소"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list(
+        self,
+        status: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[int, list[DecisionRecord]]:
+        """
+        의사결정 목록 조회 (최신순)
+
+        Args:
+            status: 상태 필터
+            limit: 페이지 크기
+            offset: 시작 위치
+
+        Returns:
+            tuple[int, list[DecisionRecord]]: (전체 건수, 현재 페이지 항목)
+        """
+        count_stmt = select(func.count()).select_from(DecisionRecord)
+        items_stmt = select(DecisionRecord)
+        if status:
+            count_stmt = count_stmt.where(DecisionRecord.status == status)
+            items_stmt = items_stmt.where(DecisionRecord.status == status)
+
+        items_stmt = (
+            items_stmt.order_by(DecisionRecord.updated_at.desc(), DecisionRecord.id)
+            .limit(limit)
+            .offset(offset)
+        )
+
+        total = (await self.session.execute(count_stmt)).scalar_one()
+        items = list((await self.session.execute(items_stmt)).scalars().all())
+        return total, items
+
+    async def count(self, status: str | None = None) -> int:
+        """건수 조회"""
+        stmt = select(func.count()).select_from(DecisionRecord)
+        if status:
+            stmt = stmt.where(DecisionRecord.status == status)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def revision(self) -> str:
+        """저장소 리비전 (건수 + 최종 갱신 시각) - 생성/수정/삭제 시 변경됨"""
+        count, latest = (
+            await self.session.execute(
+                select(func.count(), func.max(DecisionRecord.updated_at)).select_from(
+                    DecisionRecord
+                )
+            )
+        ).one()
+        return f"{count}:{latest.isoformat() if latest else ''}"
+
+    async def get(self, decision_id: str) -> DecisionRecord | None:
+        """단건 조회"""
+        return await self.session.get(DecisionRecord, decision_id)
+
+    async def create(self, decision_id: str, title: str, question: str) -> DecisionRecord:
+        """의사결정 생성"""
+        now = datetime.now(UTC)
+        record = DecisionRecord(
+            id=decision_id,
+            title=title,
+            question=question,
+            status="pending",
+            options=None,
+            selected_option=None,
+            created_at=now,
+            updated_at=now,
+        )
+        self.session.add(record)
+        await self.session.commit()
+        return record
+
+    async def update(self, record: DecisionRecord, **fields: Any) -> DecisionRecord:
+        """필드 갱신 (updated_at 자동 갱신)"""
+        for key, value in fields.items():
+            setattr(record, key, value)
+        record.updated_at = datetime.now(UTC)
+        await self.session.commit()
+        return record
+
+    async def delete(self, decision_id: str) -> bool:
+        """의사결정 삭제"""
+        result = await self.session.execute(
+            delete(DecisionRecord).where(DecisionRecord.id == decision_id)
+        )
+        await self.session.commit()
+        return result.rowcount > 0
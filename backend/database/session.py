@@ -0,0 +1,109 @@
+"""
+비동기 DB 세션 관리
+
+settings.database_url 기반 AsyncEngine/세션 팩토리 제공
+- PostgreSQL: postgresql://... → postgresql+psycopg:// (psycopg3 async)
+- 미설정 시 로컬 SQLite (aiosqlite) 사용
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from backend.api.config import settings
+from backend.database.base import Base
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./hr_dss.db"
+# 여러 워커가 동시에 시작할 때 테이블 생성 경합 재시도 횟수
+SCHEMA_CREATE_ATTEMPTS = 10
+
+_engine: AsyncEngine | None = None
+_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+_schema_ready = False
+_schema_lock: asyncio.Lock | None = None
+
+
+def normalize_database_url(url: str) -> str:
+    """DB URL을 async 드라이버 URL로 정규화"""
+    if not url:
+        return DEFAULT_DATABASE_URL
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://") :]
+    if url.startswith("postgresql://"):
+        return "postgresql+psycopg://" + url[len("postgresql://") :]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://") :]
+    return url
+
+
+def get_engine() -> AsyncEngine:
+    """AsyncEngine 반환 (싱글톤)"""
+    global _engine, _sessionmaker
+    if _engine is None:
+        url = normalize_database_url(settings.database_url)
+        if url.startswith("sqlite"):
+            # SQLite는 커넥션을 이벤트 루프 간에 공유하지 않음
+            _engine = create_async_engine(url, poolclass=NullPool)
+        else:
+            _engine = create_async_engine(url, pool_pre_ping=True, pool_size=10, max_overflow=20)
+        _sessionmaker = async_sessionmaker(_engine, expire_on_commit=False)
+    return _engine
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """세션 팩토리 반환"""
+    get_engine()
+    assert _sessionmaker is not None
+    return _sessionmaker
+
+
+async def init_db() -> None:
+    """테이블 생성 (프로세스당 1회)"""
+    global _schema_ready, _schema_lock
+    if _schema_ready:
+        return
+    if _schema_lock is None:
+        _schema_lock = asyncio.Lock()
+    async with _schema_lock:
+        if _schema_ready:
+            return
+        # 모델 등록
+        import backend.database.models  # noqa: F401
+
+        for attempt in range(SCHEMA_CREATE_ATTEMPTS):
+            try:
+                async with get_engine().begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all)
+                break
+            except (OperationalError, ProgrammingError):
+                # 다른 워커 프로세스가 동시에 테이블을 만드는 중: 잠시 후 다시 확인
+                if attempt == SCHEMA_CREATE_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(0.05 * (attempt + 1))
+        _schema_ready = True
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """요청 단위 세션 (FastAPI 의존성용)"""
+    await init_db()
+    async with get_sessionmaker()() as session:
+        yield session
+
+
+async def dispose_engine() -> None:
+    """엔진 종료 (커넥션 풀 정리)"""
+    global _engine, _sessionmaker, _schema_ready, _schema_lock
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _sessionmaker = None
+    _schema_ready = False
+    _schema_lock = None
@@ -0,0 +1,141 @@
+"""
+에이전트 대규모 입력 처리 시간 벤치마크
+
+단위 테스트는 동작만 검증하고, 규모별 처리 시간은 이 스크립트에서 측정합니다.
+- reallocation: 직원 5천 명 × 26주 재배치 배정
+- option_ranking: 대안 5천 개 파레토 순위화
+- monte_carlo: 대안 3개 × 10만 샘플 Monte Carlo
+- portfolio: 기회 500개 × 52주 Go/No-go 효율적 경계
+--check를 주면 중앙값이 예산을 넘는 시나리오가 있을 때 실패(exit 1)합니다.
+
+사용법:
+    python scripts/bench_agents.py [--repeat 5] [--only monte_carlo] [--check]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.agent_runtime.agents.impact_simulator import ImpactSimulatorAgent
+from backend.agent_runtime.agents.option_ranking import CRITERIA, OptionRanker
+from backend.agent_runtime.agents.portfolio import PortfolioOptimizer
+from backend.agent_runtime.agents.reallocation import (
+    DemandGap,
+    ReallocationOptimizer,
+    StaffMember,
+)
+
+# 시나리오별 예산 (ms). 느린 CI 러너를 고려해 여유를 둠 (HR_DSS_BENCH_SCALE로 일괄 조정)
+SCALE = float(os.environ.get("HR_DSS_BENCH_SCALE", "1.0"))
+BUDGETS_MS = {
+    "reallocation": 1000.0,
+    "option_ranking": 1000.0,
+    "monte_carlo": 1000.0,
+    "portfolio": 3000.0,
+}
+
+
+def reallocation_case() -> Callable[[], object]:
+    rng = np.random.default_rng(0)
+    weeks = [f"W{i:02d}" for i in range(1, 27)]
+    staff = [
+        StaffMember(
+            f"EMP-{i:05d}",
+            org_unit_id=f"ORG-{i % 30:02d}",
+            available_fte=dict(zip(weeks, rng.uniform(0, 0.5, len(weeks)).tolist(), strict=True)),
+            competencies={f"C{c}": int(rng.integers(1, 6)) for c in rng.choice(20, 3)},
+        )
+        for i in range(5000)
+    ]
+    demand = [DemandGap(w, 5.0, f"C{c}") for w in weeks for c in range(5)]
+    demand += [DemandGap(w, 20.0) for w in weeks]
+    optimizer = ReallocationOptimizer()
+    return lambda: optimizer.solve(staff, demand, target_org_unit_id="ORG-01")
+
+
+def option_ranking_case() -> Callable[[], object]:
+    rng = np.random.default_rng(1)
+    options = [
+        {"option_id": f"OPT-{i}", "scores": dict(zip(CRITERIA, row, strict=True))}
+        for i, row in enumerate(rng.uniform(0, 100, size=(5000, 5)).tolist())
+    ]
+    ranker = OptionRanker({"impact": 1, "cost": 1})
+    return lambda: ranker.rank(options)
+
+
+def monte_carlo_case() -> Callable[[], object]:
+    agent = ImpactSimulatorAgent()
+    options = [
+        {"option_id": f"OPT-{t}", "option_type": t, "name": t}
+        for t in ("CONSERVATIVE", "BALANCED", "AGGRESSIVE")
+    ]
+    baseline = {"deal_value": 800000000, "utilization": 0.8, "margin": 0.2}
+    return lambda: agent.simulate("GO_NOGO", options, baseline, samples=100_000)
+
+
+def portfolio_case() -> Callable[[], object]:
+    rng = np.random.default_rng(0)
+    opportunities = [
+        {
+            "opportunity_id": f"OPP-{i:03d}",
+            "deal_value": float(rng.uniform(1e8, 1e10)),
+            "required_fte": float(rng.uniform(0.5, 6)),
+            "start_week": int(rng.integers(0, 40)),
+            "duration_weeks": int(rng.integers(4, 20)),
+        }
+        for i in range(500)
+    ]
+    optimizer = PortfolioOptimizer()
+    return lambda: optimizer.evaluate(opportunities, capacity_fte=120, committed_fte=80, weeks=52)
+
+
+CASES = {
+    "reallocation": reallocation_case,
+    "option_ranking": option_ranking_case,
+    "monte_carlo": monte_carlo_case,
+    "portfolio": portfolio_case,
+}
+
+
+def _median_ms(func: Callable[[], object], repeat: int) -> float:
+    func()  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", choices=list(CASES), action="append")
+    parser.add_argument("--check", action="store_true", help="예산 초과 시 exit 1")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<18}{'median ms':>12}{'budget ms':>12}")
+    print("-" * 42)
+    failures = []
+    for name in args.only or CASES:
+        median = _median_ms(CASES[name](), args.repeat)
+        budget = BUDGETS_MS[name] * SCALE
+        print(f"{name:<18}{median:>12.1f}{budget:>12.0f}")
+        if median > budget:
+            failures.append(f"{name} {median:.0f} ms > 예산 {budget:.0f} ms")
+    for failure in failures:
+        print(f"\n✗ {failure}")
+    return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
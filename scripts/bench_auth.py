@@ -0,0 +1,67 @@
+"""
+요청당 인증(JWT 검증) 오버헤드 벤치마크
+
+같은 토큰으로 반복 호출하는 대시보드 폴링을 가정하여
+- full: 매번 서명 검증 + 디코딩 (캐시 비활성)
+- cached: 검증된 토큰 캐시 적중
+경로의 verify_token 호출당 시간을 비교합니다.
+
+사용법:
+    python scripts/bench_auth.py [--repeat 5000]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.api.dependencies import (
+    TokenPayload,
+    create_access_token,
+    token_cache,
+    verify_token,
+)
+
+
+def _per_call_us(func, repeat: int, rounds: int = 5) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        samples.append((time.perf_counter() - started) / repeat * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5000)
+    args = parser.parse_args()
+
+    token = create_access_token(TokenPayload(sub="dashboard", role="user"))
+
+    def full() -> None:
+        token_cache.invalidate()
+        verify_token(token)
+
+    def cached() -> None:
+        verify_token(token)
+
+    verify_token(token)  # import/워밍업
+    full_us = _per_call_us(full, args.repeat)
+    verify_token(token)
+    cached_us = _per_call_us(cached, args.repeat)
+
+    print(f"{'path':<10}{'µs/call':>12}")
+    print("-" * 22)
+    print(f"{'full':<10}{full_us:>12.2f}")
+    print(f"{'cached':<10}{cached_us:>12.2f}")
+    print(f"\nspeedup: {full_us / cached_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
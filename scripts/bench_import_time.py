@@ -0,0 +1,96 @@
+"""
+API 프로세스 import 시간 벤치마크
+
+새 인터프리터에서 `python -X importtime -c "import backend.api.main"`을 여러 번 실행해
+전체 import 시간(최솟값/중앙값)과 누적 시간이 큰 모듈을 보여줍니다.
+--check를 주면 예산 초과 또는 지연 로드 대상 모듈이 기동 시 로드되면 실패(exit 1)합니다.
+
+사용법:
+    python scripts/bench_import_time.py [--runs 5] [--top 15] [--check]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+MODULE = "backend.api.main"
+# 기동 시 import 예산 (ms). 느린 CI 러너를 고려해 여유를 둠
+BUDGET_MS = float(os.environ.get("HR_DSS_IMPORT_BUDGET_MS", "1500"))
+# 첫 사용 시 로드해야 하는 무거운 모듈 (기동 시 로드되면 회귀)
+DEFERRED_MODULES = [
+    "neo4j",
+    "numpy",
+    "anthropic",
+    "jose",
+    "cryptography",
+    "sse_starlette",
+    "backend.agent_runtime.agents.impact_simulator",
+    "backend.agent_runtime.agents.option_generator",
+    "backend.agent_runtime.agents.query_decomposition",
+    "backend.agent_runtime.agents.success_probability",
+    "backend.agent_runtime.agents.validator",
+    "backend.agent_runtime.ontology.data_loader",
+    "backend.agent_runtime.ontology.kg_query",
+]
+
+
+def measure(module: str = MODULE) -> dict[str, tuple[int, int]]:
+    """
+    새 프로세스에서 모듈 import 시간 측정
+
+    Returns:
+        dict[str, tuple[int, int]]: 모듈명 → (self µs, 누적 µs)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--check", action="store_true", help="예산/지연 로드 위반 시 exit 1")
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    totals = [run[MODULE][1] / 1000 for run in runs]
+    fastest = runs[totals.index(min(totals))]
+
+    print(f"{MODULE}: min {min(totals):.0f} ms, median {statistics.median(totals):.0f} ms")
+    print(f"\n{'module':<60}{'self ms':>10}{'cum ms':>10}")
+    print("-" * 80)
+    top = sorted(fastest.items(), key=lambda item: item[1][1], reverse=True)[: args.top]
+    for name, (self_us, cumulative_us) in top:
+        print(f"{name:<60}{self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}")
+
+    eager = [name for name in DEFERRED_MODULES if name in fastest]
+    failures = []
+    if min(totals) > args.budget_ms:
+        failures.append(f"import 시간 {min(totals):.0f} ms > 예산 {args.budget_ms:.0f} ms")
+    if eager:
+        failures.append(f"기동 시 로드된 지연 로드 대상 모듈: {', '.join(eager)}")
+    for failure in failures:
+        print(f"\n✗ {failure}")
+    return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
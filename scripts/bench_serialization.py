@@ -0,0 +1,144 @@
+"""
+응답 직렬화/압축 벤치마크
+
+대표 응답 페이로드에 대해 기존 경로(jsonable_encoder + json.dumps)와
+orjson 경로의 인코딩 시간, 그리고 원본/gzip/brotli 크기를 비교합니다.
+
+사용법:
+    python scripts/bench_serialization.py [--repeat 50]
+"""
+
+import argparse
+import gzip
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from backend.agent_runtime.agents import ImpactSimulatorAgent
+from backend.api.config import settings
+from backend.api.pipeline import run_query
+from backend.api.responses import BROTLI_AVAILABLE, dumps
+
+if BROTLI_AVAILABLE:
+    import brotli
+
+
+def impact_payload(options: int = 20, weeks: int = 52) -> dict:
+    """영향 시뮬레이션 결과 (대안별 주간 시계열)"""
+    agent = ImpactSimulatorAgent()
+    option_list = [
+        {
+            "option_id": f"OPT-{i:03d}",
+            "option_type": ["CONSERVATIVE", "BALANCED", "AGGRESSIVE"][i % 3],
+            "name": f"대안 {i}",
+            "estimated_cost": 1_000_000 * (i + 1),
+            "risk_level": "MEDIUM",
+            "actions": [{"type": "REALLOCATE", "description": "재배치"}],
+        }
+        for i in range(options)
+    ]
+    baseline = {"current": 0.92, "utilization": 0.92, "headcount": 45}
+    comparison = agent.simulate("CAPACITY", option_list, baseline, horizon_weeks=weeks)
+    return agent.to_dict(comparison)
+
+
+def node_listing_payload(count: int = 1000) -> dict:
+    """노드 목록 (/api/v1/graph/nodes/{label})"""
+    start = date(2024, 1, 1)
+    nodes = [
+        {
+            "employeeId": f"EMP-{i:05d}",
+            "name": f"직원{i}",
+            "grade": f"G{i % 6 + 1}",
+            "jobRole": "Backend Engineer",
+            "hireDate": start + timedelta(days=i),
+            "updatedAt": datetime(2025, 1, 1, 9, 0) + timedelta(minutes=i),
+            "status": "ACTIVE",
+            "skills": ["Python", "Neo4j", "FastAPI"],
+        }
+        for i in range(count)
+    ]
+    return {"label": "Employee", "total": count, "limit": count, "offset": 0, "nodes": nodes}
+
+
+def agent_query_payload() -> dict:
+    """에이전트 쿼리 응답 (/api/v1/agents/query)"""
+    return {
+        "request_id": "bench",
+        "status": "success",
+        "result": run_query("향후 12주 가동률 병목 예측", {"org_unit_id": "ORG-001"}),
+    }
+
+
+def _median_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def bench(name: str, payload: dict, repeat: int) -> dict:
+    baseline = JSONResponse(content=None)
+
+    def encode_stdlib() -> bytes:
+        return baseline.render(jsonable_encoder(payload))
+
+    def encode_orjson() -> bytes:
+        return dumps(payload)
+
+    raw = encode_orjson()
+    row = {
+        "payload": name,
+        "stdlib_ms": _median_ms(encode_stdlib, repeat),
+        "orjson_ms": _median_ms(encode_orjson, repeat),
+        "raw_kb": len(raw) / 1024,
+        "gzip_kb": len(gzip.compress(raw, compresslevel=settings.gzip_level)) / 1024,
+        "br_kb": (
+            len(brotli.compress(raw, quality=settings.brotli_quality)) / 1024
+            if BROTLI_AVAILABLE
+            else float("nan")
+        ),
+    }
+    row["speedup"] = row["stdlib_ms"] / row["orjson_ms"] if row["orjson_ms"] else float("inf")
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    payloads = {
+        "impact 20x52w": impact_payload(),
+        "nodes x1000": node_listing_payload(),
+        "agent query": agent_query_payload(),
+    }
+
+    header = (
+        f"{'payload':<16}{'stdlib ms':>11}{'orjson ms':>11}{'speedup':>9}"
+        f"{'raw KB':>10}{'gzip KB':>10}{'br KB':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, payload in payloads.items():
+        r = bench(name, payload, args.repeat)
+        print(
+            f"{r['payload']:<16}{r['stdlib_ms']:>11.2f}{r['orjson_ms']:>11.2f}{r['speedup']:>8.1f}x"
+            f"{r['raw_kb']:>10.1f}{r['gzip_kb']:>10.1f}{r['br_kb']:>10.1f}"
+        )
+    if not BROTLI_AVAILABLE:
+        print("\nbrotli 미설치: pip install 'hr-dss[compression]'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+성공 확률 모델 추론 벤치마크
+
+- 단건: calculate_probability (휴리스틱 vs 학습 모델, 특성 캐시 미적중/적중)
+- 일괄: score_batch N건 (휴리스틱 vs 학습 모델) 및 예측 1건당 지연
+
+--model이 없으면 합성 컨텍스트에 휴리스틱 확률을 연성 라벨로 붙여 학습한 모델을 씁니다
+(지연 측정용, 정확도와 무관).
+
+사용법:
+    python scripts/bench_success_model.py [--model data/models/success_model.json]
+        [--batch 10000] [--repeat 200]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.agent_runtime.agents.success_model import (
+    FEATURES,
+    FeatureCache,
+    SuccessModel,
+    SuccessPredictor,
+    feature_matrix,
+    fit_logistic,
+)
+from backend.agent_runtime.agents.success_probability import SuccessProbabilityAgent
+
+PROJECT_TYPES = ["AI/ML", "DATA_ENGINEERING", "CLOUD_MIGRATION", "CONSULTING", "DEFAULT"]
+
+
+def sample_contexts(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "project_type": rng.choice(PROJECT_TYPES),
+            "available_fte": round(rng.uniform(0, 8), 1),
+            "required_fte": round(rng.uniform(1, 8), 1),
+            "competency_match_score": round(rng.random(), 2),
+            "historical_success_rate": round(rng.random(), 2),
+            "is_existing_customer": rng.random() < 0.5,
+            "planned_duration_weeks": rng.choice([12, 24, 36]),
+            "buffer_weeks": rng.randint(0, 6),
+            "tech_complexity": rng.choice(["MEDIUM", "HIGH"]),
+            "current_utilization": round(rng.uniform(0.5, 1.05), 2),
+        }
+        for _ in range(count)
+    ]
+
+
+def synthetic_model(heuristic: SuccessProbabilityAgent) -> SuccessModel:
+    """휴리스틱 확률을 연성 라벨로 학습한 지연 측정용 모델"""
+    contexts = sample_contexts(500, seed=2)
+    targets = heuristic.score_batch(contexts).success_probability
+    return SuccessModel(list(FEATURES), *fit_logistic(feature_matrix(contexts), targets))
+
+
+def _median_us(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", type=Path, default=None)
+    parser.add_argument("--batch", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    heuristic = SuccessProbabilityAgent()
+    predictor = (
+        SuccessPredictor.load(args.model)
+        if args.model
+        else SuccessPredictor(synthetic_model(heuristic))
+    )
+    trained = SuccessProbabilityAgent(ml_model=predictor)
+    context = sample_contexts(1)[0]
+
+    def cold() -> None:
+        predictor.cache = FeatureCache()
+        trained.calculate_probability("PROJECT", "PRJ-1", "벤치", context)
+
+    single = [
+        (
+            "heuristic",
+            _median_us(
+                lambda: heuristic.calculate_probability("PROJECT", "PRJ-1", "벤치", context),
+                args.repeat,
+            ),
+        ),
+        ("model (cache miss)", _median_us(cold, args.repeat)),
+        (
+            "model (cache hit)",
+            _median_us(
+                lambda: trained.calculate_probability("PROJECT", "PRJ-1", "벤치", context),
+                args.repeat,
+            ),
+        ),
+        (
+            "predict only (hit)",
+            _median_us(lambda: predictor.predict([context], "PROJECT", ["PRJ-1"]), args.repeat),
+        ),
+    ]
+    print("calculate_probability (1건)")
+    print(f"{'path':<22}{'median us':>12}")
+    print("-" * 34)
+    for name, micros in single:
+        print(f"{name:<22}{micros:>12.1f}")
+
+    contexts = sample_contexts(args.batch, seed=1)
+    ids = [f"PRJ-{i}" for i in range(len(contexts))]
+    repeat = max(3, args.repeat // 40)
+    batch = [
+        ("heuristic", _median_us(lambda: heuristic.score_batch(contexts), repeat)),
+        ("model (no ids)", _median_us(lambda: trained.score_batch(contexts), repeat)),
+        (
+            "model (with ids)",
+            _median_us(lambda: trained.score_batch(contexts, "PROJECT", ids), repeat),
+        ),
+    ]
+    print(f"\nscore_batch ({args.batch}건)")
+    print(f"{'path':<22}{'total ms':>12}{'us/pred':>10}")
+    print("-" * 44)
+    for name, micros in batch:
+        print(f"{name:<22}{micros / 1000:>12.2f}{micros / args.batch:>10.2f}")
+    print(f"\nfeature cache: {predictor.cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+영향도 시뮬레이션 시계열 벤치마크
+
+52주 × 20개 대안 비교를 가정하여
+- legacy: 주차마다 포인트 객체를 만들고 응답 시 dict로 다시 펼치는 방식
+- array: 진행률 곡선을 배열로 계산해 보관하고 응답 시에만 dict로 변환
+의 생성/변환 시간과 보관 메모리, simulate + to_dict 전체 시간을 비교합니다.
+
+사용법:
+    python scripts/bench_time_series.py [--options 20] [--weeks 52] [--repeat 50]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.agent_runtime.agents.impact_simulator import ImpactSimulatorAgent
+
+OPTION_TYPES = ["CONSERVATIVE", "BALANCED", "AGGRESSIVE"]
+
+
+@dataclass
+class LegacyPoint:
+    period: str
+    as_is_value: float
+    to_be_value: float
+
+
+def legacy_series(start: float, end: float, weeks: int, option_type: str) -> list[LegacyPoint]:
+    """이전 구현 (주차별 Python 루프 + 포인트 객체)"""
+    points = []
+    for week in range(1, weeks + 1):
+        if option_type == "CONSERVATIVE":
+            progress = (week / weeks) ** 0.5
+        elif option_type == "AGGRESSIVE":
+            progress = max(0, (week - weeks * 0.5) / (weeks * 0.5)) ** 2
+        else:
+            progress = week / weeks
+        points.append(LegacyPoint(f"W{week:02d}", start, start + (end - start) * progress))
+    return points
+
+
+def legacy_to_list(points: list[LegacyPoint]) -> list[dict]:
+    return [{"period": p.period, "as_is": p.as_is_value, "to_be": p.to_be_value} for p in points]
+
+
+def _median_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _retained_kb(func) -> float:
+    tracemalloc.start()
+    kept = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--options", type=int, default=20)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    agent = ImpactSimulatorAgent()
+    types = [OPTION_TYPES[i % 3] for i in range(args.options)]
+
+    def generate_legacy() -> list:
+        return [legacy_series(92.0, 78.2, args.weeks, t) for t in types]
+
+    def generate_array() -> list:
+        return [agent._generate_time_series(92.0, 78.2, args.weeks, t) for t in types]
+
+    legacy_kept, array_kept = generate_legacy(), generate_array()
+    rows = [
+        (
+            "generate",
+            _median_ms(generate_legacy, args.repeat),
+            _median_ms(generate_array, args.repeat),
+        ),
+        (
+            "materialize",
+            _median_ms(lambda: [legacy_to_list(s) for s in legacy_kept], args.repeat),
+            _median_ms(lambda: [s.to_list() for s in array_kept], args.repeat),
+        ),
+    ]
+
+    options = [
+        {"option_id": f"OPT-{i:03d}", "option_type": t, "name": f"대안 {i}"}
+        for i, t in enumerate(types)
+    ]
+    baseline = {"utilization": 0.92, "headcount": 45}
+
+    def simulate_to_dict() -> dict:
+        return agent.to_dict(agent.simulate("CAPACITY", options, baseline, args.weeks))
+
+    print(f"{args.weeks} weeks x {args.options} options")
+    print(f"\n{'step':<14}{'legacy ms':>12}{'array ms':>12}{'speedup':>10}")
+    print("-" * 48)
+    for name, legacy_ms, array_ms in rows:
+        print(f"{name:<14}{legacy_ms:>12.3f}{array_ms:>12.3f}{legacy_ms / array_ms:>9.1f}x")
+
+    legacy_kb = _retained_kb(generate_legacy)
+    array_kb = _retained_kb(generate_array)
+    print(f"\nretained: legacy {legacy_kb:.1f} KB, array {array_kb:.1f} KB")
+    print(f"simulate + to_dict: {_median_ms(simulate_to_dict, args.repeat):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+성공 확률 모델 학습
+
+data/labeled의 프로젝트 결과 라벨로 로지스틱 회귀를 학습하고 JSON으로 저장합니다.
+학습셋, leave-one-out, 현재 휴리스틱의 보정 지표(Brier, log loss, ECE)를 함께 출력합니다.
+
+사용법:
+    python scripts/train_success_model.py [--contexts contexts.json] [--l2 0.3]
+        [--output data/models/success_model.json]
+
+--contexts: 프로젝트 ID → 착수 시점 컨텍스트 JSON. 없으면 NEO4J_URI로 연결한 KG에서
+            착수 시점 컨텍스트(필요/가용 FTE, 계획 기간, 팀 경력 등)를 조회합니다.
+            프로젝트 라벨에는 사후 지표만 있으므로 컨텍스트가 없는 라벨은 제외되며, 학습할
+            예제나 특성이 없으면 모델을 저장하지 않고 실패합니다 (서버는 휴리스틱 유지).
+서버에서 사용: SUCCESS_MODEL_PATH=data/models/success_model.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.agent_runtime.agents.success_model import (
+    DEFAULT_LABELED_DIR,
+    DEFAULT_MODEL_PATH,
+    FEATURES,
+    load_training_set,
+    train_success_model,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--labeled-dir", type=Path, default=DEFAULT_LABELED_DIR)
+    parser.add_argument("--contexts", type=Path, default=None)
+    parser.add_argument("--l2", type=float, default=0.3)
+    parser.add_argument("--output", type=Path, default=DEFAULT_MODEL_PATH)
+    args = parser.parse_args()
+
+    contexts, kg_client = None, None
+    if args.contexts:
+        contexts = json.loads(args.contexts.read_text(encoding="utf-8"))
+    else:
+        from backend.api.pipeline import get_kg_client
+
+        kg_client = get_kg_client()
+        if kg_client is None:
+            print("KG 미연결 (NEO4J_URI): 라벨에 포함된 컨텍스트만 사용합니다")
+    training = load_training_set(args.labeled_dir, contexts, kg_client=kg_client)
+    try:
+        model = train_success_model(training, l2=args.l2)
+    except ValueError as e:
+        print(f"✗ 학습 실패: {e}")
+        return 1
+    model.save(args.output)
+
+    metrics = model.metrics
+    print(
+        f"examples: {metrics['examples']} (skipped {metrics['skipped']}), "
+        f"fit {metrics['fit_ms']:.1f} ms, l2={args.l2}"
+    )
+    if metrics["unlearned_features"]:
+        print(f"unlearned features: {', '.join(metrics['unlearned_features'])}")
+    print(f"\n{'set':<16}{'brier':>8}{'log_loss':>10}{'ece':>8}")
+    print("-" * 42)
+    for name in ("train", "leave_one_out", "heuristic"):
+        report = metrics[name]
+        print(f"{name:<16}{report['brier']:>8.4f}{report['log_loss']:>10.4f}{report['ece']:>8.4f}")
+
+    print("\nreliability (leave_one_out)")
+    for row in metrics["leave_one_out"]["reliability"]:
+        print(
+            f"  {row['bin']}: n={row['count']:<3} predicted {row['mean_predicted']:.3f}"
+            f" / observed {row['observed_rate']:.3f}"
+        )
+
+    print("\ncoefficients (standardized)")
+    for name, coef in zip(FEATURES, model.coef, strict=True):
+        if coef:
+            print(f"  {name:<24}{coef:>8.3f}")
+    print(f"  {'intercept':<24}{model.intercept:>8.3f}")
+    print(f"\nsaved: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,16 @@ HR DSS 테스트 공통 설정 및 Fixtures
 """
 
 import json
+import os
+import tempfile
 from pathlib import Path
 
 import pytest
 
+# 테스트용 로컬 SQLite DB (Postgres 대체) - 앱 import 전에 설정
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="hr-dss-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_TEST_DB_DIR}/test.db")
+
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "mock"
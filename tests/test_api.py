@@ -1,5 +1,6 @@
 """API 테스트"""
 
+import time
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
@@ -9,6 +10,17 @@ from backend.api.main import app
 client = TestClient(app)
 
 
+def _wait_for_job(c: TestClient, job_id: str, timeout: float = 10.0) -> dict:
+    """백그라운드 작업 완료 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = c.get(f"/api/v1/jobs/{job_id}").json()
+        if job["status"] in ("completed", "failed"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"작업이 완료되지 않음: {job_id}")
+
+
 class TestHealthEndpoints:
     """헬스 체크 엔드포인트 테스트"""
 
@@ -66,6 +78,46 @@ class TestAgentsEndpoints:
         assert "request_id" in data
         assert "result" in data
 
+    def test_query_cache_hit(self):
+        """동일 질문(정규화 기준) 재요청 시 캐시 적중"""
+        from backend.api.cache import query_cache
+
+        query_cache.invalidate()
+        first = client.post(
+            "/api/v1/agents/query",
+            json={"question": "인력 재배치  방안은?", "context": {"org_unit_id": "ORG-001"}},
+        )
+        second = client.post(
+            "/api/v1/agents/query",
+            json={"question": "인력 재배치 방안은", "context": {"org_unit_id": "ORG-001"}},
+        )
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json()["result"] == first.json()["result"]
+        assert second.json()["request_id"] != first.json()["request_id"]
+        assert first.json()["result"]["options"]
+
+        # 우회 요청은 캐시를 읽지도 덮어쓰지도 않음
+        with patch(
+            "backend.api.routers.agents.run_query", return_value={"options": [], "bypass": True}
+        ):
+            bypass = client.post(
+                "/api/v1/agents/query",
+                json={
+                    "question": "인력 재배치 방안은",
+                    "context": {"org_unit_id": "ORG-001"},
+                    "options": {"cache": False},
+                },
+            )
+        assert bypass.headers["X-Cache"] == "BYPASS"
+        assert bypass.json()["result"]["bypass"] is True
+        third = client.post(
+            "/api/v1/agents/query",
+            json={"question": "인력 재배치 방안은", "context": {"org_unit_id": "ORG-001"}},
+        )
+        assert third.headers["X-Cache"] == "HIT"
+        assert third.json()["result"] == first.json()["result"]
+
     def test_get_agent_info(self):
         """에이전트 상세 정보 테스트"""
         response = client.get("/api/v1/agents/query-decomposition")
@@ -104,36 +156,102 @@ class TestDecisionsEndpoints:
 
     def test_decision_workflow(self):
         """의사결정 전체 워크플로우 테스트"""
-        # 1. 생성
-        create_response = client.post(
-            "/api/v1/decisions",
-            json={"title": "워크플로우 테스트", "question": "테스트용 질문"},
-        )
-        assert create_response.status_code == 200
-        decision_id = create_response.json()["id"]
+        with TestClient(app) as c:
+            # 1. 생성
+            create_response = c.post(
+                "/api/v1/decisions",
+                json={"title": "워크플로우 테스트", "question": "향후 12주 가동률 병목 예측"},
+            )
+            assert create_response.status_code == 200
+            decision_id = create_response.json()["id"]
 
-        # 2. 조회
-        get_response = client.get(f"/api/v1/decisions/{decision_id}")
-        assert get_response.status_code == 200
-        assert get_response.json()["status"] == "pending"
+            # 2. 조회
+            get_response = c.get(f"/api/v1/decisions/{decision_id}")
+            assert get_response.status_code == 200
+            assert get_response.json()["status"] == "pending"
 
-        # 3. 분석
-        analyze_response = client.post(f"/api/v1/decisions/{decision_id}/analyze")
-        assert analyze_response.status_code == 200
-        assert analyze_response.json()["status"] == "analyzed"
+            # 3. 분석 (백그라운드 작업)
+            analyze_response = c.post(f"/api/v1/decisions/{decision_id}/analyze")
+            assert analyze_response.status_code == 202
+            job_id = analyze_response.json()["job_id"]
+            job = _wait_for_job(c, job_id)
+            assert job["status"] == "completed", job["error"]
+            assert len(job["progress"]) >= 5
 
-        # 4. 조회 (분석 완료 상태)
-        get_response2 = client.get(f"/api/v1/decisions/{decision_id}")
-        assert get_response2.json()["status"] == "analyzed"
-        assert get_response2.json()["options"] is not None
+            # 4. 조회 (분석 완료 상태)
+            get_response2 = c.get(f"/api/v1/decisions/{decision_id}")
+            assert get_response2.json()["status"] == "analyzed"
+            assert get_response2.json()["options"] is not None
 
-        # 5. 승인
-        approve_response = client.post(
-            f"/api/v1/decisions/{decision_id}/approve",
-            json={"option_id": "opt-1", "comment": "테스트 승인"},
-        )
-        assert approve_response.status_code == 200
-        assert approve_response.json()["status"] == "approved"
+            # 5. 승인
+            approve_response = c.post(
+                f"/api/v1/decisions/{decision_id}/approve",
+                json={"option_id": "opt-1", "comment": "테스트 승인"},
+            )
+            assert approve_response.status_code == 200
+            assert approve_response.json()["status"] == "approved"
+            assert approve_response.json()["decision_log_id"]
+
+    def test_analyze_queue_full_restores_status(self):
+        """큐 포화로 제출이 거부되면 상태를 되돌리고 503"""
+        from backend.api.jobs import JobQueueFullError, job_runner
+
+        with TestClient(app) as c:
+            decision_id = c.post(
+                "/api/v1/decisions", json={"title": "큐 포화", "question": "가동률 병목 예측"}
+            ).json()["id"]
+            with patch.object(job_runner, "submit", side_effect=JobQueueFullError("full")):
+                response = c.post(f"/api/v1/decisions/{decision_id}/analyze")
+            assert response.status_code == 503
+            assert c.get(f"/api/v1/decisions/{decision_id}").json()["status"] == "pending"
+
+    def test_analyze_rejects_decision_in_progress(self):
+        """분석 중인 의사결정은 다시 분석하지 않음 (작업/승인 요청 중복 방지)"""
+        from types import SimpleNamespace
+
+        from backend.api.jobs import job_runner
+
+        with TestClient(app) as c:
+            decision_id = c.post(
+                "/api/v1/decisions", json={"title": "중복 분석", "question": "가동률 병목 예측"}
+            ).json()["id"]
+            job = SimpleNamespace(job_id="JOB-PENDING")
+            with patch.object(job_runner, "submit", return_value=job) as submit:
+                assert c.post(f"/api/v1/decisions/{decision_id}/analyze").status_code == 202
+                assert c.post(f"/api/v1/decisions/{decision_id}/analyze").status_code == 409
+                batch = c.post(
+                    "/api/v1/decisions/batch-analyze",
+                    json={"items": [{"decision_id": decision_id}]},
+                )
+                assert batch.status_code == 409
+            assert submit.call_count == 1
+            assert c.get(f"/api/v1/decisions/{decision_id}").json()["status"] == "analyzing"
+
+    def test_analysis_progress_stream(self):
+        """분석 진행 이벤트 SSE 스트림"""
+        with TestClient(app) as c:
+            decision_id = c.post(
+                "/api/v1/decisions",
+                json={"title": "SSE 테스트", "question": "데이터플랫폼팀 1명 증원 요청 분석"},
+            ).json()["id"]
+            job_id = c.post(f"/api/v1/decisions/{decision_id}/analyze").json()["job_id"]
+
+            with c.stream("GET", f"/api/v1/jobs/{job_id}/events") as response:
+                assert response.status_code == 200
+                assert response.headers["content-type"].startswith("text/event-stream")
+                events = [
+                    line.split(":", 1)[1].strip()
+                    for line in response.iter_lines()
+                    if line.startswith("event:")
+                ]
+
+            assert events[0] == "queued"
+            assert "step" in events
+            assert events[-1] == "completed"
+
+    def test_job_not_found(self):
+        """존재하지 않는 작업"""
+        assert client.get("/api/v1/jobs/JOB-NONE").status_code == 404
 
     def test_decision_not_found(self):
         """존재하지 않는 의사결정 테스트"""
@@ -200,3 +318,1343 @@ class TestGraphEndpoints:
         data = response.json()
         assert "query" in data
         assert "results" in data
+
+
+class TestDecisionStore:
+    """의사결정 영속 저장소 테스트"""
+
+    def _create(self, title: str) -> str:
+        response = client.post(
+            "/api/v1/decisions",
+            json={"title": title, "question": "저장소 테스트 질문"},
+        )
+        assert response.status_code == 200
+        return response.json()["id"]
+
+    def test_list_status_filter_and_pagination(self):
+        """상태 필터 + 페이지네이션"""
+        ids = [self._create(f"페이지 테스트 {i}") for i in range(3)]
+        client.post(f"/api/v1/decisions/{ids[0]}/reject")
+
+        rejected = client.get("/api/v1/decisions", params={"status": "rejected"}).json()
+        assert rejected["total"] >= 1
+        assert all(item["status"] == "rejected" for item in rejected["items"])
+
+        page = client.get("/api/v1/decisions", params={"limit": 2, "offset": 0}).json()
+        assert len(page["items"]) == 2
+        assert page["total"] >= 3
+
+        # 최신순 정렬: 방금 반려된 의사결정이 가장 먼저
+        assert page["items"][0]["id"] == ids[0]
+        updated = [item["updated_at"] for item in page["items"]]
+        assert updated == sorted(updated, reverse=True)
+
+    def test_delete_decision(self):
+        """삭제 후 조회 불가"""
+        decision_id = self._create("삭제 테스트")
+        assert client.delete(f"/api/v1/decisions/{decision_id}").status_code == 200
+        assert client.get(f"/api/v1/decisions/{decision_id}").status_code == 404
+        assert client.delete(f"/api/v1/decisions/{decision_id}").status_code == 404
+
+    async def test_repository_persists_across_sessions(self):
+        """세션이 달라도 저장된 데이터 유지"""
+        from backend.database.repositories.decision import DecisionRepository
+        from backend.database.session import get_sessionmaker, init_db
+
+        await init_db()
+        async with get_sessionmaker()() as session:
+            await DecisionRepository(session).create("repo-persist-1", "영속성", "질문")
+
+        async with get_sessionmaker()() as session:
+            record = await DecisionRepository(session).get("repo-persist-1")
+            assert record is not None
+            assert record.status == "pending"
+
+
+class TestJobRunner:
+    """백그라운드 작업 실행기 테스트"""
+
+    async def test_queue_full_rejected(self):
+        """대기 큐 초과 시 거절"""
+        import asyncio
+
+        from backend.api.jobs import JobQueueFullError, JobRunner
+
+        runner = JobRunner(max_workers=1, max_queue=1)
+        release = asyncio.Event()
+
+        async def blocking(ctx):
+            await release.wait()
+            return {"ok": True}
+
+        first = runner.submit("test", blocking)
+        try:
+            runner.submit("test", blocking)
+        except JobQueueFullError:
+            pass
+        else:
+            raise AssertionError("큐 포화 시 JobQueueFullError 발생해야 함")
+
+        release.set()
+        events = [e["event"] async for e in runner.stream(first.job_id)]
+        assert events == ["queued", "started", "completed"]
+        await runner.stop()
+
+    async def test_events_shared_through_store(self):
+        """다른 워커가 저장소로 이벤트/상태 조회 (이벤트는 추가 기록, 스냅샷은 상태 변경 시만)"""
+        import asyncio
+
+        from backend.agent_runtime.state import InMemoryStateStore
+        from backend.api.jobs import JOB_STATE_NAMESPACE, JobRunner
+
+        store = InMemoryStateStore()
+        snapshots = []
+        original_put = store.put
+
+        def put(namespace, key, value):
+            if namespace == JOB_STATE_NAMESPACE:
+                snapshots.append(value["status"])
+            original_put(namespace, key, value)
+
+        store.put = put
+        owner = JobRunner(max_workers=1, store_factory=lambda: store, poll_interval=0.01)
+        other = JobRunner(max_workers=1, store_factory=lambda: store, poll_interval=0.01)
+        release = asyncio.Event()
+
+        async def steps(ctx):
+            for i in range(20):
+                ctx.report("step", {"index": i})
+            await release.wait()
+            return {"ok": True}
+
+        job = owner.submit("test", steps)
+        while len(job.events) < 22:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        running = await other.snapshot(job.job_id)
+        assert running["status"] == "running"
+        assert [e["data"]["index"] for e in running["progress"]] == list(range(20))
+
+        release.set()
+        events = [e["event"] async for e in other.stream(job.job_id)]
+        assert events == ["queued", "started", *["step"] * 20, "completed"]
+        assert snapshots == ["queued", "running", "completed"]
+        await owner.stop()
+        await other.stop()
+
+
+class TestSingleFlight:
+    """동일 조회 병합 테스트"""
+
+    async def test_concurrent_queries_coalesced(self):
+        """동시에 들어온 동일 읽기 쿼리는 한 번만 실행"""
+        import asyncio
+
+        from backend.agent_runtime.ontology.singleflight import AsyncSingleFlight
+
+        flight = AsyncSingleFlight()
+        executions = 0
+
+        async def query():
+            nonlocal executions
+            executions += 1
+            await asyncio.sleep(0.05)
+            return [{"count": 42}]
+
+        results = await asyncio.gather(*(flight.do("stats", query) for _ in range(5)))
+        assert executions == 1
+        assert all(r == [{"count": 42}] for r in results)
+        stats = flight.stats()
+        assert stats["calls"] == 5
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+        # 완료 후 재호출은 새로 실행 (캐시 아님)
+        await flight.do("stats", query)
+        assert executions == 2
+
+    async def test_error_shared_and_not_cached(self):
+        """실패는 대기자 모두에게 전달되고 다음 호출은 재실행"""
+        import asyncio
+
+        from backend.agent_runtime.ontology.singleflight import AsyncSingleFlight
+
+        flight = AsyncSingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("neo4j down")
+
+        results = await asyncio.gather(
+            *(flight.do("q", failing) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.stats()["errors"] == 1
+        assert flight.stats()["in_flight"] == 0
+
+    def test_threaded_kg_queries_coalesced(self):
+        """스레드에서 동시에 호출된 동일 KG 조회 병합"""
+        import threading
+
+        from backend.agent_runtime.ontology.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        executions = 0
+
+        def query():
+            nonlocal executions
+            executions += 1
+            started.set()
+            release.wait(5)
+            return {"utilization": 0.9}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("ORG-001", query)))
+            for _ in range(4)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for t in threads[1:]:
+            t.start()
+        while flight.stats()["coalesced"] < 3:
+            time.sleep(0.005)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert executions == 1
+        assert results == [{"utilization": 0.9}] * 4
+
+    def test_write_queries_not_coalesced(self):
+        """쓰기 쿼리는 병합하지 않음"""
+        from backend.api.dependencies import _WRITE_CLAUSE
+
+        assert _WRITE_CLAUSE.search("MERGE (m:GraphMeta {key: 'graph'}) SET m.version = 1")
+        assert not _WRITE_CLAUSE.search("MATCH (n) RETURN count(n) AS count")
+
+    def test_coalescing_stats_endpoint(self):
+        """병합 통계 노출"""
+        response = client.get("/api/v1/graph/coalescing")
+        assert response.status_code == 200
+        data = response.json()
+        assert {"calls", "executions", "coalesced", "in_flight"} <= set(data["neo4j"])
+        assert "kg_query" in data
+
+
+class TestTracing:
+    """요청 추적 테스트"""
+
+    def test_request_id_and_server_timing(self):
+        """요청 ID와 Server-Timing 헤더"""
+        response = client.get("/health")
+        assert len(response.headers["X-Request-ID"]) == 32
+        assert "total;dur=" in response.headers["Server-Timing"]
+        assert "serialize;dur=" in response.headers["Server-Timing"]
+
+    def test_incoming_request_id_propagated(self):
+        """클라이언트가 보낸 요청 ID 유지 (형식이 잘못되면 새로 발급)"""
+        response = client.get("/health", headers={"X-Request-ID": "dash-123"})
+        assert response.headers["X-Request-ID"] == "dash-123"
+        response = client.get("/health", headers={"X-Request-ID": "bad id\n"})
+        assert response.headers["X-Request-ID"] != "bad id\n"
+
+    def test_agent_stages(self):
+        """에이전트 단계 시간 기록"""
+        from backend.api.cache import query_cache
+
+        query_cache.invalidate()
+        response = client.post(
+            "/api/v1/agents/query",
+            json={"question": "향후 12주 가동률 병목 예측"},
+        )
+        timing = response.headers["Server-Timing"]
+        assert "agent.query_decomposition;dur=" in timing
+        assert "agent.option_generation;dur=" in timing
+
+    def test_stage_outside_request_is_noop(self):
+        """요청 밖에서는 기록하지 않음"""
+        from backend.api.tracing import current_trace, stage
+
+        with stage("neo4j"):
+            pass
+        assert current_trace() is None
+
+    def test_verify_token_recorded(self):
+        """verify_token 호출 시 auth 단계 기록"""
+        from backend.api.dependencies import TokenPayload, create_access_token, verify_token
+        from backend.api.tracing import Trace, _current_trace
+
+        trace = Trace(request_id="t")
+        token = _current_trace.set(trace)
+        try:
+            verify_token(create_access_token(TokenPayload(sub="tester")))
+        finally:
+            _current_trace.reset(token)
+        assert [s.name for s in trace.spans] == ["auth"]
+
+
+class TestMetrics:
+    """운영 메트릭 테스트"""
+
+    def test_metrics_prometheus_format(self):
+        """라우트 템플릿별 지연 히스토그램과 운영 게이지 노출"""
+        decision_id = client.post(
+            "/api/v1/decisions", json={"title": "메트릭", "question": "질문"}
+        ).json()["id"]
+        client.get(f"/api/v1/decisions/{decision_id}")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = response.text
+        assert "# TYPE hr_dss_http_request_duration_seconds histogram" in body
+        assert 'route="/api/v1/decisions/{decision_id}"' in body
+        assert decision_id not in body
+        assert 'le="+Inf"' in body
+        for name in (
+            "hr_dss_neo4j_pool_connections",
+            "hr_dss_neo4j_pool_acquire_wait_seconds",
+            "hr_dss_kg_query_duration_seconds",
+            "hr_dss_cache_hit_ratio",
+            "hr_dss_hitl_pending_requests",
+        ):
+            assert f"# TYPE {name}" in body
+
+    def test_workflow_step_durations_recorded(self):
+        """워크플로 단계 실행 시간 기록"""
+        from backend.agent_runtime.metrics import WORKFLOW_STEP_SECONDS
+        from backend.api.pipeline import run_analysis
+
+        before = WORKFLOW_STEP_SECONDS.count(step="OPTION_GENERATION", status="COMPLETED")
+        run_analysis("향후 12주 가동률 병목 예측")
+        after = WORKFLOW_STEP_SECONDS.count(step="OPTION_GENERATION", status="COMPLETED")
+        assert after == before + 1
+
+    def test_histogram_buckets_cumulative(self):
+        """히스토그램 버킷 누적값"""
+        from backend.agent_runtime.metrics import Histogram
+
+        hist = Histogram("test_latency_seconds", "test", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            hist.observe(value)
+        lines = hist.render()
+        assert 'test_latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'test_latency_seconds_bucket{le="1"} 2' in lines
+        assert 'test_latency_seconds_bucket{le="+Inf"} 3' in lines
+        assert "test_latency_seconds_count 3" in lines
+
+
+class TestReadiness:
+    """준비 상태 점검 테스트"""
+
+    def setup_method(self):
+        from backend.api.readiness import readiness_probe
+
+        readiness_probe.invalidate()
+
+    def test_ready_with_real_checks(self):
+        """DB 점검 결과와 지연 시간 보고, 짧게 캐시"""
+        first = client.get("/ready")
+        assert first.status_code == 200
+        data = first.json()
+        assert data["status"] == "ready"
+        assert data["checks"]["database"]["status"] == "ok"
+        assert "latency_ms" in data["checks"]["database"]
+        assert data["checks"]["neo4j"]["status"] == "not_configured"
+        assert first.headers["X-Cache"] == "MISS"
+
+        second = client.get("/ready")
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json()["checked_at"] == data["checked_at"]
+
+    def test_neo4j_failure_not_ready(self):
+        """Neo4j 점검 실패 시 503"""
+        from unittest.mock import AsyncMock
+
+        with (
+            patch(
+                "backend.api.dependencies.Neo4jService.get_driver",
+                new=AsyncMock(return_value=object()),
+            ),
+            patch(
+                "backend.api.dependencies.Neo4jService.execute_query",
+                new=AsyncMock(side_effect=ConnectionError("pool closed")),
+            ),
+        ):
+            response = client.get("/ready")
+        assert response.status_code == 503
+        data = response.json()
+        assert data["status"] == "not_ready"
+        assert data["checks"]["neo4j"] == {
+            "status": "error",
+            "latency_ms": data["checks"]["neo4j"]["latency_ms"],
+            "error": "pool closed",
+        }
+
+    async def test_check_timeout(self):
+        """제한 시간 초과 시 timeout"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from backend.api.readiness import check_neo4j
+
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(1)
+
+        with (
+            patch(
+                "backend.api.dependencies.Neo4jService.get_driver",
+                new=AsyncMock(return_value=object()),
+            ),
+            patch("backend.api.dependencies.Neo4jService.execute_query", new=slow),
+        ):
+            result = await check_neo4j(timeout=0.05)
+        assert result.status == "timeout"
+        assert not result.healthy
+        assert result.latency_ms < 500
+
+
+class TestSerialization:
+    """응답 직렬화/압축 테스트"""
+
+    def test_orjson_native_types(self):
+        """datetime/Enum/dataclass/neo4j 날짜 직렬화"""
+        import json
+        from dataclasses import dataclass
+        from datetime import UTC, datetime
+        from enum import Enum
+
+        from neo4j.time import Date
+
+        from backend.api.responses import ORJSONResponse
+
+        class Status(Enum):
+            DONE = "done"
+
+        @dataclass
+        class Point:
+            week: int
+            value: float
+
+        body = ORJSONResponse(
+            {
+                "at": datetime(2025, 1, 1, tzinfo=UTC),
+                "status": Status.DONE,
+                "series": [Point(1, 0.5)],
+                "hired": Date(2024, 3, 1),
+                "이름": "홍길동",
+            }
+        ).body
+        assert json.loads(body) == {
+            "at": "2025-01-01T00:00:00+00:00",
+            "status": "done",
+            "series": [{"week": 1, "value": 0.5}],
+            "hired": "2024-03-01",
+            "이름": "홍길동",
+        }
+
+    def test_gzip_and_brotli_negotiated(self):
+        """임계 크기 이상 응답은 협상된 인코딩으로 압축"""
+        from backend.api.responses import BROTLI_AVAILABLE
+
+        gz = client.get("/api/v1/graph/schema", headers={"Accept-Encoding": "gzip"})
+        assert gz.headers["Content-Encoding"] == "gzip"
+        assert "nodes" in gz.json()
+        assert "Accept-Encoding" in gz.headers["Vary"]
+
+        br = client.get("/api/v1/graph/schema", headers={"Accept-Encoding": "gzip, br"})
+        assert br.headers["Content-Encoding"] == ("br" if BROTLI_AVAILABLE else "gzip")
+
+        refused = client.get("/api/v1/graph/schema", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "Content-Encoding" not in refused.headers
+
+    def test_small_response_not_compressed(self):
+        """임계 크기 미만 응답은 압축하지 않음"""
+        response = client.get("/health", headers={"Accept-Encoding": "gzip, br"})
+        assert "Content-Encoding" not in response.headers
+
+
+class TestStateStore:
+    """공유 상태 저장소 테스트"""
+
+    def test_sqlite_store_shared_between_instances(self, tmp_path):
+        """같은 SQLite 파일을 쓰는 저장소 인스턴스 간 공유"""
+        from backend.agent_runtime.state import SQLiteStateStore, create_state_store
+
+        path = tmp_path / "state.db"
+        a = SQLiteStateStore(path)
+        b = create_state_store(f"sqlite+aiosqlite:///{path}")
+
+        a.put("ns", "k1", {"value": 1})
+        assert b.get("ns", "k1") == {"value": 1}
+        b.put("ns", "k1", {"value": 2})
+        assert a.get("ns", "k1") == {"value": 2}
+        assert a.count("ns") == 1
+        assert b.delete("ns", "k1") is True
+        assert a.delete("ns", "k1") is False
+        assert a.get("ns", "k1") is None
+
+    def test_prune_keeps_most_recent(self, tmp_path):
+        """prune은 최근 저장(갱신 포함)된 항목만 남김"""
+        from backend.agent_runtime.state import InMemoryStateStore, SQLiteStateStore
+
+        for store in (InMemoryStateStore(), SQLiteStateStore(tmp_path / "state.db")):
+            for i in range(5):
+                store.put("ns", f"k{i}", i)
+            store.put("ns", "k0", 0)  # 갱신된 항목은 최근 항목
+            store.put("other", "k1", 1)
+
+            assert store.prune("ns", 2) == 3
+            assert sorted(store.keys("ns")) == ["k0", "k4"]
+            assert store.get("other", "k1") == 1
+
+    def test_workflow_resumed_by_another_instance(self, tmp_path):
+        """한 인스턴스에서 멈춘 워크플로를 다른 인스턴스에서 재개"""
+        from backend.agent_runtime.agents import WorkflowBuilderAgent, WorkflowContext
+        from backend.agent_runtime.agents.workflow_builder import StepStatus, WorkflowStatus
+        from backend.agent_runtime.state import SQLiteStateStore
+
+        path = tmp_path / "state.db"
+        first = WorkflowBuilderAgent(state_store=SQLiteStateStore(path))
+        second = WorkflowBuilderAgent(state_store=SQLiteStateStore(path))
+
+        workflow = first.build_workflow("CAPACITY")
+        context = WorkflowContext(user_query="가동률 병목", org_unit_id="ORG-001")
+        paused = first.run_workflow(workflow, context, stop_on_hitl=True)
+        assert paused.status == WorkflowStatus.PAUSED
+
+        stored = second.executions[paused.execution_id]
+        assert stored.status == WorkflowStatus.PAUSED
+        assert stored.started_at == paused.started_at
+        assert all(r.status == StepStatus.COMPLETED for r in stored.step_results.values())
+
+        done = second.resume_workflow(paused.execution_id, workflow, context, {"approved": True})
+        assert done.status == WorkflowStatus.COMPLETED
+        assert first.get_workflow_status(paused.execution_id)["status"] == "COMPLETED"
+
+    def test_approval_claimed_once_across_instances(self, tmp_path):
+        """여러 인스턴스가 같은 승인 요청을 처리해도 한 번만 성공"""
+        import pytest
+
+        from backend.agent_runtime.state import SQLiteStateStore
+        from backend.agent_runtime.workflows import ApprovalStatus, HITLApprovalSystem
+        from backend.agent_runtime.workflows.hitl_approval import DecisionType
+
+        path = tmp_path / "state.db"
+        first = HITLApprovalSystem(state_store=SQLiteStateStore(path))
+        second = HITLApprovalSystem(state_store=SQLiteStateStore(path))
+
+        request = first.create_approval_request(
+            execution_id="EXEC-SHARED",
+            decision_type=DecisionType.CAPACITY,
+            workflow_context={"options": {"options": [], "recommendation": None}},
+            requester_id="tester",
+            metadata={"decision_id": "D-1"},
+        )
+        escalated = second.escalate_request(request.request_id, "금액 초과", "tester")
+        pending = first.get_pending_requests()
+        assert [r.request_id for r in pending] == [request.request_id]
+        assert pending[0].required_level == escalated.required_level
+        assert pending[0].metadata["decision_id"] == "D-1"
+
+        second.submit_response(
+            request.request_id,
+            ApprovalStatus.APPROVED,
+            approver_id="lead",
+            approver_name="팀장",
+            approval_level=escalated.required_level,
+        )
+        with pytest.raises(ValueError):
+            first.submit_response(
+                request.request_id,
+                ApprovalStatus.APPROVED,
+                approver_id="lead",
+                approver_name="팀장",
+                approval_level=escalated.required_level,
+            )
+        assert len(first.pending_requests) == 0
+        assert first.get_approval_statistics()["approved"] == 1
+
+
+class TestMultiWorker:
+    """다중 워커(uvicorn --workers 2) 일관성 테스트"""
+
+    def _start_server(self, tmp_path):
+        import os
+        import socket
+        import subprocess
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+        from pathlib import Path
+
+        import httpx
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        env = {**os.environ, "DATABASE_URL": f"sqlite+aiosqlite:///{tmp_path}/multi.db"}
+        env.pop("STATE_STORE_URL", None)
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "backend.api.main:app",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(port),
+                "--workers",
+                "2",
+                "--log-level",
+                "warning",
+            ],
+            cwd=Path(__file__).parent.parent,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+
+        def instance() -> str | None:
+            try:
+                return httpx.get(f"{base_url}/health").json()["instance"]
+            except httpx.TransportError:
+                return None
+
+        # 두 워커가 모두 응답할 때까지 대기 (동시 요청이어야 두 워커에 분산됨)
+        instances: set[str] = set()
+        deadline = time.monotonic() + 30
+        with ThreadPoolExecutor(8) as pool:
+            while time.monotonic() < deadline:
+                instances.update(i for i in pool.map(lambda _: instance(), range(16)) if i)
+                if len(instances) == 2:
+                    return process, base_url
+                time.sleep(0.2)
+        process.terminate()
+        raise AssertionError(f"워커가 모두 시작되지 않음: {instances}")
+
+    def test_consistent_state_across_workers(self, tmp_path):
+        """어느 워커가 받든 의사결정/작업/승인 상태가 동일"""
+        import re
+
+        import httpx
+
+        process, base_url = self._start_server(tmp_path)
+
+        def pending_approvals() -> float:
+            text = httpx.get(f"{base_url}/metrics").text
+            return float(re.search(r"^hr_dss_hitl_pending_requests (\S+)$", text, re.M).group(1))
+
+        try:
+            decision_id = httpx.post(
+                f"{base_url}/api/v1/decisions",
+                json={"title": "다중 워커", "question": "향후 12주 가동률 병목 예측"},
+            ).json()["id"]
+            job_id = httpx.post(f"{base_url}/api/v1/decisions/{decision_id}/analyze").json()[
+                "job_id"
+            ]
+
+            deadline = time.monotonic() + 30
+            while time.monotonic() < deadline:
+                job = httpx.get(f"{base_url}/api/v1/jobs/{job_id}").json()
+                if job["status"] in ("completed", "failed"):
+                    break
+                time.sleep(0.1)
+            assert job["status"] == "completed"
+            approval_id = job["result"]["approval_request_id"]
+            assert approval_id
+
+            for _ in range(10):
+                job = httpx.get(f"{base_url}/api/v1/jobs/{job_id}").json()
+                assert job["status"] == "completed"
+                assert job["result"]["approval_request_id"] == approval_id
+                decision = httpx.get(f"{base_url}/api/v1/decisions/{decision_id}").json()
+                assert decision["status"] == "analyzed"
+                assert pending_approvals() == 1
+
+            option_id = decision["options"][0]["id"]
+            approved = httpx.post(
+                f"{base_url}/api/v1/decisions/{decision_id}/approve",
+                json={"option_id": option_id},
+            )
+            assert approved.status_code == 200
+            assert approved.json()["decision_log_id"]
+
+            for _ in range(10):
+                decision = httpx.get(f"{base_url}/api/v1/decisions/{decision_id}").json()
+                assert decision["status"] == "approved"
+                assert decision["selected_option"] == option_id
+                assert pending_approvals() == 0
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+class TestConditionalGet:
+    """ETag / If-None-Match 조건부 GET 테스트"""
+
+    def test_decision_list_not_modified(self):
+        """의사결정 저장소가 바뀌기 전까지 304"""
+        first = client.get("/api/v1/decisions")
+        etag = first.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        unchanged = client.get("/api/v1/decisions", headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert unchanged.headers["ETag"] == etag
+
+        # 페이지 파라미터가 다르면 다른 ETag
+        other_page = client.get("/api/v1/decisions", params={"limit": 5})
+        assert other_page.headers["ETag"] != etag
+
+        decision_id = client.post(
+            "/api/v1/decisions", json={"title": "ETag 테스트", "question": "질문"}
+        ).json()["id"]
+        changed = client.get("/api/v1/decisions", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+        detail = client.get(f"/api/v1/decisions/{decision_id}")
+        detail_etag = detail.headers["ETag"]
+        assert (
+            client.get(
+                f"/api/v1/decisions/{decision_id}", headers={"If-None-Match": detail_etag}
+            ).status_code
+            == 304
+        )
+        client.post(f"/api/v1/decisions/{decision_id}/reject")
+        rejected = client.get(
+            f"/api/v1/decisions/{decision_id}", headers={"If-None-Match": detail_etag}
+        )
+        assert rejected.status_code == 200
+        assert rejected.json()["status"] == "rejected"
+
+    def test_graph_stats_etag_follows_graph_version(self):
+        """그래프 버전이 같으면 통계를 다시 조회하지 않고 304"""
+        from unittest.mock import AsyncMock
+
+        stats = {"node_count": 3, "relationship_count": 2, "labels": {}, "relationship_types": {}}
+        version = AsyncMock(return_value="v1")
+        get_stats = AsyncMock(return_value=stats)
+        with (
+            patch("backend.api.etag.Neo4jService.get_graph_version", version),
+            patch("backend.api.routers.graph.Neo4jService.get_stats", get_stats),
+        ):
+            first = client.get("/api/v1/graph/stats")
+            assert first.status_code == 200
+            etag = first.headers["ETag"]
+
+            unchanged = client.get(
+                "/api/v1/graph/stats", headers={"If-None-Match": f'"other", {etag}'}
+            )
+            assert unchanged.status_code == 304
+            assert get_stats.await_count == 1
+
+            version.return_value = "v2"
+            reloaded = client.get("/api/v1/graph/stats", headers={"If-None-Match": etag})
+            assert reloaded.status_code == 200
+            assert reloaded.headers["ETag"] != etag
+
+            # 버전을 알 수 없으면 ETag 생략
+            version.return_value = "unversioned"
+            assert "ETag" not in client.get("/api/v1/graph/stats").headers
+
+    def test_etag_matching(self):
+        """약한 비교, 목록, 와일드카드"""
+        from backend.api.etag import etag_matches, make_etag
+
+        etag = make_etag("graph", "v1")
+        assert etag == make_etag("graph", "v1")
+        assert etag_matches(etag, etag)
+        assert etag_matches(etag.removeprefix("W/"), etag)
+        assert etag_matches(f'W/"x", {etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches(make_etag("graph", "v2"), etag)
+
+
+class TestConcurrencyLimits:
+    """라우트 그룹별 동시 실행 제한 테스트"""
+
+    async def test_queue_full_and_timeout_rejected(self):
+        """대기열 포화는 즉시, 대기 시간 초과는 timeout으로 거절"""
+        import asyncio
+
+        from backend.api.limits import ConcurrencyLimiter, ConcurrencyLimitError
+
+        limiter = ConcurrencyLimiter("test", max_concurrent=1, max_queue=1, queue_timeout=0.05)
+
+        async def hold(seconds: float):
+            async with limiter.slot():
+                await asyncio.sleep(seconds)
+
+        first = asyncio.create_task(hold(0.2))
+        await asyncio.sleep(0)
+        assert limiter.in_flight == 1
+
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+        try:
+            await limiter.acquire()
+        except ConcurrencyLimitError as e:
+            assert e.reason == "queue_full"
+            assert e.retry_after >= 1
+        else:
+            raise AssertionError("대기열 포화 시 ConcurrencyLimitError 발생해야 함")
+
+        try:
+            await waiting
+        except ConcurrencyLimitError as e:
+            assert e.reason == "timeout"
+        else:
+            raise AssertionError("대기 시간 초과 시 ConcurrencyLimitError 발생해야 함")
+
+        await first
+        assert limiter.stats()["rejected"] == {"queue_full": 1, "timeout": 1}
+        assert (limiter.in_flight, limiter.queue_depth) == (0, 0)
+
+    async def test_slot_handed_over_in_order(self):
+        """슬롯은 반환 즉시 대기 순서대로 넘어감"""
+        import asyncio
+
+        from backend.api.limits import ConcurrencyLimiter
+
+        limiter = ConcurrencyLimiter("test", max_concurrent=1, max_queue=4, queue_timeout=1.0)
+        order: list[int] = []
+
+        async def work(i: int):
+            async with limiter.slot():
+                order.append(i)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work(i) for i in range(4)))
+        assert order == [0, 1, 2, 3]
+        assert limiter.admitted == 4
+        assert limiter.in_flight == 0
+
+    def test_overloaded_route_returns_503(self):
+        """제한 초과 시 Neo4j에 도달하기 전에 503 + Retry-After, 메트릭 노출"""
+        from unittest.mock import AsyncMock
+
+        from backend.api.limits import ConcurrencyLimiter, limiters
+
+        full = ConcurrencyLimiter("graph_read", max_concurrent=0, max_queue=0, queue_timeout=1.0)
+        get_stats = AsyncMock(return_value={})
+        with (
+            patch.dict(limiters, {"graph_read": full}),
+            patch("backend.api.routers.graph.Neo4jService.get_stats", get_stats),
+        ):
+            response = client.get("/api/v1/graph/stats")
+            metrics = client.get("/metrics").text
+
+        assert response.status_code == 503
+        assert int(response.headers["Retry-After"]) >= 1
+        get_stats.assert_not_awaited()
+        assert 'hr_dss_limiter_rejected_total{group="graph_read",reason="queue_full"} 1' in metrics
+        assert 'hr_dss_limiter_queue_depth{group="agent"} 0' in metrics
+
+
+class TestStartup:
+    """기동 시간 (지연 import) 테스트"""
+
+    def test_import_time_within_budget(self):
+        """API 모듈 import 시간 예산 및 무거운 모듈 지연 로드"""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        script = Path(__file__).parent.parent / "scripts" / "bench_import_time.py"
+        result = subprocess.run(
+            [sys.executable, str(script), "--runs", "3", "--check"],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+
+    async def test_warm_up_loads_deferred_modules(self):
+        """워밍업은 에이전트와 지연 모듈을 미리 로드하고 그래프 오류는 무시"""
+        import sys
+        from unittest.mock import AsyncMock
+
+        from backend.api import pipeline
+        from backend.api.warmup import warm_up
+
+        failing = AsyncMock(side_effect=RuntimeError("neo4j down"))
+        with (
+            patch.object(pipeline, "_agents", None),
+            patch("backend.api.warmup.Neo4jService.get_graph_version", failing),
+        ):
+            await warm_up()
+            assert pipeline._agents is not None
+        failing.assert_awaited_once()
+        assert "jose.jwt" in sys.modules
+        assert "sse_starlette.sse" in sys.modules
+
+
+class TestBatchAnalysis:
+    """의사결정 일괄 분석 테스트"""
+
+    def test_batch_shares_kg_lookups(self):
+        """같은 조직/질문 유형의 KG 조회는 조직별로 한 번만 실행하고 항목별 결과를 순차 전달"""
+        from collections import Counter
+        from types import SimpleNamespace
+
+        from backend.api import pipeline
+
+        calls = Counter()
+
+        class StubKG:
+            def get_org_utilization(self, org_unit_id, start, end):
+                calls[org_unit_id] += 1
+                value = {"ORG-001": 0.95, "ORG-002": 0.6}[org_unit_id]
+                return SimpleNamespace(data=[{"orgUnitName": org_unit_id, "utilization": value}])
+
+            def get_capacity_forecast(self, org_unit_id, weeks=12):
+                gap = -2.0 if org_unit_id == "ORG-001" else 1.0
+                return SimpleNamespace(
+                    data=[
+                        {"weekLabel": f"W{w:02d}", "utilization": 0.9 - gap / 20, "gapFTE": gap}
+                        for w in range(1, weeks + 1)
+                    ]
+                )
+
+            def get_reallocation_candidates(self, org_unit_id, weeks=12):
+                return SimpleNamespace(data=[])
+
+        question = "향후 12주 가동률 병목 예측"
+        with (
+            TestClient(app) as c,
+            patch.object(pipeline, "get_kg_client", return_value=StubKG()),
+        ):
+            existing = [
+                c.post("/api/v1/decisions", json={"title": f"팀 {i}", "question": question}).json()[
+                    "id"
+                ]
+                for i in range(2)
+            ]
+            response = c.post(
+                "/api/v1/decisions/batch-analyze",
+                json={
+                    "items": [
+                        *({"decision_id": d, "org_unit_id": "ORG-001"} for d in existing),
+                        {"question": question, "org_unit_id": "ORG-002"},
+                    ]
+                },
+            )
+            assert response.status_code == 202
+            body = response.json()
+            assert body["decision_ids"][:2] == existing
+            assert len(body["decision_ids"]) == 3
+
+            job = _wait_for_job(c, body["job_id"])
+            assert job["status"] == "completed", job["error"]
+            result = job["result"]
+            assert (result["completed"], result["failed"]) == (3, 0)
+            assert calls == {"ORG-001": 1, "ORG-002": 1}
+            assert result["kg_lookups"] == {"lookups": 3, "executions": 2, "shared": 1}
+            assert sorted(e["data"]["index"] for e in job["progress"]) == [0, 1, 2]
+
+            created = c.get(f"/api/v1/decisions/{body['decision_ids'][2]}").json()
+            assert created["title"] == question
+            assert all(
+                c.get(f"/api/v1/decisions/{d}").json()["status"] == "analyzed"
+                for d in body["decision_ids"]
+            )
+
+    def test_batch_validation(self):
+        """빈 요청, 대상 미지정/중복 지정, 존재하지 않는 의사결정"""
+        url = "/api/v1/decisions/batch-analyze"
+        assert client.post(url, json={"items": []}).status_code == 400
+        assert client.post(url, json={"items": [{"org_unit_id": "ORG-001"}]}).status_code == 400
+        both = {"decision_id": "x", "question": "질문"}
+        assert client.post(url, json={"items": [both]}).status_code == 400
+        missing = {"items": [{"decision_id": "non-existent-id"}]}
+        assert client.post(url, json=missing).status_code == 404
+
+    def test_kg_lookup_cache_returns_copies(self):
+        """공유된 KG 결과를 한 분석이 수정해도 다른 분석에 영향 없음"""
+        from backend.agent_runtime.agents import KGLookupCache
+
+        cache = KGLookupCache()
+        calls = []
+
+        def load():
+            calls.append(1)
+            return {"utilization": {"current": 0.85}}
+
+        first = cache.get_or_load(("CAPACITY", "ORG-001"), load)
+        first["utilization"]["current"] = 0.1
+        second = cache.get_or_load(("CAPACITY", "ORG-001"), load)
+        assert second["utilization"]["current"] == 0.85
+        assert len(calls) == 1
+        cache.get_or_load(("CAPACITY", "ORG-002"), load)
+        assert cache.stats() == {"lookups": 3, "executions": 2, "shared": 1}
+
+
+class TestProfiling:
+    """관리자 옵트인 프로파일링 테스트"""
+
+    def _token(self, role: str) -> dict[str, str]:
+        from backend.api.dependencies import TokenPayload, create_access_token
+
+        token = create_access_token(TokenPayload(sub="ops", role=role))
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_admin_request_profiled_and_rate_limited(self):
+        """관리자 요청만 프로파일링, 간격 내 재요청은 프로파일 없이 처리"""
+        from backend.api.profiling import ProfileGate
+
+        async def slow_stats():
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                pass
+            return {"node_count": 0, "relationship_count": 0}
+
+        admin = {**self._token("admin"), "X-Profile": "1"}
+        with (
+            patch("backend.api.profiling.profile_gate", ProfileGate(min_interval=60)),
+            patch("backend.api.routers.graph.Neo4jService.get_stats", slow_stats),
+        ):
+            user = client.get(
+                "/api/v1/graph/stats", headers={**self._token("user"), "X-Profile": "1"}
+            )
+            assert user.status_code == 200
+            assert "X-Profile-ID" not in user.headers
+
+            profiled = client.get("/api/v1/graph/stats", headers=admin)
+            assert profiled.status_code == 200
+            profile_id = profiled.headers["X-Profile-ID"]
+
+            limited = client.get("/api/v1/graph/stats", params={"_profile": "1"}, headers=admin)
+            assert limited.status_code == 200
+            assert limited.headers["X-Profile-Status"] == "rate_limited"
+            assert "X-Profile-ID" not in limited.headers
+
+        folded = client.get(f"/api/v1/profiles/{profile_id}", headers=self._token("admin"))
+        assert folded.status_code == 200
+        lines = folded.text.splitlines()
+        assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert "slow_stats" in folded.text
+
+        listing = client.get("/api/v1/profiles", headers=self._token("admin")).json()
+        assert listing["items"][0]["profile_id"] == profile_id
+        assert listing["items"][0]["path"] == "/api/v1/graph/stats"
+
+    def test_profiles_admin_only(self):
+        """프로파일 조회는 관리자만"""
+        assert client.get("/api/v1/profiles").status_code == 401
+        assert client.get("/api/v1/profiles", headers=self._token("user")).status_code == 403
+
+
+class TestTokenCache:
+    """검증된 JWT 캐시 테스트"""
+
+    def test_cached_until_expiry(self):
+        """같은 토큰은 한 번만 디코딩하고, 캐시 항목의 exp가 지나면 다시 검증"""
+        from datetime import timedelta
+
+        from backend.api import dependencies
+        from backend.api.dependencies import TokenPayload, create_access_token, verify_token
+
+        token = create_access_token(TokenPayload(sub="dashboard"), timedelta(minutes=5))
+        decode = patch.object(dependencies, "_decode_token", wraps=dependencies._decode_token)
+        with decode as spy:
+            assert verify_token(token).sub == "dashboard"
+            assert verify_token(token).sub == "dashboard"
+            assert spy.call_count == 1
+
+            digest = dependencies._token_digest(token)
+            _, data = dependencies.token_cache.get(digest)
+            dependencies.token_cache.set(digest, (time.time() - 1, data))
+            assert verify_token(token).sub == "dashboard"
+            assert spy.call_count == 2
+
+        expired = create_access_token(TokenPayload(sub="old"), timedelta(seconds=-1))
+        try:
+            verify_token(expired)
+        except dependencies.HTTPException as e:
+            assert e.status_code == 401
+        else:
+            raise AssertionError("만료된 토큰은 거부되어야 함")
+        assert dependencies.token_cache.get(dependencies._token_digest(expired)) is None
+
+    def test_revoked_token_rejected(self):
+        """폐기된 토큰은 캐시에 있어도 거부"""
+        from backend.api.dependencies import (
+            TokenPayload,
+            create_access_token,
+            revoke_token,
+            verify_token,
+        )
+
+        token = create_access_token(TokenPayload(sub="leaked", role="admin"))
+        headers = {"Authorization": f"Bearer {token}"}
+        assert verify_token(token).role == "admin"
+        assert client.get("/api/v1/profiles", headers=headers).status_code == 200
+
+        revoke_token(token)
+        response = client.get("/api/v1/profiles", headers=headers)
+        assert response.status_code == 401
+        assert response.json()["detail"] == "폐기된 토큰입니다"
+
+
+class TestImpactSweep:
+    """영향도 파라미터 스윕 테스트"""
+
+    OPTIONS = [
+        {"option_id": f"OPT-{t}", "name": t, "option_type": t}
+        for t in ("CONSERVATIVE", "BALANCED", "AGGRESSIVE")
+    ]
+
+    def test_sweep_grid_tornado_break_even(self):
+        """그리드 × 대안 점수, 토네이도, 손익분기점 반환"""
+        response = client.post(
+            "/api/v1/agents/impact-simulator/sweep",
+            json={
+                "query_type": "GO_NOGO",
+                "options": self.OPTIONS,
+                "baseline": {"utilization": 0.85},
+                "ranges": {
+                    "utilization": {"low": 0.6, "high": 1.0, "steps": 9},
+                    "risk": [0.0, 0.2, 0.4, 0.6],
+                },
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["parameters"] == ["utilization", "risk"]
+        scores = data["grid"]["scores"]["OPT-BALANCED"]
+        assert len(scores) == 9 and all(len(row) == 4 for row in scores)
+        assert len(data["grid"]["best_option"]) == 9
+
+        bars = data["tornado"]["OPT-CONSERVATIVE"]
+        assert [bar["swing"] for bar in bars] == sorted(
+            (bar["swing"] for bar in bars), reverse=True
+        )
+        assert bars[0]["parameter"] == "risk"
+
+        # 리스크가 낮으면 조건부 Go, 높아지면 No-Go가 최적
+        changes = data["break_even"]["risk"]["best_option_changes"]
+        assert changes[0]["from_option"] == "OPT-BALANCED"
+        assert changes[0]["to_option"] == "OPT-CONSERVATIVE"
+        assert 0.0 < changes[0]["value"] < 0.6
+
+    def test_sweep_matches_simulate(self):
+        """스윕 기준점 점수 = simulate 점수, 그리드 상한 초과/모델이 읽지 않는 파라미터는 400"""
+        from backend.api.pipeline import get_agents
+
+        agent = get_agents()["impact_simulator"]
+        baseline = {"utilization": 0.92, "cost": 100000000}
+        result = agent.sweep("CAPACITY", self.OPTIONS, baseline, {"risk": [0.1, 0.3, 0.5]})
+        point = agent.simulate("CAPACITY", self.OPTIONS, baseline, samples=0)
+        for score, analysis in zip(result.base_scores, point.analyses, strict=True):
+            assert abs(score - analysis.overall_impact_score) < 1e-9
+
+        with patch("backend.api.routers.agents.settings.sweep_max_points", 10):
+            response = client.post(
+                "/api/v1/agents/impact-simulator/sweep",
+                json={
+                    "query_type": "CAPACITY",
+                    "options": self.OPTIONS,
+                    "ranges": {"utilization": {"low": 0.5, "high": 1.0, "steps": 20}},
+                },
+            )
+        assert response.status_code == 400
+
+        response = client.post(
+            "/api/v1/agents/impact-simulator/sweep",
+            json={
+                "query_type": "CAPACITY",
+                "options": self.OPTIONS,
+                "ranges": {"gap_fte": [1, 2, 3], "utilization": [0.8, 0.9]},
+            },
+        )
+        assert response.status_code == 400
+        assert "gap_fte" in response.json()["detail"]
+
+
+class TestSimulationCache:
+    """영향도 시뮬레이션 결과 캐시 테스트"""
+
+    OPTIONS = [
+        {"option_id": f"OPT-{t}", "name": t, "option_type": t}
+        for t in ("CONSERVATIVE", "BALANCED", "AGGRESSIVE")
+    ]
+
+    def test_shared_across_workers(self):
+        """같은 저장소를 쓰는 다른 인스턴스(워커)에서도 적중, 무관한 입력 변경은 같은 키"""
+        from dataclasses import replace
+
+        from backend.agent_runtime.agents.impact_simulator import ImpactSimulatorAgent
+        from backend.agent_runtime.agents.simulation_cache import SimulationCache
+        from backend.agent_runtime.state import InMemoryStateStore
+
+        store = InMemoryStateStore()
+        worker_a = ImpactSimulatorAgent(mc_samples=2000, mc_seed=0, cache=SimulationCache(store))
+        worker_b = ImpactSimulatorAgent(mc_samples=2000, mc_seed=0, cache=SimulationCache(store))
+
+        baseline = {"utilization": 0.9, "cost": 100000000}
+        first = worker_a.simulate("CAPACITY", self.OPTIONS, baseline, 12)
+
+        tweaked = [{**option, "actions": [{"type": "REALLOCATE"}]} for option in self.OPTIONS]
+        with patch.object(ImpactSimulatorAgent, "_simulate") as simulate:
+            second = worker_b.simulate(
+                "CAPACITY", tweaked, {**baseline, "employees": ["EMP-001"]}, 12
+            )
+            simulate.assert_not_called()
+
+        assert worker_b.cache.stats()["hits"] == 1
+        assert second.baseline["employees"] == ["EMP-001"]
+        assert worker_b.to_dict(second)["analyses"] == worker_a.to_dict(first)["analyses"]
+        assert second.simulated_at == first.simulated_at  # 계산 시각 유지
+
+        # 구간은 백분위 키로 조회 (캐시 왕복/순서 변경과 무관)
+        summary = first.analyses[0].monte_carlo
+        reordered = replace(summary, percentiles=dict(reversed(summary.percentiles.items())))
+        assert reordered.interval == summary.interval
+        assert summary.interval == (
+            round(summary.percentiles["p5"], 1),
+            round(summary.percentiles["p95"], 1),
+        )
+        assert [a.monte_carlo.interval for a in second.analyses] == [
+            a.monte_carlo.interval for a in first.analyses
+        ]
+
+        # 결과에 영향을 주는 입력이 바뀌면 새로 계산
+        worker_b.simulate("CAPACITY", self.OPTIONS, {**baseline, "utilization": 0.8}, 12)
+        assert worker_b.cache.stats()["misses"] == 1
+
+    def test_bounded_with_eviction_metrics(self):
+        """최대 항목 수 초과 시 오래된 항목 삭제, /metrics에 캐시 통계 노출"""
+        from backend.agent_runtime.agents.impact_simulator import ImpactSimulatorAgent
+        from backend.agent_runtime.agents.simulation_cache import SimulationCache
+
+        cache = SimulationCache(max_size=4)
+        agent = ImpactSimulatorAgent(cache=cache)
+        for i in range(10):
+            agent.simulate("CAPACITY", self.OPTIONS, {"utilization": 0.5 + i / 100})
+
+        stats = cache.stats()
+        assert stats["size"] <= 4
+        assert stats["evictions"] == 10 - stats["size"]
+
+        # 시드 없는 Monte Carlo는 캐시하지 않음
+        agent.simulate("CAPACITY", self.OPTIONS, {"utilization": 0.9}, samples=100)
+        assert cache.stats()["misses"] == 10
+
+        body = client.get("/metrics").text
+        assert 'hr_dss_cache_evictions_total{cache="impact_simulation"}' in body
+
+
+class TestPortfolioGoNoGo:
+    """포트폴리오 Go/No-go 테스트"""
+
+    def test_portfolio_frontier(self):
+        """기회 일괄 평가 후 효율적 경계와 추천 조합 반환"""
+        opportunities = [
+            {
+                "opportunity_id": f"OPP-{i}",
+                "name": f"기회 {i}",
+                "deal_value": 1e9 * (i + 1),
+                "required_fte": 3.0,
+                "start_week": "W03",
+                "duration_weeks": 6,
+                "competency_match_score": 0.9,
+            }
+            for i in range(4)
+        ]
+        response = client.post(
+            "/api/v1/agents/go-nogo/portfolio",
+            json={
+                "opportunities": opportunities,
+                "capacity_fte": 20,
+                "committed_fte": [12] * 12,
+                "weeks": 12,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert [o["peak_fte"] for o in data["opportunities"]] == [3.0] * 4
+        assert all(0.05 <= o["success_probability"] <= 0.95 for o in data["opportunities"])
+        # 목표 가동률 90% (18 FTE) 안에서는 2건까지, 가장 큰 두 건 선택
+        assert sorted(data["recommended"]["selected"]) == ["OPP-2", "OPP-3"]
+        assert data["frontier"][-1]["peak_utilization"] > 0.9
+
+    def test_invalid_capacity_length(self):
+        """주차 수와 맞지 않는 capacity_fte는 400"""
+        response = client.post(
+            "/api/v1/agents/go-nogo/portfolio",
+            json={
+                "opportunities": [{"deal_value": 1e9, "required_fte": 1}],
+                "capacity_fte": [10, 10],
+                "weeks": 12,
+            },
+        )
+        assert response.status_code == 400
+
+    def test_null_fields_default_to_zero(self):
+        """null 값은 빠진 값으로 처리 (500이 아닌 정상 응답)"""
+        response = client.post(
+            "/api/v1/agents/go-nogo/portfolio",
+            json={
+                "opportunities": [
+                    {"opportunity_id": "OPP-NULL", "deal_value": None, "required_fte": None},
+                    {"deal_value": 1e9, "weekly_fte": [1, None, 2, None], "start_week": None},
+                ],
+                "capacity_fte": 10,
+                "weeks": 4,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [o["peak_fte"] for o in data["opportunities"]] == [0.0, 2.0]
+        assert data["opportunities"][0]["deal_value"] == 0.0
+
+
+class TestOptionRank:
+    """대안 순위화 API 테스트"""
+
+    def test_rank_pareto(self):
+        """지배되는 대안은 파레토 집합에서 제외되고 프로필에 따라 순위 변경"""
+        options = [
+            {"option_id": "A", "scores": {"impact": 80, "risk": 60, "cost": 70}},
+            {"option_id": "B", "scores": {"impact": 50, "risk": 20, "cost": 20}},
+            {"option_id": "C", "scores": {"impact": 45, "risk": 30, "cost": 30}},
+        ]
+        response = client.post("/api/v1/agents/options/rank", json={"options": options})
+        assert response.status_code == 200
+        data = response.json()
+
+        assert sorted(data["pareto_option_ids"]) == ["A", "B"]
+        assert data["ranked"][-1] == {
+            "rank": 3,
+            "option_id": "C",
+            "utility": data["ranked"][-1]["utility"],
+            "pareto_optimal": False,
+            "dominated_by": 1,
+        }
+
+        response = client.post(
+            "/api/v1/agents/options/rank",
+            json={"options": options, "weight_profile": {"impact": 1}},
+        )
+        assert response.json()["recommendation"] == "A"
+
+    def test_invalid_profile(self):
+        """알 수 없는 프로필은 400"""
+        response = client.post(
+            "/api/v1/agents/options/rank",
+            json={"options": [{"option_id": "A"}], "weight_profile": "unknown"},
+        )
+        assert response.status_code == 400
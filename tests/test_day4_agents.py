@@ -14,9 +14,25 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # Agent imports
 try:
+    from backend.agent_runtime.agents.headcount_planner import HeadcountPlanner, PlanningCosts
     from backend.agent_runtime.agents.impact_simulator import ImpactSimulatorAgent
     from backend.agent_runtime.agents.option_generator import OptionGeneratorAgent, OptionType
+    from backend.agent_runtime.agents.option_ranking import CRITERIA, OptionRanker, dominance_counts
+    from backend.agent_runtime.agents.portfolio import PortfolioOptimizer
     from backend.agent_runtime.agents.query_decomposition import QueryDecompositionAgent, QueryType
+    from backend.agent_runtime.agents.reallocation import (
+        DemandGap,
+        ReallocationOptimizer,
+        StaffMember,
+    )
+    from backend.agent_runtime.agents.success_model import (
+        DEFAULT_LABELED_DIR,
+        FEATURES,
+        SuccessModel,
+        SuccessPredictor,
+        load_training_set,
+        train_success_model,
+    )
     from backend.agent_runtime.agents.success_probability import SuccessProbabilityAgent
     from backend.agent_runtime.agents.validator import ValidatorAgent
     from backend.agent_runtime.agents.workflow_builder import WorkflowBuilderAgent
@@ -130,6 +146,159 @@ class TestOptionGenerator:
         option_ids = {opt.option_id for opt in result.options}
         assert result.recommendation in option_ids, "Recommendation not in options"
 
+    def test_capacity_reallocation_actions(self, agent):
+        """보수적 대안이 직원별 재배치 액션/리소스 배분을 포함"""
+        context = {
+            "bottleneck_weeks": ["W05", "W06", "W07"],
+            "gap_fte": 0.6,
+            "available_resources": [
+                {"employee_id": "EMP-001", "name": "김철수", "available_fte": 0.5},
+                {"employee_id": "EMP-002", "name": "이영희", "available_fte": 0.3},
+            ],
+        }
+        result = agent.generate_options("CAPACITY", context, {})
+        conservative = result.options[0]
+
+        allocations = {ra.employee_id: ra for ra in conservative.resource_allocations}
+        assert allocations["EMP-001"].allocation_fte == 0.5
+        assert (allocations["EMP-001"].start_date, allocations["EMP-001"].end_date) == (
+            "W05",
+            "W07",
+        )
+        assert sum(ra.allocation_fte for ra in allocations.values()) == pytest.approx(0.6)
+        assert "EMP-001" in conservative.actions[0]
+        assert agent.to_dict(result)["options"][0]["resource_allocations"]
+
+    def test_capacity_without_staff_keeps_template(self, agent):
+        """직원 데이터가 없으면 기존 템플릿 액션 유지"""
+        result = agent.generate_options("CAPACITY", {"gap_fte": 3}, {})
+
+        assert result.options[0].resource_allocations == []
+        assert "유휴 인력 1명" in result.options[0].actions[0]
+
+
+@pytest.mark.day4
+@pytest.mark.skipif(not AGENTS_AVAILABLE, reason="Agent modules not available")
+class TestReallocationOptimizer:
+    """Capacity 재배치 최적화 검증"""
+
+    @pytest.fixture
+    def optimizer(self):
+        return ReallocationOptimizer()
+
+    def test_prefers_fewer_moves(self, optimizer):
+        """전 주차를 혼자 메울 수 있는 직원 1명을 주차별 부분 가용 인력보다 우선"""
+        staff = [
+            StaffMember("EMP-A", available_fte={"W01": 1.0}),
+            StaffMember("EMP-B", available_fte={"W02": 1.0}),
+            StaffMember("EMP-C", available_fte=1.0),
+        ]
+        demand = [DemandGap("W01", 1.0), DemandGap("W02", 1.0)]
+        plan = optimizer.solve(staff, demand)
+
+        assert [r.employee_id for r in plan.reassignments] == ["EMP-C"]
+        assert plan.coverage_ratio == pytest.approx(1.0)
+
+    def test_competency_and_expert_protection(self, optimizer):
+        """역량 미달자는 제외하고, 요구 레벨에 가까운 직원을 상위 전문가보다 우선"""
+        staff = [
+            StaffMember("EMP-LOW", available_fte=1.0, competencies={"PY": 2}),
+            StaffMember("EMP-EXPERT", available_fte=1.0, competencies={"PY": 5}),
+            StaffMember("EMP-FIT", available_fte=1.0, competencies={"PY": 3}),
+        ]
+        plan = optimizer.solve(staff, [DemandGap("W01", 1.5, "PY", min_level=3)])
+
+        assert [r.employee_id for r in plan.reassignments] == ["EMP-FIT", "EMP-EXPERT"]
+        assert plan.reassignments[1].fte == [pytest.approx(0.5)]
+
+    def test_scarce_competency_first_and_uncovered(self, optimizer):
+        """희소 역량 수요가 범용 수요보다 먼저 배정되고, 남은 부족분은 미충족으로 보고"""
+        staff = [StaffMember("EMP-ML", available_fte=1.0, competencies={"ML": 4})]
+        demand = [DemandGap("W01", 1.0), DemandGap("W01", 1.0, "ML")]
+        plan = optimizer.solve(staff, demand)
+
+        assert plan.reassignments[0].competency_id == "ML"
+        assert plan.uncovered_by_week == {"W01": pytest.approx(1.0)}
+        assert plan.coverage_ratio == pytest.approx(0.5)
+
+    def test_thousands_of_employees(self, optimizer):
+        """5천 명 × 26주 배정 (처리 시간은 scripts/bench_agents.py)"""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        weeks = [f"W{i:02d}" for i in range(1, 27)]
+        staff = [
+            StaffMember(
+                f"EMP-{i:05d}",
+                org_unit_id=f"ORG-{i % 30:02d}",
+                available_fte=dict(
+                    zip(weeks, rng.uniform(0, 0.5, len(weeks)).tolist(), strict=True)
+                ),
+                competencies={f"C{c}": int(rng.integers(1, 6)) for c in rng.choice(20, 3)},
+            )
+            for i in range(5000)
+        ]
+        demand = [DemandGap(w, 5.0, f"C{c}") for w in weeks for c in range(5)]
+        demand += [DemandGap(w, 20.0) for w in weeks]
+
+        plan = optimizer.solve(staff, demand, target_org_unit_id="ORG-01")
+
+        assert plan.coverage_ratio == pytest.approx(1.0)
+
+
+@pytest.mark.day4
+@pytest.mark.skipif(not AGENTS_AVAILABLE, reason="Agent modules not available")
+class TestOptionRanking:
+    """파레토 프런티어 대안 순위화 검증"""
+
+    def test_dominance_matches_brute_force(self):
+        """지배 수가 전수 비교와 일치 (동점/중복 포함)"""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        directions = np.array([1, 1, -1, -1, -1])
+        for _ in range(20):
+            matrix = rng.integers(0, 4, size=(int(rng.integers(1, 60)), 5)).astype(float)
+            values = matrix * directions
+            expected = [
+                sum(bool((other >= row).all() and (other > row).any()) for other in values)
+                for row in values
+            ]
+            assert dominance_counts(matrix).tolist() == expected
+
+    def test_weight_profile_changes_recommendation(self):
+        """제약조건의 가중치 프로필로 추천 변경, 잘못된 프로필은 기본값"""
+        agent = OptionGeneratorAgent()
+        context = {"opportunity": {"name": "테스트 기회", "deal_value": 5000000000}}
+
+        default = agent.generate_options("HEADCOUNT", context, {})
+        cost_saving = agent.generate_options(
+            "HEADCOUNT", context, {"weight_profile": "cost_saving"}
+        )
+        invalid = agent.generate_options("HEADCOUNT", context, {"weight_profile": "unknown"})
+
+        assert default.recommendation == "HC-OPT-02"
+        assert cost_saving.recommendation == "HC-OPT-01"
+        assert invalid.recommendation == default.recommendation
+        assert cost_saving.ranking["profile"] == "cost_saving"
+        assert cost_saving.ranking["ranked"][0]["option_id"] == cost_saving.recommendation
+
+    def test_thousands_of_options(self):
+        """5000개 대안 순위화, 1위는 파레토 최적 (처리 시간은 scripts/bench_agents.py)"""
+        import numpy as np
+
+        rng = np.random.default_rng(1)
+        options = [
+            {"option_id": f"OPT-{i}", "scores": dict(zip(CRITERIA, row, strict=True))}
+            for i, row in enumerate(rng.uniform(0, 100, size=(5000, 5)).tolist())
+        ]
+
+        ranking = OptionRanker({"impact": 1, "cost": 1}).rank(options)
+
+        assert ranking.dominated_by[ranking.recommended_index] == 0
+        assert 0 < len(ranking.pareto_ids) < len(options)
+        assert ranking.to_dict(top_k=10)["ranked"][0]["option_id"] == ranking.recommended
+
 
 @pytest.mark.day4
 @pytest.mark.skipif(not AGENTS_AVAILABLE, reason="Agent modules not available")
@@ -170,6 +339,238 @@ class TestImpactSimulator:
 
         assert hasattr(result.analyses[0], "time_series"), "Missing time_series"
 
+    def test_time_series_arrays(self, agent):
+        """시계열은 배열로 보관하고 응답 변환 시에만 주차별 dict로 펼침"""
+        options = [
+            {"option_id": f"OPT-{t}", "option_type": t, "name": t}
+            for t in ("CONSERVATIVE", "BALANCED", "AGGRESSIVE")
+        ]
+        result = agent.simulate("CAPACITY", options, {"utilization": 0.9}, 52)
+
+        for analysis in result.analyses:
+            series = analysis.time_series["utilization"]
+            assert len(series) == 52
+            assert series.to_be[-1] == pytest.approx(analysis.metrics[0].to_be_value)
+
+        aggressive = result.analyses[2].time_series["utilization"]
+        assert (aggressive.to_be[:26] == aggressive.as_is[:26]).all()  # 후반부터 변화
+
+        points = agent.to_dict(result)["analyses"][1]["time_series"]["utilization"]
+        assert points[0] == {"period": "W01", "as_is": 90.0, "to_be": pytest.approx(89.826923)}
+        assert points[-1]["period"] == "W52"
+
+    def test_monte_carlo_intervals(self, agent):
+        """Monte Carlo: 실제 백분위 구간과 개선/최적 확률"""
+        options = [
+            {"option_id": f"OPT-{t}", "option_type": t, "name": t}
+            for t in ("CONSERVATIVE", "BALANCED", "AGGRESSIVE")
+        ]
+        baseline = {"utilization": 0.92, "cost": 100000000, "risk": 0.3}
+        result = agent.simulate("CAPACITY", options, baseline, 12, samples=20000, seed=7)
+
+        for analysis in result.analyses:
+            mc = analysis.monte_carlo
+            assert mc.percentiles["p5"] <= mc.percentiles["p50"] <= mc.percentiles["p95"]
+            assert analysis.confidence_interval == mc.interval
+            assert 0.0 <= mc.prob_improvement <= 1.0
+        assert sum(a.monte_carlo.prob_best for a in result.analyses) == pytest.approx(1.0)
+
+        again = agent.simulate("CAPACITY", options, baseline, 12, samples=20000, seed=7)
+        assert [a.confidence_interval for a in again.analyses] == [
+            a.confidence_interval for a in result.analyses
+        ]
+        assert agent.to_dict(result)["analyses"][0]["monte_carlo"]["samples"] == 20000
+
+    def test_monte_carlo_matches_point_estimate(self, agent):
+        """Monte Carlo: 분산 0 분포면 점추정 점수와 일치"""
+        from backend.agent_runtime.agents.monte_carlo import Distribution
+
+        options = [
+            {"option_id": f"OPT-{t}", "option_type": t, "name": t}
+            for t in ("CONSERVATIVE", "BALANCED", "AGGRESSIVE")
+        ]
+        baseline = {"utilization": 0.9, "headcount": 10}
+        for query_type in ("CAPACITY", "GO_NOGO", "HEADCOUNT", "COMPETENCY_GAP"):
+            inputs = agent._resolve_inputs(query_type, baseline)
+            fixed = {key: Distribution.fixed(value) for key, value in inputs.items()}
+            result = agent.simulate(query_type, options, baseline, samples=100, distributions=fixed)
+            for analysis in result.analyses:
+                assert analysis.monte_carlo.percentiles["p50"] == pytest.approx(
+                    analysis.overall_impact_score
+                )
+
+    def test_monte_carlo_100k_samples(self, agent):
+        """Monte Carlo: 대안별 10만 샘플 (처리 시간은 scripts/bench_agents.py)"""
+        options = [
+            {"option_id": f"OPT-{t}", "option_type": t, "name": t}
+            for t in ("CONSERVATIVE", "BALANCED", "AGGRESSIVE")
+        ]
+        baseline = {"deal_value": 800000000, "utilization": 0.8, "margin": 0.2}
+        result = agent.simulate("GO_NOGO", options, baseline, samples=100_000)
+
+        assert all(a.monte_carlo.samples == 100_000 for a in result.analyses)
+
+
+@pytest.mark.day4
+@pytest.mark.skipif(not AGENTS_AVAILABLE, reason="Agent modules not available")
+class TestPortfolioOptimizer:
+    """포트폴리오 Go/No-go 최적화 검증"""
+
+    @pytest.fixture
+    def optimizer(self):
+        return PortfolioOptimizer()
+
+    def test_select_near_optimal(self):
+        """작은 문제에서 전수 탐색 최적해 대비 95% 이상, 주차별 여유 준수"""
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        masks = ((np.arange(1 << 10)[:, None] >> np.arange(10)) & 1).astype(float)
+        ratios = []
+        for _ in range(30):
+            values = rng.uniform(1, 10, 10)
+            demand = rng.uniform(0, 3, (10, 6)) * (rng.random((10, 6)) < 0.6)
+            headroom = rng.uniform(3, 8, 6)
+
+            selected = PortfolioOptimizer.select(values, demand, headroom)
+            assert np.all(demand[selected].sum(axis=0) <= headroom + 1e-9)
+            feasible = np.all(masks @ demand <= headroom + 1e-9, axis=1)
+            ratios.append(values[selected].sum() / (masks @ values)[feasible].max())
+
+        assert min(ratios) >= 0.95
+        assert np.mean(ratios) >= 0.99
+
+    def test_frontier_and_recommendation(self, optimizer):
+        """효율적 경계는 가동률/기대 매출이 함께 증가, 추천은 목표 가동률 이내 (배열 입력 동일)"""
+        import numpy as np
+
+        opportunities = [
+            {
+                "opportunity_id": f"OPP-{i:02d}",
+                "deal_value": 1e9 * (i + 1),
+                "success_probability": 0.5,
+                "required_fte": 2.0 + i % 3,
+                "start_week": i % 8,
+                "duration_weeks": 4,
+            }
+            for i in range(12)
+        ]
+        result = optimizer.evaluate(opportunities, capacity_fte=20, committed_fte=12, weeks=12)
+        as_arrays = optimizer.evaluate(
+            opportunities, capacity_fte=np.full(12, 20.0), committed_fte=np.full(12, 12.0), weeks=12
+        )
+        assert as_arrays.recommended.selected == result.recommended.selected
+
+        peaks = [p.peak_utilization for p in result.frontier]
+        revenues = [p.expected_revenue for p in result.frontier]
+        assert peaks == sorted(peaks) and revenues == sorted(revenues)
+        assert len(set(revenues)) == len(revenues)
+        assert result.recommended.peak_utilization <= 0.9
+        assert result.recommended.expected_revenue == max(
+            p.expected_revenue for p in result.frontier if p.peak_utilization <= 0.9
+        )
+
+    def test_batch_scores_with_success_agent(self, optimizer):
+        """성공 확률 미지정 기회는 SuccessProbabilityAgent로 일괄 평가"""
+        context = {"available_fte": 5, "required_fte": 5, "is_existing_customer": True}
+        weeks = [f"W{i:02d}" for i in range(1, 13)]
+        scored = optimizer.score([{"opportunity_id": "OPP-A", "deal_value": 1e9, **context}], weeks)
+        expected = optimizer.probability_agent.calculate_probability(
+            "OPPORTUNITY", "OPP-A", "OPP-A", context
+        )
+
+        assert scored[0].success_probability == expected.success_probability
+        assert scored[0].demand.tolist() == [5.0] * 12
+
+    def test_hundreds_of_opportunities(self, optimizer):
+        """500개 기회 × 52주 효율적 경계 (처리 시간은 scripts/bench_agents.py)"""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        opportunities = [
+            {
+                "opportunity_id": f"OPP-{i:03d}",
+                "deal_value": float(rng.uniform(1e8, 1e10)),
+                "required_fte": float(rng.uniform(0.5, 6)),
+                "start_week": int(rng.integers(0, 40)),
+                "duration_weeks": int(rng.integers(4, 20)),
+            }
+            for i in range(500)
+        ]
+        result = optimizer.evaluate(opportunities, capacity_fte=120, committed_fte=80, weeks=52)
+
+        assert result.recommended is not None
+
+
+@pytest.mark.day4
+@pytest.mark.skipif(not AGENTS_AVAILABLE, reason="Agent modules not available")
+class TestHeadcountPlanner:
+    """다기간 증원 계획 DP 검증"""
+
+    GAP = [0, 0, 0, 0, 1, 2, 3, 3] + [3] * 16
+
+    def test_contractor_dp_matches_brute_force(self):
+        """채용 없는 계획의 외주 일정이 전수 탐색 최소 비용과 일치"""
+        import itertools
+
+        import numpy as np
+
+        costs = PlanningCosts(max_contractors=2, max_hires=0)
+        gap = np.random.default_rng(3).uniform(0, 2.5, 12)
+        plan = HeadcountPlanner(costs).plan(gap, reassign_fte=0.3)[0]
+
+        best = np.inf
+        for seq in itertools.product(range(3), repeat=10):
+            contractors = np.array((0, 0, *seq), dtype=float)
+            remaining = np.clip(gap - contractors, 0, None)
+            reassigned = np.minimum(remaining, 0.3)
+            onboarded = np.clip(np.diff(contractors, prepend=0), 0, None).sum()
+            best = min(
+                best,
+                costs.contractor_weekly * contractors.sum()
+                + costs.contractor_onboarding * onboarded
+                + costs.reassign_weekly * reassigned.sum()
+                + costs.shortfall_weekly * (remaining - reassigned).sum(),
+            )
+        assert plan.total_cost == pytest.approx(best)
+
+    def test_plans_respect_lead_time_and_ramp(self):
+        """채용은 리드타임 후 합류해 온보딩 기간 동안 선형 증가, 비용 최소안이 가장 저렴"""
+        plans = HeadcountPlanner().plan(self.GAP, reassign_fte=0.5)
+        by_type = {plan.option_type: plan for plan in plans}
+
+        hired = by_type["AGGRESSIVE"]
+        assert hired.hires > 0 and hired.contractor_fte.sum() == 0
+        arrival = hired.arrival
+        assert hired.hire_fte[:arrival].sum() == 0
+        assert hired.hire_fte[arrival] == pytest.approx(hired.hires / 8)
+        assert hired.hire_fte[arrival + 7] == pytest.approx(hired.hires)
+
+        assert by_type["CONSERVATIVE"].hires == 0
+        assert by_type["BALANCED"].total_cost <= min(plan.total_cost for plan in plans)
+
+        with pytest.raises(ValueError):
+            HeadcountPlanner().plan([1.0] * 8)
+
+    def test_plans_feed_impact_simulator(self):
+        """증원 대안이 일정을 포함하고, 시뮬레이터가 일정 기반으로 계산"""
+        context = {"gap_series": self.GAP, "reassign_fte": 0.5, "headcount": 20}
+        options = OptionGeneratorAgent().to_dict(
+            OptionGeneratorAgent().generate_options("HEADCOUNT", context, {})
+        )["options"]
+        assert all(option["schedule"] for option in options)
+
+        simulator = ImpactSimulatorAgent()
+        result = simulator.simulate("HEADCOUNT", options, {"headcount": 20, "utilization": 0.95})
+        for option, analysis in zip(options, result.analyses, strict=True):
+            metrics = {m.name: m for m in analysis.metrics}
+            schedule = option["schedule"]
+            assert metrics["인원"].to_be_value == 20 + schedule["hires"]
+            assert metrics["인건비"].to_be_value == 500000000 + schedule["total_cost"]
+            utilization = analysis.time_series["utilization"]
+            assert len(utilization) == len(self.GAP)
+            assert utilization.to_be[0] == pytest.approx(95.0)
+
 
 @pytest.mark.day4
 @pytest.mark.skipif(not AGENTS_AVAILABLE, reason="Agent modules not available")
@@ -212,6 +613,171 @@ class TestSuccessProbability:
             assert hasattr(factor, "weight"), "Factor missing weight"
             assert hasattr(factor, "score"), "Factor missing score"
 
+    def test_batch_matches_scalar(self, agent):
+        """일괄 계산이 대상별 계산과 같은 결과 (요인/리스크/문구 포함)"""
+        import random
+
+        rng = random.Random(0)
+        contexts = []
+        for _ in range(300):
+            context = {
+                "project_type": rng.choice(["AI/ML", "CONSULTING", "UNKNOWN"]),
+                "available_fte": rng.choice([0, 2, rng.uniform(0, 8)]),
+                "required_fte": rng.choice([0, 1, rng.uniform(0.5, 8)]),
+                "competency_match_score": rng.choice([0.8, rng.random()]),
+                "historical_project_count": rng.randint(0, 10),
+                "is_existing_customer": rng.choice([True, False]),
+                "planned_duration_weeks": rng.choice([0, 12, 24]),
+                "buffer_weeks": rng.randint(0, 5),
+                "similar_project_count": rng.randint(0, 8),
+                "tech_complexity": rng.choice(["MEDIUM", "HIGH"]),
+                "current_utilization": rng.uniform(0.5, 1.1),
+                "data_completeness": rng.random(),
+            }
+            # 일부 키는 빠진 채로 (기본값 경로)
+            contexts.append({k: v for k, v in context.items() if rng.random() < 0.8})
+        ids = [f"PRJ-{i}" for i in range(len(contexts))]
+
+        expected = [
+            agent.to_dict(agent.calculate_probability("PROJECT", i, i, c))
+            for i, c in zip(ids, contexts, strict=True)
+        ]
+        batch = [agent.to_dict(r) for r in agent.calculate_batch("PROJECT", ids, ids, contexts)]
+        for row in expected + batch:
+            row.pop("calculated_at")
+
+        assert batch == expected
+        assert agent.score_batch(contexts).probabilities() == [
+            row["success_probability"] for row in expected
+        ]
+
+
+@pytest.mark.day4
+@pytest.mark.skipif(not AGENTS_AVAILABLE, reason="Agent modules not available")
+class TestSuccessModel:
+    """라벨 결과로 학습한 성공 확률 모델 검증"""
+
+    @pytest.fixture
+    def training(self):
+        """프로젝트 라벨 + 착수 시점 컨텍스트 (성공 프로젝트일수록 인력/역량 여유)"""
+        import json
+
+        path = DEFAULT_LABELED_DIR / "project_outcomes.json"
+        labels = json.loads(path.read_text(encoding="utf-8"))["labels"]
+        level = {"SUCCESS": 1.0, "PARTIAL": 0.5, "FAILURE": 0.0}
+        contexts = {
+            label["subjectId"]: {
+                "available_fte": 2 + 2 * level[label["label"]] + (i % 3) * 0.5,
+                "required_fte": 4,
+                "competency_match_score": 0.4 + 0.3 * level[label["label"]] + (i % 4) * 0.05,
+                "buffer_weeks": i % 3,
+            }
+            for i, label in enumerate(labels)
+        }
+        return load_training_set(contexts=contexts)
+
+    @pytest.fixture
+    def model(self, training):
+        return train_success_model(training)
+
+    def test_requires_pre_outcome_context(self):
+        """사후 지표만 있는 라벨은 제외, 학습할 예제/특성이 없으면 실패"""
+        training = load_training_set()
+        assert len(training.targets) == 0 and len(training.skipped) == 20
+        with pytest.raises(ValueError, match="최소"):
+            train_success_model(training)
+
+        constant = load_training_set(
+            contexts={subject_id: {"project_type": "SI"} for subject_id in training.skipped}
+        )
+        with pytest.raises(ValueError, match="특성이 없습니다"):
+            train_success_model(constant)
+
+    def test_training_contexts_from_kg(self, training):
+        """--contexts가 없으면 KG 착수 시점 컨텍스트로 학습 (넘긴 컨텍스트가 우선)"""
+        from types import SimpleNamespace
+
+        requested = []
+
+        class FakeKG:
+            def get_project_start_contexts(self, project_ids):
+                requested.extend(project_ids)
+                return SimpleNamespace(
+                    data=[
+                        {
+                            "projectId": subject_id,
+                            "requiredFTE": 4.0,
+                            "availableFTE": training.contexts[i]["available_fte"],
+                            "plannedDurationWeeks": 12.0,
+                            "teamAvgExperienceYears": None,
+                        }
+                        for i, subject_id in enumerate(training.subject_ids)
+                    ]
+                )
+
+        first = training.subject_ids[0]
+        kg_training = load_training_set(
+            contexts={first: {"available_fte": 9.0}}, kg_client=FakeKG()
+        )
+
+        assert first not in requested and len(requested) == 19
+        assert kg_training.skipped == []
+        assert kg_training.contexts[0]["available_fte"] == 9.0
+        assert kg_training.contexts[1] == {
+            "required_fte": 4.0,
+            "available_fte": training.contexts[1]["available_fte"],
+            "planned_duration_weeks": 12.0,
+        }
+        model = train_success_model(kg_training)
+        assert "resource_ratio" not in model.metrics["unlearned_features"]
+
+    def test_calibrated_better_than_heuristic(self, model):
+        """leave-one-out 보정 지표가 휴리스틱보다 좋음, 값이 없는 특성은 학습되지 않음"""
+        metrics = model.metrics
+
+        assert metrics["examples"] == 20
+        assert {"base_rate", "current_utilization"} <= set(metrics["unlearned_features"])
+        assert "resource_ratio" not in metrics["unlearned_features"]
+        assert metrics["leave_one_out"]["brier"] < metrics["heuristic"]["brier"]
+        assert 0 <= metrics["leave_one_out"]["ece"] <= 1
+        unlearned = [FEATURES.index(name) for name in metrics["unlearned_features"]]
+        assert not model.coef[unlearned].any()
+        assert model.coef[FEATURES.index("resource_ratio")] > 0
+
+    def test_serialized_model_roundtrip(self, model, tmp_path):
+        """저장/로드 후 같은 예측, 이전 버전 모델은 거부"""
+        path = tmp_path / "success_model.json"
+        model.save(path)
+        loaded = SuccessModel.load(path)
+        contexts = [{"available_fte": f, "required_fte": 4} for f in (2, 3, 5)] + [{}]
+
+        assert loaded.predict(contexts).tolist() == model.predict(contexts).tolist()
+        with pytest.raises(ValueError, match="버전"):
+            SuccessModel.from_dict({**model.to_dict(), "version": 1})
+
+    def test_agent_uses_model(self, model):
+        """ml_model이 있으면 모델 확률 사용, 단건/일괄 결과 동일, 특성 캐시 적중"""
+        predictor = SuccessPredictor(model)
+        agent = SuccessProbabilityAgent(ml_model=predictor)
+        contexts = [
+            {"available_fte": 5, "required_fte": 4, "competency_match_score": 0.8},
+            {"available_fte": 2, "required_fte": 4, "competency_match_score": 0.4},
+        ]
+        ids = ["PRJ-A", "PRJ-B"]
+
+        scalar = [
+            agent.calculate_probability("PROJECT", i, i, c)
+            for i, c in zip(ids, contexts, strict=True)
+        ]
+        agent.calculate_probability("PROJECT", "PRJ-A", "PRJ-A", contexts[0])
+        batch = agent.calculate_batch("PROJECT", ids, ids, contexts)
+
+        expected = [round(min(0.95, max(0.05, float(p))), 3) for p in model.predict(contexts)]
+        assert [r.success_probability for r in scalar] == expected
+        assert [r.success_probability for r in batch] == expected
+        assert expected[0] > expected[1]
+        assert predictor.cache.stats()["hits"] == 1
+
 
 @pytest.mark.day4
 @pytest.mark.skipif(not AGENTS_AVAILABLE, reason="Agent modules not available")
@@ -288,6 +854,61 @@ class TestWorkflowBuilder:
         hitl_steps = [step for step in workflow.steps if step.step_type == StepType.HITL_APPROVAL]
         assert len(hitl_steps) > 0, "No HITL step found in workflow"
 
+    def test_kg_capacity_feeds_reallocation(self):
+        """KG 조회 결과(후보 인력 + 주차별 부족분)로 재배치 계획 수립"""
+        from types import SimpleNamespace
+
+        from backend.agent_runtime.agents.workflow_builder import WorkflowContext
+
+        class FakeKG:
+            def get_org_utilization(self, org_unit_id, start, end):
+                return SimpleNamespace(data=[{"orgUnitName": "개발1팀", "utilization": 0.95}])
+
+            def get_capacity_forecast(self, org_unit_id, weeks=12):
+                gaps = {"2026-W01": 1.0, "2026-W02": -1.5, "2026-W03": -0.5}
+                return SimpleNamespace(
+                    data=[
+                        {"weekLabel": w, "utilization": 0.95 if g < 0 else 0.8, "gapFTE": g}
+                        for w, g in gaps.items()
+                    ]
+                )
+
+            def get_reallocation_candidates(self, org_unit_id, weeks=12):
+                weekly = [
+                    {"week": w, "availableFTE": fte}
+                    for w, fte in (("2026-W01", 0.5), ("2026-W02", 1.0), ("2026-W03", 0.4))
+                ]
+                return SimpleNamespace(
+                    data=[
+                        {
+                            "employeeId": "EMP-101",
+                            "name": "이영희",
+                            "orgUnitId": "ORG-002",
+                            "sameOrg": False,
+                            "competencies": [{"competencyId": "C-PY", "level": 4}],
+                            "availableFTEByWeek": weekly,
+                        }
+                    ]
+                )
+
+        builder = WorkflowBuilderAgent(kg_client=FakeKG())
+        result = builder._execute_kg_query(
+            "CAPACITY", WorkflowContext(user_query="병목 예측", org_unit_id="ORG-001")
+        )
+
+        assert result["weekly_demand"] == [
+            {"week": "2026-W02", "gap_fte": 1.5},
+            {"week": "2026-W03", "gap_fte": 0.5},
+        ]
+        resource = result["available_resources"][0]
+        assert resource["employee_id"] == "EMP-101"
+        assert resource["available_fte"] == 0.4
+        assert resource["competencies"] == [{"competency_id": "C-PY", "level": 4}]
+
+        plan = OptionGeneratorAgent()._plan_reallocation(result)
+        assert plan is not None
+        assert {r.employee_id for r in plan.reassignments} == {"EMP-101"}
+
 
 @pytest.mark.day4
 @pytest.mark.acceptance
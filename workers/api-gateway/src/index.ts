@@ -44,7 +44,9 @@ function corsHeaders(origin: string, allowedOrigins: string): HeadersInit {
   return {
     "Access-Control-Allow-Origin": allowOrigin,
     "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
-    "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Request-ID",
+    "Access-Control-Allow-Headers":
+      "Content-Type, Authorization, X-Request-ID, If-None-Match",
+    "Access-Control-Expose-Headers": "ETag",
     "Access-Control-Max-Age": "86400",
     "Access-Control-Allow-Credentials": "true",
   };
@@ -178,7 +180,7 @@ router.all(
       headers.set("X-Forwarded-Proto", "https");
       headers.delete("Host");
 
-      // Backend로 프록시
+      // Backend로 프록시 (If-None-Match 등 조건부 헤더 그대로 전달 → 304 응답 통과)
       const backendResponse = await fetch(backendUrl, {
         method: request.method,
         headers,